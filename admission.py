@@ -0,0 +1,286 @@
+"""
+Admission control for exam starts
+
+At the start of an exam slot every student calls /api/start_exam within a
+few seconds, and each start samples a paper and inserts an exam document.
+The admission controller lets at most Config.ADMISSION_MAX_CONCURRENT starts
+run at once. Everyone else gets a ticket and a 202 response with their
+place in the queue and an estimated wait. exam.html shows these and polls
+again with the ticket every Config.ADMISSION_RETRY_AFTER seconds.
+
+    * Tickets are admitted strictly in the order they were issued (FIFO),
+      so polling more often does not get anyone in sooner.
+    * A queued ticket that stops polling for Config.ADMISSION_TICKET_TTL
+      seconds (a closed tab) loses its place instead of blocking the line.
+    * The exam clock starts when the exam document is created, i.e. after
+      admission, so time spent in the queue is not deducted from
+      EXAM_DURATION_MINUTES.
+
+Config.ADMISSION_SCOPE selects where the queue lives. 'global' (the
+default) keeps it in MongoDB: the cap holds across all workers, the queue
+is strictly FIFO whichever worker a poll lands on, and an admitted start
+that never finishes frees its slot after Config.ADMISSION_LEASE seconds.
+'worker' keeps it in process without extra database work, but a ticket is
+only known to the worker that issued it; a poll routed to another worker
+starts over at the back of that worker's queue. Use it only with a single
+worker (local development).
+"""
+
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta, timezone
+
+from pymongo import ReturnDocument
+
+from models import db_manager
+
+# admitted: run the request now; otherwise position (1 = next) and estimated_wait (seconds)
+Admission = namedtuple('Admission', 'admitted ticket position estimated_wait')
+
+_SERVICE_TIME_WEIGHT = 0.2   # EWMA weight of the latest start duration
+
+
+class AdmissionController:
+    """In-process FIFO admission with a fixed number of concurrent slots"""
+
+    def __init__(self, name, capacity, ticket_ttl, retry_after):
+        self.name = name
+        self.capacity = capacity
+        self.ticket_ttl = ticket_ttl
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._worker = uuid.uuid4().hex[:8]   # Tickets from other workers are not honoured
+        self._next = 0
+        self._waiting = OrderedDict()   # ticket number -> [first seen, last seen]
+        self._active = {}               # ticket number -> admitted at
+        self._service_time = None       # EWMA of seconds per admitted request
+        self._counters = {'issued': 0, 'admitted': 0, 'queued': 0, 'expired': 0,
+                          'wait_total': 0.0, 'wait_max': 0.0}
+
+    # ---------- tickets ----------
+
+    def _parse(self, ticket):
+        worker, _, number = str(ticket or '').partition(':')
+        if worker != self._worker or not number.isdigit():
+            return None
+        return int(number)
+
+    def _format(self, number):
+        return f'{self._worker}:{number}'
+
+    def _expire(self, now):
+        for number, (_, last_seen) in list(self._waiting.items()):
+            if now - last_seen > self.ticket_ttl:
+                del self._waiting[number]
+                self._counters['expired'] += 1
+
+    def _estimate(self, position):
+        # A queued student is only admitted on a poll, so never estimate less than one poll interval
+        service = self._service_time if self._service_time is not None else self.retry_after
+        return max(self.retry_after, math.ceil(position / self.capacity) * service)
+
+    def _record_service(self, seconds):
+        if self._service_time is None:
+            self._service_time = seconds
+        else:
+            self._service_time += _SERVICE_TIME_WEIGHT * (seconds - self._service_time)
+
+    # ---------- admission ----------
+
+    def acquire(self, ticket=None):
+        """Admit the caller or return their place in the queue; call release() after an admitted request"""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            number = self._parse(ticket)
+            if number is None or number not in self._waiting:
+                number = self._next
+                self._next += 1
+                self._waiting[number] = [now, now]
+                self._counters['issued'] += 1
+            else:
+                self._waiting[number][1] = now
+
+            free = self.capacity - len(self._active)
+            ahead = list(self._waiting).index(number)
+            if ahead < free:
+                first_seen, _ = self._waiting.pop(number)
+                self._active[number] = now
+                waited = now - first_seen
+                self._counters['admitted'] += 1
+                self._counters['wait_total'] += waited
+                self._counters['wait_max'] = max(self._counters['wait_max'], waited)
+                return Admission(True, self._format(number), 0, 0)
+
+            self._counters['queued'] += 1
+            position = ahead - free + 1
+            return Admission(False, self._format(number), position, self._estimate(position))
+
+    def release(self, admission):
+        number = self._parse(admission.ticket)
+        with self._lock:
+            admitted_at = self._active.pop(number, None)
+            if admitted_at is not None:
+                self._record_service(time.monotonic() - admitted_at)
+
+    def stats(self):
+        with self._lock:
+            c = self._counters
+            return {
+                'scope': 'worker',
+                'capacity': self.capacity,
+                'active': len(self._active),
+                'waiting': len(self._waiting),
+                'issued': c['issued'],
+                'admitted': c['admitted'],
+                'queued_responses': c['queued'],
+                'expired': c['expired'],
+                'wait_avg_s': round(c['wait_total'] / c['admitted'], 3) if c['admitted'] else 0.0,
+                'wait_max_s': round(c['wait_max'], 3),
+                'service_time_s': round(self._service_time, 3) if self._service_time is not None else None
+            }
+
+
+class MongoAdmissionController(AdmissionController):
+    """
+    FIFO admission shared by all workers through MongoDB
+
+    Admitted starts hold a lease in one gate document per queue
+    (admission_gates); a lease is only added while the gate has fewer than
+    capacity of them, in a single atomic update. While nobody is queued a
+    start costs that one update plus one $pull on release. Students who
+    have to wait get a numbered ticket in admission_tickets and are admitted
+    in ticket order; while tickets are waiting the gate is marked queued,
+    so newcomers take a ticket instead of slipping past them.
+    """
+
+    def __init__(self, name, capacity, ticket_ttl, retry_after, lease):
+        super().__init__(name, capacity, ticket_ttl, retry_after)
+        self.lease = lease
+        self._indexed = False
+
+    def _collections(self):
+        db = db_manager.get_db()
+        if not self._indexed:
+            db.admission_tickets.create_index([('queue', 1), ('state', 1), ('n', 1)])
+            db.admission_tickets.create_index('expires_at', expireAfterSeconds=0)  # Garbage collection
+            db.admission_gates.update_one({'_id': self.name}, {'$setOnInsert': {'active': []}}, upsert=True)
+            self._indexed = True
+        return db.admission_tickets, db.admission_gates, db.counters
+
+    def _parse(self, ticket):
+        ticket = str(ticket or '')
+        return int(ticket) if ticket.isdigit() else None
+
+    def _format(self, number):
+        return str(number)
+
+    def _count_waiting(self, tickets, since, below=None):
+        query = {'queue': self.name, 'state': 'waiting', 'seen': {'$gt': since}}
+        if below is not None:
+            query['n'] = {'$lt': below}
+        return tickets.count_documents(query)
+
+    def _reserve(self, gates, now, lease_id, unless_queued):
+        """Add a lease to the gate if it has room (and, with unless_queued, nobody is waiting)"""
+        # The array has fewer than capacity leases exactly when its last allowed index is empty
+        query = {'_id': self.name, f'active.{self.capacity - 1}': {'$exists': False}}
+        if unless_queued:
+            query['queued_until'] = {'$not': {'$gt': now}}
+        lease = {'id': lease_id, 'expires_at': now + timedelta(seconds=self.lease)}
+        return gates.update_one(query, {'$push': {'active': lease}}).modified_count == 1
+
+    def _admitted(self, lease_id, waited):
+        with self._lock:
+            self._active[lease_id] = time.monotonic()
+            self._counters['admitted'] += 1
+            self._counters['wait_total'] += waited
+            self._counters['wait_max'] = max(self._counters['wait_max'], waited)
+        return Admission(True, lease_id, 0, 0)
+
+    def acquire(self, ticket=None):
+        tickets, gates, counters = self._collections()
+        now = datetime.now(timezone.utc)
+        number = self._parse(ticket)
+
+        # Fast path: a new start while nobody is queued
+        lease_id = uuid.uuid4().hex
+        if number is None and self._reserve(gates, now, lease_id, unless_queued=True):
+            return self._admitted(lease_id, 0.0)
+
+        # Leases of admitted starts that never finished
+        gates.update_one({'_id': self.name}, {'$pull': {'active': {'expires_at': {'$lte': now}}}})
+        cutoff = now - timedelta(seconds=self.ticket_ttl)
+        waiting_expiry = now + timedelta(seconds=self.ticket_ttl)
+
+        doc = None
+        if number is not None:
+            doc = tickets.find_one_and_update(
+                {'queue': self.name, 'n': number, 'state': 'waiting', 'seen': {'$gt': cutoff}},
+                {'$set': {'seen': now, 'expires_at': waiting_expiry}}
+            )
+        if doc is None:
+            number = counters.find_one_and_update(
+                {'_id': f'admission:{self.name}'}, {'$inc': {'n': 1}},
+                upsert=True, return_document=ReturnDocument.AFTER
+            )['n']
+            doc = {'queue': self.name, 'n': number, 'state': 'waiting',
+                   'first_seen': now, 'seen': now, 'expires_at': waiting_expiry}
+            tickets.insert_one(doc)
+            with self._lock:
+                self._counters['issued'] += 1
+
+        ahead = self._count_waiting(tickets, cutoff, below=number)
+        gate = gates.find_one({'_id': self.name}, {'active': 1}) or {}
+        free = self.capacity - len(gate.get('active', []))
+        if ahead < free:
+            # Atomic on the gate, so workers admitting at the same moment cannot exceed the capacity
+            if self._reserve(gates, now, lease_id, unless_queued=False):
+                tickets.delete_one({'_id': doc['_id']})
+                return self._admitted(lease_id, (now - doc['first_seen'].replace(tzinfo=timezone.utc)).total_seconds())
+            free = 0
+
+        # Keeps newcomers off the fast path while tickets are polling (each poll extends it)
+        queued_until = now + timedelta(seconds=2 * self.retry_after + 1)
+        gates.update_one({'_id': self.name}, {'$max': {'queued_until': queued_until}})
+        position = max(1, ahead - max(free, 0) + 1)
+        with self._lock:
+            self._counters['queued'] += 1
+            return Admission(False, self._format(number), position, self._estimate(position))
+
+    def release(self, admission):
+        _, gates, _ = self._collections()
+        gates.update_one({'_id': self.name}, {'$pull': {'active': {'id': admission.ticket}}})
+        with self._lock:
+            admitted_at = self._active.pop(admission.ticket, None)
+            if admitted_at is not None:
+                self._record_service(time.monotonic() - admitted_at)
+
+    def stats(self):
+        stats = super().stats()
+        tickets, gates, _ = self._collections()
+        now = datetime.now(timezone.utc)
+        gate = gates.find_one({'_id': self.name}) or {}
+        stats.update({
+            'scope': 'global',
+            'active': sum(1 for lease in gate.get('active', []) if _aware(lease['expires_at']) > now),
+            'waiting': self._count_waiting(tickets, now - timedelta(seconds=self.ticket_ttl)),
+            'active_this_worker': len(self._active)
+        })
+        return stats
+
+
+def _aware(moment):
+    # pymongo returns naive UTC datetimes unless the client is tz_aware
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def create_controller(config, name='exam_start'):
+    """Admission controller configured by Config.ADMISSION_*"""
+    args = (name, config['ADMISSION_MAX_CONCURRENT'], config['ADMISSION_TICKET_TTL'], config['ADMISSION_RETRY_AFTER'])
+    if config['ADMISSION_SCOPE'] == 'global':
+        return MongoAdmissionController(*args, lease=config['ADMISSION_LEASE'])
+    return AdmissionController(*args)
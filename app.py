@@ -1,33 +1,169 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+import startup  # First, so the startup profile covers every other import
+from flask import (
+    Flask, Response, render_template, request, jsonify, session, redirect, url_for,
+    make_response, stream_with_context, g
+)
 from datetime import datetime, timedelta
 from bson.objectid import ObjectId
+from pymongo.errors import DuplicateKeyError
 from urllib.parse import unquote
+from werkzeug.http import is_resource_modified
+import hashlib
 import os
+import time
 
 from config import config
-from models import db_manager, Student, Question, Exam, Admin
+from models import db_manager, Student, Question, Exam, Admin, SubjectCatalog
 from utils import (
-    validate_email, validate_phone, calculate_score, 
-    calculate_grade, sanitize_input, get_exam_status, format_datetime
+    validate_email, validate_phone, sanitize_input, get_exam_status, format_datetime
 )
+from cache import cache_stats, single_flight_stats
+from dedupe import duplicate_index
+from search import search_index
+import question_bank
+from json_provider import BSONJSONProvider
+from compression import ResponseCompressor
+from page_cache import PageCache
+import assets
+from template_cache import TemplateCache
+import admission
+from load_shedding import LoadShedder
+from exam_sweeper import exam_sweeper, pending_count as pending_expired_exams
+from idempotency import IdempotencyStore
+
+startup.mark('imports')
 
 # Initialize Flask app
 app = Flask(__name__)
 
+# jsonify encodes ObjectId/datetime/Decimal128 itself, with orjson when installed
+app.json = BSONJSONProvider(app)
+
 # Load configuration
 env = os.environ.get('FLASK_ENV', 'development')
 app.config.from_object(config[env])
 
+# Cold-start timings (STARTUP_PROFILE=1 prints them after the first request)
+startup.init_app(app)
+
+# 503 for admin, result and other low-priority routes while MongoDB is slow; exam routes always run
+load_shedder = LoadShedder(app)
+
+# gzip/brotli/zstd for large text responses
+compressor = ResponseCompressor(app)
+
+# Short-lived cache of rendered semi-static pages
+page_cache = PageCache(app)
+Question.add_change_listener(page_cache.clear)
+
+# Fingerprinted, minified static files from static/dist (python assets.py build)
+assets.init_app(app)
+
+# Precompiled templates and a shared bytecode cache for the rest
+template_cache = TemplateCache(app)
+
+# Caps concurrent exam starts; the rest wait in a FIFO queue (see admission.py)
+exam_admission = admission.create_controller(app.config) if app.config['ADMISSION_ENABLED'] else None
+
+# Finalizes abandoned exams in the background (python exam_sweeper.py run on serverless)
+exam_sweeper.init_app(app)
+
+# Replays the first response to retried save_answer/submit_exam requests (Idempotency-Key header)
+idempotency = IdempotencyStore(app.config)
+
+startup.mark('setup')
+
 # Database will connect lazily on first use (important for serverless deployment)
 
 # ==================== HELPER FUNCTIONS ====================
 
+# Profile fields carried in the signed session so most pages need no student query
+STUDENT_PROFILE_FIELDS = ('roll_number', 'name', 'subject')
+
+# Roll number -> time its cached profile was invalidated (admin delete/edit), plus
+# the time all cached profiles were invalidated. Other workers catch up once
+# SESSION_PROFILE_TTL has passed.
+_profile_revocations = {}
+_profile_epoch = 0.0
+
+def invalidate_student_profile(roll_number=None):
+    """Force the cached session profile of one student (or all students) to be reloaded"""
+    global _profile_epoch
+    if roll_number is None:
+        _profile_epoch = time.time()
+        _profile_revocations.clear()
+    else:
+        now = time.time()
+        # Sessions older than the TTL revalidate anyway, so old entries can go
+        for roll, revoked_at in list(_profile_revocations.items()):
+            if now - revoked_at > app.config['SESSION_PROFILE_TTL']:
+                del _profile_revocations[roll]
+        _profile_revocations[roll_number] = now
+
+def store_student_profile(student):
+    """Copy the immutable profile fields into the session"""
+    session['student_roll'] = student['roll_number']
+    session['student_name'] = student.get('name')
+    session['student_subject'] = student.get('subject')
+    session['profile_loaded_at'] = time.time()
+
+def clear_student_session():
+    for key in ('student_roll', 'student_name', 'student_subject', 'profile_loaded_at'):
+        session.pop(key, None)
+
+def session_profile(data):
+    """
+    Student profile cached in a session (any mapping), or None if it has to be reloaded
+
+    The copy is trusted while it is younger than SESSION_PROFILE_TTL and has
+    not been invalidated by invalidate_student_profile().
+    """
+    roll_number = data.get('student_roll')
+    loaded_at = data.get('profile_loaded_at', 0)
+    fresh = (time.time() - loaded_at < app.config['SESSION_PROFILE_TTL']
+             and loaded_at > _profile_epoch
+             and loaded_at > _profile_revocations.get(roll_number, 0))
+    if not roll_number or not fresh:
+        return None
+    return {
+        'roll_number': roll_number,
+        'name': data.get('student_name'),
+        'subject': data.get('student_subject')
+    }
+
+def current_student():
+    """
+    Profile of the logged-in student ({'roll_number', 'name', 'subject'}) or None
+
+    Loaded at most once per request. The session copy is used while it is
+    younger than SESSION_PROFILE_TTL and has not been invalidated; otherwise
+    the student is re-read with a narrow projection. A student deleted by an
+    admin is logged out.
+    """
+    if 'student_profile' in g:
+        return g.student_profile
+
+    profile = None
+    roll_number = session.get('student_roll')
+    if roll_number:
+        profile = session_profile(session)
+        if profile is None:
+            student = Student.get_by_roll(roll_number, fields=STUDENT_PROFILE_FIELDS)
+            if student:
+                store_student_profile(student)
+                profile = {field: student.get(field) for field in STUDENT_PROFILE_FIELDS}
+            else:
+                clear_student_session()
+
+    g.student_profile = profile
+    return profile
+
 def login_required(f):
     """Decorator to require student login"""
     from functools import wraps
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if 'student_roll' not in session:
+        if 'student_roll' not in session or current_student() is None:
             return redirect(url_for('login'))
         return f(*args, **kwargs)
     return decorated_function
@@ -42,6 +178,55 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def paper_response(fragments):
+    """
+    JSON exam paper assembled from pre-serialized question fragments
+
+    Only the small envelope is added per request; the question objects are
+    joined as bytes straight from the question bank snapshot.
+    """
+    body = b''.join([b'{"success":true,"questions":[', b','.join(fragments), b']}'])
+    return Response(body, status=200, mimetype='application/json')
+
+def make_etag(*parts):
+    """Strong ETag value derived from the given parts"""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+_template_stamps = {}
+
+def template_stamp(template_name):
+    """Modification stamp of a template, so ETags change when the page layout does"""
+    stamp = _template_stamps.get(template_name)
+    if stamp is None or app.debug:
+        path = os.path.join(app.root_path, app.template_folder, template_name)
+        stamp = _template_stamps[template_name] = os.stat(path).st_mtime_ns
+    return stamp
+
+def not_modified(etag, last_modified=None):
+    """304 response when the client's validators match, otherwise None"""
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+    response = app.response_class(status=304)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+def add_validators(response, etag, last_modified=None):
+    """
+    Mark a per-student response as revalidate-on-use with an ETag
+
+    Browsers keep the body and ask again with If-None-Match, which
+    not_modified() answers with a 304.
+    """
+    response = make_response(response)
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
 # ==================== INITIALIZATION ====================
 
 _initialized = False
@@ -51,8 +236,13 @@ def ensure_initialized():
     global _initialized
     if not _initialized:
         try:
-            db_manager.connect()
-            Admin.ensure_default_admin()
+            with startup.phase('connect'):
+                db_manager.connect()
+            with startup.phase('default_admin'):
+                Admin.ensure_default_admin()
+            with startup.phase('indexes'):
+                Question.ensure_indexes()
+                Exam.ensure_indexes()
             _initialized = True
         except Exception as e:
             print(f"Initialization warning: {e}")
@@ -66,23 +256,24 @@ def before_request():
 # ==================== MAIN ROUTES ====================
 
 @app.route('/')
+@page_cache.cached(current_student)
 def index():
     """Landing page"""
     # Default to all subjects (marketing view)
     subjects = Question.get_subjects()
     
     # If student is logged in, restrict to their registered subject
-    if 'student_roll' in session:
-        student = Student.get_by_roll(session['student_roll'])
-        if student and student.get('subject'):
-            # Only show the registered subject
-            subjects = [student['subject']]
+    student = current_student()
+    if student and student.get('subject'):
+        # Only show the registered subject
+        subjects = [student['subject']]
             
     return render_template('index.html', subjects=subjects)
 
 # ==================== STUDENT ROUTES ====================
 
 @app.route('/register')
+@page_cache.cached(current_student)
 def register_page():
     """Student registration page"""
     if 'student_roll' in session:
@@ -143,6 +334,7 @@ def register():
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/login')
+@page_cache.cached(current_student)
 def login_page():
     """Student login page"""
     if 'student_roll' in session:
@@ -177,8 +369,7 @@ def login():
         #     }), 403
         
         # Set session
-        session['student_roll'] = roll_number
-        session['student_name'] = student['name']
+        store_student_profile(student)
         session.permanent = True
         
         return jsonify({
@@ -193,8 +384,7 @@ def login():
 @app.route('/logout')
 def logout():
     """Student logout"""
-    session.pop('student_roll', None)
-    session.pop('student_name', None)
+    clear_student_session()
     return redirect(url_for('index'))
 
 # ==================== EXAM ROUTES ====================
@@ -206,13 +396,16 @@ def subjects_page():
     subjects = Question.get_subjects()
     
     # Restrict to registered subject if available
-    student_roll = session.get('student_roll')
-    if student_roll:
-        student = Student.get_by_roll(student_roll)
-        if student and student.get('subject'):
-            subjects = [student['subject']]
+    student = current_student()
+    if student and student.get('subject'):
+        subjects = [student['subject']]
+    
+    etag = make_etag('subjects', template_stamp('subjects.html'), subjects, student)
+    cached = not_modified(etag)
+    if cached:
+        return cached
             
-    return render_template('subjects.html', subjects=subjects)
+    return add_validators(render_template('subjects.html', subjects=subjects), etag)
 
 @app.route('/exam/<subject>')
 @login_required
@@ -234,6 +427,21 @@ def exam_page(subject):
 
 from urllib.parse import unquote
 
+def queued_response(slot):
+    """202 telling a student waiting for admission their place in the queue"""
+    retry_after = app.config['ADMISSION_RETRY_AFTER']
+    response = jsonify({
+        'success': False,
+        'queued': True,
+        'ticket': slot.ticket,
+        'position': slot.position,
+        'estimated_wait': round(slot.estimated_wait),
+        'retry_after': retry_after
+    })
+    response.headers['Retry-After'] = str(retry_after)
+    response.headers['Cache-Control'] = 'no-store'
+    return response, 202
+
 @app.route('/api/start_exam/<subject>', methods=['POST'])
 @login_required
 def start_exam(subject):
@@ -253,65 +461,93 @@ def start_exam(subject):
                     'redirect': '/result/' + student_roll
                 }), 403
             
-            # Return existing exam
-            questions = Question.get_all()
-            question_map = {str(q['_id']): q for q in questions}
-            
-            exam_questions = []
-            for q_id in existing_exam['questions']:
-                if q_id in question_map:
-                    q = question_map[q_id]
-                    exam_questions.append({
-                        'id': str(q['_id']),
-                        'question': q['question'],
-                        'options': q['options']
-                    })
-            
-            # Calculate remaining time
-            elapsed = (datetime.now() - existing_exam['start_time']).total_seconds()
-            remaining = max(0, app.config['EXAM_DURATION_MINUTES'] * 60 - elapsed)
-            
+            # Resume: the paper itself is fetched (and revalidated) from the paper endpoint
             return jsonify({
                 'success': True,
-                'questions': exam_questions,
-                'remaining_time': int(remaining),
+                'paper_url': url_for('exam_paper', subject=subject),
+                'remaining_time': Exam.remaining_seconds(existing_exam),
                 'saved_answers': existing_exam.get('answers', {})
             }), 200
         
-        # Get random questions by subject
-        questions = Question.get_random_by_subject(subject, app.config['TOTAL_QUESTIONS'])
+        # New exams are admitted a few at a time during start-of-slot bursts
+        slot = exam_admission.acquire((request.get_json(silent=True) or {}).get('ticket')) if exam_admission else None
+        if slot is not None and not slot.admitted:
+            return queued_response(slot)
+        
+        try:
+            # Reject under-stocked subjects from the cached catalog before sampling
+            available = SubjectCatalog.count(subject)
+            if available < app.config['TOTAL_QUESTIONS']:
+                return jsonify({
+                    'success': False,
+                    'message': f'Not enough questions in database for subject {subject}. Need {app.config["TOTAL_QUESTIONS"]}, found {available}'
+                }), 500
+
+            # Get random questions by subject from the shared question bank snapshot
+            questions = question_bank.sample_questions(subject, app.config['TOTAL_QUESTIONS'])
+        
+            if len(questions) < app.config['TOTAL_QUESTIONS']:
+                return jsonify({
+                    'success': False,
+                    'message': f'Not enough questions in database for subject {subject}. Need {app.config["TOTAL_QUESTIONS"]}, found {len(questions)}'
+                }), 500
+        
+            # Create exam
+            exam, error = Exam.create(student_roll, subject, questions)
+        
+            if error:
+                return jsonify({'success': False, 'message': error}), 400
         
-        if len(questions) < app.config['TOTAL_QUESTIONS']:
             return jsonify({
-                'success': False,
-                'message': f'Not enough questions in database for subject {subject}. Need {app.config["TOTAL_QUESTIONS"]}, found {len(questions)}'
-            }), 500
+                'success': True,
+                'paper_url': url_for('exam_paper', subject=subject),
+                'remaining_time': app.config['EXAM_DURATION_MINUTES'] * 60,
+                'saved_answers': {}
+            }), 200
         
-        # Create exam
-        exam, error = Exam.create(student_roll, subject, questions)
+        finally:
+            if slot is not None:
+                exam_admission.release(slot)
         
-        if error:
-            return jsonify({'success': False, 'message': error}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@app.route('/api/exam/<subject>/paper')
+@login_required
+def exam_paper(subject):
+    """
+    Read-only question paper of the student's running exam (without answers)
+
+    It carries a strong ETag built from the exam ID and a digest of the
+    exam's own questions as sent, so a refresh or resume is answered with
+    304 Not Modified until one of those questions is edited (changes to
+    other questions in the bank leave it valid).
+    """
+    try:
+        subject = unquote(subject)
+        exam = Exam.get_by_student_and_subject(session.get('student_roll'), subject)
         
-        # Format questions for frontend (without correct answers)
-        exam_questions = [{
-            'id': str(q['_id']),
-            'question': q['question'],
-            'options': q['options']
-        } for q in questions]
+        if not exam:
+            return jsonify({'success': False, 'message': 'Exam not found'}), 404
         
-        return jsonify({
-            'success': True,
-            'questions': exam_questions,
-            'remaining_time': app.config['EXAM_DURATION_MINUTES'] * 60,
-            'saved_answers': {}
-        }), 200
+        if exam['status'] == 'completed':
+            return jsonify({'success': False, 'message': 'Exam already completed for this subject'}), 403
+        
+        # Pre-serialized questions for the frontend (without correct answers)
+        fragments = question_bank.public_fragments(exam['questions'])
+        etag = make_etag('paper', str(exam['_id']), hashlib.sha1(b'\n'.join(fragments)).hexdigest())
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        return add_validators(paper_response(fragments), etag)
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/save_answer', methods=['POST'])
 @login_required
+@idempotency.idempotent('save_answer')
 def save_answer():
     """Save individual answer"""
     try:
@@ -320,11 +556,12 @@ def save_answer():
         
         question_id = data.get('question_id')
         answer = data.get('answer')
+        seq = data.get('seq')  # Per-question save counter from the exam page (optional)
         
-        if not all([question_id, answer]):
+        if not all([question_id, answer]) or (seq is not None and type(seq) is not int):
             return jsonify({'success': False, 'message': 'Invalid data'}), 400
         
-        Exam.save_answer(student_roll, question_id, answer)
+        Exam.save_answer(student_roll, question_id, answer, seq)
         
         return jsonify({'success': True}), 200
         
@@ -333,6 +570,7 @@ def save_answer():
 
 @app.route('/api/submit_exam', methods=['POST'])
 @login_required
+@idempotency.idempotent('submit_exam')
 def submit_exam():
     """Submit exam and calculate results"""
     try:
@@ -347,16 +585,11 @@ def submit_exam():
         if exam['status'] == 'completed':
             return jsonify({'success': False, 'message': 'Exam already submitted'}), 400
         
-        # Get all questions
-        questions = Question.get_all()
-        question_map = {str(q['_id']): q for q in questions}
-        
-        # Get exam questions
-        exam_questions = [question_map[q_id] for q_id in exam['questions'] if q_id in question_map]
+        # Answer keys come from the database, never from a possibly stale snapshot
+        exam_questions = Question.get_answer_keys(exam['questions'])
         
         # Calculate score
-        score, total, percentage = calculate_score(exam_questions, exam.get('answers', {}))
-        grade = calculate_grade(percentage)
+        score, total, percentage, grade = Exam.score(exam, exam_questions)
         
         # Submit exam
         Exam.submit(student_roll, score, total, percentage, grade)
@@ -377,7 +610,7 @@ def result_page(roll_number):
     """View result page"""
     try:
         # Get student
-        student = Student.get_by_roll(roll_number)
+        student = Student.get_by_roll(roll_number, fields=('roll_number', 'name', 'email'))
         
         if not student:
             return render_template('error.html', message='Student not found'), 404
@@ -389,29 +622,20 @@ def result_page(roll_number):
             return render_template('error.html', message='No exams found'), 404
         
         # Prepare result data
-        results = []
-        for exam in exams:
-            if exam['status'] == 'completed':
-                results.append({
-                    'roll_number': roll_number,
-                    'name': student['name'],
-                    'email': student['email'],
-                    'subject': exam.get('subject', 'Unknown'),
-                    'score': exam['score'],
-                    'total': exam['total'],
-                    'percentage': exam['percentage'],
-                    'grade': exam['grade'],
-                    'exam_date': format_datetime(exam['submit_time']),
-                    'status': 'PASS' if exam['percentage'] >= app.config['PASSING_MARKS'] else 'FAIL',
-                    'attempted': len(exam.get('answers', {})),
-                    'correct': int(exam['score']),
-                    'wrong': len(exam.get('answers', {})) - int(exam['score'])
-                })
+        results = Exam.result_rows(student, exams)
         
         if not results:
              return render_template('error.html', message='Result not available yet'), 404
 
-        return render_template('result.html', results=results, student=student)
+        # Results only change when another exam is submitted
+        last_modified = max(exam['submit_time'] for exam in exams if exam['status'] == 'completed')
+        etag = make_etag('result', template_stamp('result.html'), results, student)
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
+
+        return add_validators(render_template('result.html', results=results, student=student),
+                              etag, last_modified)
         
     except Exception as e:
         return render_template('error.html', message=str(e)), 500
@@ -562,7 +786,7 @@ def get_questions():
         for q in questions:
             try:
                 question_list.append({
-                    'id': str(q['_id']),
+                    'id': q['_id'],
                     'question': q.get('question', ''),
                     'subject': q.get('subject', ''),
                     'options': q.get('options', []),
@@ -583,6 +807,51 @@ def get_questions():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@app.route('/api/admin/questions/search', methods=['GET'])
+@admin_required
+def search_questions():
+    """Ranked question search with subject/answer filters and per-subject counts (API)"""
+    try:
+        text = request.args.get('q', '')
+        subject = request.args.get('subject') or None
+        answer = request.args.get('answer') or None
+        page = max(1, request.args.get('page', 1, type=int))
+        per_page = app.config['QUESTIONS_PER_PAGE']
+
+        if answer and answer.upper() not in ('A', 'B', 'C', 'D'):
+            return jsonify({'success': False, 'message': 'Answer must be A, B, C or D'}), 400
+
+        question_ids, total, subject_counts = search_index.search(
+            text, subject=subject, answer=answer, skip=(page-1)*per_page, limit=per_page
+        )
+
+        # Fetch the page in one query and keep the ranking order
+        questions = {str(q['_id']): q for q in Question.get_by_ids(question_ids)}
+        question_list = []
+        for question_id in question_ids:
+            q = questions.get(question_id)
+            if not q:
+                continue
+            question_list.append({
+                'id': question_id,
+                'question': q.get('question', ''),
+                'subject': q.get('subject', ''),
+                'options': q.get('options', []),
+                'correct': q.get('correct', '')
+            })
+
+        return jsonify({
+            'success': True,
+            'questions': question_list,
+            'total': total,
+            'page': page,
+            'pages': (total + per_page - 1) // per_page,
+            'subject_counts': subject_counts
+        }), 200
+
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 @app.route('/api/admin/questions', methods=['POST'])
 @admin_required
 def add_question():
@@ -601,7 +870,28 @@ def add_question():
         if len(options) != 4:
             return jsonify({'success': False, 'message': 'There must be 4 options'}), 400
 
-        Question.create(question_text, options, correct_answer, subject)
+        # Exact duplicates are always rejected; near-duplicates unless the admin insists
+        match, signature = duplicate_index.check(question_text, options, subject)
+        if match.exact_id or (match.similar and not data.get('force')):
+            similar = [{'id': match.exact_id, 'similarity': 1.0}] if match.exact_id else [
+                {'id': question_id, 'similarity': round(score, 2)} for question_id, score in match.similar[:5]
+            ]
+            texts = {str(q['_id']): q.get('question', '') for q in Question.get_by_ids([s['id'] for s in similar])}
+            for item in similar:
+                item['question'] = texts.get(item['id'], '')
+            return jsonify({
+                'success': False,
+                'message': match.message(),
+                'duplicate': 'exact' if match.exact_id else 'near',
+                'similar': similar
+            }), 409
+
+        try:
+            question_id = Question.create(question_text, options, correct_answer, subject)
+        except DuplicateKeyError:
+            return jsonify({'success': False, 'message': 'Duplicate of an existing question', 'duplicate': 'exact'}), 409
+        duplicate_index.add(question_id, question_text, options, subject, signature=signature)
+        search_index.add(question_id, question_text, options, subject, correct_answer)
         
         return jsonify({'success': True, 'message': 'Question added successfully'}), 201
         
@@ -617,6 +907,8 @@ def delete_question(question_id):
             return jsonify({'success': False, 'message': 'Invalid Question ID'}), 400
         
         if Question.delete_question(question_id):
+            duplicate_index.remove(question_id)
+            search_index.remove(question_id)
             return jsonify({'success': True, 'message': 'Question deleted successfully'}), 200
         else:
             return jsonify({'success': False, 'message': 'Question not found'}), 404
@@ -682,59 +974,33 @@ def upload_questions():
     if not file.filename.endswith('.csv'):
         return jsonify({'success': False, 'message': 'File must be a CSV'}), 400
 
-    try:
-        stream = io.StringIO(file.stream.read().decode("UTF8"), newline=None)
-        csv_input = csv.reader(stream)
-        
-        # Skip header
-        header = next(csv_input, None)
-        if not header:
-            return jsonify({'success': False, 'message': 'Empty file'}), 400
+    # Admin-only, so kept off the cold-start import path
+    from question_io import import_questions_csv, stream_import_questions_csv
 
-        count = 0
-        errors = []
-        
-        for i, row in enumerate(csv_input):
+    batch_size = request.args.get('batch_size', type=int) or app.config['UPLOAD_BATCH_SIZE']
+    allow_similar = request.args.get('allow_similar') == '1'
+
+    # ?stream=1 reports progress as newline-delimited JSON, one line per batch
+    if request.args.get('stream') == '1':
+        def generate():
             try:
-                # Expected format: Question, Option A, Option B, Option C, Option D, Correct Answer, Subject
-                if len(row) < 7:
-                    continue
-                    
-                question_text = row[0].strip()
-                options = [row[1].strip(), row[2].strip(), row[3].strip(), row[4].strip()]
-                correct = row[5].strip().upper()  # Expecting 'A', 'B', 'C', or 'D'
-                subject = row[6].strip()
-                
-                if not all([question_text, all(options), correct, subject]):
-                    continue
-                    
-                # Map 'A', 'B', 'C', 'D' to the actual option text if needed, 
-                # but our model stores the correct option value (text).
-                # Wait, the current model stores the correct option VALUE (text), not the index/letter.
-                # Let's check the Question.create method.
-                # It takes (question, options, correct_answer, subject).
-                # And the UI sends the VALUE of the correct option.
-                
-                # Let's map the letter to the value
-                option_map = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
-                if correct in option_map:
-                    correct_val = options[option_map[correct]]
-                else:
-                    # Assume it might be the full text
-                    correct_val = correct
-
-                Question.create(question_text, options, correct_val, subject)
-                count += 1
+                for progress in stream_import_questions_csv(file.stream, batch_size, allow_similar):
+                    yield app.json.dumps(progress.to_dict()) + '\n'
+                yield app.json.dumps({'success': True, 'message': 'Upload processed', 'done': True}) + '\n'
             except Exception as e:
-                errors.append(f"Row {i+2}: {str(e)}")
-        
-        return jsonify({
-            'success': True, 
-            'message': 'Upload processed', 
-            'count': count,
-            'errors': errors
-        })
+                yield app.json.dumps({'success': False, 'message': str(e), 'done': True}) + '\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+    try:
+        progress = import_questions_csv(file.stream, batch_size, allow_similar)
 
+        result = progress.to_dict()
+        result.update({'success': True, 'message': 'Upload processed'})
+        return jsonify(result)
+
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
@@ -742,9 +1008,13 @@ def upload_questions():
 @admin_required
 def sample_csv():
     """Generate sample CSV for questions"""
+    import csv
+    import io
+    from question_io import CSV_HEADER
+
     si = io.StringIO()
     cw = csv.writer(si)
-    cw.writerow(['Question', 'Option A', 'Option B', 'Option C', 'Option D', 'Correct Answer', 'Subject'])
+    cw.writerow(CSV_HEADER)
     cw.writerow(['What is the output of print(2**3)?', '6', '8', '9', '12', 'B', 'Python'])
     cw.writerow(['HTML stands for?', 'Hyper Text Markup Language', 'High Text Machine Language', 'Hyper Tool Multi Language', 'None', 'A', 'Web Design'])
     
@@ -759,6 +1029,9 @@ def delete_all_questions():
     """Delete ALL questions"""
     try:
         result = db_manager.get_db().questions.delete_many({})
+        Question.notify_changed()
+        duplicate_index.invalidate()
+        search_index.invalidate()
         return jsonify({
             'success': True, 
             'message': f'Deleted {result.deleted_count} questions'
@@ -781,6 +1054,10 @@ def delete_bulk_questions():
         object_ids = [ObjectId(qid) for qid in question_ids]
         
         result = db_manager.get_db().questions.delete_many({'_id': {'$in': object_ids}})
+        Question.notify_changed()
+        for question_id in object_ids:
+            duplicate_index.remove(question_id)
+            search_index.remove(question_id)
         
         return jsonify({
             'success': True, 
@@ -790,16 +1067,48 @@ def delete_bulk_questions():
         return jsonify({'success': False, 'message': str(e)}), 500
 
 
+@app.route('/api/admin/questions/duplicates')
+@admin_required
+def duplicate_questions_report():
+    """List clusters of exact and near-duplicate questions across the bank"""
+    try:
+        clusters = duplicate_index.clusters()
+        limit = request.args.get('limit', 50, type=int)
+
+        ids = [question_id for cluster in clusters[:limit] for question_id in cluster['ids']]
+        questions = {str(q['_id']): q for q in Question.get_by_ids(ids)}
+
+        report = []
+        for cluster in clusters[:limit]:
+            report.append({
+                'kind': cluster['kind'],
+                'questions': [{
+                    'id': question_id,
+                    'question': questions.get(question_id, {}).get('question', ''),
+                    'subject': questions.get(question_id, {}).get('subject', '')
+                } for question_id in cluster['ids']]
+            })
+
+        return jsonify({
+            'success': True,
+            'total_clusters': len(clusters),
+            'duplicate_questions': sum(len(c['ids']) - 1 for c in clusters),
+            'clusters': report
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
 @app.route('/api/admin/students/all', methods=['DELETE'])
 @admin_required
 def delete_all_students():
     """Delete ALL students"""
     try:
-        db = db_manager.get_db()
-        result = db.students.delete_many({})
+        deleted = Student.delete_all()
+        invalidate_student_profile()
         return jsonify({
             'success': True, 
-            'message': f'Deleted {result.deleted_count} students'
+            'message': f'Deleted {deleted} students'
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -809,10 +1118,10 @@ def delete_all_students():
 def delete_student(roll_number):
     """Delete a single student"""
     try:
-        db = db_manager.get_db()
-        result = db.students.delete_one({'roll_number': roll_number})
+        deleted = Student.delete(roll_number)
+        invalidate_student_profile(roll_number)
         
-        if result.deleted_count > 0:
+        if deleted:
             return jsonify({'success': True, 'message': 'Student deleted successfully'})
         else:
             return jsonify({'success': False, 'message': 'Student not found'}), 404
@@ -820,10 +1129,46 @@ def delete_student(roll_number):
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@app.route('/api/admin/cache_stats')
+@admin_required
+def get_cache_stats():
+    """Hit/miss statistics of this worker's in-process caches"""
+    return jsonify({'success': True, 'caches': cache_stats(), 'pages': page_cache.stats(),
+                    'templates': template_cache.stats(), 'single_flight': single_flight_stats()})
+
+@app.route('/api/admin/traffic')
+@admin_required
+def get_traffic_stats():
+    """Admission queue of exam starts, load shedding decisions and retried exam writes"""
+    return jsonify({'success': True,
+                    'admission': exam_admission.stats() if exam_admission else {'enabled': False},
+                    'shedding': load_shedder.stats(),
+                    'idempotency': idempotency.stats()})
+
+@app.route('/api/admin/exam_sweeper', methods=['GET', 'POST'])
+@admin_required
+def exam_sweeper_status():
+    """Expiry sweeper counters and backlog; POST runs a sweep now"""
+    try:
+        run = exam_sweeper.sweep() if request.method == 'POST' else None
+        return jsonify({'success': True, 'run': run, 'pending': pending_expired_exams(),
+                        'sweeper': exam_sweeper.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@app.route('/api/admin/startup')
+@admin_required
+def get_startup_profile():
+    """Cold-start timings of this worker"""
+    return jsonify({'success': True, 'startup': startup.report()})
+
 @app.route('/portfolio')
+@page_cache.cached(current_student)
 def portfolio_page():
     return render_template('portfolio.html')
 
+startup.mark('routes')
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
@@ -0,0 +1,362 @@
+"""
+Static asset pipeline
+
+`python assets.py build` minifies every CSS and JS file under static/,
+copies the other assets, and writes them to static/dist/ under fingerprinted
+names (style.css -> style.3f9c2a1b.css). Each text asset also gets a .gz
+sibling, plus a .br sibling when brotli is installed.
+static/dist/manifest.json maps each source name to its built file, and the
+build adds an immutable-caching route for /static/dist/ to vercel.json.
+
+At runtime init_app() makes every url_for('static', filename=...) in the
+templates resolve through the manifest, so templates keep their usual
+url_for calls. Fingerprinted files are served with a one-year immutable
+Cache-Control, and a precompressed sibling is used when the browser accepts
+it. Without a manifest (or in debug mode, for files edited since the last
+build) the source file is served as before.
+
+Usage:
+    python assets.py build
+    python assets.py clean
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+
+from flask import request, send_from_directory
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+DIST_NAME = 'dist'
+DIST_DIR = os.path.join(STATIC_DIR, DIST_NAME)
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+VERCEL_CONFIG = os.path.join(BASE_DIR, 'vercel.json')
+
+FINGERPRINT_LENGTH = 8
+PRECOMPRESS_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt')
+PRECOMPRESS_MIN_SIZE = 512
+IMMUTABLE_MAX_AGE = 31536000  # One year
+
+
+# ---------- minification ----------
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_STRING = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+
+
+def minify_css(source):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    parts = _CSS_STRING.split(source)
+    out = []
+    for index, part in enumerate(parts):
+        if index % 2:  # Quoted string, keep as-is
+            out.append(part)
+            continue
+        part = _CSS_COMMENT.sub('', part)
+        part = re.sub(r'\s+', ' ', part)
+        part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+        part = re.sub(r':\s+', ':', part)
+        part = part.replace(';}', '}')
+        out.append(part)
+    return ''.join(out).strip() + '\n'
+
+
+# A '/' after one of these starts a regular expression literal, not a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                   'throw', 'case', 'do', 'else', 'yield', 'await'}
+
+
+def _previous_allows_regex(out):
+    text = ''.join(out[-20:]).rstrip()
+    if not text:
+        return True
+    if text[-1] in _REGEX_PRECEDERS:
+        return True
+    word = re.search(r'([A-Za-z_$][\w$]*)$', text)
+    return bool(word and word.group(1) in _REGEX_KEYWORDS)
+
+
+def minify_js(source):
+    """
+    Conservative JavaScript minifier
+
+    Removes comments, indentation, trailing whitespace and blank lines while
+    keeping line breaks, so automatic semicolon insertion behaves exactly as
+    in the source. Strings, template literals and regex literals are copied
+    verbatim.
+    """
+    out = []
+    i = 0
+    n = len(source)
+    template_depth = []   # Brace depth inside each open ${ ... }
+
+    def copy_quoted(start, quote):
+        j = start + 1
+        while j < n:
+            c = source[j]
+            if c == '\\':
+                j += 2
+                continue
+            if c == quote:
+                return j + 1
+            j += 1
+        return n
+
+    def copy_template(start):
+        # Copies a template literal chunk up to its end or the next ${
+        j = start
+        while j < n:
+            c = source[j]
+            if c == '\\':
+                j += 2
+                continue
+            if c == '`':
+                return j + 1, False
+            if c == '$' and j + 1 < n and source[j + 1] == '{':
+                return j + 2, True
+            j += 1
+        return n, False
+
+    while i < n:
+        c = source[i]
+        nxt = source[i + 1] if i + 1 < n else ''
+
+        if c in '"\'':
+            end = copy_quoted(i, c)
+            out.append(source[i:end])
+            i = end
+        elif c == '`':
+            end, opened = copy_template(i + 1)
+            out.append(source[i:end])
+            i = end
+            if opened:
+                template_depth.append(0)
+        elif c == '{' and template_depth:
+            template_depth[-1] += 1
+            out.append(c)
+            i += 1
+        elif c == '}' and template_depth and template_depth[-1] == 0:
+            template_depth.pop()
+            end, opened = copy_template(i + 1)
+            out.append(source[i:end])
+            i = end
+            if opened:
+                template_depth.append(0)
+        elif c == '}' and template_depth:
+            template_depth[-1] -= 1
+            out.append(c)
+            i += 1
+        elif c == '/' and nxt == '/':
+            while i < n and source[i] != '\n':
+                i += 1
+        elif c == '/' and nxt == '*':
+            end = source.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            out.append(' ')
+        elif c == '/' and _previous_allows_regex(out):
+            j = i + 1
+            in_class = False
+            while j < n and source[j] != '\n':
+                ch = source[j]
+                if ch == '\\':
+                    j += 2
+                    continue
+                if ch == '[':
+                    in_class = True
+                elif ch == ']':
+                    in_class = False
+                elif ch == '/' and not in_class:
+                    j += 1
+                    break
+                j += 1
+            while j < n and (source[j].isalnum() or source[j] == '_'):  # Flags
+                j += 1
+            out.append(source[i:j])
+            i = j
+        elif c in ' \t\r':
+            if out and out[-1] not in (' ', '\n'):
+                out.append(' ')
+            i += 1
+        elif c == '\n':
+            while out and out[-1] == ' ':
+                out.pop()
+            if out and out[-1] != '\n':
+                out.append('\n')
+            i += 1
+        else:
+            if out and out[-1] == ' ' and (len(out) == 1 or out[-2] == '\n'):
+                out.pop()  # Indentation
+            out.append(c)
+            i += 1
+
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+# ---------- build ----------
+
+def _source_files():
+    for root, dirs, files in os.walk(STATIC_DIR):
+        if os.path.abspath(root).startswith(DIST_DIR):
+            continue
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != DIST_DIR]
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            yield os.path.relpath(path, STATIC_DIR).replace(os.sep, '/'), path
+
+
+def _fingerprinted(name, data):
+    digest = hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+    stem, ext = os.path.splitext(name)
+    return f'{stem}.{digest}{ext}'
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def build(verbose=True):
+    """Build static/dist and its manifest; returns the manifest"""
+    import gzip
+    try:
+        import brotli
+    except ImportError:  # Optional dependency
+        brotli = None
+
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+
+    manifest = {}
+    sources = {}
+    for name, path in _source_files():
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = raw
+        ext = os.path.splitext(name)[1].lower()
+        if ext in MINIFIERS:
+            data = MINIFIERS[ext](raw.decode('utf-8')).encode('utf-8')
+
+        built = _fingerprinted(name, data)
+        target = os.path.join(DIST_DIR, built)
+        _write(target, data)
+
+        if ext in PRECOMPRESS_EXTENSIONS and len(data) >= PRECOMPRESS_MIN_SIZE:
+            _write(target + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                _write(target + '.br', brotli.compress(data, quality=11))
+
+        manifest[name] = f'{DIST_NAME}/{built}'
+        sources[name] = hashlib.sha256(raw).hexdigest()
+        if verbose:
+            print(f"{name:<32} {len(raw):>8} -> {len(data):>8} bytes  {manifest[name]}")
+
+    _write(MANIFEST_PATH, json.dumps({'files': manifest, 'sources': sources}, indent=2, sort_keys=True).encode('utf-8'))
+    update_vercel_routes()
+    return manifest
+
+
+def clean():
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+
+
+def update_vercel_routes():
+    """Serve /static/dist/ from Vercel's CDN with immutable caching (idempotent)"""
+    if not os.path.exists(VERCEL_CONFIG):
+        return
+    with open(VERCEL_CONFIG, newline='') as f:
+        raw = f.read()
+    newline = '\r\n' if '\r\n' in raw else '\n'
+    config = json.loads(raw)
+
+    route = {
+        'src': f'/static/{DIST_NAME}/(.*)',
+        'headers': {'Cache-Control': f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'},
+        'dest': f'/static/{DIST_NAME}/$1'
+    }
+    routes = [r for r in config.get('routes', []) if r.get('src') != route['src']]
+    config['routes'] = [route] + routes
+
+    text = json.dumps(config, indent=4, ensure_ascii=False)
+    with open(VERCEL_CONFIG, 'w', newline='') as f:
+        f.write(text.replace('\n', newline))
+
+
+# ---------- runtime ----------
+
+class AssetManifest:
+    """Maps static filenames to their fingerprinted builds"""
+
+    def __init__(self, check_sources=False):
+        self.files = {}
+        try:
+            with open(MANIFEST_PATH) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.files = data.get('files', {})
+
+        if check_sources:
+            # Development: fall back to sources edited since the last build
+            for name, digest in data.get('sources', {}).items():
+                try:
+                    with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+                        current = hashlib.sha256(f.read()).hexdigest()
+                except OSError:
+                    current = None
+                if current != digest:
+                    self.files.pop(name, None)
+
+    def resolve(self, filename):
+        return self.files.get(filename, filename)
+
+
+def init_app(app):
+    """Fingerprint url_for('static', ...) and serve static/dist with immutable caching"""
+    manifest = AssetManifest(check_sources=app.debug)
+    app.extensions['assets'] = manifest
+
+    @app.url_defaults
+    def fingerprint_static_urls(endpoint, values):
+        if endpoint == 'static' and 'filename' in values:
+            values['filename'] = manifest.resolve(values['filename'])
+
+    @app.route(f'/static/{DIST_NAME}/<path:filename>', endpoint='static_dist')
+    def static_dist(filename):
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        encodings = request.accept_encodings
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if encodings[encoding] and os.path.isfile(os.path.join(DIST_DIR, filename + suffix)):
+                response = send_from_directory(DIST_DIR, filename + suffix, mimetype=mimetype,
+                                               max_age=IMMUTABLE_MAX_AGE)
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            response = send_from_directory(DIST_DIR, filename, mimetype=mimetype, max_age=IMMUTABLE_MAX_AGE)
+        response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build fingerprinted, minified and precompressed static assets')
+    parser.add_argument('command', choices=['build', 'clean'])
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        files = build()
+        print(f"Built {len(files)} assets into {os.path.relpath(DIST_DIR, BASE_DIR)}")
+    else:
+        clean()
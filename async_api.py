@@ -0,0 +1,389 @@
+"""
+Async ASGI front end for the exam hot path
+
+Under WSGI every in-flight request holds a worker thread while it waits on
+MongoDB. This module serves the four routes every student hits during an
+exam -- start_exam, save_answer, submit_exam and the result page -- as
+asyncio handlers with an async MongoDB driver, so a single worker process
+can keep hundreds of exam sessions waiting on the database at once.
+Everything else (pages, admin, the exam paper) is passed through to the
+Flask app, which this module mounts, so both stacks run side by side in one
+process:
+
+    uvicorn async_api:app --workers 2
+
+Both stacks share the business logic in models.Exam/Student (document
+builders, scoring, result summaries), the signed Flask session cookie, the
+question bank snapshot and the in-process exam/student caches, so a student
+can move between them mid-exam. The WSGI deployment (app.py on Vercel) is
+unchanged.
+
+The native asyncio driver in pymongo (4.9+) is used when installed, Motor
+otherwise. Requires the packages in requirements-async.txt.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from functools import wraps
+from urllib.parse import unquote
+
+from a2wsgi import WSGIMiddleware
+from flask import render_template
+from itsdangerous import BadSignature
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
+from starlette.routing import Mount, Route
+from werkzeug.http import http_date, is_resource_modified
+
+try:
+    from pymongo import AsyncMongoClient  # Native asyncio driver (pymongo >= 4.9)
+except ImportError:
+    from motor.motor_asyncio import AsyncIOMotorClient as AsyncMongoClient
+
+import app as flask_module
+import idempotency
+import question_bank
+from config import Config
+from models import Exam, Question, Student, SubjectCatalog, exam_cache, student_cache
+
+flask_app = flask_module.app
+_urls = flask_app.url_map.bind('')
+
+
+class AsyncDatabase:
+    """Lazily created async client; it must be created inside the running event loop"""
+
+    def __init__(self):
+        self._client = None
+
+    @property
+    def db(self):
+        if self._client is None:
+            self._client = AsyncMongoClient(
+                Config.MONGO_URI,
+                serverSelectionTimeoutMS=5000,
+                connectTimeoutMS=5000,
+                socketTimeoutMS=5000,
+                maxPoolSize=Config.ASYNC_MONGO_POOL_SIZE
+            )
+        return self._client[Config.DB_NAME]
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+database = AsyncDatabase()
+
+
+class BSONJSONResponse(JSONResponse):
+    """JSON response encoded by the Flask app's provider (ObjectId, datetime, orjson)"""
+
+    def render(self, content):
+        return flask_app.json.dumps(content).encode('utf-8')
+
+
+# ==================== SESSION ====================
+
+def load_session(request):
+    """The Flask session of a request, read from its signed cookie"""
+    cookie = request.cookies.get(flask_app.config['SESSION_COOKIE_NAME'])
+    if not cookie:
+        return {}
+    serializer = flask_app.session_interface.get_signing_serializer(flask_app)
+    try:
+        return dict(serializer.loads(cookie, max_age=int(flask_app.permanent_session_lifetime.total_seconds())))
+    except BadSignature:
+        return {}
+
+
+async def current_student(session):
+    """Same rules as app.current_student(); a stale profile is re-read without touching the cookie"""
+    roll_number = session.get('student_roll')
+    if not roll_number:
+        return None
+    profile = flask_module.session_profile(session)
+    if profile is not None:
+        return profile
+
+    projection = dict.fromkeys(flask_module.STUDENT_PROFILE_FIELDS, 1)
+    student = await database.db.students.find_one({'roll_number': roll_number}, projection)
+    if not student:
+        return None
+    return {field: student.get(field) for field in flask_module.STUDENT_PROFILE_FIELDS}
+
+
+def login_required(handler):
+    @wraps(handler)
+    async def wrapper(request):
+        student = await current_student(load_session(request))
+        if student is None:
+            return RedirectResponse(_urls.build('login'), status_code=302)
+        request.state.student = student
+        return await handler(request)
+    return wrapper
+
+
+def idempotent(scope):
+    """Same Idempotency-Key handling as the Flask routes, through the shared flask_module.idempotency store"""
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(request):
+            store = flask_module.idempotency
+            if not store.config['IDEMPOTENCY_ENABLED']:
+                return await handler(request)
+            key = request.headers.get(idempotency.HEADER)
+            if not key:
+                store.count(scope, 'without_key')
+                return await handler(request)
+            if len(key) > idempotency.MAX_KEY_LENGTH:
+                return BSONJSONResponse({'success': False, 'message': 'Idempotency key too long'}, status_code=400)
+
+            owner = request.state.student['roll_number']
+            fingerprint = idempotency.fingerprint(await request.body())
+            claimed = False
+            try:
+                # Durable scopes claim the key in MongoDB through the sync client; a failed claim is released by begin()
+                outcome = await run_in_threadpool(store.begin, scope, owner, key, fingerprint)
+                if outcome.action == 'replay':
+                    return Response(outcome.body, status_code=outcome.status, media_type='application/json',
+                                    headers={'Idempotent-Replayed': 'true'})
+                if outcome.action == 'mismatch':
+                    return BSONJSONResponse({'success': False, 'message': 'Idempotency key reused for a different request'},
+                                            status_code=422)
+                if outcome.action == 'in_progress':
+                    return BSONJSONResponse({'success': False, 'message': 'This request is still being processed'},
+                                            status_code=409, headers={'Retry-After': '1'})
+                claimed = True
+                response = await handler(request)
+            except Exception:
+                if claimed:
+                    await run_in_threadpool(store.complete, scope, owner, key, fingerprint, 500, None)
+                raise
+            await run_in_threadpool(store.complete, scope, owner, key, fingerprint,
+                                    response.status_code, response.body.decode())
+            return response
+        return wrapper
+    return decorator
+
+
+def render(template, status_code=200, **context):
+    # url_for() in the templates needs a Flask request context
+    with flask_app.test_request_context():
+        return HTMLResponse(render_template(template, **context), status_code=status_code)
+
+
+# ==================== EXAM ROUTES ====================
+
+def not_enough_questions(subject, found):
+    return BSONJSONResponse({
+        'success': False,
+        'message': f'Not enough questions in database for subject {subject}. Need {Config.TOTAL_QUESTIONS}, found {found}'
+    }, status_code=500)
+
+
+def queued(slot):
+    retry_after = Config.ADMISSION_RETRY_AFTER
+    return BSONJSONResponse({
+        'success': False,
+        'queued': True,
+        'ticket': slot.ticket,
+        'position': slot.position,
+        'estimated_wait': round(slot.estimated_wait),
+        'retry_after': retry_after
+    }, status_code=202, headers={'Retry-After': str(retry_after), 'Cache-Control': 'no-store'})
+
+
+@login_required
+async def start_exam(request):
+    """Start exam and get questions for a specific subject"""
+    try:
+        subject = unquote(request.path_params['subject'])
+        student_roll = request.state.student['roll_number']
+        db = database.db
+        paper_url = _urls.build('exam_paper', {'subject': subject})
+
+        existing_exam = await db.exams.find_one({'student_roll': student_roll, 'subject': subject})
+        if existing_exam:
+            if existing_exam['status'] == 'completed':
+                return BSONJSONResponse({
+                    'success': False,
+                    'message': 'Exam already completed for this subject',
+                    'redirect': '/result/' + student_roll
+                }, status_code=403)
+
+            return BSONJSONResponse({
+                'success': True,
+                'paper_url': paper_url,
+                'remaining_time': Exam.remaining_seconds(existing_exam),
+                'saved_answers': existing_exam.get('answers', {})
+            })
+
+        # Same admission queue as the Flask route; the global scope queries MongoDB synchronously
+        admission = flask_module.exam_admission
+        slot = None
+        if admission is not None:
+            try:
+                ticket = (await request.json()).get('ticket')
+            except (ValueError, AttributeError):
+                ticket = None
+            slot = await run_in_threadpool(admission.acquire, ticket)
+            if not slot.admitted:
+                return queued(slot)
+
+        try:
+            # The catalog and snapshot are in memory; a refresh may query the database synchronously
+            available = await run_in_threadpool(SubjectCatalog.count, subject)
+            if available < Config.TOTAL_QUESTIONS:
+                return not_enough_questions(subject, available)
+
+            questions = await run_in_threadpool(question_bank.sample_questions, subject, Config.TOTAL_QUESTIONS)
+            if len(questions) < Config.TOTAL_QUESTIONS:
+                return not_enough_questions(subject, len(questions))
+
+            exam = Exam.new_document(student_roll, subject, questions)
+            await db.exams.insert_one(exam)
+            exam_cache.invalidate_tag(student_roll)
+
+            return BSONJSONResponse({
+                'success': True,
+                'paper_url': paper_url,
+                'remaining_time': Config.EXAM_DURATION_MINUTES * 60,
+                'saved_answers': {}
+            })
+        finally:
+            if slot is not None:
+                await run_in_threadpool(admission.release, slot)
+
+    except Exception as e:
+        return BSONJSONResponse({'success': False, 'message': str(e)}, status_code=500)
+
+
+@login_required
+@idempotent('save_answer')
+async def save_answer(request):
+    """Save individual answer"""
+    try:
+        data = await request.json()
+        student_roll = request.state.student['roll_number']
+
+        question_id = data.get('question_id')
+        answer = data.get('answer')
+        seq = data.get('seq')
+
+        if not all([question_id, answer]) or (seq is not None and type(seq) is not int):
+            return BSONJSONResponse({'success': False, 'message': 'Invalid data'}, status_code=400)
+
+        await database.db.exams.update_one(*Exam.answer_update(student_roll, question_id, answer, seq))
+        exam_cache.invalidate_tag(student_roll)
+
+        return BSONJSONResponse({'success': True})
+
+    except Exception as e:
+        return BSONJSONResponse({'success': False, 'message': str(e)}, status_code=500)
+
+
+@login_required
+@idempotent('submit_exam')
+async def submit_exam(request):
+    """Submit exam and calculate results"""
+    try:
+        student_roll = request.state.student['roll_number']
+        db = database.db
+
+        exam = await db.exams.find_one({'student_roll': student_roll, 'status': 'in_progress'})
+        if not exam:
+            return BSONJSONResponse({'success': False, 'message': 'Exam not found'}, status_code=404)
+
+        exam_questions = await db.questions.find(*Question.answer_key_query(exam['questions'])).to_list(None)
+        score, total, percentage, grade = Exam.score(exam, exam_questions)
+
+        await asyncio.gather(
+            db.exams.update_one(*Exam.submit_update(student_roll, score, total, percentage, grade)),
+            db.students.update_one(*Student.exam_taken_update(student_roll))
+        )
+        exam_cache.invalidate_tag(student_roll)
+        student_cache.invalidate_tag(student_roll)
+
+        return BSONJSONResponse({
+            'success': True,
+            'message': 'Exam submitted successfully!',
+            'redirect': '/result/' + student_roll
+        })
+
+    except Exception as e:
+        return BSONJSONResponse({'success': False, 'message': str(e)}, status_code=500)
+
+
+# ==================== RESULT ROUTES ====================
+
+async def result_page(request):
+    """View result page"""
+    try:
+        roll_number = request.path_params['roll_number']
+        db = database.db
+
+        student, exams = await asyncio.gather(
+            db.students.find_one({'roll_number': roll_number}, {'roll_number': 1, 'name': 1, 'email': 1}),
+            db.exams.find({'student_roll': roll_number}).to_list(None)
+        )
+
+        if not student:
+            return render('error.html', 404, message='Student not found')
+        if not exams:
+            return render('error.html', 404, message='No exams found')
+
+        results = Exam.result_rows(student, exams)
+        if not results:
+            return render('error.html', 404, message='Result not available yet')
+
+        # Same validators as the Flask route, so cached copies stay valid across stacks
+        last_modified = max(exam['submit_time'] for exam in exams if exam['status'] == 'completed')
+        etag = flask_module.make_etag('result', flask_module.template_stamp('result.html'), results, student)
+        headers = {
+            'ETag': f'"{etag}"',
+            'Last-Modified': http_date(last_modified),
+            'Cache-Control': 'private, no-cache'
+        }
+        environ = {
+            'REQUEST_METHOD': request.method,
+            'HTTP_IF_NONE_MATCH': request.headers.get('if-none-match', ''),
+            'HTTP_IF_MODIFIED_SINCE': request.headers.get('if-modified-since', '')
+        }
+        if not is_resource_modified(environ, etag=etag, last_modified=last_modified):
+            return Response(status_code=304, headers=headers)
+
+        response = render('result.html', results=results, student=student)
+        response.headers.update(headers)
+        return response
+
+    except Exception as e:
+        return render('error.html', 500, message=str(e))
+
+
+# ==================== APPLICATION ====================
+
+@asynccontextmanager
+async def lifespan(app):
+    # Indexes and the default admin, as on the first Flask request
+    await run_in_threadpool(flask_module.ensure_initialized)
+    yield
+    database.close()
+
+
+app = Starlette(
+    routes=[
+        Route('/api/start_exam/{subject}', start_exam, methods=['POST']),
+        Route('/api/save_answer', save_answer, methods=['POST']),
+        Route('/api/submit_exam', submit_exam, methods=['POST']),
+        Route('/result/{roll_number}', result_page, methods=['GET', 'HEAD']),
+        Mount('/', app=WSGIMiddleware(flask_app))
+    ],
+    # Responses already compressed by the Flask app pass through untouched
+    middleware=[Middleware(GZipMiddleware, minimum_size=Config.COMPRESS_MIN_SIZE)],
+    lifespan=lifespan
+)
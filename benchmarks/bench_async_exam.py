@@ -0,0 +1,245 @@
+"""
+Benchmark: concurrent exam sessions per worker, threaded Flask vs async ASGI
+
+Every simulated student starts an exam, saves --answers answers and submits,
+all students at once. The threaded path runs the Flask app in a pool of
+--threads workers (a gthread worker) with the app's own MongoDB pool
+(--sync-pool, maxPoolSize=1 by default as on Vercel); the async path runs
+async_api.app in one event loop. Reported per concurrency level: sessions
+per second, request latency percentiles and the peak number of threads.
+
+Needs a MongoDB server and the packages in requirements-async.txt. Data goes
+to a scratch database that is dropped afterwards. Atlas round trips are
+what make threads pile up, so --latency-ms routes the driver connections
+through a local proxy that delays every message by that much (mongodb://
+URIs only).
+
+Usage:
+    python benchmarks/bench_async_exam.py --mongo-uri mongodb://localhost:27017 --latency-ms 20
+    python benchmarks/bench_async_exam.py --sessions 50,200,500 --threads 32
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+BENCH_DB = 'olevel_exam_bench'
+SUBJECT = 'Benchmark'
+
+
+class LatencyProxy:
+    """TCP proxy that delays each message by a fixed time, standing in for the network path to Atlas"""
+
+    def __init__(self, host, port, delay):
+        self.target = (host, port)
+        self.delay = delay
+        self.port = None
+        self._ready = threading.Event()
+
+    def start(self):
+        threading.Thread(target=lambda: asyncio.run(self._serve()), daemon=True).start()
+        self._ready.wait()
+        return self
+
+    async def _serve(self):
+        server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, client_reader, client_writer):
+        upstream_reader, upstream_writer = await asyncio.open_connection(*self.target)
+        await asyncio.gather(self._pipe(client_reader, upstream_writer),
+                             self._pipe(upstream_reader, client_writer),
+                             return_exceptions=True)
+
+    async def _pipe(self, reader, writer):
+        try:
+            while data := await reader.read(65536):
+                await asyncio.sleep(self.delay)
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+def proxied_uri(uri, delay):
+    parts = urlsplit(uri)
+    if parts.scheme != 'mongodb' or ',' in parts.netloc:
+        raise SystemExit('--latency-ms needs a single-host mongodb:// URI')
+    proxy = LatencyProxy(parts.hostname, parts.port or 27017, delay).start()
+    auth = parts.netloc.rpartition('@')[0]
+    netloc = f"{auth}@127.0.0.1:{proxy.port}" if auth else f"127.0.0.1:{proxy.port}"
+    return urlunsplit(parts._replace(netloc=netloc))
+
+
+class ThreadPeak:
+    """Samples threading.active_count() while a run is in progress"""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        def sample():
+            while not self._stop.wait(0.005):
+                self.peak = max(self.peak, threading.active_count())
+        self._thread = threading.Thread(target=sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def seed(db, sessions):
+    from bench_question_bank import synthetic_questions
+    from models import Question
+
+    db.client.drop_database(BENCH_DB)
+    questions = list(synthetic_questions(Config.TOTAL_QUESTIONS * 2))
+    for question in questions:
+        question['subject'] = SUBJECT
+    db.questions.insert_many(questions)
+    db.students.insert_many([
+        {'roll_number': f'BENCH{i:05d}', 'name': f'Student {i}', 'subject': SUBJECT, 'exam_taken': False}
+        for i in range(sessions)
+    ])
+    Question.notify_changed()
+
+
+def session_cookies(flask_app, sessions):
+    serializer = flask_app.session_interface.get_signing_serializer(flask_app)
+    return [serializer.dumps({
+        'student_roll': f'BENCH{i:05d}', 'student_name': f'Student {i}',
+        'student_subject': SUBJECT, 'profile_loaded_at': time.time()
+    }) for i in range(sessions)]
+
+
+def reset_exams(db):
+    from models import exam_cache, student_cache
+    db.exams.delete_many({})
+    exam_cache.clear()
+    student_cache.clear()
+
+
+def summarize(label, sessions, elapsed, latencies, peak_threads, failures):
+    latencies.sort()
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+    print(f"{label:<8} {sessions:>8} {sessions / elapsed:>12.1f} {pct(0.5):>9.1f} {pct(0.95):>9.1f} "
+          f"{pct(0.99):>9.1f} {peak_threads:>8} {failures:>8}")
+
+
+def run_threaded(flask_app, cookies, answers, threads):
+    latencies, failures = [], []
+    cookie_name = flask_app.config['SESSION_COOKIE_NAME']
+
+    def student(cookie):
+        client = flask_app.test_client()
+        client.set_cookie(cookie_name, cookie)
+        def call(method, path, **kwargs):
+            started = time.perf_counter()
+            response = getattr(client, method)(path, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                failures.append(response.status_code)
+            return response
+        call('post', f'/api/start_exam/{SUBJECT}')
+        exam_questions = client.get(f'/api/exam/{SUBJECT}/paper').get_json()['questions']
+        for question in exam_questions[:answers]:
+            call('post', '/api/save_answer', json={'question_id': question['id'], 'answer': 'A'})
+        call('post', '/api/submit_exam')
+
+    with ThreadPeak() as peak, ThreadPoolExecutor(max_workers=threads) as pool:
+        started = time.perf_counter()
+        list(pool.map(student, cookies))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, peak.peak, len(failures)
+
+
+async def run_async(asgi_app, flask_app, cookies, answers):
+    import httpx
+
+    latencies, failures = [], []
+    cookie_name = flask_app.config['SESSION_COOKIE_NAME']
+    transport = httpx.ASGITransport(app=asgi_app)
+
+    async def student(cookie):
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench',
+                                     cookies={cookie_name: cookie}) as client:
+            async def call(method, path, **kwargs):
+                started = time.perf_counter()
+                response = await getattr(client, method)(path, **kwargs)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    failures.append(response.status_code)
+                return response
+            await call('post', f'/api/start_exam/{SUBJECT}')
+            exam_questions = (await client.get(f'/api/exam/{SUBJECT}/paper')).json()['questions']
+            for question in exam_questions[:answers]:
+                await call('post', '/api/save_answer', json={'question_id': question['id'], 'answer': 'A'})
+            await call('post', '/api/submit_exam')
+
+    with ThreadPeak() as peak:
+        started = time.perf_counter()
+        await asyncio.gather(*(student(cookie) for cookie in cookies))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, peak.peak, len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent exam sessions: threaded Flask vs async ASGI')
+    parser.add_argument('--mongo-uri', default=os.environ.get('MONGO_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--latency-ms', type=float, default=0, help='Added delay per message to MongoDB')
+    parser.add_argument('--sessions', default='50,200,500', help='Comma-separated concurrency levels')
+    parser.add_argument('--answers', type=int, default=10, help='save_answer calls per session')
+    parser.add_argument('--threads', type=int, default=32, help='Threads of the threaded worker')
+    parser.add_argument('--sync-pool', type=int, default=1, help='maxPoolSize of the Flask app')
+    args = parser.parse_args()
+
+    Config.MONGO_URI = proxied_uri(args.mongo_uri, args.latency_ms / 1000) if args.latency_ms else args.mongo_uri
+    Config.DB_NAME = BENCH_DB
+    Config.QUESTION_SNAPSHOT_PATH = os.path.join(tempfile.mkdtemp(), 'bench.snapshot')  # Not the shared one
+
+    import async_api
+    from models import db_manager
+
+    levels = [int(level) for level in args.sessions.split(',')]
+    db_manager.connect(max_pool_size=args.sync_pool)
+    db = db_manager.get_db()
+    seed(db, max(levels))
+    async_api.flask_module.ensure_initialized()
+    flask_app = async_api.flask_app
+    cookies = session_cookies(flask_app, max(levels))
+
+    print(f"latency {args.latency_ms:g} ms per message, {args.answers} answers per session, "
+          f"{args.threads} threads / pool {args.sync_pool} (threaded), "
+          f"pool {Config.ASYNC_MONGO_POOL_SIZE} (async)\n")
+    print(f"{'path':<8} {'sessions':>8} {'sessions/s':>12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'threads':>8} {'failed':>8}")
+    try:
+        for level in levels:
+            reset_exams(db)
+            summarize('threaded', level, *run_threaded(flask_app, cookies[:level], args.answers, args.threads))
+            reset_exams(db)
+            summarize('async', level, *asyncio.run(run_async(async_api.app, flask_app, cookies[:level], args.answers)))
+            async_api.database.close()  # Bound to the finished event loop
+    finally:
+        db.client.drop_database(BENCH_DB)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: cold-start import time, checked against the budget in startup.py
+
+Runs `import app` in fresh interpreters and reports the median wall time,
+plus (from one extra `-X importtime` run) how much of it is spent in this
+repository's own modules and whether any of startup.LAZY_MODULES got
+imported eagerly. Exits with status 1 when a budget is exceeded, so it can
+run as a regression check after changes to imports or module-level setup.
+
+Usage:
+    python benchmarks/bench_cold_start.py --runs 7
+    python benchmarks/bench_cold_start.py --budget-ms 250 --own-budget-ms 30
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import startup
+
+TIMED_IMPORT = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import app\n"
+    "print('IMPORT_MS', (time.perf_counter() - started) * 1000)\n"
+)
+
+
+def import_ms():
+    result = subprocess.run([sys.executable, '-c', TIMED_IMPORT], cwd=BASE_DIR,
+                            capture_output=True, text=True, check=True)
+    line = [l for l in result.stdout.splitlines() if l.startswith('IMPORT_MS ')][-1]
+    return float(line.split()[1])
+
+
+def import_breakdown():
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=BASE_DIR,
+                            capture_output=True, text=True, check=True)
+    rows = startup.parse_importtime(result.stderr)
+    own = startup.own_modules()
+    own_ms = sum(self_us for name, self_us, _, _ in rows if name.split('.')[0] in own) / 1000
+    loaded = {name for name, _, _, _ in rows}
+    return own_ms, [name for name in startup.LAZY_MODULES if name in loaded]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--budget-ms', type=float, default=startup.IMPORT_BUDGET_MS)
+    parser.add_argument('--own-budget-ms', type=float, default=startup.OWN_IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    import_ms()  # Warm the OS file cache and __pycache__
+    timings = [import_ms() for _ in range(args.runs)]
+    median = statistics.median(timings)
+    own_ms, eager = import_breakdown()
+
+    print(f"import app    median {median:7.1f} ms  min {min(timings):7.1f}  max {max(timings):7.1f}"
+          f"  (budget {args.budget_ms:.0f} ms)")
+    print(f"own modules          {own_ms:7.1f} ms under -X importtime  (budget {args.own_budget_ms:.0f} ms)")
+
+    failures = []
+    if median > args.budget_ms:
+        failures.append(f"import time {median:.1f} ms exceeds {args.budget_ms:.0f} ms")
+    if own_ms > args.own_budget_ms:
+        failures.append(f"own module import time {own_ms:.1f} ms exceeds {args.own_budget_ms:.0f} ms")
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: within the cold-start budget")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
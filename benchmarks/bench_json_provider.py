@@ -0,0 +1,80 @@
+"""
+Benchmark: jsonify with Flask's default provider vs BSONJSONProvider
+
+Encodes a start_exam-sized payload and an admin question listing built from
+question documents. The default provider is timed including the by-hand
+ObjectId/datetime conversion the routes used to do; the BSON-aware provider
+gets the raw documents. Both orjson and the standard library fallback are
+measured.
+
+Usage:
+    python benchmarks/bench_json_provider.py --rounds 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+import json_provider
+from json_provider import BSONJSONProvider
+from bench_question_bank import synthetic_questions
+
+
+EXAM_DOCS = list(synthetic_questions(100))
+LISTING_DOCS = list(synthetic_questions(200, seed=2))
+for _doc in LISTING_DOCS:
+    _doc['created_at'] = datetime.now()
+
+
+def start_exam_payload(raw):
+    return {
+        'success': True,
+        'questions': [{'id': d['_id'] if raw else str(d['_id']), 'question': d['question'],
+                       'options': d['options']} for d in EXAM_DOCS],
+        'remaining_time': 3600,
+        'saved_answers': {}
+    }
+
+
+def admin_listing_payload(raw):
+    questions = [{
+        'id': d['_id'] if raw else str(d['_id']),
+        'question': d['question'],
+        'subject': d['subject'],
+        'options': d['options'],
+        'correct': d['correct'],
+        'created_at': d['created_at'] if raw else d['created_at'].isoformat()
+    } for d in LISTING_DOCS]
+    return {'success': True, 'questions': questions, 'total': 200, 'page': 1, 'pages': 10}
+
+
+def measure(label, provider_factory, raw, rounds):
+    app = Flask(__name__)
+    app.json = provider_factory(app)
+    with app.app_context():
+        for name, build in (('start_exam', start_exam_payload), ('admin listing', admin_listing_payload)):
+            jsonify(build(raw))  # Warm up
+            start = time.perf_counter()
+            for _ in range(rounds):
+                jsonify(build(raw))
+            elapsed = (time.perf_counter() - start) / rounds
+            print(f"{label:<24} {name:<14} {elapsed * 1e6:>9.1f} us/response")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare JSON providers')
+    parser.add_argument('--rounds', type=int, default=1000)
+    args = parser.parse_args()
+
+    measure('flask default', DefaultJSONProvider, False, args.rounds)
+    if json_provider.orjson is not None:
+        measure('BSON provider (orjson)', BSONJSONProvider, True, args.rounds)
+    BSONJSONProvider.fast = False
+    measure('BSON provider (stdlib)', BSONJSONProvider, True, args.rounds)
@@ -0,0 +1,141 @@
+"""
+Memory benchmark: plain question dicts vs the compact QuestionBank
+
+Builds synthetic banks shaped like uploaded questions and measures the
+memory each representation holds with tracemalloc, plus lookup and subject
+slicing times on the compact bank.
+
+With --workers, it also writes a snapshot file and starts that many worker
+processes which either map it or build a private in-memory copy, touch every
+question and report their proportional set size (Linux only). The mapped
+workers share the snapshot pages, so their total stays close to one copy.
+
+Usage:
+    python benchmarks/bench_question_bank.py
+    python benchmarks/bench_question_bank.py --sizes 10000 100000 1000000
+    python benchmarks/bench_question_bank.py --sizes 100000 --workers 4
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson.objectid import ObjectId
+
+from question_bank import QuestionBank, write_snapshot
+
+SUBJECTS = ['M1-R5', 'M2-R5', 'M3-R5', 'M4-R5', 'R1-R5', 'R2-R5', 'R3-R5', 'R4-R5',
+            'Python', 'Web Design', 'IoT', 'Networking', 'Cyber Security', 'Data Science']
+WORDS = ('what which the of is a an in for computer memory program data network '
+         'function output value system file protocol device layer table query').split()
+
+
+def synthetic_questions(count, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        options = [' '.join(rng.choices(WORDS, k=rng.randint(1, 4))) for _ in range(4)]
+        yield {
+            '_id': ObjectId(),
+            'question': ' '.join(rng.choices(WORDS, k=rng.randint(8, 20))) + '?',
+            'options': options,
+            'correct': options[rng.randrange(4)],
+            'subject': rng.choice(SUBJECTS)
+        }
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def run(count):
+    # Both representations are built from the same generator so the
+    # measurement only includes what each one keeps alive.
+    docs, dict_bytes, dict_secs = measure(lambda: list(synthetic_questions(count)))
+    ids = [d['_id'] for d in random.sample(docs, min(1000, count))]
+    del docs
+    bank, bank_bytes, bank_secs = measure(lambda: QuestionBank.from_documents(synthetic_questions(count)))
+
+    start = time.perf_counter()
+    for question_id in ids:
+        bank.get(str(question_id))
+    lookup_us = (time.perf_counter() - start) / len(ids) * 1e6
+
+    start = time.perf_counter()
+    bank.subject_slice(SUBJECTS[0], 0, 100)
+    slice_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{count:>9,}  {dict_bytes / 2**20:>10.1f}  {bank_bytes / 2**20:>10.1f}  "
+          f"{dict_bytes / bank_bytes:>6.1f}x  {dict_secs:>7.2f}s  {bank_secs:>7.2f}s  "
+          f"{lookup_us:>8.1f}  {slice_ms:>8.2f}")
+
+
+def _pss_kib():
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith('Pss:'):
+                return int(line.split()[1])
+    return 0
+
+
+def _worker(path, count, mapped, results):
+    before = _pss_kib()
+    if mapped:
+        bank = QuestionBank.open(path)
+    else:
+        bank = QuestionBank.from_documents(synthetic_questions(count))
+    for subject in SUBJECTS:
+        bank.subject_slice(subject)
+    results.put(_pss_kib() - before)
+    results.get()  # Stay alive until every worker has measured
+
+
+def run_workers(count, workers):
+    path = os.path.join(tempfile.mkdtemp(), 'bench.snapshot')
+    write_snapshot(path, synthetic_questions(count))
+    print(f"\n{count:,} questions, {workers} workers, snapshot {os.path.getsize(path) / 2**20:.1f} MiB")
+    for mapped in (False, True):
+        results = multiprocessing.Queue()
+        procs = [multiprocessing.Process(target=_worker, args=(path, count, mapped, results))
+                 for _ in range(workers)]
+        for proc in procs:
+            proc.start()
+        growth = [results.get() for _ in procs]
+        for _ in procs:
+            results.put(None)
+        for proc in procs:
+            proc.join()
+        label = 'mapped snapshot' if mapped else 'private copies'
+        print(f"    {label:<16} PSS growth {sum(growth) / 1024:>8.1f} MiB total, "
+              f"{sum(growth) / len(growth) / 1024:>7.1f} MiB per worker")
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare question bank memory usage')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--workers', type=int, default=0,
+                        help='also compare worker processes mapping a shared snapshot (Linux)')
+    args = parser.parse_args()
+
+    print(f"{'questions':>9}  {'dicts MiB':>10}  {'bank MiB':>10}  {'saving':>7}  "
+          f"{'build':>8}  {'build':>8}  {'get us':>8}  {'slice ms':>8}")
+    for size in args.sizes:
+        run(size)
+    if args.workers:
+        for size in args.sizes:
+            run_workers(size, args.workers)
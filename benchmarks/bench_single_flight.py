@@ -0,0 +1,140 @@
+"""
+Benchmark: single-flight coalescing of identical concurrent reads
+
+Releases --callers threads at once (a barrier) against Question.count(),
+Student.count() and Question.get_subjects() (with a cold subject catalog),
+the reads that stampede when a dashboard cache expires at peak time, and
+counts the MongoDB commands actually sent with a pymongo command listener.
+Each read is run twice: through the model method (coalesced by
+models.db_flight) and as the bare query. Exits with status 1 if a
+coalesced round sent more than one command.
+
+Needs a MongoDB server; data goes to a scratch database that is dropped
+afterwards. --latency-ms (default 20) delays every message through a local
+proxy so the callers overlap the way they do against Atlas.
+
+Usage:
+    python benchmarks/bench_single_flight.py --mongo-uri mongodb://localhost:27017 --callers 50
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import monitoring
+
+from bench_async_exam import proxied_uri
+from config import Config
+
+BENCH_DB = 'olevel_exam_bench'
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts commands by (name, collection)"""
+
+    def __init__(self):
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        with self._lock:
+            self.counts[(event.command_name, collection)] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def take(self):
+        with self._lock:
+            counts, self.counts = self.counts, Counter()
+        return counts
+
+
+def run_round(fn, callers, before=None):
+    """Run fn in callers threads released together; returns (seconds, errors)"""
+    barrier = threading.Barrier(callers)
+    errors = []
+
+    def caller():
+        barrier.wait()
+        try:
+            fn()
+        except Exception as e:
+            errors.append(e)
+
+    if before:
+        before()
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Single-flight coalescing of concurrent identical reads')
+    parser.add_argument('--mongo-uri', default=os.environ.get('MONGO_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--latency-ms', type=float, default=20, help='Added delay per message to MongoDB')
+    parser.add_argument('--callers', type=int, default=50, help='Concurrent callers per round')
+    parser.add_argument('--pool', type=int, default=10, help='maxPoolSize of the client')
+    args = parser.parse_args()
+
+    counter = CommandCounter()
+    monitoring.register(counter)   # Before the client is created
+    Config.MONGO_URI = proxied_uri(args.mongo_uri, args.latency_ms / 1000) if args.latency_ms else args.mongo_uri
+    Config.DB_NAME = BENCH_DB
+
+    from bench_question_bank import synthetic_questions
+    from models import Question, Student, SubjectCatalog, db_flight, db_manager
+
+    db_manager.connect(max_pool_size=args.pool)
+    db = db_manager.get_db()
+    db.client.drop_database(BENCH_DB)
+    db.questions.insert_many(list(synthetic_questions(2000)))
+    db.students.insert_many([{'roll_number': f'BENCH{i:05d}', 'name': f'Student {i}'} for i in range(500)])
+
+    reads = [
+        ('Question.count()', Question.count, lambda: db.questions.count_documents({}), None),
+        ('Student.count()', Student.count, lambda: db.students.count_documents({}), None),
+        ('Question.get_subjects()', Question.get_subjects,
+         lambda: list(db.questions.aggregate([{'$group': {'_id': '$subject', 'count': {'$sum': 1}}}])),
+         SubjectCatalog.invalidate),
+    ]
+
+    print(f"{args.callers} concurrent callers, latency {args.latency_ms:g} ms per message, pool {args.pool}\n")
+    print(f"{'read':<26} {'path':<10} {'commands':>9} {'ms':>9} {'errors':>7}")
+    failures = []
+    try:
+        for label, coalesced, bare, before in reads:
+            for path, fn in (('bare', bare), ('coalesced', coalesced)):
+                counter.take()
+                seconds, errors = run_round(fn, args.callers, before=before)
+                commands = sum(counter.take().values())
+                print(f"{label:<26} {path:<10} {commands:>9} {seconds * 1000:9.1f} {len(errors):>7}")
+                if path == 'coalesced' and commands > 1:
+                    failures.append(f"{label} sent {commands} commands for {args.callers} concurrent callers")
+                if errors:
+                    failures.append(f"{label} ({path}): {errors[0]!r}")
+        print(f"\nsingle-flight stats: {db_flight.stats()}")
+    finally:
+        db.client.drop_database(BENCH_DB)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: each coalesced round sent one command")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Benchmark: exam paper response assembly
+
+Compares building the exam paper the old way (decode question documents,
+build a dict per question, jsonify) with joining the pre-serialized fragments
+stored in the question bank snapshot, as the paper endpoint does. Reports responses per second, MB/s of response body and CPU
+time per response.
+
+Usage:
+    python benchmarks/bench_start_exam_payload.py
+    python benchmarks/bench_start_exam_payload.py --questions 100 --bank 50000 --rounds 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import jsonify
+
+from app import app, paper_response
+from question_bank import QuestionBank
+from bench_question_bank import synthetic_questions
+
+
+def jsonify_path(bank, question_ids):
+    exam_questions = [{
+        'id': str(q['_id']),
+        'question': q['question'],
+        'options': q['options']
+    } for q in bank.get_many(question_ids)]
+    return jsonify({'success': True, 'questions': exam_questions})
+
+
+def fragment_path(bank, question_ids):
+    return paper_response([bank.fragment(qid) for qid in question_ids])
+
+
+def measure(name, build, bank, exams, rounds):
+    total_bytes = 0
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for i in range(rounds):
+        total_bytes += len(build(bank, exams[i % len(exams)]).get_data())
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    print(f"{name:<10} {rounds / wall:>9.0f} resp/s  {total_bytes / wall / 2**20:>8.1f} MB/s  "
+          f"{cpu / rounds * 1e6:>8.1f} us CPU/resp  {total_bytes / rounds / 1024:>6.1f} KiB/resp")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare exam paper assembly')
+    parser.add_argument('--bank', type=int, default=20_000, help='questions in the synthetic bank')
+    parser.add_argument('--questions', type=int, default=100, help='questions per exam')
+    parser.add_argument('--rounds', type=int, default=1000)
+    args = parser.parse_args()
+
+    docs = list(synthetic_questions(args.bank))
+    bank = QuestionBank.from_documents(docs)
+    ids = [str(d['_id']) for d in docs]
+    exams = [random.sample(ids, args.questions) for _ in range(50)]
+
+    with app.app_context():
+        # Both paths must produce the same data
+        assert (json.loads(jsonify_path(bank, exams[0]).get_data())
+                == json.loads(fragment_path(bank, exams[0]).get_data()))
+        measure('jsonify', jsonify_path, bank, exams, args.rounds)
+        measure('fragments', fragment_path, bank, exams, args.rounds)
@@ -0,0 +1,231 @@
+"""
+In-process caching helpers
+
+TTLCache is a bounded, thread-safe LRU with per-entry expiry used as a
+read-through cache in front of hot model lookups. Entries can carry a tag
+(e.g. a roll number) so every cached view of one student can be dropped with
+a single invalidate_tag() call when that student's data changes.
+
+A load that races with an invalidation of its tag is not stored, so a
+reader never puts back a value that a concurrent writer just invalidated.
+
+SingleFlight coalesces identical concurrent reads: while one caller runs a
+query for a key, other callers with the same key wait for that call and
+share its result (or its exception) instead of running the query again.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+# All caches and single-flight groups created in this process, for the admin stats endpoint
+_registry = []
+_flights = []
+
+
+class TTLCache:
+    """Bounded LRU cache with TTL, tags and hit/miss statistics"""
+
+    def __init__(self, name, maxsize, ttl):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()   # key -> (expires_at, tag, value)
+        self._tags = {}              # tag -> set(keys)
+        self._generations = {}       # tag -> invalidation counter
+        self._epoch = 0              # bumped by clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        _registry.append(self)
+
+    def _drop(self, key):
+        _, tag, _ = self._data.pop(key)
+        if tag is not None:
+            keys = self._tags.get(tag)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key, default=None):
+        """Cached value for key, or default when missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[0] < time.monotonic():
+                self._drop(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[2])
+
+    def set(self, key, value, tag=None, generation=None):
+        """
+        Store a value
+
+        When generation is given (from generation()), the value is only stored
+        if the tag has not been invalidated since.
+        """
+        with self._lock:
+            if generation is not None and (self._epoch, self._generations.get(tag, 0)) != generation:
+                return
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (time.monotonic() + self.ttl, tag, copy.deepcopy(value))
+            if tag is not None:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+
+    def generation(self, tag):
+        """Token identifying the current invalidation state of tag"""
+        with self._lock:
+            return self._epoch, self._generations.get(tag, 0)
+
+    def get_or_load(self, key, loader, tag=None):
+        """Read-through lookup: return the cached value or call loader() and cache it"""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        generation = self.generation(tag)
+        value = loader()
+        self.set(key, value, tag=tag, generation=generation)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+                self.invalidations += 1
+
+    def invalidate_tag(self, tag):
+        """Drop every entry stored under tag"""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self._tags.clear()
+            self._generations.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+class SingleFlightTimeout(Exception):
+    """Raised to a caller that gave up waiting for another caller's in-flight call"""
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call per key between concurrent callers
+
+    The first caller of a key runs fn(); callers arriving while it runs wait
+    up to timeout seconds for it and get the same result object, so results
+    must be treated as read-only. An exception raised by fn() is raised to
+    every waiting caller. Nothing is kept once the call finishes: this only
+    collapses concurrent duplicates, caching is left to the caller.
+    """
+
+    def __init__(self, name, timeout):
+        self.name = name
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls = {}   # key -> _Call in flight
+        self.calls = 0
+        self.shared = 0
+        self.errors = 0
+        self.timeouts = 0
+        _flights.append(self)
+
+    def do(self, key, fn, timeout=None):
+        """Result of fn(), shared with concurrent callers of the same key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except Exception as e:
+                call.error = e
+                with self._lock:
+                    self.errors += 1
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        elif not call.done.wait(self.timeout if timeout is None else timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise SingleFlightTimeout(f'{self.name}: timed out waiting for in-flight call {key!r}')
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            requests = self.calls + self.shared
+            return {
+                'name': self.name,
+                'in_flight': len(self._calls),
+                'calls': self.calls,
+                'shared': self.shared,
+                'shared_rate': round(self.shared / requests, 4) if requests else 0.0,
+                'errors': self.errors,
+                'timeouts': self.timeouts
+            }
+
+
+def cache_stats():
+    """Statistics for every cache in this process"""
+    return [c.stats() for c in _registry]
+
+
+def single_flight_stats():
+    """Statistics for every single-flight group in this process"""
+    return [f.stats() for f in _flights]
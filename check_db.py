@@ -1,15 +1,17 @@
-from models import Question, db_manager
+from models import Question, SubjectCatalog, db_manager
 
 def check_counts():
     try:
         db_manager.connect()
         print("Total Questions:", Question.count())
-        print("Subjects:", Question.get_subjects())
-        
-        for subject in Question.get_subjects():
-            count = len(Question.get_random_by_subject(subject, 1000))
-            print(f"Subject: {subject}, Count: {count}")
-            
+
+        # One $group aggregation instead of sampling every subject
+        catalog = SubjectCatalog.get()
+        print("Subjects:", sorted(catalog))
+
+        for subject in sorted(catalog):
+            print(f"Subject: {subject}, Count: {catalog[subject]['count']}")
+
     except Exception as e:
         print(f"Error: {e}")
 
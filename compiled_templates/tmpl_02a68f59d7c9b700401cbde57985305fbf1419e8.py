@@ -0,0 +1,20 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'error.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_message = resolve('message')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Error - O Level Exam Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">\n</head>\n\n<body>\n    <!-- Animated Background -->\n    <div class="particles" id="particles"></div>\n\n    <nav class="navbar glass-effect">\n        <div class="container navbar-content">\n            <div class="navbar-brand">\n                <i class="fas fa-satellite-dish" style="color: var(--primary);"></i>\n                <span>O Level <span style="color: var(--primary);">Portal</span></span>\n            </div>\n            <ul class="navbar-nav">\n                <li><a href="/" class="nav-link"><i class="fas fa-home"></i> Home</a></li>\n            </ul>\n        </div>\n    </nav>\n\n    <div class="container" style="display: flex; justify-content: center; align-items: center; min-height: 80vh;">\n        <div class="glass-card animate-slide-up" style="max-width: 500px; text-align: center; padding: 3rem;">\n            <div style="font-size: 5rem; margin-bottom: 1.5rem; text-shadow: 0 0 30px rgba(255, 59, 48, 0.5);">⚠️</div>\n            <h2 style="color: #ff3b30; margin-bottom: 1rem; font-size: 2rem;">Oops! Something went wrong</h2>\n            <p style="color: rgba(255,255,255,0.7); font-size: 1.1rem; margin-bottom: 2.5rem; line-height: 1.6;">\n                '
+    yield escape((undefined(name='message') if l_0_message is missing else l_0_message))
+    yield '\n            </p>\n            <a href="/" class="btn btn-primary"\n                style="background: linear-gradient(135deg, #00C6FF 0%, #0072FF 100%); width: 100%;">\n                <i class="fas fa-arrow-left" style="margin-right: 0.5rem;"></i> Return to Home\n            </a>\n        </div>\n    </div>\n\n    <script>\n        // Particle Animation\n        function createParticles() {\n            const particlesContainer = document.getElementById(\'particles\');\n            const particleCount = 50;\n\n            for (let i = 0; i < particleCount; i++) {\n                const particle = document.createElement(\'div\');\n                particle.classList.add(\'particle\');\n\n                const size = Math.random() * 3 + 1;\n                particle.style.width = `${size}px`;\n                particle.style.height = `${size}px`;\n\n                particle.style.left = `${Math.random() * 100}%`;\n                particle.style.top = `${Math.random() * 100}%`;\n\n                const duration = Math.random() * 20 + 10;\n                particle.style.animationDuration = `${duration}s`;\n                particle.style.animationDelay = `${Math.random() * 5}s`;\n\n                particlesContainer.appendChild(particle);\n            }\n        }\n\n        window.addEventListener(\'load\', createParticles);\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=14&34=16'
\ No newline at end of file
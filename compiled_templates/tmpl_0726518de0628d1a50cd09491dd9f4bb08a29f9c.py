@@ -0,0 +1,17 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin_reset_exam.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Reset Exam - Admin Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">\n</head>\n\n<body>\n    <nav class="navbar">\n        <div class="container navbar-content">\n            <div class="navbar-brand">🎓 Admin Portal</div>\n            <ul class="navbar-nav">\n                <li><a href="/admin/dashboard" class="nav-link">Dashboard</a></li>\n                <li><a href="/admin/logout" class="nav-link">Logout</a></li>\n            </ul>\n        </div>\n    </nav>\n\n    <section class="section">\n        <div class="container" style="max-width: 600px;">\n            <div class="glass-card">\n                <h2 class="text-center" style="margin-bottom: 2rem;">Reset Student Exam</h2>\n                <p class="text-center" style="color: var(--text-muted); margin-bottom: 2rem;">\n                    Allow a student to retake an exam for a specific subject.\n                </p>\n\n                <form id="resetExamForm">\n                    <div class="form-group">\n                        <label for="resetRoll" class="form-label">Student Roll Number</label>\n                        <input type="text" id="resetRoll" name="student_roll" class="form-input" required\n                            placeholder="e.g. OL20250001">\n                    </div>\n                    <div class="form-group">\n                        <label for="resetSubject" class="form-label">Subject</label>\n                        <select id="resetSubject" name="subject" class="form-input" required>\n                            <option value="" disabled selected>Select Subject</option>\n                            <option value="Python">Python</option>\n                            <option value="Web Design">Web Design</option>\n                            <option value="IoT">IoT</option>\n                            <option value="Computer Fundamentals">Computer Fundamentals</option>\n                        </select>\n                    </div>\n                    <button type="submit" class="btn btn-danger" style="width: 100%;">Reset Exam</button>\n                </form>\n            </div>\n        </div>\n    </section>\n\n    <script>\n        document.getElementById(\'resetExamForm\').addEventListener(\'submit\', async function (e) {\n            e.preventDefault();\n\n            const student_roll = document.getElementById(\'resetRoll\').value;\n            const subject = document.getElementById(\'resetSubject\').value;\n\n            if (!confirm(`Are you sure you want to reset the ${subject} exam for student ${student_roll}?`)) {\n                return;\n            }\n\n            try {\n                const response = await fetch(\'/api/admin/reset_exam\', {\n                    method: \'POST\',\n                    headers: { \'Content-Type\': \'application/json\' },\n                    body: JSON.stringify({ student_roll, subject })\n                });\n\n                const data = await response.json();\n\n                if (data.success) {\n                    alert(\'Exam reset successfully!\');\n                    document.getElementById(\'resetExamForm\').reset();\n                } else {\n                    alert(\'Error: \' + data.message);\n                }\n            } catch (error) {\n                alert(\'Failed to reset exam. Please try again.\');\n            }\n        });\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=13'
\ No newline at end of file
@@ -0,0 +1,75 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'result.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_results = resolve('results')
+    try:
+        t_1 = environment.filters['format']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'format' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Result - Dark Satellite</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">\n\n    <style>\n        /* Screen Styles */\n        body {\n            font-family: \'Outfit\', sans-serif;\n            background: #0f172a;\n            color: white;\n            min-height: 100vh;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            padding: 2rem;\n            overflow-x: hidden;\n        }\n\n        .confetti-canvas {\n            position: fixed;\n            top: 0;\n            left: 0;\n            width: 100%;\n            height: 100%;\n            z-index: 1000;\n            pointer-events: none;\n        }\n\n        .result-card-modern {\n            background: rgba(30, 41, 59, 0.8);\n            backdrop-filter: blur(20px);\n            border-radius: 24px;\n            padding: 3rem;\n            width: 100%;\n            max-width: 800px;\n            border: 1px solid rgba(255, 255, 255, 0.1);\n            box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.5);\n            text-align: center;\n            animation: popUp 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.275);\n            position: relative;\n            z-index: 10;\n        }\n\n        @keyframes popUp {\n            from {\n                opacity: 0;\n                transform: scale(0.9) translateY(20px);\n            }\n\n            to {\n                opacity: 1;\n                transform: scale(1) translateY(0);\n            }\n        }\n\n        .score-circle-container {\n            width: 200px;\n            height: 200px;\n            margin: 0 auto 2rem;\n            position: relative;\n        }\n\n        svg {\n            transform: rotate(-90deg);\n            width: 100%;\n            height: 100%;\n        }\n\n        .circle-bg {\n            fill: none;\n            stroke: rgba(255, 255, 255, 0.1);\n            stroke-width: 8;\n        }\n\n        .circle-progress {\n            fill: none;\n            stroke: #10b981;\n            stroke-width: 8;\n            stroke-linecap: round;\n            stroke-dasharray: 440;\n            stroke-dashoffset: 440;\n            /* Start empty */\n            transition: stroke-dashoffset 1.5s ease-out;\n        }\n\n        .score-text {\n            position: absolute;\n            top: 50%;\n            left: 50%;\n            transform: translate(-50%, -50%);\n            text-align: center;\n        }\n\n        .score-percentage {\n            font-size: 3rem;\n            font-weight: 700;\n            color: white;\n            line-height: 1;\n        }\n\n        .score-label {\n            font-size: 0.9rem;\n            color: rgba(255, 255, 255, 0.6);\n            margin-top: 5px;\n        }\n\n        .result-status {\n            font-size: 1.5rem;\n            font-weight: 700;\n            margin-bottom: 2rem;\n            padding: 0.5rem 1.5rem;\n            border-radius: 50px;\n            display: inline-block;\n        }\n\n        .status-pass {\n            background: rgba(16, 185, 129, 0.2);\n            color: #34d399;\n        }\n\n        .status-fail {\n            background: rgba(244, 63, 94, 0.2);\n            color: #f43f5e;\n        }\n\n        .details-grid {\n            display: grid;\n            grid-template-columns: repeat(2, 1fr);\n            gap: 1.5rem;\n            margin-bottom: 2rem;\n            text-align: left;\n        }\n\n        .detail-item {\n            background: rgba(255, 255, 255, 0.03);\n            padding: 1rem;\n            border-radius: 12px;\n        }\n\n        .detail-label {\n            font-size: 0.8rem;\n            color: rgba(255, 255, 255, 0.5);\n            display: block;\n            margin-bottom: 0.3rem;\n        }\n\n        .detail-value {\n            font-size: 1.1rem;\n            font-weight: 500;\n        }\n\n        .action-buttons {\n            display: flex;\n            gap: 1rem;\n            justify-content: center;\n        }\n\n        .btn-action {\n            padding: 1rem 2rem;\n            border-radius: 12px;\n            font-weight: 600;\n            cursor: pointer;\n            border: none;\n            transition: all 0.2s;\n            display: flex;\n            align-items: center;\n            gap: 0.5rem;\n            text-decoration: none;\n        }\n\n        .btn-home {\n            background: rgba(255, 255, 255, 0.1);\n            color: white;\n        }\n\n        .btn-home:hover {\n            background: rgba(255, 255, 255, 0.2);\n        }\n\n        .btn-print {\n            background: #0072FF;\n            color: white;\n        }\n\n        .btn-print:hover {\n            background: #0062d9;\n            transform: translateY(-2px);\n        }\n\n        /* Print Styles - Hides Modern UI, Shows Certificate */\n        .print-certificate {\n            display: none;\n        }\n\n        @media print {\n            body {\n                background: white;\n                color: black;\n                padding: 0;\n                display: block;\n            }\n\n            .result-card-modern,\n            .confetti-canvas {\n                display: none !important;\n            }\n\n            .print-certificate {\n                display: block;\n                width: 100%;\n                height: 100%;\n            }\n\n            .cert-container {\n                border: 2px solid #333;\n                padding: 40px;\n                max-width: 100%;\n                margin: 0;\n            }\n\n            .cert-header {\n                text-align: center;\n                margin-bottom: 40px;\n                border-bottom: 2px solid #333;\n                padding-bottom: 20px;\n            }\n\n            .cert-title {\n                font-size: 24px;\n                font-weight: bold;\n                text-transform: uppercase;\n            }\n\n            .cert-row {\n                display: flex;\n                margin-bottom: 10px;\n            }\n\n            .cert-label {\n                width: 150px;\n                font-weight: bold;\n            }\n\n            .cert-table {\n                width: 100%;\n                border-collapse: collapse;\n                margin-top: 30px;\n            }\n\n            .cert-table th,\n            .cert-table td {\n                border: 1px solid #333;\n                padding: 10px;\n                text-align: center;\n            }\n        }\n    </style>\n</head>\n\n<body>\n    <canvas id="confetti" class="confetti-canvas"></canvas>\n\n    '
+    for l_1_exam in (undefined(name='results') if l_0_results is missing else l_0_results):
+        l_1_student = resolve('student')
+        _loop_vars = {}
+        pass
+        yield '\n    <!-- Modern Card for Screen -->\n    <div class="result-card-modern">\n        <h2 style="margin-bottom: 2rem;">Result Statement</h2>\n\n        <div class="score-circle-container">\n            <svg>\n                <circle class="circle-bg" cx="100" cy="100" r="70"></circle>\n                <circle class="circle-progress" cx="100" cy="100" r="70" id="progress-circle"></circle>\n            </svg>\n            <div class="score-text">\n                <div class="score-percentage">'
+        yield escape(t_1('%.0f', environment.getattr(l_1_exam, 'percentage')))
+        yield '%</div>\n                <div class="score-label">Score</div>\n            </div>\n        </div>\n\n        <div class="result-status '
+        yield escape(('status-pass' if (environment.getattr(l_1_exam, 'status') == 'PASS') else 'status-fail'))
+        yield '">\n            '
+        yield escape(environment.getattr(l_1_exam, 'status'))
+        yield '\n        </div>\n\n        <div class="details-grid">\n            <div class="detail-item">\n                <span class="detail-label">Student Name</span>\n                <span class="detail-value">'
+        yield escape(environment.getattr((undefined(name='student') if l_1_student is missing else l_1_student), 'name'))
+        yield '</span>\n            </div>\n            <div class="detail-item">\n                <span class="detail-label">Subject</span>\n                <span class="detail-value">'
+        yield escape(environment.getattr(l_1_exam, 'subject'))
+        yield '</span>\n            </div>\n            <div class="detail-item">\n                <span class="detail-label">Marks Obtained</span>\n                <span class="detail-value">'
+        yield escape(t_1('%.1f', environment.getattr(l_1_exam, 'score')))
+        yield ' / '
+        yield escape(environment.getattr(l_1_exam, 'total'))
+        yield '</span>\n            </div>\n            <div class="detail-item">\n                <span class="detail-label">Attempted</span>\n                <span class="detail-value">'
+        yield escape(environment.getattr(l_1_exam, 'attempted'))
+        yield ' / '
+        yield escape(environment.getattr(l_1_exam, 'total'))
+        yield '</span>\n            </div>\n            <div class="detail-item">\n                <span class="detail-label" style="color: #34d399;">Correct</span>\n                <span class="detail-value" style="color: #34d399;">'
+        yield escape(environment.getattr(l_1_exam, 'correct'))
+        yield '</span>\n            </div>\n            <div class="detail-item">\n                <span class="detail-label" style="color: #f43f5e;">Wrong</span>\n                <span class="detail-value" style="color: #f43f5e;">'
+        yield escape(environment.getattr(l_1_exam, 'wrong'))
+        yield '</span>\n            </div>\n            <div class="detail-item">\n                <span class="detail-label">Grade Awarded</span>\n                <span class="detail-value">'
+        yield escape(environment.getattr(l_1_exam, 'grade'))
+        yield '</span>\n            </div>\n        </div>\n\n        <div class="action-buttons">\n            <a href="/" class="btn-action btn-home"><i class="fas fa-home"></i> Home</a>\n            <button onclick="window.print()" class="btn-action btn-print"><i class="fas fa-print"></i> Print\n                Statement</button>\n        </div>\n    </div>\n\n    <!-- Hidden Print Certificate -->\n    <div class="print-certificate">\n        <div class="cert-container">\n            <div class="cert-header">\n                <div class="cert-title">National Institute of Electronics and Information Technology</div>\n                <div style="font-size: 18px; margin-top: 5px;">(NIELIT)</div>\n                <div style="font-size: 20px; text-decoration: underline; margin-top: 15px;">Statement of Grades</div>\n            </div>\n\n            <div class="cert-row"><span class="cert-label">Name:</span> <span>'
+        yield escape(environment.getattr((undefined(name='student') if l_1_student is missing else l_1_student), 'name'))
+        yield '</span></div>\n            <div class="cert-row"><span class="cert-label">Roll No:</span> <span>'
+        yield escape(environment.getattr((undefined(name='student') if l_1_student is missing else l_1_student), 'roll_number'))
+        yield '</span></div>\n            <div class="cert-row"><span class="cert-label">Date:</span> <span>'
+        yield escape(environment.getattr(l_1_exam, 'exam_date'))
+        yield '</span></div>\n\n            <table class="cert-table">\n                <thead>\n                    <tr>\n                        <th>Subject</th>\n                        <th>Max Marks</th>\n                        <th>Obtained</th>\n                        <th>Grade</th>\n                        <th>Result</th>\n                    </tr>\n                </thead>\n                <tbody>\n                    <tr>\n                        <td>'
+        yield escape(environment.getattr(l_1_exam, 'subject'))
+        yield '</td>\n                        <td>'
+        yield escape(environment.getattr(l_1_exam, 'total'))
+        yield '</td>\n                        <td>'
+        yield escape(t_1('%.1f', environment.getattr(l_1_exam, 'score')))
+        yield '</td>\n                        <td>'
+        yield escape(environment.getattr(l_1_exam, 'grade'))
+        yield '</td>\n                        <td>'
+        yield escape(environment.getattr(l_1_exam, 'status'))
+        yield '</td>\n                    </tr>\n                </tbody>\n            </table>\n\n            <div style="margin-top: 50px; display: flex; justify-content: space-between; font-size: 12px;">\n                <span>* Computer Generated Report</span>\n                <span>Controller of Examinations</span>\n            </div>\n        </div>\n    </div>\n\n    <script src="https://cdn.jsdelivr.net/npm/canvas-confetti@1.6.0/dist/confetti.browser.min.js"></script>\n    <script>\n        // Progress Circle Animation\n        const percentage = '
+        yield escape(environment.getattr(l_1_exam, 'percentage'))
+        yield ';\n        const circle = document.getElementById(\'progress-circle\');\n        const radius = circle.r.baseVal.value;\n        const circumference = radius * 2 * Math.PI;\n\n        circle.style.strokeDasharray = `${circumference} ${circumference}`;\n        circle.style.strokeDashoffset = circumference;\n\n        // Color based on pass/fail\n        const isPass = "'
+        yield escape(environment.getattr(l_1_exam, 'status'))
+        yield '" === "PASS";\n        circle.style.stroke = isPass ? \'#10b981\' : \'#f43f5e\';\n\n        setTimeout(() => {\n            const offset = circumference - (percentage / 100) * circumference;\n            circle.style.strokeDashoffset = offset;\n        }, 300);\n\n        // Confetti if Pass\n        if (isPass) {\n            const duration = 3000;\n            const end = Date.now() + duration;\n\n            (function frame() {\n                confetti({\n                    particleCount: 5,\n                    angle: 60,\n                    spread: 55,\n                    origin: { x: 0 },\n                    colors: [\'#00C6FF\', \'#0072FF\', \'#ffffff\']\n                });\n                confetti({\n                    particleCount: 5,\n                    angle: 120,\n                    spread: 55,\n                    origin: { x: 1 },\n                    colors: [\'#00C6FF\', \'#0072FF\', \'#ffffff\']\n                });\n\n                if (Date.now() < end) {\n                    requestAnimationFrame(frame);\n                }\n            }());\n        }\n    </script>\n    '
+    l_1_exam = l_1_student = missing
+    yield '\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=20&270=22&281=27&286=29&287=31&293=33&297=35&301=37&305=41&309=45&313=47&317=49&337=51&338=53&339=55&353=57&354=59&355=61&356=63&357=65&372=67&381=69'
\ No newline at end of file
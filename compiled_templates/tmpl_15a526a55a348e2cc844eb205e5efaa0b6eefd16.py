@@ -0,0 +1,81 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'subjects.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_session = resolve('session')
+    l_0_subjects = resolve('subjects')
+    try:
+        t_1 = environment.filters['lower']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'lower' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Select Subject - Dark Satellite</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <style>\n        body {\n            font-family: \'Outfit\', sans-serif;\n            background: #0f172a;\n            color: white;\n            min-height: 100vh;\n            display: flex;\n            flex-direction: column;\n            overflow-x: hidden;\n        }\n\n        .animated-bg {\n            position: fixed;\n            top: 0;\n            left: 0;\n            width: 100%;\n            height: 100%;\n            z-index: -1;\n            background: radial-gradient(circle at 10% 20%, rgba(0, 198, 255, 0.1) 0%, transparent 20%),\n                radial-gradient(circle at 90% 80%, rgba(0, 114, 255, 0.1) 0%, transparent 20%);\n            animation: bg-pulse 10s ease-in-out infinite alternate;\n        }\n\n        @keyframes bg-pulse {\n            0% {\n                opacity: 0.5;\n                transform: scale(1);\n            }\n\n            100% {\n                opacity: 1;\n                transform: scale(1.1);\n            }\n        }\n\n        .container {\n            max-width: 1200px;\n            margin: 0 auto;\n            padding: 2rem;\n            flex: 1;\n            display: flex;\n            flex-direction: column;\n            justify-content: center;\n        }\n\n        .header {\n            text-align: center;\n            margin-bottom: 4rem;\n            animation: fadeInDown 0.8s ease-out;\n        }\n\n        .header h1 {\n            font-size: 3rem;\n            font-weight: 700;\n            margin-bottom: 1rem;\n            background: linear-gradient(135deg, #00C6FF 0%, #0072FF 100%);\n            -webkit-background-clip: text;\n            -webkit-text-fill-color: transparent;\n        }\n\n        .header p {\n            color: rgba(255, 255, 255, 0.6);\n            font-size: 1.2rem;\n        }\n\n        @keyframes fadeInDown {\n            from {\n                opacity: 0;\n                transform: translateY(-30px);\n            }\n\n            to {\n                opacity: 1;\n                transform: translateY(0);\n            }\n        }\n\n        /* Subject Icons Mapping */\n        .icon-python {\n            color: #F7D358;\n        }\n\n        /* Yellow/Gold for Python */\n        .icon-web {\n            color: #00C6FF;\n        }\n\n        /* Blue for Web */\n        .icon-iot {\n            color: #10b981;\n        }\n\n        /* Green for IoT */\n        .icon-default {\n            color: #a78bfa;\n        }\n\n        /* Purple default */\n    </style>\n</head>\n\n<body>\n    <div class="animated-bg"></div>\n\n    <!-- Navbar -->\n    <nav class="navbar">\n        <div class="container navbar-content" style="padding: 1rem 0;">\n            <a href="/" class="navbar-brand">Dark Satellite</a>\n            <div style="display: flex; align-items: center; gap: 1rem;">\n                <span style="color: rgba(255,255,255,0.7); font-size: 0.9rem;">Welcome, '
+    yield escape(context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'student_name', 'Student'))
+    yield '</span>\n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'logout'))
+    yield '" class="btn btn-outline btn-sm"\n                    style="padding: 0.5rem 1rem; border-radius: 20px; font-size: 0.8rem;">\n                    <i class="fas fa-sign-out-alt"></i> Logout\n                </a>\n            </div>\n        </div>\n    </nav>\n\n    <div class="container">\n        <div class="header">\n            <h1>Select Your Domain</h1>\n            <p>Choose a subject to begin your assessment journey</p>\n        </div>\n\n        <div class="card-grid">\n            '
+    l_1_loop = missing
+    for l_1_subject, l_1_loop in LoopContext((undefined(name='subjects') if l_0_subjects is missing else l_0_subjects), undefined):
+        l_1_icon_class = l_1_color_class = missing
+        _loop_vars = {}
+        pass
+        yield '\n            '
+        l_1_icon_class = 'fa-code'
+        _loop_vars['icon_class'] = l_1_icon_class
+        yield '\n            '
+        l_1_color_class = 'icon-default'
+        _loop_vars['color_class'] = l_1_color_class
+        yield '\n\n            '
+        if ('python' in t_1(l_1_subject)):
+            pass
+            yield '\n            '
+            l_1_icon_class = 'fa-brands fa-python'
+            _loop_vars['icon_class'] = l_1_icon_class
+            yield '\n            '
+            l_1_color_class = 'icon-python'
+            _loop_vars['color_class'] = l_1_color_class
+            yield '\n            '
+        elif ('web' in t_1(l_1_subject)):
+            pass
+            yield '\n            '
+            l_1_icon_class = 'fa-solid fa-laptop-code'
+            _loop_vars['icon_class'] = l_1_icon_class
+            yield '\n            '
+            l_1_color_class = 'icon-web'
+            _loop_vars['color_class'] = l_1_color_class
+            yield '\n            '
+        elif ('iot' in t_1(l_1_subject)):
+            pass
+            yield '\n            '
+            l_1_icon_class = 'fa-solid fa-microchip'
+            _loop_vars['icon_class'] = l_1_icon_class
+            yield '\n            '
+            l_1_color_class = 'icon-iot'
+            _loop_vars['color_class'] = l_1_color_class
+            yield '\n            '
+        yield '\n\n            <div class="subject-card animate-slide-up" style="animation-delay: '
+        yield escape((environment.getattr(l_1_loop, 'index0') * 0.1))
+        yield 's;">\n                <i class="'
+        yield escape((undefined(name='icon_class') if l_1_icon_class is missing else l_1_icon_class))
+        yield ' subject-icon '
+        yield escape((undefined(name='color_class') if l_1_color_class is missing else l_1_color_class))
+        yield '"></i>\n                <h3 class="subject-name">'
+        yield escape(l_1_subject)
+        yield '</h3>\n                <p style="color: rgba(255,255,255,0.5); font-size: 0.9rem; margin-bottom: 1.5rem;">Click to start exam\n                </p>\n                <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'exam_page', subject=l_1_subject, _loop_vars=_loop_vars))
+        yield '" class="btn btn-primary"\n                    style="background: linear-gradient(135deg, #00C6FF 0%, #0072FF 100%); border: none; padding: 0.8rem 2rem; border-radius: 50px; font-weight: 600; width: 100%; text-align: center; text-decoration: none; display: inline-block;">\n                    Start Exam <i class="fas fa-arrow-right" style="margin-left: 0.5rem;"></i>\n                </a>\n            </div>\n            '
+    l_1_loop = l_1_subject = l_1_icon_class = l_1_color_class = missing
+    yield '\n        </div>\n    </div>\n\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=21&120=23&122=25&137=28&138=33&139=36&141=39&142=42&143=45&144=48&145=51&146=54&147=57&148=60&149=63&152=67&153=69&154=73&157=75'
\ No newline at end of file
@@ -0,0 +1,19 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'register.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Student Registration - O Level Exam Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">\n</head>\n\n<body>\n    <nav class="navbar">\n        <div class="container navbar-content">\n            <div class="navbar-brand">🎓 O Level Exam Portal</div>\n            <ul class="navbar-nav">\n                <li><a href="/" class="nav-link">Home</a></li>\n                <li><a href="/login" class="nav-link">Login</a></li>\n            </ul>\n        </div>\n    </nav>\n\n    <section class="section">\n        <div class="container" style="max-width: 500px;">\n            <div class="glass-card">\n                <h2 class="text-center" style="margin-bottom: 2rem;">Student Registration</h2>\n\n                <div id="alert-container"></div>\n\n                <form id="registerForm">\n                    <div class="form-group">\n                        <label class="form-label">Full Name</label>\n                        <input type="text" id="name" class="form-input" placeholder="Enter your full name" required>\n                    </div>\n\n                    <div class="form-group">\n                        <label class="form-label">Email Address</label>\n                        <input type="email" id="email" class="form-input" placeholder="your.email@example.com" required>\n                    </div>\n\n                    <div class="form-group">\n                        <label class="form-label">Phone Number</label>\n                        <input type="tel" id="phone" class="form-input" placeholder="10-digit phone number" required\n                            pattern="[0-9]{10}">\n                    </div>\n\n                    <div class="form-group">\n                        <label class="form-label">Preferred Subject</label>\n                        <select id="subject" class="form-input" required>\n                            <option value="" disabled selected>Select a subject</option>\n                            <option value="Python">Python</option>\n                            <option value="Web Design">Web Design</option>\n                            <option value="IoT">IoT</option>\n                            <option value="Computer Fundamentals">Computer Fundamentals</option>\n                        </select>\n                    </div>\n\n                    <div class="form-group">\n                        <label class="form-label">Password</label>\n                        <input type="password" id="password" class="form-input" placeholder="Minimum 6 characters"\n                            required minlength="6">\n                    </div>\n\n                    <div class="form-group">\n                        <label class="form-label">Confirm Password</label>\n                        <input type="password" id="confirmPassword" class="form-input" placeholder="Re-enter password"\n                            required>\n                    </div>\n\n                    <button type="submit" class="btn btn-primary" style="width: 100%;">Register</button>\n                </form>\n\n                <p class="text-center mt-2" style="color: var(--text-muted);">\n                    Already have an account? <a href="/login" style="color: var(--primary);">Login here</a>\n                </p>\n            </div>\n        </div>\n    </section>\n\n    <script src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='js/main.js'))
+    yield '"></script>\n    <script>\n        document.getElementById(\'registerForm\').addEventListener(\'submit\', async (e) => {\n            e.preventDefault();\n\n            const name = document.getElementById(\'name\').value;\n            const email = document.getElementById(\'email\').value;\n            const phone = document.getElementById(\'phone\').value;\n            const subject = document.getElementById(\'subject\').value;\n            const password = document.getElementById(\'password\').value;\n            const confirmPassword = document.getElementById(\'confirmPassword\').value;\n\n            // Validate passwords match\n            if (password !== confirmPassword) {\n                showAlert(\'Passwords do not match\', \'error\');\n                return;\n            }\n\n            // Validate phone\n            if (!/^\\d{10}$/.test(phone)) {\n                showAlert(\'Phone must be exactly 10 digits\', \'error\');\n                return;\n            }\n\n            try {\n                const response = await fetch(\'/api/register\', {\n                    method: \'POST\',\n                    headers: {\n                        \'Content-Type\': \'application/json\'\n                    },\n                    body: JSON.stringify({ name, email, phone, password, subject })\n                });\n\n                const data = await response.json();\n\n                if (data.success) {\n                    showAlert(`Registration successful! Redirecting to details...`, \'success\');\n                    setTimeout(() => {\n                        window.location.href = `/registration_complete/${data.roll_number}`;\n                    }, 1000);\n                } else {\n                    showAlert(data.message, \'error\');\n                }\n            } catch (error) {\n                showAlert(\'Registration failed. Please try again.\', \'error\');\n            }\n        });\n\n        function showAlert(message, type) {\n            const alertContainer = document.getElementById(\'alert-container\');\n            alertContainer.innerHTML = `\n                <div class="alert alert-${type}">\n                    ${message}\n                </div>\n            `;\n        }\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=13&80=15'
\ No newline at end of file
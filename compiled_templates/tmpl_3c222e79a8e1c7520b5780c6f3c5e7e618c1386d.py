@@ -0,0 +1,20 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'auth.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_active_panel = resolve('active_panel')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Authentication - O Level Exam Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <style>\n        /* Auth Specific Overrides */\n        body {\n            font-family: \'Outfit\', sans-serif;\n            background: #0f172a;\n            display: flex;\n            justify-content: center;\n            align-items: center;\n            flex-direction: column;\n            height: 100vh;\n            margin: 0;\n            overflow: hidden;\n        }\n\n        .auth-container {\n            background-color: var(--bg-card);\n            border-radius: 20px;\n            box-shadow: 0 14px 28px rgba(0, 0, 0, 0.25), 0 10px 10px rgba(0, 0, 0, 0.22);\n            position: relative;\n            overflow: hidden;\n            width: 768px;\n            max-width: 100%;\n            min-height: 600px;\n            border: 1px solid rgba(255, 255, 255, 0.1);\n            backdrop-filter: blur(10px);\n            animation: fadeIn 0.8s ease-out;\n        }\n\n        .form-container {\n            position: absolute;\n            top: 0;\n            height: 100%;\n            transition: all 0.6s ease-in-out;\n        }\n\n        .sign-in-container {\n            left: 0;\n            width: 50%;\n            z-index: 2;\n        }\n\n        .auth-container.right-panel-active .sign-in-container {\n            transform: translateX(100%);\n        }\n\n        .sign-up-container {\n            left: 0;\n            width: 50%;\n            opacity: 0;\n            z-index: 1;\n        }\n\n        .auth-container.right-panel-active .sign-up-container {\n            transform: translateX(100%);\n            opacity: 1;\n            z-index: 5;\n            animation: show 0.6s;\n        }\n\n        @keyframes show {\n\n            0%,\n            49.99% {\n                opacity: 0;\n                z-index: 1;\n            }\n\n            50%,\n            100% {\n                opacity: 1;\n                z-index: 5;\n            }\n        }\n\n        @keyframes fadeIn {\n            from {\n                opacity: 0;\n                transform: translateY(-20px);\n            }\n\n            to {\n                opacity: 1;\n                transform: translateY(0);\n            }\n        }\n\n        .overlay-container {\n            position: absolute;\n            top: 0;\n            left: 50%;\n            width: 50%;\n            height: 100%;\n            overflow: hidden;\n            transition: transform 0.6s ease-in-out;\n            z-index: 100;\n        }\n\n        .auth-container.right-panel-active .overlay-container {\n            transform: translateX(-100%);\n        }\n\n        .overlay {\n            background: var(--primary-gradient, linear-gradient(135deg, #00C6FF 0%, #0072FF 100%));\n            background: -webkit-linear-gradient(to right, #00C6FF, #0072FF);\n            background: linear-gradient(to right, #00C6FF, #0072FF);\n            background-repeat: no-repeat;\n            background-size: cover;\n            background-position: 0 0;\n            color: #FFFFFF;\n            position: relative;\n            left: -100%;\n            height: 100%;\n            width: 200%;\n            transform: translateX(0);\n            transition: transform 0.6s ease-in-out;\n        }\n\n        .auth-container.right-panel-active .overlay {\n            transform: translateX(50%);\n        }\n\n        .overlay-panel {\n            position: absolute;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            flex-direction: column;\n            padding: 0 40px;\n            text-align: center;\n            top: 0;\n            height: 100%;\n            width: 50%;\n            transform: translateX(0);\n            transition: transform 0.6s ease-in-out;\n        }\n\n        .overlay-left {\n            transform: translateX(-20%);\n        }\n\n        .auth-container.right-panel-active .overlay-left {\n            transform: translateX(0);\n        }\n\n        .overlay-right {\n            right: 0;\n            transform: translateX(0);\n        }\n\n        .auth-container.right-panel-active .overlay-right {\n            transform: translateX(20%);\n        }\n\n        form {\n            background-color: var(--bg-card);\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            flex-direction: column;\n            padding: 0 50px;\n            height: 100%;\n            text-align: center;\n            color: white;\n        }\n\n        h1 {\n            font-weight: bold;\n            margin: 0;\n            margin-bottom: 1rem;\n        }\n\n        p {\n            font-size: 14px;\n            font-weight: 100;\n            line-height: 20px;\n            letter-spacing: 0.5px;\n            margin: 20px 0 30px;\n        }\n\n        span {\n            font-size: 12px;\n            color: rgba(255, 255, 255, 0.6);\n            margin-bottom: 10px;\n        }\n\n        a {\n            color: white;\n            font-size: 14px;\n            text-decoration: none;\n            margin: 15px 0;\n            transition: color 0.3s;\n        }\n\n        a:hover {\n            color: var(--primary-light);\n        }\n\n        button {\n            border-radius: 20px;\n            border: 1px solid #FFFFFF;\n            background-color: transparent;\n            color: #FFFFFF;\n            font-size: 12px;\n            font-weight: bold;\n            padding: 12px 45px;\n            letter-spacing: 1px;\n            text-transform: uppercase;\n            transition: transform 80ms ease-in, background-color 0.3s;\n            cursor: pointer;\n            margin-top: 10px;\n        }\n\n        button:active {\n            transform: scale(0.95);\n        }\n\n        button:focus {\n            outline: none;\n        }\n\n        button.ghost {\n            background-color: transparent;\n            border-color: #FFFFFF;\n        }\n\n        button.ghost:hover {\n            background-color: rgba(255, 255, 255, 0.1);\n        }\n\n        button[type="submit"] {\n            background: linear-gradient(135deg, #00C6FF 0%, #0072FF 100%);\n            border: none;\n            box-shadow: 0 4px 15px rgba(0, 198, 255, 0.4);\n        }\n\n        button[type="submit"]:hover {\n            transform: translateY(-2px);\n            box-shadow: 0 6px 20px rgba(0, 198, 255, 0.6);\n        }\n\n        input,\n        select {\n            background-color: rgba(255, 255, 255, 0.05);\n            border: 1px solid rgba(255, 255, 255, 0.1);\n            padding: 12px 15px;\n            margin: 8px 0;\n            width: 100%;\n            color: white;\n            border-radius: 5px;\n        }\n\n        input:focus,\n        select:focus {\n            outline: none;\n            border-color: #00C6FF;\n            background-color: rgba(255, 255, 255, 0.1);\n        }\n\n        select option {\n            background-color: #1e293b;\n            color: white;\n        }\n\n        /* Particle Background */\n        #particles-js {\n            position: absolute;\n            width: 100%;\n            height: 100%;\n            z-index: -1;\n            background-image: url("");\n            background-repeat: no-repeat;\n            background-size: cover;\n            background-position: 50% 50%;\n        }\n\n        .alert-msg {\n            margin-top: 10px;\n            font-size: 0.9rem;\n            min-height: 20px;\n        }\n\n        .alert-msg.success {\n            color: #4ade80;\n        }\n\n        .alert-msg.error {\n            color: #f87171;\n        }\n\n        .alert-msg.info {\n            color: #60a5fa;\n        }\n    </style>\n</head>\n\n<body>\n    <div id="particles-js"></div>\n\n    <div class="auth-container '
+    yield escape(('right-panel-active' if ((undefined(name='active_panel') if l_0_active_panel is missing else l_0_active_panel) == 'register') else ''))
+    yield '" id="container">\n\n        <!-- Sign Up Container -->\n        <div class="form-container sign-up-container">\n            <form id="registerForm">\n                <h1>Create Account</h1>\n                <span>or use your email for registration</span>\n                <input type="text" id="reg-name" placeholder="Name" required />\n                <input type="email" id="reg-email" placeholder="Email" required />\n                <input type="tel" id="reg-phone" placeholder="Phone (10 digits)" required pattern="[0-9]{10}" />\n                <input type="date" id="reg-dob" placeholder="Date of Birth" required style="color-scheme: dark;" />\n                <select id="reg-subject" required>\n                    <option value="" disabled selected>Select Subject</option>\n                    <option value="Python">Python</option>\n                    <option value="Web Design">Web Design</option>\n                    <option value="IoT">IoT</option>\n                    <option value="Computer Fundamentals">Computer Fundamentals</option>\n                </select>\n                <input type="password" id="reg-password" placeholder="Password" required minlength="6" />\n                <button type="submit">Sign Up</button>\n                <div id="reg-alert" class="alert-msg"></div>\n            </form>\n        </div>\n\n        <!-- Sign In Container -->\n        <div class="form-container sign-in-container">\n            <form id="loginForm">\n                <h1 style="margin-bottom: 2rem;">Sign in</h1>\n                <span>or use your account</span>\n                <input type="text" id="login-roll" placeholder="Roll Number" required />\n                <input type="password" id="login-password" placeholder="Password" required />\n                <input type="date" id="login-dob" placeholder="Date of Birth" required style="color-scheme: dark;" />\n                <a href="#">Forgot your password?</a>\n                <button type="submit">Sign In</button>\n                <div id="login-alert" class="alert-msg"></div>\n            </form>\n        </div>\n\n        <!-- Overlay Container -->\n        <div class="overlay-container">\n            <div class="overlay">\n                <div class="overlay-panel overlay-left">\n                    <h1>Welcome Back!</h1>\n                    <p>To keep connected with us please login with your personal info</p>\n                    <button class="ghost" id="signIn">Sign In</button>\n                </div>\n                <div class="overlay-panel overlay-right">\n                    <h1>Hello, Friend!</h1>\n                    <p>Enter your personal details and start your journey with us</p>\n                    <button class="ghost" id="signUp">Sign Up</button>\n                </div>\n            </div>\n        </div>\n    </div>\n\n    <!-- Scripts -->\n    <script src="https://cdn.jsdelivr.net/particles.js/2.0.0/particles.min.js"></script>\n    <script>\n        // Particles Config\n        particlesJS("particles-js", {\n            "particles": {\n                "number": { "value": 80, "density": { "enable": true, "value_area": 800 } },\n                "color": { "value": "#ffffff" },\n                "shape": { "type": "circle" },\n                "opacity": { "value": 0.5, "random": false },\n                "size": { "value": 3, "random": true },\n                "line_linked": { "enable": true, "distance": 150, "color": "#ffffff", "opacity": 0.4, "width": 1 },\n                "move": { "enable": true, "speed": 3, "direction": "none", "random": false, "straight": false, "out_mode": "out", "bounce": false }\n            },\n            "interactivity": {\n                "detect_on": "canvas",\n                "events": { "onhover": { "enable": true, "mode": "repulse" }, "onclick": { "enable": true, "mode": "push" }, "resize": true },\n                "modes": { "repulse": { "distance": 200, "duration": 0.4 }, "push": { "particles_nb": 4 } }\n            },\n            "retina_detect": true\n        });\n\n        const signUpButton = document.getElementById(\'signUp\');\n        const signInButton = document.getElementById(\'signIn\');\n        const container = document.getElementById(\'container\');\n\n        signUpButton.addEventListener(\'click\', () => {\n            container.classList.add("right-panel-active");\n        });\n\n        signInButton.addEventListener(\'click\', () => {\n            container.classList.remove("right-panel-active");\n        });\n\n        // Register Logic\n        document.getElementById(\'registerForm\').addEventListener(\'submit\', async (e) => {\n            e.preventDefault();\n            const alert = document.getElementById(\'reg-alert\');\n            alert.textContent = \'Processing...\';\n            alert.className = \'alert-msg info\';\n\n            const name = document.getElementById(\'reg-name\').value;\n            const email = document.getElementById(\'reg-email\').value;\n            const phone = document.getElementById(\'reg-phone\').value;\n            const dob = document.getElementById(\'reg-dob\').value;\n            const subject = document.getElementById(\'reg-subject\').value;\n            const password = document.getElementById(\'reg-password\').value;\n\n            try {\n                const res = await fetch(\'/api/register\', {\n                    method: \'POST\',\n                    headers: { \'Content-Type\': \'application/json\' },\n                    body: JSON.stringify({ name, email, phone, dob, subject, password })\n                });\n                const data = await res.json();\n                if (data.success) {\n                    alert.textContent = `Success! Redirecting...`;\n                    alert.className = \'alert-msg success\';\n                    setTimeout(() => {\n                        window.location.href = `/registration_complete/${data.roll_number}`;\n                    }, 1000);\n                } else {\n                    alert.textContent = data.message;\n                    alert.className = \'alert-msg error\';\n                }\n            } catch (err) {\n                alert.textContent = \'Error: \' + err.message;\n                alert.className = \'alert-msg error\';\n            }\n        });\n\n        // Login Logic\n        document.getElementById(\'loginForm\').addEventListener(\'submit\', async (e) => {\n            e.preventDefault();\n            const alert = document.getElementById(\'login-alert\');\n            alert.textContent = \'Verifying...\';\n            alert.className = \'alert-msg info\';\n\n            const roll_number = document.getElementById(\'login-roll\').value;\n            const password = document.getElementById(\'login-password\').value;\n            const dob = document.getElementById(\'login-dob\').value;\n\n            try {\n                const res = await fetch(\'/api/login\', {\n                    method: \'POST\',\n                    headers: { \'Content-Type\': \'application/json\' },\n                    body: JSON.stringify({ roll_number, password, dob })\n                });\n                const data = await res.json();\n                if (data.success) {\n                    alert.textContent = \'Login Successful!\';\n                    alert.className = \'alert-msg success\';\n                    setTimeout(() => {\n                        window.location.href = data.redirect;\n                    }, 800);\n                } else {\n                    alert.textContent = data.message;\n                    alert.className = \'alert-msg error\';\n                }\n            } catch (err) {\n                alert.textContent = \'Error: \' + err.message;\n                alert.className = \'alert-msg error\';\n            }\n        });\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=14&309=16'
\ No newline at end of file
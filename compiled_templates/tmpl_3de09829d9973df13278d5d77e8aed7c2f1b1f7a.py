@@ -0,0 +1,42 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'exam.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_subject = resolve('subject')
+    l_0_url_for = resolve('url_for')
+    l_0_duration = resolve('duration')
+    l_0_student_name = resolve('student_name')
+    try:
+        t_1 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Exam - '
+    yield escape((undefined(name='subject') if l_0_subject is missing else l_0_subject))
+    yield '</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/exam.css'))
+    yield '">\n</head>\n\n<body data-subject="'
+    yield escape((undefined(name='subject') if l_0_subject is missing else l_0_subject))
+    yield '" data-duration="'
+    yield escape((undefined(name='duration') if l_0_duration is missing else l_0_duration))
+    yield '">\n\n    <div class="exam-layout">\n        <!-- Sidebar -->\n        <aside class="exam-sidebar">\n            <div class="student-profile">\n                <div class="student-avatar">\n                    '
+    yield escape(t_1(environment.getitem((undefined(name='student_name') if l_0_student_name is missing else l_0_student_name), 0)))
+    yield '\n                </div>\n                <h3>'
+    yield escape((undefined(name='student_name') if l_0_student_name is missing else l_0_student_name))
+    yield '</h3>\n                <p style="color: rgba(255,255,255,0.6); font-size: 0.9rem;">'
+    yield escape((undefined(name='subject') if l_0_subject is missing else l_0_subject))
+    yield '</p>\n            </div>\n\n            <h4 style="margin-bottom: 1rem;">Question Palette</h4>\n            <div class="question-palette" id="palette">\n                <!-- Generated via JS -->\n            </div>\n\n            <button onclick="submitExam()" class="btn-nav btn-submit"\n                style="margin-top: auto; justify-content: center; width: 100%;">\n                Submit Exam\n            </button>\n        </aside>\n\n        <!-- Main Content -->\n        <main class="exam-content">\n            <div class="timer-bar">\n                <span>Time Remaining</span>\n                <div class="timer-display" id="timer">00:00:00</div>\n            </div>\n\n            <div class="question-container">\n                <div id="loader">\n                    <i class="fas fa-circle-notch fa-spin fa-2x"></i>\n                    <p id="queue-status" class="queue-status"></p>\n                </div>\n\n                <div id="question-area">\n                    <span class="mb-3" style="color: #00C6FF; font-weight: 600; display: block;" id="q-number">Question\n                        1</span>\n                    <h2 class="question-text" id="q-text">Loading question...</h2>\n\n                    <div class="options-grid" id="options-area">\n                        <!-- Options generated via JS -->\n                    </div>\n                </div>\n\n                <div class="controls">\n                    <button class="btn-nav" id="btn-prev" onclick="navQuestion(-1)">\n                        <i class="fas fa-arrow-left"></i> Previous\n                    </button>\n                    <button class="btn-nav" id="btn-next" onclick="navQuestion(1)" style="background: #0072FF;">\n                        Next <i class="fas fa-arrow-right"></i>\n                    </button>\n                </div>\n            </div>\n        </main>\n    </div>\n\n    <script src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='js/exam.js'))
+    yield '"></script>\n\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '7=22&8=24&11=26&14=28&21=32&23=34&24=36&73=38'
\ No newline at end of file
@@ -0,0 +1,24 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'registration_complete.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_student = resolve('student')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Registration Complete</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">\n    <style>\n        body {\n            font-family: \'Outfit\', sans-serif;\n            background: #0f172a;\n            color: white;\n            min-height: 100vh;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            overflow: hidden;\n        }\n\n        .success-card {\n            background: rgba(30, 41, 59, 0.8);\n            backdrop-filter: blur(20px);\n            border-radius: 24px;\n            padding: 3rem;\n            text-align: center;\n            max-width: 500px;\n            width: 90%;\n            border: 1px solid rgba(255, 255, 255, 0.1);\n            box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.5);\n            animation: bounceIn 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.275);\n            position: relative;\n            z-index: 10;\n        }\n\n        @keyframes bounceIn {\n            0% {\n                opacity: 0;\n                transform: scale(0.3);\n            }\n\n            50% {\n                opacity: 1;\n                transform: scale(1.05);\n            }\n\n            70% {\n                transform: scale(0.9);\n            }\n\n            100% {\n                transform: scale(1);\n            }\n        }\n\n        .icon-container {\n            width: 80px;\n            height: 80px;\n            background: rgba(16, 185, 129, 0.2);\n            color: #10b981;\n            border-radius: 50%;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            font-size: 2.5rem;\n            margin: 0 auto 2rem;\n            box-shadow: 0 0 20px rgba(16, 185, 129, 0.3);\n        }\n\n        .roll-number-box {\n            background: rgba(0, 0, 0, 0.3);\n            border: 1px dashed rgba(255, 255, 255, 0.2);\n            padding: 1rem;\n            border-radius: 12px;\n            margin: 2rem 0;\n            cursor: pointer;\n            transition: all 0.2s;\n            position: relative;\n        }\n\n        .roll-number-box:hover {\n            border-color: #00C6FF;\n            background: rgba(0, 198, 255, 0.1);\n        }\n\n        .roll-text {\n            font-size: 1.5rem;\n            font-weight: 700;\n            letter-spacing: 2px;\n            color: #00C6FF;\n        }\n\n        .copy-tooltip {\n            position: absolute;\n            top: -30px;\n            left: 50%;\n            transform: translateX(-50%);\n            background: #333;\n            padding: 4px 8px;\n            border-radius: 4px;\n            font-size: 12px;\n            opacity: 0;\n            transition: opacity 0.2s;\n        }\n\n        .roll-number-box:active .copy-tooltip {\n            opacity: 1;\n        }\n\n        /* Particle BG */\n        #particles-js {\n            position: absolute;\n            width: 100%;\n            height: 100%;\n            z-index: 0;\n        }\n    </style>\n</head>\n\n<body>\n    <div id="particles-js"></div>\n\n    <div class="success-card">\n        <div class="icon-container">\n            <i class="fas fa-check"></i>\n        </div>\n\n        <h1 style="margin-bottom: 0.5rem;">Registration Successful!</h1>\n        <p style="color: rgba(255,255,255,0.6);">Welcome, '
+    yield escape(environment.getattr((undefined(name='student') if l_0_student is missing else l_0_student), 'name'))
+    yield '</p>\n\n        <p style="margin-top: 2rem; font-size: 0.9rem;">Your Roll Number is:</p>\n        <div class="roll-number-box" onclick="copyRoll()" title="Click to copy">\n            <span class="copy-tooltip">Copied!</span>\n            <div class="roll-text" id="roll">'
+    yield escape(environment.getattr((undefined(name='student') if l_0_student is missing else l_0_student), 'roll_number'))
+    yield '</div>\n            <div style="font-size: 0.8rem; color: rgba(255,255,255,0.4); margin-top: 5px;">\n                <i class="fas fa-copy"></i> Click to Copy\n            </div>\n        </div>\n\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'login_page'))
+    yield '" class="btn btn-primary"\n            style="width: 100%; display: block; padding: 1rem; text-align: center; background: linear-gradient(135deg, #00C6FF 0%, #0072FF 100%); border: none; border-radius: 12px; font-weight: 600;">\n            Proceed to Login\n        </a>\n    </div>\n\n    <script src="https://cdn.jsdelivr.net/particles.js/2.0.0/particles.min.js"></script>\n    <script>\n        particlesJS("particles-js", {\n            "particles": {\n                "number": { "value": 50 },\n                "color": { "value": "#10b981" },\n                "shape": { "type": "circle" },\n                "opacity": { "value": 0.5 },\n                "size": { "value": 3 },\n                "move": { "enable": true, "speed": 2 }\n            }\n        });\n\n        function copyRoll() {\n            const roll = document.getElementById(\'roll\').innerText;\n            navigator.clipboard.writeText(roll).then(() => {\n                const tooltip = document.querySelector(\'.copy-tooltip\');\n                tooltip.style.opacity = 1;\n                setTimeout(() => tooltip.style.opacity = 0, 1500);\n            });\n        }\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=14&131=16&136=18&142=20'
\ No newline at end of file
@@ -0,0 +1,17 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin_add_question.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Add Questions - Admin Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">\n    <style>\n        .tab-container {\n            display: flex;\n            gap: 1rem;\n            margin-bottom: 2rem;\n            border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n            padding-bottom: 1rem;\n        }\n\n        .tab-btn {\n            background: transparent;\n            border: none;\n            color: var(--text-muted);\n            font-size: 1.1rem;\n            font-weight: 600;\n            cursor: pointer;\n            padding: 0.5rem 1rem;\n            border-radius: var(--radius-md);\n            transition: all 0.3s ease;\n        }\n\n        .tab-btn.active {\n            background: rgba(99, 102, 241, 0.1);\n            color: var(--primary);\n        }\n\n        .tab-content {\n            display: none;\n            animation: fadeIn 0.5s ease;\n        }\n\n        .tab-content.active {\n            display: block;\n        }\n\n        @keyframes fadeIn {\n            from {\n                opacity: 0;\n                transform: translateY(10px);\n            }\n\n            to {\n                opacity: 1;\n                transform: translateY(0);\n            }\n        }\n    </style>\n</head>\n\n<body>\n    <nav class="navbar">\n        <div class="container navbar-content">\n            <div class="navbar-brand">🎓 Admin Portal</div>\n            <ul class="navbar-nav">\n                <li><a href="/admin/dashboard" class="nav-link">Dashboard</a></li>\n                <li><a href="/admin/logout" class="nav-link">Logout</a></li>\n            </ul>\n        </div>\n    </nav>\n\n    <section class="section">\n        <div class="container" style="max-width: 800px;">\n            <div class="glass-card">\n                <h2 class="text-center" style="margin-bottom: 2rem;">Question Management</h2>\n\n                <div class="tab-container">\n                    <button class="tab-btn active" onclick="switchTab(\'single\')">Add Single Question</button>\n                    <button class="tab-btn" onclick="switchTab(\'bulk\')">Bulk Upload (CSV)</button>\n                </div>\n\n                <!-- Single Question Form -->\n                <div id="single-tab" class="tab-content active">\n                    <form id="addQuestionForm">\n                        <div class="form-group">\n                            <label class="form-label">Question Text</label>\n                            <input type="text" id="question" class="form-input" required>\n                        </div>\n                        <div class="form-group">\n                            <label class="form-label">Option A</label>\n                            <input type="text" id="optionA" class="form-input" required>\n                        </div>\n                        <div class="form-group">\n                            <label class="form-label">Option B</label>\n                            <input type="text" id="optionB" class="form-input" required>\n                        </div>\n                        <div class="form-group">\n                            <label class="form-label">Option C</label>\n                            <input type="text" id="optionC" class="form-input" required>\n                        </div>\n                        <div class="form-group">\n                            <label class="form-label">Option D</label>\n                            <input type="text" id="optionD" class="form-input" required>\n                        </div>\n                        <div class="form-group">\n                            <label class="form-label">Correct Answer</label>\n                            <select id="correct" class="form-input" required>\n                                <option value="A">Option A</option>\n                                <option value="B">Option B</option>\n                                <option value="C">Option C</option>\n                                <option value="D">Option D</option>\n                            </select>\n                        </div>\n                        <div class="form-group">\n                            <label class="form-label">Subject</label>\n                            <input type="text" id="subject" class="form-input" required placeholder="e.g. Python">\n                        </div>\n                        <button type="submit" class="btn btn-primary" style="width: 100%;">Add Question</button>\n                    </form>\n                </div>\n\n                <!-- Bulk Upload Form -->\n                <div id="bulk-tab" class="tab-content">\n                    <div style="text-align: center; margin-bottom: 2rem;">\n                        <p style="color: var(--text-secondary); margin-bottom: 1rem;">\n                            Upload a CSV file with the following columns:<br>\n                            <code>Question, Option A, Option B, Option C, Option D, Correct Answer, Subject</code>\n                        </p>\n                        <a href="/api/admin/sample_csv" class="btn btn-outline">Download Sample CSV</a>\n                    </div>\n\n                    <form id="uploadForm">\n                        <div class="form-group">\n                            <label class="form-label">Select CSV File</label>\n                            <input type="file" id="csvFile" class="form-input" accept=".csv" required\n                                style="padding: 0.5rem;">\n                        </div>\n                        <button type="submit" class="btn btn-primary" style="width: 100%;">Upload Questions</button>\n                    </form>\n                    <div id="uploadStatus" style="margin-top: 1rem; text-align: center;"></div>\n                </div>\n            </div>\n        </div>\n    </section>\n\n    <script>\n        function switchTab(tab) {\n            document.querySelectorAll(\'.tab-btn\').forEach(btn => btn.classList.remove(\'active\'));\n            document.querySelectorAll(\'.tab-content\').forEach(content => content.classList.remove(\'active\'));\n\n            if (tab === \'single\') {\n                document.querySelector(\'button[onclick="switchTab(\\\'single\\\')"]\').classList.add(\'active\');\n                document.getElementById(\'single-tab\').classList.add(\'active\');\n            } else {\n                document.querySelector(\'button[onclick="switchTab(\\\'bulk\\\')"]\').classList.add(\'active\');\n                document.getElementById(\'bulk-tab\').classList.add(\'active\');\n            }\n        }\n\n        // Add Single Question\n        document.getElementById(\'addQuestionForm\').addEventListener(\'submit\', async function (e) {\n            e.preventDefault();\n\n            const question = document.getElementById(\'question\').value;\n            const options = [\n                document.getElementById(\'optionA\').value,\n                document.getElementById(\'optionB\').value,\n                document.getElementById(\'optionC\').value,\n                document.getElementById(\'optionD\').value\n            ];\n            const correct = document.getElementById(\'correct\').value;\n            const subject = document.getElementById(\'subject\').value;\n\n            try {\n                const send = (force) => fetch(\'/api/admin/questions\', {\n                    method: \'POST\',\n                    headers: { \'Content-Type\': \'application/json\' },\n                    body: JSON.stringify({ question, options, correct, subject, force })\n                });\n\n                let response = await send(false);\n                let data = await response.json();\n\n                // Near-duplicates can be added anyway after confirmation; exact ones cannot\n                if (data.duplicate === \'near\') {\n                    const similar = data.similar.map(s => `- ${s.question} (${Math.round(s.similarity * 100)}%)`).join(\'\\n\');\n                    if (confirm(`This looks like an existing question:\\n${similar}\\n\\nAdd it anyway?`)) {\n                        response = await send(true);\n                        data = await response.json();\n                    } else {\n                        return;\n                    }\n                }\n\n                if (data.success) {\n                    alert(\'Question added successfully!\');\n                    document.getElementById(\'addQuestionForm\').reset();\n                } else {\n                    alert(\'Error: \' + data.message);\n                }\n            } catch (error) {\n                alert(\'Failed to add question. Please try again.\');\n            }\n        });\n\n        // Bulk Upload\n        document.getElementById(\'uploadForm\').addEventListener(\'submit\', async function (e) {\n            e.preventDefault();\n\n            const fileInput = document.getElementById(\'csvFile\');\n            const file = fileInput.files[0];\n\n            if (!file) return;\n\n            const formData = new FormData();\n            formData.append(\'file\', file);\n\n            const statusDiv = document.getElementById(\'uploadStatus\');\n            statusDiv.innerHTML = \'<span style="color: var(--info);">Uploading...</span>\';\n\n            try {\n                // Streamed upload: the server sends one JSON line per inserted batch\n                const response = await fetch(\'/api/admin/upload_questions?stream=1\', {\n                    method: \'POST\',\n                    body: formData\n                });\n\n                const contentType = response.headers.get(\'Content-Type\') || \'\';\n                if (!contentType.includes(\'ndjson\')) {\n                    const data = await response.json();\n                    statusDiv.innerHTML = `<span style="color: var(--error);">Error: ${data.message}</span>`;\n                    return;\n                }\n\n                const reader = response.body.getReader();\n                const decoder = new TextDecoder();\n                let buffer = \'\';\n                let progress = null;\n                let final = null;\n\n                while (true) {\n                    const { value, done } = await reader.read();\n                    if (done) break;\n                    buffer += decoder.decode(value, { stream: true });\n\n                    let newline;\n                    while ((newline = buffer.indexOf(\'\\n\')) >= 0) {\n                        const line = buffer.slice(0, newline).trim();\n                        buffer = buffer.slice(newline + 1);\n                        if (!line) continue;\n\n                        const update = JSON.parse(line);\n                        if (update.done) {\n                            final = update;\n                        } else {\n                            progress = update;\n                            statusDiv.innerHTML = `<span style="color: var(--info);">Processed ${progress.processed} rows, ${progress.count} added...</span>`;\n                        }\n                    }\n                }\n\n                if (final && final.success && progress) {\n                    let html = `<span style="color: var(--success);">${final.message} (${progress.count} questions added, ${progress.failed} rows failed)</span>`;\n                    if (progress.errors.length > 0) {\n                        const items = progress.errors.map(err => `<li>${err.replace(/</g, \'&lt;\')}</li>`).join(\'\');\n                        html += `<ul style="text-align: left; margin-top: 1rem; color: var(--error); font-size: 0.85rem;">${items}</ul>`;\n                        if (progress.errors_truncated) {\n                            html += \'<p style="color: var(--text-muted); font-size: 0.85rem;">Only the first errors are shown.</p>\';\n                        }\n                    }\n                    statusDiv.innerHTML = html;\n                    fileInput.value = \'\';\n                } else {\n                    const message = final ? final.message : \'Upload interrupted\';\n                    statusDiv.innerHTML = `<span style="color: var(--error);">Error: ${message}</span>`;\n                }\n            } catch (error) {\n                statusDiv.innerHTML = \'<span style="color: var(--error);">Upload failed. Please try again.</span>\';\n            }\n        });\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=13'
\ No newline at end of file
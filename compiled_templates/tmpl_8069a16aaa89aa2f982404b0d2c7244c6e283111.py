@@ -0,0 +1,19 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'login.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Student Login - O Level Exam Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">\n</head>\n\n<body>\n    <nav class="navbar">\n        <div class="container navbar-content">\n            <div class="navbar-brand">🎓 O Level Exam Portal</div>\n            <ul class="navbar-nav">\n                <li><a href="/" class="nav-link">Home</a></li>\n                <li><a href="/register" class="nav-link">Register</a></li>\n            </ul>\n        </div>\n    </nav>\n\n    <section class="section">\n        <div class="container" style="max-width: 500px;">\n            <div class="glass-card">\n                <h2 class="text-center" style="margin-bottom: 2rem;">Student Login</h2>\n\n                <div id="alert-container"></div>\n\n                <form id="loginForm">\n                    <div class="form-group">\n                        <label class="form-label">Roll Number</label>\n                        <input type="text" id="rollNumber" class="form-input" placeholder="Enter your roll number"\n                            required>\n                    </div>\n\n                    <div class="form-group">\n                        <label class="form-label">Password</label>\n                        <input type="password" id="password" class="form-input" placeholder="Enter your password"\n                            required>\n                    </div>\n\n                    <button type="submit" class="btn btn-primary" style="width: 100%;">Login</button>\n                </form>\n\n                <p class="text-center mt-2" style="color: var(--text-muted);">\n                    Don\'t have an account? <a href="/register" style="color: var(--primary);">Register here</a>\n                </p>\n            </div>\n        </div>\n    </section>\n\n    <script src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='js/main.js'))
+    yield '"></script>\n    <script>\n        document.getElementById(\'loginForm\').addEventListener(\'submit\', async (e) => {\n            e.preventDefault();\n\n            const roll_number = document.getElementById(\'rollNumber\').value;\n            const password = document.getElementById(\'password\').value;\n\n            try {\n                const response = await fetch(\'/api/login\', {\n                    method: \'POST\',\n                    headers: {\n                        \'Content-Type\': \'application/json\'\n                    },\n                    body: JSON.stringify({ roll_number, password })\n                });\n\n                const data = await response.json();\n\n                if (data.success) {\n                    showAlert(data.message, \'success\');\n                    setTimeout(() => {\n                        window.location.href = data.redirect;\n                    }, 1000);\n                } else {\n                    showAlert(data.message, \'error\');\n                    if (data.redirect) {\n                        setTimeout(() => {\n                            window.location.href = data.redirect;\n                        }, 2000);\n                    }\n                }\n            } catch (error) {\n                showAlert(\'Login failed. Please try again.\', \'error\');\n            }\n        });\n\n        function showAlert(message, type) {\n            const alertContainer = document.getElementById(\'alert-container\');\n            alertContainer.innerHTML = `\n                <div class="alert alert-${type}">\n                    ${message}\n                </div>\n            `;\n        }\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=13&53=15'
\ No newline at end of file
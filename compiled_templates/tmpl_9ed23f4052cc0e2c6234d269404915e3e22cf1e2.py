@@ -0,0 +1,26 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin_dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_stats = resolve('stats')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>O Level Exam Portal - Admin</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">\n</head>\n\n<body>\n    <nav class="navbar">\n        <div class="container navbar-content">\n            <div class="navbar-brand">🎓 Admin Portal</div>\n            <ul class="navbar-nav">\n                <li><a href="/" class="nav-link">Home</a></li>\n                <li><a href="/admin/logout" class="nav-link">Logout</a></li>\n            </ul>\n        </div>\n    </nav>\n\n    <section class="section">\n        <div class="container">\n            <h2 class="text-center" style="margin-bottom: 2rem;">Admin Dashboard</h2>\n\n            <!-- Stats Overview -->\n            <div class="dashboard-grid">\n                <div class="stat-card">\n                    <div class="stat-label">Total Students</div>\n                    <div class="stat-value">'
+    yield escape(environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'total_students'))
+    yield '</div>\n                </div>\n                <div class="stat-card">\n                    <div class="stat-label">Exams Completed</div>\n                    <div class="stat-value">'
+    yield escape(environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'exams_completed'))
+    yield '</div>\n                </div>\n                <div class="stat-card">\n                    <div class="stat-label">Total Questions</div>\n                    <div class="stat-value">'
+    yield escape(environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'total_questions'))
+    yield '</div>\n                </div>\n            </div>\n\n            <!-- Student Management -->\n            <div class="glass-card">\n                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">\n                    <h3>Registered Students</h3>\n                    <button class="btn btn-outline" style="border-color: var(--error); color: var(--error);"\n                        onclick="deleteAllStudents()">\n                        Delete ALL Registrations\n                    </button>\n                </div>\n                <div id="studentsContainer">\n                    <p class="text-center" style="color: var(--text-muted);">Loading students...</p>\n                </div>\n            </div>\n\n            <!-- Quick Actions -->\n            <div class="glass-card" style="margin-top: 2rem;">\n                <h3 style="margin-bottom: 1.5rem;">Quick Actions</h3>\n                <div class="dashboard-grid" style="grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));">\n                    <a href="/admin/reset_exam" class="btn btn-secondary" style="text-align: center; padding: 2rem;">\n                        <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔄</div>\n                        <div>Reset Student Exam</div>\n                    </a>\n                    <a href="/admin/add_question" class="btn btn-primary" style="text-align: center; padding: 2rem;">\n                        <div style="font-size: 2rem; margin-bottom: 0.5rem;">➕</div>\n                        <div>Add / Upload Questions</div>\n                    </a>\n                </div>\n            </div>\n\n            <!-- Question Bank Summary -->\n            <div class="glass-card" style="margin-top: 2rem;">\n                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">\n                    <h3>Question Bank</h3>\n                    <div style="display: flex; gap: 1rem;">\n                        <button id="deleteSelectedBtn" class="btn btn-danger" style="display: none;"\n                            onclick="deleteSelectedQuestions()">\n                            Delete Selected (<span id="selectedCount">0</span>)\n                        </button>\n                        <button class="btn btn-outline" onclick="loadDuplicates()">\n                            Duplicate Report\n                        </button>\n                        <button class="btn btn-outline" style="border-color: var(--error); color: var(--error);"\n                            onclick="deleteAllQuestions()">\n                            Delete ALL Questions\n                        </button>\n                    </div>\n                </div>\n                <div id="duplicatesContainer"></div>\n                <div style="display: flex; gap: 1rem; flex-wrap: wrap; margin-bottom: 1.5rem;">\n                    <input type="search" id="questionSearch" class="form-input" style="flex: 1; min-width: 220px;"\n                        placeholder="Search questions and options..." autocomplete="off">\n                    <select id="subjectFilter" class="form-input" style="width: auto;">\n                        <option value="">All subjects</option>\n                    </select>\n                    <select id="answerFilter" class="form-input" style="width: auto;">\n                        <option value="">Any answer</option>\n                        <option value="A">Answer A</option>\n                        <option value="B">Answer B</option>\n                        <option value="C">Answer C</option>\n                        <option value="D">Answer D</option>\n                    </select>\n                </div>\n                <div id="questionsContainer">\n                    <p class="text-center" style="color: var(--text-muted);">Loading questions...</p>\n                </div>\n            </div>\n        </div>\n    </section>\n\n    <script src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='js/admin_dashboard.js'))
+    yield '"></script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=14&31=16&35=18&39=20&112=22'
\ No newline at end of file
@@ -0,0 +1,17 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin_login.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Admin Login - Dark Satellite</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">\n    <style>\n        body {\n            font-family: \'Outfit\', sans-serif;\n            background: #0f172a;\n            color: white;\n            min-height: 100vh;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            overflow: hidden;\n        }\n\n        .login-card {\n            background: rgba(30, 41, 59, 0.8);\n            backdrop-filter: blur(20px);\n            border-radius: 20px;\n            padding: 3rem;\n            width: 100%;\n            max-width: 400px;\n            border: 1px solid rgba(255, 255, 255, 0.1);\n            box-shadow: 0 0 50px rgba(0, 0, 0, 0.5);\n            animation: fadeIn 0.8s ease-out;\n            position: relative;\n            z-index: 10;\n        }\n\n        @keyframes fadeIn {\n            from {\n                opacity: 0;\n                transform: translateY(20px);\n            }\n\n            to {\n                opacity: 1;\n                transform: translateY(0);\n            }\n        }\n\n        .admin-icon {\n            width: 80px;\n            height: 80px;\n            background: rgba(239, 68, 68, 0.2);\n            color: #ef4444;\n            border-radius: 50%;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            font-size: 2rem;\n            margin: 0 auto 2rem;\n            box-shadow: 0 0 20px rgba(239, 68, 68, 0.3);\n        }\n\n        h2 {\n            text-align: center;\n            margin-bottom: 2rem;\n            font-weight: 700;\n        }\n\n        .form-group {\n            margin-bottom: 1.5rem;\n        }\n\n        input {\n            width: 100%;\n            padding: 12px;\n            background: rgba(255, 255, 255, 0.05);\n            border: 1px solid rgba(255, 255, 255, 0.1);\n            border-radius: 8px;\n            color: white;\n            outline: none;\n            transition: all 0.3s;\n        }\n\n        input:focus {\n            border-color: #ef4444;\n            background: rgba(255, 255, 255, 0.1);\n        }\n\n        .btn-admin {\n            width: 100%;\n            padding: 12px;\n            background: linear-gradient(135deg, #ef4444 0%, #b91c1c 100%);\n            border: none;\n            border-radius: 8px;\n            color: white;\n            font-weight: 600;\n            cursor: pointer;\n            transition: all 0.3s;\n            box-shadow: 0 4px 15px rgba(239, 68, 68, 0.3);\n        }\n\n        .btn-admin:hover {\n            transform: translateY(-2px);\n            box-shadow: 0 6px 20px rgba(239, 68, 68, 0.5);\n        }\n\n        .back-link {\n            display: block;\n            text-align: center;\n            margin-top: 1.5rem;\n            color: rgba(255, 255, 255, 0.4);\n            text-decoration: none;\n            font-size: 0.9rem;\n        }\n\n        .back-link:hover {\n            color: white;\n        }\n\n        /* Animated Background */\n        .admin-bg {\n            position: fixed;\n            top: 0;\n            left: 0;\n            width: 100%;\n            height: 100%;\n            z-index: 0;\n            background:\n                radial-gradient(circle at 10% 10%, rgba(239, 68, 68, 0.1) 0%, transparent 20%),\n                radial-gradient(circle at 90% 90%, rgba(239, 68, 68, 0.1) 0%, transparent 20%);\n            animation: pulse-bg 10s infinite alternate;\n        }\n\n        @keyframes pulse-bg {\n            0% {\n                opacity: 0.5;\n            }\n\n            100% {\n                opacity: 1;\n            }\n        }\n    </style>\n</head>\n\n<body>\n    <div class="admin-bg"></div>\n\n    <div class="login-card">\n        <div class="admin-icon">\n            <i class="fas fa-user-shield"></i>\n        </div>\n        <h2>Admin Portal</h2>\n\n        <form id="adminLoginForm">\n            <div class="form-group">\n                <input type="text" id="username" placeholder="Username" required>\n            </div>\n            <div class="form-group">\n                <input type="password" id="password" placeholder="Password" required>\n            </div>\n            <button type="submit" class="btn-admin">Login</button>\n        </form>\n\n        <a href="/" class="back-link"><i class="fas fa-arrow-left"></i> Back to Home</a>\n    </div>\n\n    <script>\n        document.getElementById(\'adminLoginForm\').addEventListener(\'submit\', async (e) => {\n            e.preventDefault();\n            const btn = e.target.querySelector(\'button\');\n            const originalText = btn.innerText;\n            btn.innerText = \'Authenticating...\';\n            btn.disabled = true;\n\n            const username = document.getElementById(\'username\').value;\n            const password = document.getElementById(\'password\').value;\n\n            try {\n                const res = await fetch(\'/api/admin/login\', {\n                    method: \'POST\',\n                    headers: { \'Content-Type\': \'application/json\' },\n                    body: JSON.stringify({ username, password })\n                });\n                const data = await res.json();\n\n                if (data.success) {\n                    window.location.href = data.redirect;\n                } else {\n                    alert(data.message);\n                    btn.innerText = originalText;\n                    btn.disabled = false;\n                }\n            } catch (err) {\n                console.error(err);\n                alert(\'An error occurred\');\n                btn.innerText = originalText;\n                btn.disabled = false;\n            }\n        });\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=13'
\ No newline at end of file
@@ -0,0 +1,19 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'portfolio.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Developer Profile - Ravi Kumar</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link rel="preconnect" href="https://fonts.googleapis.com">\n    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">\n    <style>\n        /* Ensure portfolio is visible immediately since it\'s a standalone page */\n        .portfolio-section {\n            background-color: var(--bg-dark);\n            min-height: 100vh;\n            padding-top: 80px;\n            /* Space for back button */\n        }\n\n        .back-nav {\n            position: fixed;\n            top: 20px;\n            left: 20px;\n            z-index: 100;\n        }\n    </style>\n</head>\n\n<body>\n    <div class="back-nav">\n        <a href="/" class="btn btn-outline"><i class="fas fa-arrow-left"></i> Back to Home</a>\n    </div>\n\n    <!-- Portfolio Section -->\n    <section id="portfolio" class="portfolio-section">\n        <div class="container">\n            <h2 class="section-title text-center">Developer Profile</h2>\n            <div class="portfolio-grid">\n                <!-- Profile Card -->\n                <div class="profile-card glass-card">\n                    <div class="profile-header">\n                        <div class="profile-img-container">\n                            <img src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='images/profile.jpg'))
+    yield '" alt="Ravi Kumar"\n                                class="profile-img">\n                        </div>\n                        <h3>RAVI KUMAR</h3>\n                        <p class="role">SAP End User | Data Entry Executive</p>\n                        <div class="social-links">\n                            <a href="https://linkedin.com/in/i-am-ravikumar" target="_blank"><i\n                                    class="fab fa-linkedin"></i></a>\n                            <a href="mailto:shakyar014@gmail.com"><i class="fas fa-envelope"></i></a>\n                            <a href="tel:+918400698715"><i class="fas fa-phone"></i></a>\n                        </div>\n                    </div>\n                    <div class="profile-details">\n                        <div class="detail-item">\n                            <i class="fas fa-map-marker-alt"></i>\n                            <span>NOIDA (UP) 201301</span>\n                        </div>\n                        <p class="profile-bio">\n                            Results-driven SAP End User with over 6 years of experience in Sales, Accounts, and MIS.\n                            Specializing in SAP S/4 HANA Finance, Business One, and Process Integration.\n                        </p>\n                    </div>\n                </div>\n\n                <!-- Resume Details -->\n                <div class="resume-content">\n                    <!-- Experience -->\n                    <div class="resume-block glass-card">\n                        <h3><i class="fas fa-briefcase"></i> Professional Experience</h3>\n\n                        <div class="timeline-item">\n                            <div class="timeline-header">\n                                <h4>Data Entry Executive (SAP B1)</h4>\n                                <span class="date">06/2022 – Present</span>\n                            </div>\n                            <p class="company">Trusound Pvt Ltd. (AHUJA RADIOS) | Noida</p>\n                            <ul>\n                                <li>Process purchase orders, GRPO, and manage inventory transactions.</li>\n                                <li>Create and update Item Codes, Suppliers, and BOM.</li>\n                                <li>Assist in production processes for in-house and job workers.</li>\n                            </ul>\n                        </div>\n\n                        <div class="timeline-item">\n                            <div class="timeline-header">\n                                <h4>MIS Executive</h4>\n                                <span class="date">05/2021 – 05/2022</span>\n                            </div>\n                            <p class="company">RD Automobile | Nawabganj</p>\n                            <ul>\n                                <li>Track inventory of raw materials and finished vehicles.</li>\n                                <li>Create production schedules and efficiency reports.</li>\n                                <li>Provide KPI dashboards to management.</li>\n                            </ul>\n                        </div>\n\n                        <div class="timeline-item">\n                            <div class="timeline-header">\n                                <h4>Account Executive (Tally Erp 9)</h4>\n                                <span class="date">04/2019 – 03/2020</span>\n                            </div>\n                            <p class="company">Soham Infratech | Greater Noida</p>\n                            <ul>\n                                <li>General ledger, vouchers, AP/AR, Bank Reconciliation, GST/TDS.</li>\n                                <li>Payroll and Attendance integration.</li>\n                            </ul>\n                        </div>\n                    </div>\n\n                    <!-- Skills & Education Grid -->\n                    <div class="skills-edu-grid">\n                        <div class="resume-block glass-card">\n                            <h3><i class="fas fa-graduation-cap"></i> Education</h3>\n                            <div class="edu-item">\n                                <h4>Master of Commerce (M.COM)</h4>\n                                <p>Swami Vivekanand Subharti University</p>\n                                <span class="date">2020 – 2024</span>\n                            </div>\n                            <div class="edu-item">\n                                <h4>Bachelor of Commerce (B.COM)</h4>\n                                <p>Shri Rajendra Singh College</p>\n                                <span class="date">2017 – 2019</span>\n                            </div>\n                        </div>\n\n                        <div class="resume-block glass-card">\n                            <h3><i class="fas fa-tools"></i> Skills</h3>\n                            <div class="skills-tags">\n                                <span>SAP S/4HANA Finance</span>\n                                <span>SAP Business One</span>\n                                <span>Tally ERP 9</span>\n                                <span>MS Excel (Adv)</span>\n                                <span>MS PowerPoint</span>\n                                <span>SQL (Basic)</span>\n                                <span>Python (Basic)</span>\n                                <span>IOT</span>\n                                <span>AGENT AI</span>\n                            </div>\n                        </div>\n                    </div>\n\n                </div>\n            </div>\n        </div>\n    </section>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=13&45=15'
\ No newline at end of file
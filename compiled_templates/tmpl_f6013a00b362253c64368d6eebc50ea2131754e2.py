@@ -0,0 +1,35 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_subjects = resolve('subjects')
+    l_0_session = resolve('session')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Oxford Group of Institution - Exam Portal</title>\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n    <link rel="preconnect" href="https://fonts.googleapis.com">\n    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">\n    <style>\n        :root {\n            --primary-gradient: linear-gradient(135deg, #00C6FF 0%, #0072FF 100%);\n            --glass-bg: rgba(255, 255, 255, 0.05);\n            --glass-border: rgba(255, 255, 255, 0.1);\n        }\n\n        body {\n            background: #0f172a;\n            color: #ffffff;\n            font-family: \'Outfit\', sans-serif;\n            overflow-x: hidden;\n        }\n\n        /* Animated Background */\n        .animated-bg {\n            position: fixed;\n            top: 0;\n            left: 0;\n            width: 100%;\n            height: 100%;\n            z-index: -1;\n            background:\n                radial-gradient(circle at 10% 20%, rgba(0, 198, 255, 0.1) 0%, transparent 20%),\n                radial-gradient(circle at 90% 80%, rgba(0, 114, 255, 0.1) 0%, transparent 20%);\n            animation: bg-pulse 10s ease-in-out infinite alternate;\n        }\n\n        @keyframes bg-pulse {\n            0% {\n                opacity: 0.5;\n                transform: scale(1);\n            }\n\n            100% {\n                opacity: 1;\n                transform: scale(1.1);\n            }\n        }\n\n        .hero-section {\n            min-height: 100vh;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            padding: 2rem;\n            position: relative;\n        }\n\n        .hero-content {\n            z-index: 1;\n            width: 100%;\n            max-width: 800px;\n        }\n\n        .typing-text-institution {\n            font-size: 3.5rem;\n            font-weight: 700;\n            margin-bottom: 1rem;\n            background: var(--primary-gradient);\n            -webkit-background-clip: text;\n            background-clip: text;\n            -webkit-text-fill-color: transparent;\n            text-shadow: 0 0 30px rgba(0, 198, 255, 0.3);\n            min-height: 1.2em;\n        }\n\n        .typing-text-dev {\n            font-size: 1.1rem;\n            letter-spacing: 3px;\n            color: rgba(255, 255, 255, 0.6);\n            margin-bottom: 4rem;\n            text-transform: uppercase;\n        }\n\n        .exam-card {\n            background: var(--glass-bg);\n            backdrop-filter: blur(20px);\n            -webkit-backdrop-filter: blur(20px);\n            border: 1px solid var(--glass-border);\n            border-radius: 24px;\n            padding: 3rem;\n            box-shadow: 0 20px 50px rgba(0, 0, 0, 0.3);\n            transform: translateY(20px);\n            opacity: 0;\n            animation: fade-up 0.8s ease-out forwards 0.5s;\n        }\n\n        @keyframes fade-up {\n            to {\n                transform: translateY(0);\n                opacity: 1;\n            }\n        }\n\n        .card-header h2 {\n            font-size: 2rem;\n            font-weight: 600;\n            margin-bottom: 0.5rem;\n        }\n\n        .card-header p {\n            color: rgba(255, 255, 255, 0.6);\n            margin-bottom: 2rem;\n        }\n\n        .controls-grid {\n            display: grid;\n            grid-template-columns: 1fr 1.5fr auto;\n            gap: 1rem;\n            align-items: center;\n        }\n\n        .subject-select {\n            width: 100%;\n            padding: 1rem 1.5rem;\n            background: rgba(0, 0, 0, 0.2);\n            border: 1px solid var(--glass-border);\n            border-radius: 12px;\n            color: white;\n            font-family: inherit;\n            font-size: 1rem;\n            cursor: pointer;\n            transition: all 0.3s ease;\n            appearance: none;\n            background-image: url("data:image/svg+xml,%3Csvg xmlns=\'http://www.w3.org/2000/svg\' width=\'24\' height=\'24\' viewBox=\'0 0 24 24\' fill=\'none\' stroke=\'white\' stroke-width=\'2\' stroke-linecap=\'round\' stroke-linejoin=\'round\'%3E%3Cpolyline points=\'6 9 12 15 18 9\'%3E%3C/polyline%3E%3C/svg%3E");\n            background-repeat: no-repeat;\n            background-position: right 1rem center;\n            background-size: 1.2em;\n        }\n\n        .subject-select:hover {\n            border-color: rgba(255, 255, 255, 0.3);\n            background-color: rgba(0, 0, 0, 0.3);\n        }\n\n        .subject-select:focus {\n            outline: none;\n            border-color: #00C6FF;\n            box-shadow: 0 0 0 3px rgba(0, 198, 255, 0.2);\n        }\n\n        /* Modern Button Styles */\n        .btn-modern {\n            padding: 1rem 2rem;\n            border-radius: 12px;\n            font-weight: 600;\n            letter-spacing: 0.5px;\n            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);\n            position: relative;\n            overflow: hidden;\n            display: inline-flex;\n            align-items: center;\n            justify-content: center;\n            gap: 0.5rem;\n            cursor: pointer;\n            text-decoration: none;\n        }\n\n        .btn-Login {\n            background: transparent;\n            border: 1px solid var(--glass-border);\n            color: white;\n        }\n\n        .btn-Login:hover {\n            border-color: white;\n            background: rgba(255, 255, 255, 0.05);\n            transform: translateY(-2px);\n        }\n\n        .btn-Start {\n            background: var(--primary-gradient);\n            border: none;\n            color: white;\n            box-shadow: 0 0 20px rgba(0, 198, 255, 0.4);\n        }\n\n        .btn-Start:hover {\n            transform: translateY(-2px);\n            box-shadow: 0 10px 30px rgba(0, 198, 255, 0.6);\n        }\n\n        .btn-Start:active {\n            transform: translateY(0);\n        }\n\n        /* Responsive */\n        @media (max-width: 768px) {\n            .typing-text-institution {\n                font-size: 2rem;\n            }\n\n            .controls-grid {\n                grid-template-columns: 1fr;\n            }\n\n            .exam-card {\n                padding: 2rem;\n            }\n        }\n\n        /* Spinner */\n        #loading-overlay {\n            position: fixed;\n            inset: 0;\n            background: rgba(15, 23, 42, 0.9);\n            backdrop-filter: blur(10px);\n            display: flex;\n            flex-direction: column;\n            align-items: center;\n            justify-content: center;\n            z-index: 9999;\n            opacity: 0;\n            pointer-events: none;\n            transition: opacity 0.3s ease;\n        }\n\n        #loading-overlay.visible {\n            opacity: 1;\n            pointer-events: all;\n        }\n\n        .spinner {\n            width: 50px;\n            height: 50px;\n            border: 3px solid rgba(255, 255, 255, 0.1);\n            border-radius: 50%;\n            border-top-color: #00C6FF;\n            animation: spin 1s ease-in-out infinite;\n            margin-bottom: 1rem;\n        }\n\n        @keyframes spin {\n            to {\n                transform: rotate(360deg);\n            }\n        }\n    </style>\n</head>\n\n<body>\n    <div class="animated-bg"></div>\n\n    <!-- Sidebar Navigation -->\n    <div class="sidebar-overlay" id="sidebar-overlay"></div>\n    <nav class="sidebar" id="sidebar">\n        <div class="sidebar-header">\n            <h3>Menu</h3>\n            <button class="close-btn" id="close-sidebar">&times;</button>\n        </div>\n        <ul class="sidebar-nav">\n            <li><a href="/" class="nav-link active"><i class="fas fa-home"></i> Home</a></li>\n            <li><a href="/register" class="nav-link"><i class="fas fa-user-plus"></i> Register</a></li>\n            <li><a href="/login" class="nav-link"><i class="fas fa-sign-in-alt"></i> Student Login</a></li>\n            <li><a href="/admin/login" class="nav-link"><i class="fas fa-user-shield"></i> Admin</a></li>\n            <li><a href="/portfolio" class="nav-link"><i class="fas fa-id-card"></i> Developer Profile</a></li>\n        </ul>\n    </nav>\n\n    <!-- Hamburger Menu -->\n    <div class="hamburger-menu" id="hamburger-btn">\n        <div class="bar"></div>\n        <div class="bar"></div>\n        <div class="bar"></div>\n    </div>\n\n    <!-- Main Content -->\n    <section class="hero-section">\n        <div class="hero-content text-center">\n            <!-- Typing Effect for Institution Name -->\n            <h1 class="typing-text-institution" id="institution-text"></h1>\n\n            <!-- Typing Effect for Developer Name -->\n            <p class="typing-text-dev">Made with <i class="fas fa-heart" style="color: #ff4757; margin: 0 5px;"></i>\n                <span id="dev-name-text"></span>\n            </p>\n\n            <!-- Exam Card -->\n            <div class="exam-card">\n                <div class="card-header">\n                    <h2>Start Your Journey</h2>\n                    <p>Select your subject to begin the assessment</p>\n                </div>\n\n                <div class="controls-grid">\n                    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'login_page'))
+    yield '" class="btn-modern btn-Login">\n                        <i class="fas fa-user-graduate"></i> Student Login\n                    </a>\n\n                    <div class="subject-wrapper">\n                        <select id="subject-select" class="subject-select">\n                            <option value="">Select Subject...</option>\n                            '
+    for l_1_subject in (undefined(name='subjects') if l_0_subjects is missing else l_0_subjects):
+        _loop_vars = {}
+        pass
+        yield '\n                            <option value="'
+        yield escape(l_1_subject)
+        yield '">'
+        yield escape(l_1_subject)
+        yield '</option>\n                            '
+    l_1_subject = missing
+    yield '\n                        </select>\n                    </div>\n\n                    <button id="start-exam-btn" class="btn-modern btn-Start">\n                        Start Exam <i class="fas fa-arrow-right"></i>\n                    </button>\n                </div>\n            </div>\n        </div>\n    </section>\n\n    <!-- Loading Overlay -->\n    <div id="loading-overlay">\n        <div class="spinner"></div>\n        <p style="letter-spacing: 1px; font-weight: 500;">Initializing Environment...</p>\n    </div>\n\n    <script>\n        // Typing Effect\n        const institutionText = "OXFORD GROUP OF INSTITUTION";\n        const devNameText = " by RAVI KUMAR";\n\n        async function typeText(elementId, text, speed = 60, delay = 0) {\n            const element = document.getElementById(elementId);\n            element.innerHTML = \'\'; // Ensure clear start\n            await new Promise(r => setTimeout(r, delay));\n\n            for (let i = 0; i < text.length; i++) {\n                element.innerHTML += text.charAt(i);\n                await new Promise(resolve => setTimeout(resolve, speed));\n            }\n        }\n\n        window.onload = async function () {\n            await typeText(\'institution-text\', institutionText, 50, 200);\n            await typeText(\'dev-name-text\', devNameText, 80, 500);\n        };\n\n        // Exam Start Logic\n        document.getElementById(\'start-exam-btn\').addEventListener(\'click\', function () {\n            // Check login status\n            const isLoggedIn = '
+    yield escape(('true' if context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'student_roll') else 'false'))
+    yield ';\n\n        if (!isLoggedIn) {\n            window.location.href = "'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'login_page'))
+    yield '";\n            return;\n        }\n\n        const subject = document.getElementById(\'subject-select\').value;\n        const overlay = document.getElementById(\'loading-overlay\');\n\n        if (subject) {\n            overlay.classList.add(\'visible\');\n\n            // Simulate loading for better UX\n            setTimeout(() => {\n                window.location.href = \'/exam/\' + encodeURIComponent(subject);\n            }, 800);\n        } else {\n            // Shake animation or visual feedback for no selection\n            const select = document.getElementById(\'subject-select\');\n            select.style.borderColor = \'#ff4757\';\n            select.style.boxShadow = \'0 0 0 3px rgba(255, 71, 87, 0.2)\';\n            setTimeout(() => {\n                select.style.borderColor = \'\';\n                select.style.boxShadow = \'\';\n            }, 2000);\n        }\n        });\n\n        // Sidebar Logic (Reuse existing if available in main.js, else inline here for reliability)\n        const hamburger = document.getElementById(\'hamburger-btn\');\n        const sidebar = document.getElementById(\'sidebar\');\n        const closeBtn = document.getElementById(\'close-sidebar\');\n        const sidebarOverlay = document.getElementById(\'sidebar-overlay\');\n\n        function toggleSidebar() {\n            sidebar.classList.toggle(\'active\');\n            sidebarOverlay.classList.toggle(\'active\');\n            hamburger.classList.toggle(\'active\');\n        }\n\n        if (hamburger) hamburger.addEventListener(\'click\', toggleSidebar);\n        if (closeBtn) closeBtn.addEventListener(\'click\', toggleSidebar);\n        if (sidebarOverlay) sidebarOverlay.addEventListener(\'click\', toggleSidebar);\n    </script>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '8=15&299=17&306=19&307=23&350=29&354=31'
\ No newline at end of file
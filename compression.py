@@ -0,0 +1,160 @@
+"""
+Response compression
+
+An after_request hook that compresses text responses (JSON, HTML, CSS, JS,
+CSV, NDJSON) for clients that accept it. Brotli and zstd are used when their
+optional packages are installed; gzip is always available.
+
+    * Responses below Config.COMPRESS_MIN_SIZE, non-allowlisted content types,
+      responses that are already encoded, partial content and bodiless
+      statuses are left alone.
+    * Streamed responses (the NDJSON upload progress) are gzipped chunk by
+      chunk with a sync flush, so every progress line still reaches the
+      browser as soon as it is produced.
+    * Responses with an ETag (static files, exam papers, cached pages) are
+      compressed once per encoding and served from a small cache after that
+      (strong ETags only; a weak one does not promise identical bytes).
+      Their ETag is made weak, the usual convention for a transfer-encoded
+      representation; If-None-Match uses weak comparison, so 304s still work.
+"""
+
+import zlib
+
+from flask import request
+
+from cache import TTLCache
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+_BODYLESS_STATUSES = {204, 206, 304}
+
+
+def _gzip(data, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+    return compressor.compress(data) + compressor.flush()
+
+
+class ResponseCompressor:
+    """Compresses Flask responses according to Accept-Encoding"""
+
+    def __init__(self, app=None):
+        self.cache = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.config = app.config
+        self.mimetypes = set(app.config['COMPRESS_MIMETYPES'])
+        self.cache = TTLCache('compressed_responses', maxsize=app.config['COMPRESS_CACHE_SIZE'],
+                              ttl=app.config['COMPRESS_CACHE_TTL'])
+
+        # Preference order among the encodings this process can produce
+        self.encodings = {'gzip': lambda data: _gzip(data, self.config['COMPRESS_LEVEL'])}
+        if brotli is not None:
+            self.encodings['br'] = lambda data: brotli.compress(
+                data, quality=self.config['COMPRESS_BROTLI_QUALITY'])
+        if zstandard is not None:
+            self.encodings['zstd'] = lambda data: zstandard.ZstdCompressor(
+                level=self.config['COMPRESS_ZSTD_LEVEL']).compress(data)
+        self.preference = [name for name in ('br', 'zstd', 'gzip') if name in self.encodings]
+
+        app.after_request(self.after_request)
+
+    def choose_encoding(self, streamed=False):
+        """Best encoding the client accepts, or None"""
+        accepted = request.accept_encodings
+        candidates = ['gzip'] if streamed else self.preference
+        best, best_quality = None, 0
+        for name in candidates:
+            quality = accepted[name]
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    def _compressible(self, response):
+        if not self.config['COMPRESS_ENABLED']:
+            return False
+        if response.status_code < 200 or response.status_code in _BODYLESS_STATUSES:
+            return False
+        if request.method == 'HEAD' or 'Content-Encoding' in response.headers:
+            return False
+        if response.mimetype not in self.mimetypes:
+            return False
+        if 'no-transform' in response.headers.get('Cache-Control', ''):
+            return False
+        return True
+
+    def after_request(self, response):
+        if not self._compressible(response):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        # send_file responses (direct passthrough) have a known length and are
+        # buffered below; other iterables are genuine streams
+        if response.is_streamed and not response.direct_passthrough:
+            encoding = self.choose_encoding(streamed=True)
+            if encoding:
+                self._compress_stream(response)
+            return response
+
+        if response.content_length is not None and response.content_length < self.config['COMPRESS_MIN_SIZE']:
+            return response
+
+        encoding = self.choose_encoding()
+        if not encoding:
+            return response
+
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < self.config['COMPRESS_MIN_SIZE']:
+            return response
+
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            key = (etag, encoding)
+            compressed = self.cache.get(key)
+            if compressed is None:
+                compressed = self.encodings[encoding](data)
+                self.cache.set(key, compressed)
+        else:
+            compressed = self.encodings[encoding](data)
+
+        if len(compressed) >= len(data):
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        if etag:
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _compress_stream(self, response):
+        level = self.config['COMPRESS_LEVEL']
+        chunks = response.response
+
+        def generate():
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            try:
+                for chunk in chunks:
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode('utf-8')
+                    data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                    if data:
+                        yield data
+                yield compressor.flush()
+            finally:
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+
+        response.response = generate()
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers.pop('Content-Length', None)
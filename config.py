@@ -1,8 +1,10 @@
 import os
+import tempfile
 from datetime import timedelta
-from dotenv import load_dotenv
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (local development; deployments set them directly)
+if os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')):
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'))
 class Config:
     """Base configuration class for the exam portal"""
     
@@ -19,18 +21,19 @@ class Config:
     # Use Atlas if available, otherwise local
     if not MONGO_URI:
         MONGO_URI = MONGO_URI_LOCAL
-        print("ℹ️  INFO: Using local MongoDB (Offline Mode)")
-    else:
-        print("✅ INFO: Using production MongoDB")
     
     # Database name
     DB_NAME = 'olevel_exam'
     
+    # Connection pool of the async exam API (async_api.py); requests share it instead of holding threads
+    ASYNC_MONGO_POOL_SIZE = 20
+    
     # Session configuration
     PERMANENT_SESSION_LIFETIME = timedelta(hours=3)
     SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
+    SESSION_PROFILE_TTL = 300  # Seconds the student name/subject cached in the session is trusted
     
     # Exam settings
     EXAM_DURATION_MINUTES = 60
@@ -39,9 +42,99 @@ class Config:
     
     # Pagination
     STUDENTS_PER_PAGE = 20
+    QUESTIONS_PER_PAGE = 20
     
-    # File upload settings (for future enhancements)
+    # File upload settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    UPLOAD_BATCH_SIZE = 1000  # Rows per insert_many during CSV upload
+    UPLOAD_MAX_ERRORS = 100  # Per-row errors reported back (the rest are only counted)
+    
+    # Duplicate detection
+    NEAR_DUPLICATE_THRESHOLD = 0.9  # Estimated Jaccard similarity that counts as a near-duplicate
+    DUPLICATE_INDEX_TTL = 300  # Seconds before the in-process index is rebuilt from the database
+    
+    # Read-through caches for student/exam lookups (per process)
+    MODEL_CACHE_TTL = 30  # Seconds; bounds staleness of writes made by other workers
+    STUDENT_CACHE_SIZE = 2000
+    EXAM_CACHE_SIZE = 4000
+    SINGLE_FLIGHT_TIMEOUT = 10  # Seconds a caller waits for an identical in-flight query before giving up
+    
+    # Subject catalog (per-subject question counts)
+    SUBJECT_CATALOG_TTL = 60  # Seconds before the cached counts are refreshed from the database
+    
+    # Admin question search
+    SEARCH_INDEX_TTL = 300  # Seconds before the in-process search index is rebuilt from the database
+    QUESTION_BANK_TTL = 300  # Seconds before the question bank snapshot is rebuilt from the database
+    
+    # Memory-mapped question bank snapshot shared by all workers on a host ('' keeps it in process memory)
+    QUESTION_SNAPSHOT_PATH = os.environ.get('QUESTION_SNAPSHOT_PATH', os.path.join(tempfile.gettempdir(), 'olevel_questions.snapshot'))
+    QUESTION_SNAPSHOT_CHECK_INTERVAL = 5  # Seconds between checks for a snapshot written by another worker
+    
+    # Response compression (brotli/zstd are used when installed, gzip otherwise)
+    COMPRESS_ENABLED = True
+    COMPRESS_MIN_SIZE = 1024  # Bytes; smaller bodies are sent as-is
+    COMPRESS_LEVEL = 6  # gzip level (1 fastest - 9 smallest)
+    COMPRESS_BROTLI_QUALITY = 5
+    COMPRESS_ZSTD_LEVEL = 3
+    COMPRESS_MIMETYPES = [
+        'text/html', 'text/css', 'text/plain', 'text/csv', 'text/javascript',
+        'application/javascript', 'application/json', 'application/x-ndjson', 'image/svg+xml'
+    ]
+    COMPRESS_CACHE_SIZE = 256  # Compressed bodies kept for responses with a strong ETag
+    COMPRESS_CACHE_TTL = 3600
+    
+    # Full-page micro-cache for the landing, login, register and portfolio pages
+    PAGE_CACHE_ENABLED = True
+    PAGE_CACHE_TTL = 30  # Seconds a rendered page is served as fresh
+    PAGE_CACHE_STALE = 300  # Further seconds it may be served while it is re-rendered in the background
+    PAGE_CACHE_SIZE = 200
+    PAGE_CACHE_BYPASS_PREFIXES = ['/admin', '/api', '/exam', '/result']  # Never cached
+    
+    # Jinja templates: modules precompiled by `python template_cache.py build`, and a bytecode cache ('' disables)
+    TEMPLATE_PRECOMPILED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compiled_templates')
+    TEMPLATE_BYTECODE_DIR = os.environ.get('TEMPLATE_BYTECODE_DIR', os.path.join(tempfile.gettempdir(), 'olevel_jinja_cache'))
+    TEMPLATE_PROFILE = os.environ.get('TEMPLATE_PROFILE', '').lower() in ('1', 'true', 'yes')  # Record render time per template
+    
+    # Print import, setup and first-request timings once per worker (see startup.py for the cold-start budget)
+    STARTUP_PROFILE = os.environ.get('STARTUP_PROFILE', '').lower() in ('1', 'true', 'yes')
+    
+    # Admission control for exam starts: bursts beyond the cap wait in a FIFO queue
+    ADMISSION_ENABLED = True
+    ADMISSION_SCOPE = os.environ.get('ADMISSION_SCOPE', 'global')  # 'global' (MongoDB, across workers) or 'worker' (in process, single-worker dev only)
+    ADMISSION_MAX_CONCURRENT = int(os.environ.get('ADMISSION_MAX_CONCURRENT', 8))  # Exam starts processed at once (per worker with 'worker')
+    ADMISSION_RETRY_AFTER = 2  # Seconds between polls of a queued student
+    ADMISSION_TICKET_TTL = 30  # Seconds without a poll before a queued ticket loses its place
+    ADMISSION_LEASE = 30  # Seconds before an admitted start that never finished frees its slot ('global')
+    
+    # Expiry sweeper: finalizes exams abandoned past EXAM_DURATION_MINUTES (see exam_sweeper.py)
+    EXAM_SWEEP_INTERVAL = int(os.environ.get('EXAM_SWEEP_INTERVAL', 60))  # Seconds between sweeps per worker (0 disables the thread)
+    EXAM_SWEEP_GRACE = 120  # Seconds past the deadline left for the browser's own auto-submit
+    EXAM_SWEEP_BATCH = 200  # Exams scored and written per bulk_write
+    EXAM_SWEEP_MAX_BATCHES = 50  # Per sweep, so one run stays short
+    EXAM_SWEEP_LEASE = 60  # Seconds the sweeping worker holds the lease between renewals
+    
+    # Bulk regrades (python regrade.py)
+    REGRADE_BATCH_SIZE = 500  # Exams scored and written per bulk_write
+    
+    # Idempotency keys: retried save_answer/submit_exam requests get the first response replayed (see idempotency.py)
+    IDEMPOTENCY_ENABLED = True
+    IDEMPOTENCY_CACHE_SIZE = 20000  # Stored responses kept per worker
+    IDEMPOTENCY_TTL = 2 * 3600  # Seconds a key is remembered (in process and in idempotency_keys)
+    IDEMPOTENCY_DURABLE_SCOPES = ['submit_exam']  # Routes whose keys are also stored in MongoDB, for retries on other workers
+    IDEMPOTENCY_PENDING_TIMEOUT = 30  # Seconds before a claimed key whose request never finished can be retried
+    
+    # Load shedding: while MongoDB is slow or the worker is backed up, low-priority routes get a 503
+    SHED_ENABLED = True
+    SHED_CRITICAL_ENDPOINTS = ['exam_page', 'start_exam', 'exam_paper', 'save_answer', 'submit_exam',
+                               'get_traffic_stats']  # Never shed
+    SHED_LOW_PRIORITY_PREFIXES = ['/admin', '/api/admin', '/result', '/portfolio']  # Shed first; the rest second
+    SHED_LOW_LATENCY_MS = 250  # p90 MongoDB command latency above which low-priority routes are shed
+    SHED_NORMAL_LATENCY_MS = 1000  # ... and normal routes too
+    SHED_LOW_IN_FLIGHT = 16  # Requests in flight in a worker above which low-priority routes are shed
+    SHED_NORMAL_IN_FLIGHT = 32  # ... and normal routes too
+    SHED_WINDOW = 10  # Seconds of commands the latency is measured over
+    SHED_COOLDOWN = 5  # Seconds a level is held after the signals drop
+    SHED_RETRY_AFTER = 5  # Retry-After of a shed request
     
     # Admin credentials (default - should be changed)
     DEFAULT_ADMIN_USERNAME = 'admin'
@@ -0,0 +1,282 @@
+"""
+Duplicate question detection
+
+Exact duplicates are blocked by the unique index on questions.content_hash.
+Lightly reworded copies are caught by an in-process MinHash/LSH index over
+the normalised question text and options, kept per subject:
+
+    * Each question is cut into 4-character shingles, hashed with crc32 and
+      summarised by a 32-value MinHash signature.
+    * The signature is split into 8 bands of 4 values. Questions that share
+      any band bucket are candidates, and a candidate is reported when the
+      estimated Jaccard similarity reaches Config.NEAR_DUPLICATE_THRESHOLD.
+
+The index is loaded lazily, updated on add/delete in this process and
+rebuilt after Config.DUPLICATE_INDEX_TTL seconds so other workers' writes are
+picked up.
+
+Usage:
+    python dedupe.py report          # list duplicate clusters
+    python dedupe.py merge-exact     # delete exact copies not used by running exams
+"""
+
+import random
+import threading
+import time
+import zlib
+from array import array
+
+from config import Config
+from models import db_manager, Question, Exam
+from utils import normalize_text, question_hash
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20251201)  # Fixed seed: signatures must be stable across workers
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def question_text_for_matching(question_text, options):
+    """Text that near-duplicate matching is based on"""
+    return normalize_text(' '.join([question_text] + list(options)))
+
+
+def minhash_signature(text):
+    """MinHash signature (array of NUM_PERM 32-bit values) of a normalised text"""
+    data = text.encode('utf-8')
+    shingles = {zlib.crc32(data[i:i + SHINGLE_SIZE])
+                for i in range(max(1, len(data) - SHINGLE_SIZE + 1))}
+    return array('I', [min((a * x + b) % _PRIME for x in shingles) & 0xFFFFFFFF
+                       for a, b in _PERMUTATIONS])
+
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def _band_keys(subject, signature):
+    return [(subject, band, hash(tuple(signature[band * ROWS:(band + 1) * ROWS])))
+            for band in range(BANDS)]
+
+
+class DuplicateMatch:
+    """Result of checking a question against the index"""
+
+    def __init__(self, exact_id=None, similar=None):
+        self.exact_id = exact_id
+        self.similar = similar or []  # [(question_id, similarity), ...] best first
+
+    def __bool__(self):
+        return bool(self.exact_id or self.similar)
+
+    def message(self):
+        if self.exact_id:
+            return 'Duplicate of an existing question'
+        question_id, similarity = self.similar[0]
+        return f'Near-duplicate of question {question_id} ({similarity:.0%} similar)'
+
+
+class NearDuplicateIndex:
+    """In-process content-hash and MinHash/LSH index over the question bank"""
+
+    def __init__(self, threshold=None, ttl=None):
+        self.threshold = Config.NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+        self.ttl = Config.DUPLICATE_INDEX_TTL if ttl is None else ttl
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._hashes = {}      # content_hash -> question_id
+        self._entries = {}     # question_id -> (subject, content_hash, signature)
+        self._buckets = {}     # (subject, band, band_hash) -> set(question_id)
+
+    # ---------- maintenance ----------
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt from the database on next use"""
+        with self._lock:
+            self._loaded_at = None
+            self._hashes = {}
+            self._entries = {}
+            self._buckets = {}
+
+    def _ensure_loaded(self):
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return
+        self.invalidate()
+        db = db_manager.get_db()
+        cursor = db.questions.find({}, {'question': 1, 'options': 1, 'subject': 1, 'content_hash': 1})
+        for q in cursor:
+            self._add(str(q['_id']), q.get('question', ''), q.get('options', []),
+                      q.get('subject', ''), q.get('content_hash'))
+        self._loaded_at = time.monotonic()
+
+    def _add(self, question_id, question_text, options, subject, content_hash=None, signature=None):
+        content_hash = content_hash or question_hash(question_text, options, subject)
+        if signature is None:
+            signature = minhash_signature(question_text_for_matching(question_text, options))
+        self._hashes.setdefault(content_hash, question_id)
+        self._entries[question_id] = (subject, content_hash, signature)
+        for key in _band_keys(subject, signature):
+            self._buckets.setdefault(key, set()).add(question_id)
+
+    def add(self, question_id, question_text, options, subject, signature=None):
+        """Register a newly inserted question"""
+        with self._lock:
+            if self._loaded_at is not None:
+                self._add(str(question_id), question_text, options, subject, signature=signature)
+
+    def remove(self, question_id):
+        """Forget a deleted question"""
+        question_id = str(question_id)
+        with self._lock:
+            entry = self._entries.pop(question_id, None)
+            if not entry:
+                return
+            subject, content_hash, signature = entry
+            if self._hashes.get(content_hash) == question_id:
+                del self._hashes[content_hash]
+            for key in _band_keys(subject, signature):
+                bucket = self._buckets.get(key)
+                if bucket:
+                    bucket.discard(question_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+    # ---------- lookups ----------
+
+    def _similar(self, subject, signature, exclude=None):
+        candidates = set()
+        for key in _band_keys(subject, signature):
+            candidates |= self._buckets.get(key, set())
+        candidates.discard(exclude)
+
+        similar = []
+        for question_id in candidates:
+            score = estimate_similarity(signature, self._entries[question_id][2])
+            if score >= self.threshold:
+                similar.append((question_id, score))
+        similar.sort(key=lambda item: item[1], reverse=True)
+        return similar
+
+    def check(self, question_text, options, subject, signature=None):
+        """
+        Look a question up before inserting it
+
+        Returns:
+            tuple: (DuplicateMatch, signature) - pass the signature on to add()
+        """
+        content_hash = question_hash(question_text, options, subject)
+        if signature is None:
+            signature = minhash_signature(question_text_for_matching(question_text, options))
+        with self._lock:
+            self._ensure_loaded()
+            exact_id = self._hashes.get(content_hash)
+            if exact_id:
+                return DuplicateMatch(exact_id=exact_id), signature
+            return DuplicateMatch(similar=self._similar(subject, signature)), signature
+
+    def clusters(self):
+        """
+        Group the whole bank into duplicate clusters
+
+        Returns:
+            list: [{'kind': 'exact'|'near', 'ids': [...]}, ...], largest first
+        """
+        with self._lock:
+            self._ensure_loaded()
+            parent = {}
+
+            def find(x):
+                parent.setdefault(x, x)
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+
+            def union(x, y):
+                rx, ry = find(x), find(y)
+                if rx != ry:
+                    parent[ry] = rx
+
+            for question_id, (subject, _, signature) in self._entries.items():
+                for other_id, _ in self._similar(subject, signature, exclude=question_id):
+                    union(question_id, other_id)
+
+            groups = {}
+            for question_id in list(parent):
+                groups.setdefault(find(question_id), []).append(question_id)
+
+            clusters = []
+            for ids in groups.values():
+                if len(ids) < 2:
+                    continue
+                hashes = {self._entries[qid][1] for qid in ids}
+                clusters.append({'kind': 'exact' if len(hashes) == 1 else 'near', 'ids': sorted(ids)})
+
+        clusters.sort(key=lambda c: len(c['ids']), reverse=True)
+        return clusters
+
+
+# Shared per-process index
+duplicate_index = NearDuplicateIndex()
+
+
+def exact_duplicate_groups():
+    """Groups of question IDs sharing a content hash, via one aggregation"""
+    db = db_manager.get_db()
+    return list(db.questions.aggregate([
+        {'$match': {'content_hash': {'$exists': True}}},
+        {'$group': {'_id': '$content_hash', 'ids': {'$push': '$_id'}, 'count': {'$sum': 1}}},
+        {'$match': {'count': {'$gt': 1}}}
+    ], allowDiskUse=True))
+
+
+def merge_exact_duplicates():
+    """
+    Delete extra copies of exactly duplicated questions
+
+    The oldest copy is kept. Copies used by exams still in progress are kept
+    too so those exams can still be scored.
+
+    Returns:
+        tuple: (deleted_count, kept_in_use_count)
+    """
+    Question.backfill_content_hashes()
+    active = Exam.get_in_progress_question_ids()
+    to_delete = []
+    kept = 0
+    for group in exact_duplicate_groups():
+        for question_id in sorted(group['ids'])[1:]:
+            if str(question_id) in active:
+                kept += 1
+            else:
+                to_delete.append(question_id)
+
+    deleted = Question.delete_by_ids(to_delete)
+    duplicate_index.invalidate()
+    return deleted, kept
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Find or merge duplicate questions')
+    parser.add_argument('command', choices=['report', 'merge-exact'])
+    args = parser.parse_args()
+
+    db_manager.connect()
+    if args.command == 'merge-exact':
+        deleted, kept = merge_exact_duplicates()
+        print(f"Deleted {deleted} duplicate questions ({kept} kept because running exams use them)")
+        Question.ensure_indexes()
+    else:
+        clusters = duplicate_index.clusters()
+        for cluster in clusters:
+            print(f"[{cluster['kind']}] {len(cluster['ids'])} questions")
+            for q in Question.get_by_ids(cluster['ids']):
+                print(f"    {q['_id']}  {q.get('subject', '')}: {q.get('question', '')[:80]}")
+        print(f"{len(clusters)} clusters")
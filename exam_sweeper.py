@@ -0,0 +1,195 @@
+"""
+Server-side expiry of abandoned exams
+
+An exam is only scored when the browser submits it, so a closed tab leaves
+it 'in_progress' forever. The sweeper finalizes exams whose time ran out:
+
+    * expired exams are found through the (status, start_time) index, oldest
+      first, Config.EXAM_SWEEP_BATCH at a time, once they are past
+      EXAM_DURATION_MINUTES plus Config.EXAM_SWEEP_GRACE seconds (so the
+      browser's own auto-submit at 00:00 wins when the student is there);
+    * a batch is scored from its saved answers with a single query for the
+      answer keys of all of its questions;
+    * each batch is written with one bulk_write to exams (score, grade,
+      submit_time = the deadline, auto_submitted) and one to students
+      (exam_taken).
+
+Every update is conditional on status 'in_progress', so a sweep is
+idempotent and never overwrites a submission that happened meanwhile. Only
+the worker holding the 'exam_sweeper' lease (models.Lease, renewed per
+batch) sweeps, so several workers can run the sweeper side by side.
+
+init_app() runs it every Config.EXAM_SWEEP_INTERVAL seconds in a daemon
+thread. Serverless deployments, whose instances freeze between requests,
+can call `python exam_sweeper.py run` from a scheduler instead. Counters
+are reported by stats() and /api/admin/exam_sweeper.
+
+Usage:
+    python exam_sweeper.py run [--max-batches N]
+    python exam_sweeper.py pending
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from pymongo import UpdateOne
+
+from config import Config
+from models import Exam, Lease, Question, Student, db_manager, exam_cache, student_cache
+from utils import get_exam_status
+
+LEASE_NAME = 'exam_sweeper'
+
+
+def expiry_cutoff():
+    """Exams started before this are past their time plus the grace period"""
+    return datetime.now() - timedelta(minutes=Config.EXAM_DURATION_MINUTES, seconds=Config.EXAM_SWEEP_GRACE)
+
+
+class ExamSweeper:
+    """Finalizes expired in-progress exams in batches"""
+
+    def __init__(self):
+        self.holder = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}'
+        self._lock = threading.Lock()
+        self._thread = None
+        self._counters = {
+            'runs': 0, 'skipped_no_lease': 0, 'batches': 0, 'expired_found': 0,
+            'finalized': 0, 'already_completed': 0, 'errors': 0
+        }
+        self._last = {}
+
+    # ---------- sweeping ----------
+
+    def sweep(self, max_batches=None):
+        """Finalize expired exams; returns counts for this run"""
+        started = time.perf_counter()
+        run = {'batches': 0, 'expired_found': 0, 'finalized': 0, 'already_completed': 0}
+        max_batches = Config.EXAM_SWEEP_MAX_BATCHES if max_batches is None else max_batches
+        try:
+            if not Lease.acquire(LEASE_NAME, self.holder, Config.EXAM_SWEEP_LEASE):
+                self._count(skipped_no_lease=1)
+                return {**run, 'lease': False}
+
+            try:
+                while run['batches'] < max_batches:
+                    exams = [exam for exam in Exam.find_expired(expiry_cutoff(), Config.EXAM_SWEEP_BATCH)
+                             if get_exam_status(exam['start_time'], exam.get('submit_time'),
+                                                Config.EXAM_DURATION_MINUTES) == 'expired']
+                    if not exams:
+                        break
+                    finalized = self.finalize(exams)
+                    run['batches'] += 1
+                    run['expired_found'] += len(exams)
+                    run['finalized'] += finalized
+                    run['already_completed'] += len(exams) - finalized
+                    if len(exams) < Config.EXAM_SWEEP_BATCH:
+                        break
+                    # Renew per batch; stop if another worker took over (e.g. this one stalled)
+                    if not Lease.acquire(LEASE_NAME, self.holder, Config.EXAM_SWEEP_LEASE):
+                        break
+            finally:
+                Lease.release(LEASE_NAME, self.holder)
+
+            run['lease'] = True
+            return run
+        except Exception as e:
+            self._count(errors=1)
+            with self._lock:
+                self._last['error'] = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            duration = round((time.perf_counter() - started) * 1000, 2)
+            self._count(runs=1, **{key: run[key] for key in ('batches', 'expired_found', 'finalized', 'already_completed')})
+            with self._lock:
+                self._last.update({'at': datetime.now(), 'duration_ms': duration, 'run': dict(run)})
+
+    def finalize(self, exams):
+        """Score a batch of expired exams and complete them; returns how many were still in progress"""
+        question_ids = list({qid for exam in exams for qid in exam['questions']})
+        questions = {str(q['_id']): q for q in Question.get_answer_keys(question_ids)}
+
+        exam_updates, student_updates = [], []
+        for exam in exams:
+            exam_questions = [questions[qid] for qid in exam['questions'] if qid in questions]
+            score, total, percentage, grade = Exam.score(exam, exam_questions)
+            exam_updates.append(UpdateOne(*Exam.auto_submit_update(exam, score, total, percentage, grade)))
+            student_updates.append(UpdateOne(*Student.exam_taken_update(exam['student_roll'])))
+
+        db = db_manager.get_db()
+        result = db.exams.bulk_write(exam_updates, ordered=False)
+        db.students.bulk_write(student_updates, ordered=False)
+
+        for roll_number in {exam['student_roll'] for exam in exams}:
+            exam_cache.invalidate_tag(roll_number)
+            student_cache.invalidate_tag(roll_number)
+        return result.modified_count
+
+    # ---------- background thread ----------
+
+    def init_app(self, app):
+        """Start the background sweep with the first request, when EXAM_SWEEP_INTERVAL is set"""
+        if not app.config['EXAM_SWEEP_INTERVAL']:
+            return
+
+        @app.before_request
+        def start_exam_sweeper():
+            if self._thread is None:
+                with self._lock:
+                    if self._thread is None:
+                        self._thread = threading.Thread(target=self._loop, name='exam-sweeper', daemon=True)
+                        self._thread.start()
+
+    def _loop(self):
+        while True:
+            time.sleep(Config.EXAM_SWEEP_INTERVAL)
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Exam sweep failed: {e}")
+
+    # ---------- statistics ----------
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._counters[key] += value
+
+    def stats(self):
+        with self._lock:
+            return {
+                'holder': self.holder,
+                'interval': Config.EXAM_SWEEP_INTERVAL,
+                'running': self._thread is not None,
+                **self._counters,
+                'last': dict(self._last)
+            }
+
+
+def pending_count():
+    """Number of in-progress exams that are past their time (the sweeper's backlog)"""
+    db = db_manager.get_db()
+    return db.exams.count_documents({'status': 'in_progress', 'start_time': {'$lt': expiry_cutoff()}})
+
+
+exam_sweeper = ExamSweeper()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Finalize exams that ran out of time')
+    parser.add_argument('command', choices=['run', 'pending'])
+    parser.add_argument('--max-batches', type=int, default=None)
+    args = parser.parse_args()
+
+    db_manager.connect()
+    Exam.ensure_indexes()
+    if args.command == 'pending':
+        print(f"{pending_count()} expired exams waiting to be finalized")
+    else:
+        print(exam_sweeper.sweep(max_batches=args.max_batches))
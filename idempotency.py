@@ -0,0 +1,239 @@
+"""
+Idempotency keys for exam writes
+
+exam.html retries save_answer and submit_exam when the network drops a
+request, sending the same Idempotency-Key header on every attempt. The
+first request with a key runs normally and its response is stored; a
+repeat gets that response replayed (with an Idempotent-Replayed header)
+without touching the exam document, so a retried submit is not scored
+twice. The replay only works where the first response was stored: in the
+worker that served it, or anywhere for durable routes.
+
+Keys do not order saves. A delayed retry of an older answer that reaches a
+worker which never stored its key runs again. The exam page therefore also
+numbers each save of a question, and Exam.answer_update ignores a save
+that is not newer than the stored one.
+
+    * Responses are kept per student, route and key in a bounded
+      in-process TTLCache (Config.IDEMPOTENCY_CACHE_SIZE entries).
+    * Routes in Config.IDEMPOTENCY_DURABLE_SCOPES (submit_exam by default)
+      also record the key in the idempotency_keys collection, whose TTL
+      index drops it after Config.IDEMPOTENCY_TTL seconds, so a retry that
+      lands on another worker is replayed too. The key is claimed before
+      the request runs; a duplicate arriving meanwhile gets 409 with
+      Retry-After, and a claim left behind by a crashed worker is taken
+      over after Config.IDEMPOTENCY_PENDING_TIMEOUT seconds.
+    * 5xx responses are not stored, so the retry runs the request again.
+    * A key reused with a different request body gets 422.
+
+Requests without a key behave as before. stats() reports the duplicate
+rate per route (also in /api/admin/traffic).
+"""
+
+import hashlib
+import threading
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import current_app, jsonify, make_response, request, session
+from pymongo.errors import DuplicateKeyError
+
+from cache import TTLCache
+from models import db_manager
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 128
+
+# action: 'new' (run the request), 'replay' (status/body of the first response),
+# 'in_progress' (the first request is still running) or 'mismatch' (key reused for another request)
+Outcome = namedtuple('Outcome', 'action status body')
+
+
+def fingerprint(body):
+    return hashlib.sha1(body).hexdigest()
+
+
+class IdempotencyStore:
+    """Stored responses by (route, student, key), in process and in MongoDB"""
+
+    def __init__(self, config):
+        self.config = config
+        self.cache = TTLCache('idempotency', config['IDEMPOTENCY_CACHE_SIZE'], config['IDEMPOTENCY_TTL'])
+        self.durable = set(config['IDEMPOTENCY_DURABLE_SCOPES'])
+        self._lock = threading.Lock()
+        self._pending = {}   # record id -> claim token in idempotency_keys (None when not claimed there)
+        self._indexed = False
+        self._counters = {}
+
+    def _collection(self):
+        db = db_manager.get_db()
+        if not self._indexed:
+            db.idempotency_keys.create_index('created_at', expireAfterSeconds=self.config['IDEMPOTENCY_TTL'])
+            self._indexed = True
+        return db.idempotency_keys
+
+    def count(self, scope, event):
+        with self._lock:
+            counters = self._counters.setdefault(scope, {
+                'without_key': 0, 'first': 0, 'replayed_local': 0, 'replayed_durable': 0,
+                'in_progress': 0, 'mismatched': 0
+            })
+            counters[event] += 1
+
+    # ---------- request lifecycle ----------
+
+    def begin(self, scope, owner, key, request_fingerprint):
+        """Claim a key for a request, or tell how to answer a repeat of it"""
+        record_id = f'{scope}:{owner}:{key}'
+        stored = self.cache.get(record_id)
+        if stored is not None:
+            return self._replay(scope, stored, request_fingerprint, 'replayed_local')
+
+        with self._lock:
+            if record_id in self._pending:
+                in_progress = True
+            else:
+                in_progress = False
+                self._pending[record_id] = None
+        if in_progress:
+            self.count(scope, 'in_progress')
+            return Outcome('in_progress', None, None)
+
+        if scope in self.durable:
+            try:
+                outcome = self._claim(scope, record_id, request_fingerprint)
+            except Exception:
+                # Otherwise every retry in this worker would get 409 for good
+                with self._lock:
+                    self._pending.pop(record_id, None)
+                raise
+            if outcome is not None:
+                with self._lock:
+                    self._pending.pop(record_id, None)
+                return outcome
+
+        self.count(scope, 'first')
+        return Outcome('new', None, None)
+
+    def _claim(self, scope, record_id, request_fingerprint):
+        """None if this worker now owns the key, else the outcome for the repeat"""
+        collection = self._collection()
+        now = datetime.now()
+        token = uuid.uuid4().hex
+        try:
+            collection.insert_one({'_id': record_id, 'state': 'pending', 'fingerprint': request_fingerprint,
+                                   'claim': token, 'created_at': now})
+            self._claimed(record_id, token)
+            return None
+        except DuplicateKeyError:
+            pass
+
+        doc = collection.find_one({'_id': record_id})
+        if doc is not None and doc['state'] == 'done':
+            stored = (doc['status'], doc['body'], doc['fingerprint'])
+            self.cache.set(record_id, stored)
+            return self._replay(scope, stored, request_fingerprint, 'replayed_durable')
+
+        # Still pending: take it over only if the worker that claimed it stopped responding
+        stale = now - timedelta(seconds=self.config['IDEMPOTENCY_PENDING_TIMEOUT'])
+        taken = collection.update_one(
+            {'_id': record_id, 'state': 'pending', 'created_at': {'$lt': stale}},
+            {'$set': {'created_at': now, 'fingerprint': request_fingerprint, 'claim': token}}
+        )
+        if taken.modified_count:
+            self._claimed(record_id, token)
+            return None
+        self.count(scope, 'in_progress')
+        return Outcome('in_progress', None, None)
+
+    def _claimed(self, record_id, token):
+        with self._lock:
+            self._pending[record_id] = token
+
+    def _replay(self, scope, stored, request_fingerprint, event):
+        status, body, stored_fingerprint = stored
+        if stored_fingerprint != request_fingerprint:
+            self.count(scope, 'mismatched')
+            return Outcome('mismatch', None, None)
+        self.count(scope, event)
+        return Outcome('replay', status, body)
+
+    def complete(self, scope, owner, key, request_fingerprint, status, body):
+        """Store the response of a claimed request (5xx responses release the key instead)"""
+        record_id = f'{scope}:{owner}:{key}'
+        with self._lock:
+            token = self._pending.pop(record_id, None)
+        if status >= 500:
+            # Only our own claim: a failed begin() may have found another worker's
+            if token is not None:
+                self._collection().delete_one({'_id': record_id, 'state': 'pending', 'claim': token})
+            return
+        self.cache.set(record_id, (status, body, request_fingerprint))
+        if token is not None:
+            self._collection().update_one({'_id': record_id, 'claim': token}, {'$set': {
+                'state': 'done', 'status': status, 'body': body, 'fingerprint': request_fingerprint
+            }})
+
+    # ---------- Flask ----------
+
+    def idempotent(self, scope):
+        """Decorator for a JSON view of a logged-in student (below @login_required)"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.config['IDEMPOTENCY_ENABLED']:
+                    return view(*args, **kwargs)
+                key = request.headers.get(HEADER)
+                if not key:
+                    self.count(scope, 'without_key')
+                    return view(*args, **kwargs)
+                if len(key) > MAX_KEY_LENGTH:
+                    return jsonify({'success': False, 'message': 'Idempotency key too long'}), 400
+
+                owner = session.get('student_roll')
+                request_fingerprint = fingerprint(request.get_data())
+                claimed = False
+                try:
+                    # begin() releases the key itself if claiming it fails
+                    outcome = self.begin(scope, owner, key, request_fingerprint)
+                    if outcome.action != 'new':
+                        return self.answer(outcome)
+                    claimed = True
+                    response = make_response(view(*args, **kwargs))
+                except Exception:
+                    if claimed:
+                        self.complete(scope, owner, key, request_fingerprint, 500, None)
+                    raise
+                self.complete(scope, owner, key, request_fingerprint,
+                              response.status_code, response.get_data(as_text=True))
+                return response
+            return wrapper
+        return decorator
+
+    def answer(self, outcome):
+        """Flask response for a repeated request"""
+        if outcome.action == 'replay':
+            response = current_app.response_class(outcome.body, status=outcome.status, mimetype='application/json')
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+        if outcome.action == 'mismatch':
+            return jsonify({'success': False, 'message': 'Idempotency key reused for a different request'}), 422
+        return jsonify({'success': False, 'message': 'This request is still being processed'}), 409, {'Retry-After': '1'}
+
+    # ---------- statistics ----------
+
+    def stats(self):
+        with self._lock:
+            scopes = {}
+            for scope, c in self._counters.items():
+                with_key = c['first'] + c['replayed_local'] + c['replayed_durable'] + c['in_progress'] + c['mismatched']
+                duplicates = c['replayed_local'] + c['replayed_durable'] + c['in_progress']
+                scopes[scope] = {
+                    **c,
+                    'with_key': with_key,
+                    'duplicate_rate': round(duplicates / with_key, 4) if with_key else 0.0,
+                    'durable': scope in self.durable
+                }
+            return {'enabled': self.config['IDEMPOTENCY_ENABLED'], 'pending': len(self._pending), 'routes': scopes}
@@ -0,0 +1,89 @@
+"""
+JSON provider for jsonify responses
+
+Uses orjson (a C-backed encoder) when it is installed and falls back to the
+standard library otherwise. Both paths encode the MongoDB/BSON types that
+model documents carry, so routes can return them without converting by hand,
+and keep Flask's default encoding for everything else:
+
+    ObjectId             -> its 24-character hex string
+    Decimal128           -> string, like Decimal
+    set / tuple          -> list
+    datetime / date      -> HTTP date string, as Flask's default provider
+    Decimal / UUID       -> string, as Flask's default provider
+    dataclass instances  -> dict, as Flask's default provider
+"""
+
+import dataclasses
+import json
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from bson.decimal128 import Decimal128
+from bson.objectid import ObjectId
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+def encode_default(obj):
+    """Encode the non-JSON types found in MongoDB documents"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, date):
+        return http_date(obj)
+    if isinstance(obj, Decimal128):
+        return str(obj.to_decimal())
+    if isinstance(obj, (Decimal, uuid.UUID)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class BSONJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that understands BSON types and prefers orjson"""
+
+    fast = orjson is not None
+
+    def dumps(self, obj, **kwargs):
+        if self.fast and not kwargs.get('cls'):
+            return self._orjson_dumps(obj, indent=kwargs.get('indent'),
+                                      sort_keys=kwargs.get('sort_keys', self.sort_keys)).decode('utf-8')
+        kwargs.setdefault('default', encode_default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.fast and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def _orjson_dumps(self, obj, indent=None, sort_keys=False):
+        # Datetimes go through encode_default so both paths send HTTP dates, like Flask
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=encode_default, option=option)
+
+    def response(self, *args, **kwargs):
+        if not self.fast:
+            return super().response(*args, **kwargs)
+
+        # Same behaviour as the default provider, without the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._orjson_dumps(obj, indent=indent, sort_keys=self.sort_keys)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
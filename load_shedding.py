@@ -0,0 +1,183 @@
+"""
+Priority-based load shedding
+
+When MongoDB slows down, admin dashboards, CSV uploads and result views
+compete with save_answer and submit_exam for the same workers and
+connection pool. Every request gets a priority class:
+
+    critical  exam routes (Config.SHED_CRITICAL_ENDPOINTS), never shed
+    low       Config.SHED_LOW_PRIORITY_PREFIXES (admin, results, portfolio)
+    normal    everything else (landing, login, register, subjects)
+
+Two signals are measured in each worker:
+
+    * database latency: p90 of the MongoDB command durations of the last
+      Config.SHED_WINDOW seconds, from a pymongo command listener (so the
+      async driver of async_api.py is measured too);
+    * queue depth: requests in flight in this worker.
+
+Above the SHED_LOW_* thresholds low-priority requests get a 503 with
+Retry-After; above the SHED_NORMAL_* thresholds normal ones do too. Critical
+routes always go through, and they keep the latency window fed while
+shedding is on. A level is held for Config.SHED_COOLDOWN seconds after the
+signals were last above its thresholds, so shedding does not flap.
+Decisions, signals and level changes are reported by stats().
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from flask import g, jsonify, render_template, request
+from pymongo import monitoring
+
+PRIORITIES = ('critical', 'normal', 'low')
+LEVELS = ('normal', 'shedding_low', 'shedding_normal')
+_SHED_AT = {'low': 1, 'normal': 2}   # Lowest level at which a class is shed; critical never is
+
+_MIN_SAMPLES = 10   # Fewer commands in the window than this do not count as slow
+_REFRESH = 0.25     # Seconds between re-evaluations of the level
+
+
+class LatencyListener(monitoring.CommandListener):
+    """Durations of recent MongoDB commands"""
+
+    def __init__(self, maxlen=2000):
+        self.samples = deque(maxlen=maxlen)   # (finished at, ms); append is thread-safe
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.samples.append((time.monotonic(), event.duration_micros / 1000))
+
+    def failed(self, event):
+        self.samples.append((time.monotonic(), event.duration_micros / 1000))
+
+    def percentile(self, window, p=0.9):
+        """(p-th percentile ms, sample count) of the commands that finished within the last window seconds"""
+        since = time.monotonic() - window
+        recent = sorted(ms for finished, ms in list(self.samples) if finished >= since)
+        if not recent:
+            return 0.0, 0
+        return recent[min(len(recent) - 1, int(len(recent) * p))], len(recent)
+
+
+class LoadShedder:
+    """before_request hook that rejects low-priority requests while the database is slow"""
+
+    def __init__(self, app=None):
+        self.listener = LatencyListener()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._level = 0
+        self._hot_until = 0.0    # Level is held until then
+        self._checked_at = 0.0
+        self._latency_ms = 0.0
+        self._samples = 0
+        self._counters = {priority: {'served': 0, 'shed': 0} for priority in PRIORITIES}
+        self._changes = []       # Recent (time, level name, latency ms, in flight)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.config = app.config
+        self.critical = set(app.config['SHED_CRITICAL_ENDPOINTS'])
+        self.low_prefixes = tuple(app.config['SHED_LOW_PRIORITY_PREFIXES'])
+        # Applies to every MongoClient created afterwards; the database connects lazily
+        monitoring.register(self.listener)
+
+        @app.before_request
+        def shed_load():
+            if not self.config['SHED_ENABLED'] or request.endpoint in (None, 'static', 'static_dist'):
+                return None
+            with self._lock:
+                self._in_flight += 1
+            g.shed_counted = True
+            priority = self.priority()
+            if priority in _SHED_AT and self.level() >= _SHED_AT[priority]:
+                self._count(priority, 'shed')
+                return self.rejection()
+            self._count(priority, 'served')
+            return None
+
+        @app.teardown_request
+        def shed_load_done(exc):
+            if g.pop('shed_counted', False):
+                with self._lock:
+                    self._in_flight -= 1
+
+    # ---------- decisions ----------
+
+    def priority(self):
+        if request.endpoint in self.critical:
+            return 'critical'
+        if request.path.startswith(self.low_prefixes):
+            return 'low'
+        return 'normal'
+
+    def level(self):
+        """0 = serve everything, 1 = shed low, 2 = shed low and normal"""
+        now = time.monotonic()
+        if now - self._checked_at < _REFRESH:
+            return self._level
+        with self._lock:
+            if now - self._checked_at < _REFRESH:
+                return self._level
+            self._checked_at = now
+            latency, samples = self.listener.percentile(self.config['SHED_WINDOW'])
+            self._latency_ms, self._samples = latency, samples
+            slow = samples >= _MIN_SAMPLES
+
+            measured = 0
+            if (slow and latency > self.config['SHED_NORMAL_LATENCY_MS']) or self._in_flight > self.config['SHED_NORMAL_IN_FLIGHT']:
+                measured = 2
+            elif (slow and latency > self.config['SHED_LOW_LATENCY_MS']) or self._in_flight > self.config['SHED_LOW_IN_FLIGHT']:
+                measured = 1
+
+            if measured >= self._level:
+                if measured:
+                    self._hot_until = now + self.config['SHED_COOLDOWN']
+            elif now < self._hot_until:
+                measured = self._level   # Hold until the cooldown has passed
+            if measured != self._level:
+                self._level = measured
+                self._changes.append((datetime.now(), LEVELS[measured], round(latency, 1), self._in_flight))
+                del self._changes[:-20]
+            return self._level
+
+    def rejection(self):
+        retry_after = str(self.config['SHED_RETRY_AFTER'])
+        message = 'The server is busy. Please try again in a few seconds.'
+        if request.path.startswith('/api/'):
+            response = jsonify({'success': False, 'message': message, 'retry_after': int(retry_after)})
+        else:
+            response = render_template('error.html', message=message)
+        return response, 503, {'Retry-After': retry_after, 'Cache-Control': 'no-store'}
+
+    # ---------- statistics ----------
+
+    def _count(self, priority, decision):
+        with self._lock:
+            self._counters[priority][decision] += 1
+
+    def stats(self):
+        self.level()
+        with self._lock:
+            return {
+                'enabled': self.config['SHED_ENABLED'],
+                'level': LEVELS[self._level],
+                'db_latency_p90_ms': round(self._latency_ms, 1),
+                'db_latency_samples': self._samples,
+                'in_flight': self._in_flight,
+                'thresholds': {
+                    'low': {'latency_ms': self.config['SHED_LOW_LATENCY_MS'], 'in_flight': self.config['SHED_LOW_IN_FLIGHT']},
+                    'normal': {'latency_ms': self.config['SHED_NORMAL_LATENCY_MS'], 'in_flight': self.config['SHED_NORMAL_IN_FLIGHT']}
+                },
+                'requests': {priority: dict(counters) for priority, counters in self._counters.items()},
+                'level_changes': [
+                    {'at': at, 'level': level, 'db_latency_p90_ms': latency, 'in_flight': in_flight}
+                    for at, level, latency, in_flight in self._changes
+                ]
+            }
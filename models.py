@@ -1,9 +1,16 @@
-from pymongo import MongoClient
-from datetime import datetime
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from datetime import datetime, timedelta
 from bson.objectid import ObjectId
 import os
+import threading
+import time
 from config import Config
-from utils import hash_password, verify_password, generate_roll_number
+from cache import SingleFlight, TTLCache
+from utils import (
+    hash_password, verify_password, generate_roll_number, question_hash,
+    calculate_score, calculate_grade, format_datetime
+)
 
 class Database:
     """Database connection manager"""
@@ -17,7 +24,7 @@ class Database:
         return cls._instance
     
     
-    def connect(self, mongo_uri=None):
+    def connect(self, mongo_uri=None, max_pool_size=1):
         """Connect to MongoDB with retry logic"""
         if self._client is None:
             uri = mongo_uri or Config.MONGO_URI
@@ -37,12 +44,13 @@ class Database:
                         serverSelectionTimeoutMS=5000,
                         connectTimeoutMS=5000,
                         socketTimeoutMS=5000,
-                        maxPoolSize=1
+                        maxPoolSize=max_pool_size
                     )
                     # Verify connection
                     self._db = self._client[Config.DB_NAME]
                     self._client.admin.command('ping')
-                    print(f"Connected to MongoDB on attempt {attempt+1}")
+                    where = 'local MongoDB (Offline Mode)' if uri == Config.MONGO_URI_LOCAL else 'production MongoDB'
+                    print(f"Connected to {where} on attempt {attempt+1}")
                     break
                 except ConnectionFailure as e:
                     print(f"Connection failed (Attempt {attempt+1}/{max_retries}): {e}")
@@ -72,6 +80,13 @@ class Database:
 # Initialize database
 db_manager = Database()
 
+# Read-through caches for the lookups repeated on every exam request, tagged by roll number
+student_cache = TTLCache('students', Config.STUDENT_CACHE_SIZE, Config.MODEL_CACHE_TTL)
+exam_cache = TTLCache('exams', Config.EXAM_CACHE_SIZE, Config.MODEL_CACHE_TTL)
+
+# Concurrent identical reads (counts, the subject catalog) share one database call
+db_flight = SingleFlight('models', Config.SINGLE_FLIGHT_TIMEOUT)
+
 class Student:
     """Student model"""
     
@@ -108,6 +123,7 @@ class Student:
         
         result = db.students.insert_one(student)
         student['_id'] = result.inserted_id
+        student_cache.invalidate_tag(roll_number)
         return student, None
     
     @staticmethod
@@ -123,10 +139,15 @@ class Student:
         return None
     
     @staticmethod
-    def get_by_roll(roll_number):
-        """Get student by roll number"""
-        db = db_manager.get_db()
-        return db.students.find_one({'roll_number': roll_number})
+    def get_by_roll(roll_number, fields=None):
+        """Get student by roll number, optionally only the given fields (cached)"""
+        def load():
+            db = db_manager.get_db()
+            projection = dict.fromkeys(fields, 1) if fields else None
+            return db.students.find_one({'roll_number': roll_number}, projection)
+
+        key = (roll_number, tuple(fields) if fields else None)
+        return student_cache.get_or_load(key, load, tag=roll_number)
     
     @staticmethod
     def get_by_id(student_id):
@@ -144,42 +165,317 @@ class Student:
     def count():
         """Count total students"""
         db = db_manager.get_db()
-        return db.students.count_documents({})
+        return db_flight.do(('count', 'students'), lambda: db.students.count_documents({}))
     
+    @staticmethod
+    def exam_taken_update(roll_number):
+        """(filter, update) marking that a student has taken the exam"""
+        return {'roll_number': roll_number}, {'$set': {'exam_taken': True}}
+
     @staticmethod
     def mark_exam_taken(roll_number):
         """Mark that student has taken exam"""
         db = db_manager.get_db()
-        db.students.update_one(
-            {'roll_number': roll_number},
-            {'$set': {'exam_taken': True}}
-        )
+        db.students.update_one(*Student.exam_taken_update(roll_number))
+        student_cache.invalidate_tag(roll_number)
+
+    @staticmethod
+    def delete(roll_number):
+        """Delete a student (Admin feature)"""
+        db = db_manager.get_db()
+        result = db.students.delete_one({'roll_number': roll_number})
+        student_cache.invalidate_tag(roll_number)
+        exam_cache.invalidate_tag(roll_number)
+        return result.deleted_count > 0
+
+    @staticmethod
+    def delete_all():
+        """Delete every student (Admin feature)"""
+        db = db_manager.get_db()
+        result = db.students.delete_many({})
+        student_cache.clear()
+        exam_cache.clear()
+        return result.deleted_count
+
+class SubjectCatalog:
+    """
+    Per-subject question counts, cached in-process
+
+    Built from a single $group over the questions collection and reused until
+    a question write in this process invalidates it, or until
+    Config.SUBJECT_CATALOG_TTL seconds pass (to pick up other workers' writes).
+    Concurrent refreshes share one aggregation.
+    """
+    _lock = threading.Lock()
+    _entries = None
+    _loaded_at = None
+    _generation = 0   # Bumped by invalidate(), so a refresh started before a write is not reused
+
+    @classmethod
+    def get(cls):
+        """Get {subject: {'count': n, 'last_added': datetime}}"""
+        with cls._lock:
+            if cls._entries is not None and time.monotonic() - cls._loaded_at < Config.SUBJECT_CATALOG_TTL:
+                return cls._entries
+            generation = cls._generation
+        return db_flight.do(('subject_catalog', generation), lambda: cls._load(generation))
+
+    @classmethod
+    def _load(cls, generation):
+        db = db_manager.get_db()
+        if db is None:
+            raise Exception("Database connection failed. Please ensure MongoDB is running.")
+
+        entries = {}
+        for row in db.questions.aggregate([
+            {'$group': {'_id': '$subject', 'count': {'$sum': 1}, 'last_added': {'$max': '$created_at'}}}
+        ]):
+            if row['_id']:
+                entries[row['_id']] = {'count': row['count'], 'last_added': row.get('last_added')}
+
+        with cls._lock:
+            if cls._generation == generation:
+                cls._entries = entries
+                cls._loaded_at = time.monotonic()
+        return entries
+
+    @classmethod
+    def invalidate(cls):
+        """Force the next lookup to re-run the aggregation"""
+        with cls._lock:
+            cls._entries = None
+            cls._loaded_at = None
+            cls._generation += 1
+
+    @classmethod
+    def subjects(cls):
+        """Sorted list of subjects that have questions"""
+        return sorted(cls.get())
+
+    @classmethod
+    def count(cls, subject):
+        """Number of questions in a subject (0 if unknown)"""
+        entry = cls.get().get(subject)
+        return entry['count'] if entry else 0
 
 class Question:
     """Question model"""
+
+    # Callables run after any write to the questions collection (in-process caches)
+    _change_listeners = []
+
+    @staticmethod
+    def add_change_listener(listener):
+        """Register a callable to run whenever questions are added, changed or deleted"""
+        Question._change_listeners.append(listener)
+
+    @staticmethod
+    def notify_changed():
+        """Invalidate everything cached about the question bank in this process"""
+        SubjectCatalog.invalidate()
+        for listener in Question._change_listeners:
+            listener()
     
     @staticmethod
-    def create(question_text, options, correct_answer, subject):
-        """Create a new question"""
-        db = db_manager.get_db()
-        
-        question = {
+    def build(question_text, options, correct_answer, subject):
+        """Build a question document without inserting it"""
+        return {
             'question': question_text,
             'options': options,  # List of 4 options
             'correct': correct_answer,  # 'A', 'B', 'C', or 'D'
             'subject': subject,
+            'content_hash': question_hash(question_text, options, subject),
             'created_at': datetime.now()
         }
-        
+
+    @staticmethod
+    def create(question_text, options, correct_answer, subject):
+        """Create a new question"""
+        db = db_manager.get_db()
+
+        question = Question.build(question_text, options, correct_answer, subject)
+
         result = db.questions.insert_one(question)
+        Question.notify_changed()
         return result.inserted_id
-    
+
+    @staticmethod
+    def create_many(questions):
+        """
+        Insert a batch of question documents in one round trip
+
+        Uses an unordered insert so one bad document does not stop the rest.
+
+        Returns:
+            tuple: (inserted_count, [(batch_index, error_message), ...])
+        """
+        if not questions:
+            return 0, []
+
+        db = db_manager.get_db()
+        try:
+            result = db.questions.insert_many(questions, ordered=False)
+            return len(result.inserted_ids), []
+        except BulkWriteError as e:
+            details = e.details or {}
+            errors = [(err.get('index', -1), err.get('errmsg', 'Write error'))
+                      for err in details.get('writeErrors', [])]
+            return details.get('nInserted', 0), errors
+        finally:
+            Question.notify_changed()
+
+    @staticmethod
+    def upsert_many(questions):
+        """
+        Upsert a batch of question documents keyed by their content hash
+
+        Re-running with the same documents is a no-op; a changed answer key
+        updates the stored question in place.
+
+        Returns:
+            tuple: (inserted_count, modified_count)
+        """
+        if not questions:
+            return 0, 0
+
+        db = db_manager.get_db()
+        requests = [
+            UpdateOne(
+                {'content_hash': q['content_hash']},
+                {
+                    '$set': {
+                        'question': q['question'],
+                        'options': q['options'],
+                        'correct': q['correct'],
+                        'subject': q['subject']
+                    },
+                    '$setOnInsert': {'created_at': q.get('created_at') or datetime.now()}
+                },
+                upsert=True
+            )
+            for q in questions
+        ]
+        result = db.questions.bulk_write(requests, ordered=False)
+        Question.notify_changed()
+        return result.upserted_count, result.modified_count
+
+    @staticmethod
+    def get_by_hashes(hashes):
+        """Get {content_hash: correct} for the stored questions among the given hashes"""
+        db = db_manager.get_db()
+        cursor = db.questions.find(
+            {'content_hash': {'$in': list(hashes)}},
+            {'_id': 0, 'content_hash': 1, 'correct': 1}
+        )
+        return {q['content_hash']: q.get('correct') for q in cursor}
+
+    @staticmethod
+    def get_hash_index(subject=None):
+        """Get {content_hash: (_id, correct)} for the whole bank (or one subject)"""
+        db = db_manager.get_db()
+        query = {'subject': subject} if subject else {}
+        cursor = db.questions.find(query, {'content_hash': 1, 'correct': 1})
+        return {q['content_hash']: (q['_id'], q.get('correct')) for q in cursor if 'content_hash' in q}
+
+    @staticmethod
+    def iter_sorted(subject=None, batch_size=1000):
+        """Iterate over questions ordered by content hash (stable export order)"""
+        db = db_manager.get_db()
+        query = {'subject': subject} if subject else {}
+        return db.questions.find(query).sort('content_hash', 1).batch_size(batch_size)
+
+    @staticmethod
+    def delete_by_ids(question_ids, batch_size=1000):
+        """Delete questions by ObjectId in chunks, returning the number removed"""
+        db = db_manager.get_db()
+        question_ids = list(question_ids)
+        deleted = 0
+        for i in range(0, len(question_ids), batch_size):
+            result = db.questions.delete_many({'_id': {'$in': question_ids[i:i + batch_size]}})
+            deleted += result.deleted_count
+        Question.notify_changed()
+        return deleted
+
+    @staticmethod
+    def backfill_content_hashes(batch_size=1000):
+        """Add content hashes to questions created before hashing existed"""
+        db = db_manager.get_db()
+        cursor = db.questions.find(
+            {'content_hash': {'$exists': False}},
+            {'question': 1, 'options': 1, 'subject': 1}
+        )
+
+        updated = 0
+        batch = []
+        for q in cursor:
+            content_hash = question_hash(q.get('question', ''), q.get('options', []), q.get('subject', ''))
+            batch.append(UpdateOne({'_id': q['_id']}, {'$set': {'content_hash': content_hash}}))
+            if len(batch) >= batch_size:
+                updated += db.questions.bulk_write(batch, ordered=False).modified_count
+                batch = []
+        if batch:
+            updated += db.questions.bulk_write(batch, ordered=False).modified_count
+        return updated
+
+    @staticmethod
+    def ensure_indexes():
+        """
+        Create the indexes question lookups rely on
+
+        content_hash is unique so exact duplicates are rejected at insert time.
+        If the bank still holds duplicates the index stays non-unique until
+        `python dedupe.py merge-exact` has been run.
+        """
+        db = db_manager.get_db()
+        indexes = db.questions.index_information()  # One round trip on warm deployments
+        if 'subject_1' not in indexes:
+            db.questions.create_index('subject')
+
+        existing = indexes.get('content_hash_1')
+        if existing and existing.get('unique'):
+            return True
+
+        Question.backfill_content_hashes()
+        if existing:
+            db.questions.drop_index('content_hash_1')
+        try:
+            db.questions.create_index('content_hash', unique=True)
+            return True
+        except DuplicateKeyError:
+            print("Duplicate questions found; run 'python dedupe.py merge-exact' to enable the unique content_hash index")
+            db.questions.create_index('content_hash')
+            return False
+
     @staticmethod
     def get_all():
         """Get all questions"""
         db = db_manager.get_db()
         return list(db.questions.find())
     
+    @staticmethod
+    def get_by_ids(question_ids):
+        """Get questions by a list of IDs (strings or ObjectIds)"""
+        db = db_manager.get_db()
+        object_ids = [ObjectId(qid) for qid in question_ids]
+        return list(db.questions.find({'_id': {'$in': object_ids}}))
+
+    @staticmethod
+    def answer_key_query(question_ids):
+        """(filter, projection) reading the correct answers of the given questions"""
+        object_ids = [ObjectId(qid) for qid in question_ids if ObjectId.is_valid(qid)]
+        return {'_id': {'$in': object_ids}}, {'correct': 1}
+
+    @staticmethod
+    def get_answer_keys(question_ids):
+        """
+        {'_id', 'correct'} of the given questions, for scoring
+
+        Always read from the database: the question bank snapshot of another
+        worker may be minutes behind an answer-key correction.
+        """
+        db = db_manager.get_db()
+        return list(db.questions.find(*Question.answer_key_query(question_ids)))
+
     @staticmethod
     def get_random(count=100):
         """Get random questions for exam"""
@@ -188,9 +484,8 @@ class Question:
     
     @staticmethod
     def get_subjects():
-        """Get a list of distinct subjects"""
-        db = db_manager.get_db()
-        return db.questions.distinct('subject')
+        """Get a list of distinct subjects (served from the subject catalog)"""
+        return SubjectCatalog.subjects()
 
     @staticmethod
     def get_random_by_subject(subject, count=100):
@@ -215,28 +510,25 @@ class Question:
         """Delete a question by its ID"""
         db = db_manager.get_db()
         result = db.questions.delete_one({'_id': ObjectId(question_id)})
+        Question.notify_changed()
         return result.deleted_count > 0
     
     @staticmethod
     def count():
         """Count total questions"""
         db = db_manager.get_db()
-        return db.questions.count_documents({})
+        return db_flight.do(('count', 'questions'), lambda: db.questions.count_documents({}))
 
 class Exam:
     """Exam model"""
     
+    # Document builders and scoring shared by the Flask routes and the async API
+    # (async_api.py), which only differ in how they talk to the database
+
     @staticmethod
-    def create(student_roll, subject, questions):
-        """Create a new exam session"""
-        db = db_manager.get_db()
-        
-        # Check if student already has an exam for this subject
-        existing = db.exams.find_one({'student_roll': student_roll, 'subject': subject})
-        if existing:
-            return existing, "Exam already taken for this subject"
-        
-        exam = {
+    def new_document(student_roll, subject, questions):
+        """Exam document for a new session over the given question documents"""
+        return {
             'student_roll': student_roll,
             'subject': subject,
             'questions': [str(q['_id']) for q in questions],  # Store question IDs
@@ -249,20 +541,143 @@ class Exam:
             'grade': None,
             'status': 'in_progress'
         }
+
+    @staticmethod
+    def answer_update(student_roll, question_id, answer, seq=None):
+        """(filter, update) saving one answer of the student's running exam"""
+        # Only the in-progress exam that contains the question matches, so an
+        # answer can never land in a completed exam or another subject
+        query = {'student_roll': student_roll, 'status': 'in_progress', 'questions': question_id}
+        update = {'$set': {f'answers.{question_id}': answer}}
+        if seq is not None:
+            # The page numbers each save of a question; a delayed retry of an
+            # older save matches nothing instead of overwriting a newer answer
+            query['$or'] = [{f'answer_seq.{question_id}': {'$exists': False}},
+                            {f'answer_seq.{question_id}': {'$lt': seq}}]
+            update['$set'][f'answer_seq.{question_id}'] = seq
+        return query, update
+
+    @staticmethod
+    def submit_update(student_roll, score, total, percentage, grade):
+        """(filter, update) completing the student's running exam"""
+        return (
+            {'student_roll': student_roll, 'status': 'in_progress'},
+            {'$set': {
+                'submit_time': datetime.now(),
+                'score': score,
+                'total': total,
+                'percentage': percentage,
+                'grade': grade,
+                'status': 'completed'
+            }}
+        )
+
+    @staticmethod
+    def auto_submit_update(exam, score, total, percentage, grade):
+        """(filter, update) completing an exam whose time ran out; matches nothing once it is completed"""
+        return (
+            {'_id': exam['_id'], 'status': 'in_progress'},
+            {'$set': {
+                'submit_time': exam['start_time'] + timedelta(minutes=Config.EXAM_DURATION_MINUTES),
+                'score': score,
+                'total': total,
+                'percentage': percentage,
+                'grade': grade,
+                'status': 'completed',
+                'auto_submitted': True
+            }}
+        )
+
+    @staticmethod
+    def remaining_seconds(exam):
+        """Whole seconds left on a running exam"""
+        elapsed = (datetime.now() - exam['start_time']).total_seconds()
+        return int(max(0, Config.EXAM_DURATION_MINUTES * 60 - elapsed))
+
+    @staticmethod
+    def score(exam, questions):
+        """(score, total, percentage, grade) of an exam against its question documents"""
+        score, total, percentage = calculate_score(questions, exam.get('answers', {}))
+        return score, total, percentage, calculate_grade(percentage)
+
+    @staticmethod
+    def result_rows(student, exams):
+        """Result summaries of a student's completed exams, as shown on the result page"""
+        results = []
+        for exam in exams:
+            if exam['status'] != 'completed':
+                continue
+            answers = exam.get('answers', {})
+            results.append({
+                'roll_number': student['roll_number'],
+                'name': student['name'],
+                'email': student['email'],
+                'subject': exam.get('subject', 'Unknown'),
+                'score': exam['score'],
+                'total': exam['total'],
+                'percentage': exam['percentage'],
+                'grade': exam['grade'],
+                'exam_date': format_datetime(exam['submit_time']),
+                'status': 'PASS' if exam['percentage'] >= Config.PASSING_MARKS else 'FAIL',
+                'attempted': len(answers),
+                'correct': int(exam['score']),
+                'wrong': len(answers) - int(exam['score'])
+            })
+        return results
+
+    @staticmethod
+    def ensure_indexes():
+        """Create the indexes of the expiry sweep (status, start_time) and of regrades (questions)"""
+        db = db_manager.get_db()
+        indexes = db.exams.index_information()
+        if 'status_1_start_time_1' not in indexes:
+            db.exams.create_index([('status', 1), ('start_time', 1)])
+        if 'questions_1' not in indexes:
+            db.exams.create_index('questions')
+
+    @staticmethod
+    def find_expired(started_before, limit):
+        """Oldest in-progress exams started before the given time, with what scoring needs"""
+        db = db_manager.get_db()
+        return list(db.exams.find(
+            {'status': 'in_progress', 'start_time': {'$lt': started_before}},
+            {'student_roll': 1, 'questions': 1, 'answers': 1, 'start_time': 1, 'submit_time': 1}
+        ).sort('start_time', 1).limit(limit))
+
+    @staticmethod
+    def create(student_roll, subject, questions):
+        """Create a new exam session"""
+        db = db_manager.get_db()
         
+        # Check if student already has an exam for this subject
+        existing = db.exams.find_one({'student_roll': student_roll, 'subject': subject})
+        if existing:
+            return existing, "Exam already taken for this subject"
+        
+        exam = Exam.new_document(student_roll, subject, questions)
         result = db.exams.insert_one(exam)
         exam['_id'] = result.inserted_id
+        exam_cache.invalidate_tag(student_roll)
         return exam, None
     
     @staticmethod
     def get_by_student(student_roll):
-        """Get all exams by student roll number"""
-        db = db_manager.get_db()
-        return list(db.exams.find({'student_roll': student_roll}))
+        """Get all exams by student roll number (cached)"""
+        def load():
+            db = db_manager.get_db()
+            return list(db.exams.find({'student_roll': student_roll}))
+
+        return exam_cache.get_or_load(('all', student_roll), load, tag=student_roll)
 
     @staticmethod
     def get_by_student_and_subject(student_roll, subject):
-        """Get exam by student and subject"""
+        """
+        Get exam by student and subject
+
+        Not cached: it decides whether a running exam is resumed (saved answers,
+        timer) or already completed, and save_answer/submit_exam may have run in
+        another worker whose invalidation this worker never sees.
+        """
         db = db_manager.get_db()
         return db.exams.find_one({'student_roll': student_roll, 'subject': subject})
 
@@ -273,45 +688,30 @@ class Exam:
         return db.exams.find_one({'student_roll': student_roll, 'status': 'in_progress'})
     
     @staticmethod
-    def save_answer(student_roll, question_id, answer):
-        """Save a single answer"""
+    def save_answer(student_roll, question_id, answer, seq=None):
+        """Save a single answer (ignored if seq is not newer than the saved one)"""
         db = db_manager.get_db()
-        # Find exam that contains this question and belongs to student
-        # This handles multiple exams correctly since question IDs are unique per exam instance 
-        # (or at least the combination of student + question implies the active exam context)
-        # Better: Find the 'in_progress' exam for this student that has this question.
-        
-        db.exams.update_one(
-            {
-                'student_roll': student_roll, 
-                'status': 'in_progress',
-                'questions': question_id
-            },
-            {'$set': {f'answers.{question_id}': answer}}
-        )
+        db.exams.update_one(*Exam.answer_update(student_roll, question_id, answer, seq))
+        exam_cache.invalidate_tag(student_roll)
     
     @staticmethod
     def submit(student_roll, score, total, percentage, grade):
         """Submit exam and calculate results"""
         db = db_manager.get_db()
-        
-        result = db.exams.update_one(
-            {'student_roll': student_roll, 'status': 'in_progress'},
-            {'$set': {
-                'submit_time': datetime.now(),
-                'score': score,
-                'total': total,
-                'percentage': percentage,
-                'grade': grade,
-                'status': 'completed'
-            }}
-        )
-        
+        result = db.exams.update_one(*Exam.submit_update(student_roll, score, total, percentage, grade))
+        exam_cache.invalidate_tag(student_roll)
+
         # Mark student as having taken exam
         Student.mark_exam_taken(student_roll)
         
         return result.modified_count > 0
     
+    @staticmethod
+    def get_in_progress_question_ids():
+        """Question IDs (as strings) referenced by exams that are still running"""
+        db = db_manager.get_db()
+        return set(db.exams.distinct('questions', {'status': 'in_progress'}))
+
     @staticmethod
     def get_all_results(skip=0, limit=20):
         """Get all exam results with pagination"""
@@ -322,13 +722,14 @@ class Exam:
     def count_completed():
         """Count completed exams"""
         db = db_manager.get_db()
-        return db.exams.count_documents({'status': 'completed'})
+        return db_flight.do(('count', 'exams_completed'), lambda: db.exams.count_documents({'status': 'completed'}))
 
     @staticmethod
     def delete_exam(student_roll, subject):
         """Delete an exam for a student and subject (Admin feature)"""
         db = db_manager.get_db()
         result = db.exams.delete_one({'student_roll': student_roll, 'subject': subject})
+        exam_cache.invalidate_tag(student_roll)
         return result.deleted_count > 0
 
 class Admin:
@@ -376,3 +777,27 @@ class Admin:
             # The admin will be created on first successful connection
             print(f"Could not ensure default admin: {e}")
             pass
+
+class Lease:
+    """Time-limited lock in the leases collection, so one worker at a time runs a background job"""
+
+    @staticmethod
+    def acquire(name, holder, seconds):
+        """Take or renew the lease for seconds; False while another holder's lease is current"""
+        db = db_manager.get_db()
+        now = datetime.now()
+        try:
+            db.leases.find_one_and_update(
+                {'_id': name, '$or': [{'holder': holder}, {'expires_at': {'$lt': now}}]},
+                {'$set': {'holder': holder, 'expires_at': now + timedelta(seconds=seconds), 'renewed_at': now}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            # The lease exists and is held by someone else, so the upsert collided on _id
+            return False
+
+    @staticmethod
+    def release(name, holder):
+        db = db_manager.get_db()
+        db.leases.delete_one({'_id': name, 'holder': holder})
@@ -0,0 +1,174 @@
+"""
+Full-page micro-cache
+
+Caches the rendered HTML of semi-static pages (landing, login, register,
+portfolio) for a few seconds. Entries are keyed by path and session class:
+anonymous visitors share one copy, and logged-in students share one copy per
+registered subject, since that is all these pages vary on.
+
+    * A page younger than Config.PAGE_CACHE_TTL is served as-is.
+    * A page up to Config.PAGE_CACHE_STALE seconds older than that is still
+      served, and one background re-render refreshes it
+      (stale-while-revalidate).
+    * Only 200 responses are stored, without their cookies; redirects
+      (e.g. /login for a logged-in student) always run the view.
+    * Admin, API, exam and result routes are never cached, even if
+      decorated by mistake (Config.PAGE_CACHE_BYPASS_PREFIXES).
+
+Stored pages carry a strong ETag, so browsers revalidate with a 304 and the
+compressor keeps one compressed copy per page. Hit rates and render times
+are reported by stats().
+"""
+
+import hashlib
+import threading
+import time
+from functools import wraps
+
+from flask import copy_current_request_context, current_app, make_response, request, session
+
+from cache import TTLCache
+
+_MISSING = object()
+
+
+class PageCache:
+    """Response cache for whole pages, with per-endpoint render statistics"""
+
+    def __init__(self, app=None):
+        self.cache = None
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._endpoints = {}   # endpoint -> counters
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.config = app.config
+        self.cache = TTLCache('pages', maxsize=app.config['PAGE_CACHE_SIZE'],
+                              ttl=app.config['PAGE_CACHE_TTL'] + app.config['PAGE_CACHE_STALE'])
+
+    def clear(self):
+        if self.cache is not None:
+            self.cache.clear()
+
+    # ---------- statistics ----------
+
+    def _count(self, endpoint, event, render_seconds=None):
+        with self._lock:
+            counters = self._endpoints.setdefault(endpoint, {
+                'hits': 0, 'stale_hits': 0, 'misses': 0, 'bypassed': 0,
+                'renders': 0, 'render_ms_total': 0.0, 'render_ms_max': 0.0
+            })
+            if event:
+                counters[event] += 1
+            if render_seconds is not None:
+                ms = render_seconds * 1000
+                counters['renders'] += 1
+                counters['render_ms_total'] += ms
+                counters['render_ms_max'] = max(counters['render_ms_max'], ms)
+
+    def stats(self):
+        """Per-endpoint hit rates and render times"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, c in self._endpoints.items():
+                served = c['hits'] + c['stale_hits'] + c['misses']
+                endpoints[endpoint] = {
+                    'hits': c['hits'],
+                    'stale_hits': c['stale_hits'],
+                    'misses': c['misses'],
+                    'bypassed': c['bypassed'],
+                    'hit_rate': round((c['hits'] + c['stale_hits']) / served, 4) if served else 0.0,
+                    'renders': c['renders'],
+                    'render_ms_avg': round(c['render_ms_total'] / c['renders'], 2) if c['renders'] else 0.0,
+                    'render_ms_max': round(c['render_ms_max'], 2)
+                }
+        return {'entries': self.cache.stats()['size'] if self.cache else 0, 'endpoints': endpoints}
+
+    # ---------- caching ----------
+
+    def _bypass(self):
+        if not self.config['PAGE_CACHE_ENABLED'] or request.method != 'GET':
+            return True
+        return request.path.startswith(tuple(self.config['PAGE_CACHE_BYPASS_PREFIXES']))
+
+    def _session_class(self, student_loader):
+        if 'student_roll' not in session:
+            return 'anonymous'
+        student = student_loader()
+        return f"student:{student.get('subject') or ''}" if student else 'anonymous'
+
+    @staticmethod
+    def _validators(response, etag):
+        response.set_etag(etag)
+        response.vary.add('Cookie')
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    def _render(self, view, key, args, kwargs, event='misses'):
+        """Run the view and store a 200 response; returns the response"""
+        generation = self.cache.generation(None)  # A clear() during the render wins
+        started = time.perf_counter()
+        response = make_response(view(*args, **kwargs))
+        self._count(request.endpoint, event, time.perf_counter() - started)
+
+        if response.status_code == 200 and not response.is_streamed:
+            body = response.get_data()
+            etag = hashlib.sha1(body).hexdigest()
+            headers = tuple((k, v) for k, v in response.headers.items()
+                            if k.lower() not in ('set-cookie', 'content-length'))
+            fresh_until = time.monotonic() + self.config['PAGE_CACHE_TTL']
+            self.cache.set(key, (fresh_until, headers, body, etag), generation=generation)
+            response = self._validators(response, etag)
+        return response
+
+    def _refresh_in_background(self, view, key, args, kwargs):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        @copy_current_request_context
+        def refresh():
+            try:
+                self._render(view, key, args, kwargs, event=None)
+            except Exception as e:
+                current_app.logger.warning(f"Background render of {key[0]} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def cached(self, student_loader):
+        """
+        Decorator for page views
+
+        student_loader returns the logged-in student's profile (or None); it is
+        only called for requests that carry a student session.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if self._bypass():
+                    self._count(request.endpoint, 'bypassed')
+                    return view(*args, **kwargs)
+
+                key = (request.full_path, self._session_class(student_loader))
+                entry = self.cache.get(key, _MISSING)
+                if entry is _MISSING:
+                    return self._render(view, key, args, kwargs)
+
+                fresh_until, headers, body, etag = entry
+                if time.monotonic() < fresh_until:
+                    self._count(request.endpoint, 'hits')
+                else:
+                    self._count(request.endpoint, 'stale_hits')
+                    self._refresh_in_background(view, key, args, kwargs)
+
+                response = current_app.response_class(body, status=200, headers=list(headers))
+                return self._validators(response, etag)
+            return wrapper
+        return decorator
@@ -0,0 +1,618 @@
+"""
+Compact question bank snapshot
+
+Holding the bank as a list of pymongo dicts costs roughly 2 KB per question
+per worker. A QuestionBank instead wraps one read-only buffer in a simple
+binary snapshot format, laid out column by column:
+
+    ids            12-byte ObjectIds, one per row
+    slots          open-addressing hash table (int32 row numbers, keyed by
+                   crc32 of the id) for O(1) lookup by id
+    offsets        uint64 offsets into the text blob, five strings per row
+                   (question + 4 options)
+    text           the UTF-8 encoded strings
+    subject codes  uint16 per row, into the subject list in the metadata
+    answers        one byte per row encoding how 'correct' is stored
+    option counts  one byte per row
+    subject rows   uint32 row numbers grouped by subject, for fast slicing
+    fragments      each question's public JSON object (id, question, options;
+                   never the answer), pre-serialised with uint64 offsets so
+                   exam responses are assembled by joining bytes
+    metadata       JSON: subjects and their row ranges, odd answer values,
+                   build time and content digest
+
+The same buffer can live in memory (QuestionBank.from_documents) or in a file
+that every worker memory-maps read-only (QuestionBank.open), so the pages are
+shared through the OS page cache and resident memory stays flat as workers
+are added. Documents are only materialised for the rows a request touches.
+
+When questions change, or the snapshot is older than Config.QUESTION_BANK_TTL,
+a background thread writes a new snapshot next to the current one and renames
+it into place, holding a lock file so only one process per host rebuilds;
+requests keep reading the current mapping meanwhile. Other workers notice the
+new file within Config.QUESTION_SNAPSHOT_CHECK_INTERVAL seconds and map it.
+Workers that are still reading the old mapping keep it until they drop their
+reference.
+
+Usage:
+    python question_bank.py build      # write the snapshot from the database
+    python question_bank.py info       # describe the current snapshot
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from contextlib import contextmanager
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from config import Config
+from models import db_manager, Question
+
+try:
+    import fcntl
+except ImportError:   # Windows: no writer lock, each worker rebuilds on its own
+    fcntl = None
+
+MAGIC = b'OLQBANK\x00'
+FORMAT_VERSION = 2
+SECTIONS = ('ids', 'slots', 'offsets', 'text', 'subject_codes', 'answers', 'option_counts',
+            'subject_rows', 'fragment_offsets', 'fragments', 'meta')
+_HEADER = struct.Struct('<8sII' + 'QQ' * len(SECTIONS))  # magic, format, rows, (offset, length) per section
+_ALIGN = 8
+
+FIELDS_PER_ROW = 5  # question + 4 options
+ID_SIZE = 12
+EMPTY_SLOT = -1
+
+# Answer byte encoding: the stored 'correct' value is either one of the
+# option texts (uploads) or a letter (seed data)
+ANSWER_TEXT = 0      # 0-3: correct == options[n]
+ANSWER_LETTER = 4    # 4-7: correct == 'ABCD'[n - 4]
+ANSWER_OTHER = 255   # anything else, kept in the metadata
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, corrupt or from another format version"""
+
+
+def _encode_answer(correct, options):
+    for index, option in enumerate(options[:4]):
+        if correct == option:
+            return ANSWER_TEXT + index
+    if isinstance(correct, str) and len(correct) == 1 and correct in 'ABCD':
+        return ANSWER_LETTER + 'ABCD'.index(correct)
+    return ANSWER_OTHER
+
+
+def _id_slot(oid, mask):
+    return zlib.crc32(oid) & mask
+
+
+def public_fragment(doc):
+    """JSON bytes of a question as sent to students (no correct answer)"""
+    return json.dumps({
+        'id': str(doc['_id']),
+        'question': doc.get('question', ''),
+        'options': list(doc.get('options', []))
+    }, separators=(',', ':')).encode('utf-8')
+
+
+def build_snapshot(documents):
+    """Serialise question documents into the snapshot format (bytes)"""
+    ids = bytearray()
+    text = bytearray()
+    offsets = array('Q', [0])
+    subject_codes = array('H')
+    answers = bytearray()
+    option_counts = bytearray()
+    fragments = bytearray()
+    fragment_offsets = array('Q', [0])
+    subjects = []
+    subject_code = {}
+    subject_rows = []
+    other_answers = {}
+
+    for row, doc in enumerate(documents):
+        ids += doc['_id'].binary
+
+        options = list(doc.get('options', []))
+        option_counts.append(min(len(options), 4))
+        for value in [doc.get('question', '')] + (options + ['', '', '', ''])[:4]:
+            text += str(value).encode('utf-8')
+            offsets.append(len(text))
+        fragments += public_fragment(doc)
+        fragment_offsets.append(len(fragments))
+
+        subject = doc.get('subject', '')
+        code = subject_code.get(subject)
+        if code is None:
+            code = subject_code[subject] = len(subjects)
+            subjects.append(subject)
+            subject_rows.append(array('I'))
+        subject_codes.append(code)
+        subject_rows[code].append(row)
+
+        answer = _encode_answer(doc.get('correct'), options)
+        answers.append(answer)
+        if answer == ANSWER_OTHER:
+            other_answers[str(row)] = doc.get('correct')
+
+    count = len(answers)
+
+    # Hash table at most half full so linear probes stay short
+    size = 8
+    while size < 2 * count:
+        size *= 2
+    slots = array('i', [EMPTY_SLOT]) * size
+    for row in range(count):
+        oid = bytes(ids[row * ID_SIZE:(row + 1) * ID_SIZE])
+        slot = _id_slot(oid, size - 1)
+        while slots[slot] != EMPTY_SLOT:
+            if ids[slots[slot] * ID_SIZE:(slots[slot] + 1) * ID_SIZE] == oid:
+                break  # Same ID loaded twice: keep the first row
+            slot = (slot + 1) & (size - 1)
+        else:
+            slots[slot] = row
+
+    grouped = array('I')
+    ranges = []
+    for name, rows in zip(subjects, subject_rows):
+        ranges.append([name, len(grouped), len(grouped) + len(rows)])
+        grouped.extend(rows)
+
+    digest = hashlib.sha1()
+    for part in (ids, text, answers):
+        digest.update(part)
+    meta = json.dumps({
+        'subjects': ranges,
+        'other_answers': other_answers,
+        'byteorder': sys.byteorder,
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'digest': digest.hexdigest()
+    }).encode('utf-8')
+
+    parts = [bytes(ids), slots.tobytes(), offsets.tobytes(), bytes(text), subject_codes.tobytes(),
+             bytes(answers), bytes(option_counts), grouped.tobytes(), fragment_offsets.tobytes(),
+             bytes(fragments), meta]
+
+    body = bytearray()
+    table = []
+    position = _HEADER.size
+    for part in parts:
+        padding = -position % _ALIGN
+        body += b'\x00' * padding
+        position += padding
+        table += [position, len(part)]
+        body += part
+        position += len(part)
+
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, count, *table) + bytes(body)
+
+
+class QuestionBank:
+    """Read-only question bank over a snapshot buffer (bytes or mmap)"""
+
+    __slots__ = ('path', 'meta', '_buffer', '_ids', '_slots', '_mask', '_offsets', '_text',
+                 '_subject_codes', '_answers', '_option_counts', '_subject_rows', '_subjects',
+                 '_subject_ranges', '_other_answers', '_fragment_offsets', '_fragments')
+
+    def __init__(self, buffer, path=None):
+        self.path = path
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise SnapshotError('Snapshot is truncated')
+        header = _HEADER.unpack_from(view)
+        magic, format_version = header[0], header[1]
+        if magic != MAGIC:
+            raise SnapshotError('Not a question bank snapshot')
+        if format_version != FORMAT_VERSION:
+            raise SnapshotError(f'Unsupported snapshot format {format_version} (expected {FORMAT_VERSION})')
+
+        sections = {}
+        for index, name in enumerate(SECTIONS):
+            offset, length = header[3 + 2 * index], header[4 + 2 * index]
+            if offset + length > len(view):
+                raise SnapshotError('Snapshot is truncated')
+            sections[name] = view[offset:offset + length]
+
+        self.meta = json.loads(bytes(sections['meta']))
+        if self.meta['byteorder'] != sys.byteorder:
+            raise SnapshotError('Snapshot was built on a machine with a different byte order')
+
+        self._ids = sections['ids']
+        self._slots = sections['slots'].cast('i')
+        self._mask = len(self._slots) - 1
+        self._offsets = sections['offsets'].cast('Q')
+        self._text = sections['text']
+        self._subject_codes = sections['subject_codes'].cast('H')
+        self._answers = sections['answers']
+        self._option_counts = sections['option_counts']
+        self._subject_rows = sections['subject_rows'].cast('I')
+        self._fragment_offsets = sections['fragment_offsets'].cast('Q')
+        self._fragments = sections['fragments']
+        self._subjects = [sys.intern(name) for name, _, _ in self.meta['subjects']]
+        self._subject_ranges = {name: (start, end) for name, start, end in self.meta['subjects']}
+        self._other_answers = self.meta['other_answers']
+
+    @classmethod
+    def from_documents(cls, documents):
+        """In-memory bank built from question documents"""
+        return cls(build_snapshot(documents))
+
+    @classmethod
+    def open(cls, path):
+        """Bank over a memory-mapped snapshot file"""
+        try:
+            with open(path, 'rb') as f:
+                # The mapping stays valid after the file is closed or replaced
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f'Cannot map snapshot {path}: {e}')
+        return cls(buffer, path=path)
+
+    @property
+    def version(self):
+        """Content digest identifying this snapshot"""
+        return self.meta['digest']
+
+    # ---------- lookups ----------
+
+    def __len__(self):
+        return len(self._answers)
+
+    def __contains__(self, question_id):
+        return self._row(question_id) is not None
+
+    def _row(self, question_id):
+        try:
+            oid = question_id.binary if isinstance(question_id, ObjectId) else ObjectId(question_id).binary
+        except Exception:
+            return None
+        if not len(self):
+            return None
+        slot = _id_slot(oid, self._mask)
+        while True:
+            row = self._slots[slot]
+            if row == EMPTY_SLOT:
+                return None
+            if self._ids[row * ID_SIZE:(row + 1) * ID_SIZE] == oid:
+                return row
+            slot = (slot + 1) & self._mask
+
+    def _string(self, row, field):
+        index = row * FIELDS_PER_ROW + field
+        return str(self._text[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+    def _document(self, row):
+        options = [self._string(row, 1 + i) for i in range(self._option_counts[row])]
+        answer = self._answers[row]
+        if answer < ANSWER_LETTER:
+            correct = options[answer]
+        elif answer < ANSWER_OTHER:
+            correct = 'ABCD'[answer - ANSWER_LETTER]
+        else:
+            correct = self._other_answers[str(row)]
+        return {
+            '_id': ObjectId(bytes(self._ids[row * ID_SIZE:(row + 1) * ID_SIZE])),
+            'question': self._string(row, 0),
+            'options': options,
+            'correct': correct,
+            'subject': self._subjects[self._subject_codes[row]]
+        }
+
+    def get(self, question_id):
+        """Question document for an ID (string or ObjectId), or None"""
+        row = self._row(question_id)
+        return self._document(row) if row is not None else None
+
+    def fragment(self, question_id):
+        """Pre-serialised public JSON of a question (a memoryview into the snapshot), or None"""
+        row = self._row(question_id)
+        if row is None:
+            return None
+        return self._fragments[self._fragment_offsets[row]:self._fragment_offsets[row + 1]]
+
+    def get_many(self, question_ids):
+        """Documents for the given IDs in the same order, skipping unknown IDs"""
+        rows = (self._row(qid) for qid in question_ids)
+        return [self._document(row) for row in rows if row is not None]
+
+    def subjects(self):
+        return list(self._subjects)
+
+    def count(self, subject):
+        start, end = self._subject_ranges.get(subject, (0, 0))
+        return end - start
+
+    def _rows_for(self, subject):
+        start, end = self._subject_ranges.get(subject, (0, 0))
+        return self._subject_rows[start:end]
+
+    def subject_slice(self, subject, start=0, stop=None):
+        """Documents of one subject in load order, e.g. for paging"""
+        return [self._document(row) for row in self._rows_for(subject)[start:stop]]
+
+    def sample(self, subject, count):
+        """Random questions from a subject, like $sample but without a database round trip"""
+        rows = self._rows_for(subject)
+        return [self._document(rows[i]) for i in random.sample(range(len(rows)), min(count, len(rows)))]
+
+    def memory_usage(self):
+        """Bytes held by the snapshot buffer (shared between workers when mapped)"""
+        return len(self._buffer)
+
+
+# ---------- snapshot files ----------
+
+def write_snapshot(path, documents):
+    """
+    Write a snapshot file atomically
+
+    The data goes to a temporary file in the same directory which is then
+    renamed over path, so readers see either the old or the new snapshot.
+    """
+    data = build_snapshot(documents)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return len(data)
+
+
+def _load_documents():
+    db = db_manager.get_db()
+    if db is None:
+        raise Exception("Database connection failed. Please ensure MongoDB is running.")
+    cursor = db.questions.find({}, {'question': 1, 'options': 1, 'correct': 1, 'subject': 1})
+    return cursor.batch_size(5000)
+
+
+def build_snapshot_file(path=None):
+    """Write the snapshot for the current database contents; returns its size in bytes"""
+    return write_snapshot(path or Config.QUESTION_SNAPSHOT_PATH, _load_documents())
+
+
+# ---------- shared per-process instance ----------
+
+_lock = threading.Lock()
+_first_load = threading.Lock()
+_bank = None
+_bank_file = None      # (inode, mtime_ns, size) of the mapped snapshot
+_checked_at = None
+_changes = 0           # Question changes made in this process
+_built_changes = 0     # ... of which the served bank already has
+_rebuilding = False
+
+
+def invalidate():
+    """Questions changed in this process: rebuild the snapshot in the background"""
+    global _changes
+    with _lock:
+        _changes += 1
+
+
+def _file_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    return (st.st_ino, st.st_mtime_ns, st.st_size), st.st_mtime
+
+
+def _expired(path):
+    key, mtime = _file_key(path)
+    return key is None or time.time() - mtime >= Config.QUESTION_BANK_TTL
+
+
+@contextmanager
+def _writer_lock(path):
+    """Exclusive lock on the snapshot, so one process per host rebuilds it while the others wait"""
+    if fcntl is None:
+        yield
+        return
+    with open(f'{path}.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _build(path, changes, force):
+    """Rebuild the snapshot if needed (or if force) and serve it; falls back to an in-process bank"""
+    global _bank, _bank_file, _built_changes, _checked_at
+    if path:
+        try:
+            with _writer_lock(path):
+                # Another process may have rebuilt it while this one waited for the lock
+                if force or _expired(path):
+                    build_snapshot_file(path)
+                try:
+                    bank = QuestionBank.open(path)
+                except SnapshotError:
+                    # Left behind by an older release or a crashed writer
+                    build_snapshot_file(path)
+                    bank = QuestionBank.open(path)
+                key, _ = _file_key(path)
+            with _lock:
+                _bank, _bank_file = bank, key
+                _built_changes = max(_built_changes, changes)
+                _checked_at = time.monotonic()
+            return
+        except (OSError, SnapshotError) as e:
+            # Read-only filesystem, or a platform that cannot replace a mapped file
+            print(f"⚠️  Question snapshot unavailable ({e}); using an in-process bank")
+
+    bank = QuestionBank.from_documents(_load_documents())
+    with _lock:
+        _bank, _bank_file = bank, None
+        _built_changes = max(_built_changes, changes)
+        _checked_at = time.monotonic()
+
+
+def _rebuild_in_background(path, changes, force):
+    global _rebuilding
+    try:
+        _build(path, changes, force)
+    except Exception as e:
+        print(f"⚠️  Question bank rebuild failed ({e}); still serving the previous snapshot")
+    finally:
+        with _lock:
+            _rebuilding = False
+
+
+def _check():
+    """Map a snapshot written by another process, or start a rebuild when one is due (_lock held)"""
+    global _bank, _bank_file, _checked_at, _rebuilding
+    path = Config.QUESTION_SNAPSHOT_PATH
+    stale = _changes != _built_changes
+    interval = Config.QUESTION_SNAPSHOT_CHECK_INTERVAL if _bank_file else Config.QUESTION_BANK_TTL
+    if not stale and time.monotonic() - _checked_at < interval:
+        return
+    _checked_at = time.monotonic()
+
+    if _bank_file:
+        key, _ = _file_key(path)
+        if key is not None and key != _bank_file:
+            try:
+                _bank, _bank_file = QuestionBank.open(path), key
+            except SnapshotError:
+                pass   # Rebuilt below
+
+    if (stale or _bank_file is None or _expired(path)) and not _rebuilding:
+        _rebuilding = True
+        threading.Thread(target=_rebuild_in_background, args=(path, _changes, stale),
+                         name='question-bank-rebuild', daemon=True).start()
+
+
+def get_question_bank():
+    """
+    The question bank for this worker
+
+    Maps Config.QUESTION_SNAPSHOT_PATH and checks for a newer file every
+    Config.QUESTION_SNAPSHOT_CHECK_INTERVAL seconds. When the file is older
+    than Config.QUESTION_BANK_TTL, or questions changed in this process, it
+    is rebuilt by a background thread while requests keep using the current
+    mapping; a file lock lets one process per host do the write. Only the
+    first call in a worker waits for a build, when the file is missing or
+    expired. Without a snapshot path the bank is kept in process memory.
+    """
+    with _lock:
+        if _bank is not None:
+            _check()
+            return _bank
+        changes = _changes
+
+    with _first_load:
+        if _bank is None:
+            _build(Config.QUESTION_SNAPSHOT_PATH, changes, force=changes != _built_changes)
+    return _bank
+
+
+def get_questions(question_ids):
+    """
+    Questions for an exam, in exam order
+
+    Served from the question bank; IDs it does not know yet (added after the
+    snapshot was built) are fetched from the database. For display only: the
+    snapshot may lag an answer-key fix, so scoring uses Question.get_answer_keys().
+    """
+    bank = get_question_bank()
+    found = {}
+    missing = []
+    for question_id in question_ids:
+        doc = bank.get(question_id)
+        if doc is not None:
+            found[str(question_id)] = doc
+        else:
+            missing.append(question_id)
+
+    if missing:
+        for doc in Question.get_by_ids([qid for qid in missing if ObjectId.is_valid(qid)]):
+            found[str(doc['_id'])] = doc
+
+    return [found[str(qid)] for qid in question_ids if str(qid) in found]
+
+
+def public_fragments(questions):
+    """
+    Public JSON fragments for an exam's questions, in exam order
+
+    questions holds IDs or question documents. Anything missing from the
+    snapshot is serialised on the fly (documents directly, IDs after a
+    database lookup).
+    """
+    bank = get_question_bank()
+    fragments = []
+    missing = []
+    for question in questions:
+        question_id = question['_id'] if isinstance(question, dict) else question
+        fragment = bank.fragment(question_id)
+        if fragment is None:
+            if isinstance(question, dict):
+                fragment = public_fragment(question)
+            else:
+                missing.append((len(fragments), question_id))
+        fragments.append(fragment)
+
+    if missing:
+        ids = [qid for _, qid in missing if ObjectId.is_valid(qid)]
+        docs = {str(doc['_id']): doc for doc in Question.get_by_ids(ids)}
+        for position, question_id in missing:
+            if str(question_id) in docs:
+                fragments[position] = public_fragment(docs[str(question_id)])
+
+    return [fragment for fragment in fragments if fragment is not None]
+
+
+def sample_questions(subject, count):
+    """Random questions for a new exam, from the bank when it has enough of the subject"""
+    bank = get_question_bank()
+    if bank.count(subject) >= count:
+        return bank.sample(subject, count)
+    return Question.get_random_by_subject(subject, count)
+
+
+Question.add_change_listener(invalidate)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build or inspect the question bank snapshot')
+    parser.add_argument('command', choices=['build', 'info'])
+    parser.add_argument('--path', default=Config.QUESTION_SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        db_manager.connect()
+        size = build_snapshot_file(args.path)
+        print(f"Wrote {args.path} ({size / 2**20:.1f} MiB)")
+
+    try:
+        snapshot = QuestionBank.open(args.path)
+    except SnapshotError as e:
+        sys.exit(str(e))
+    print(f"{args.path}: {len(snapshot)} questions, version {snapshot.version[:12]}, "
+          f"built {snapshot.meta['built_at']}")
+    for subject in sorted(snapshot.subjects()):
+        print(f"    {subject}: {snapshot.count(subject)}")
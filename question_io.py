@@ -0,0 +1,450 @@
+"""
+Question bank import/export helpers
+
+Streams CSV uploads row by row and inserts them in batches so that large
+files are processed with constant memory and one database round trip per
+batch instead of one per row.
+
+Also reads and writes question bundles for moving the bank between
+environments. A bundle is a zip file holding:
+
+    manifest.json   format, version, record count, per-subject counts and
+                    the SHA-256 of questions.csv
+    questions.csv   the upload CSV columns plus a Content Hash column,
+                    sorted by content hash
+
+Importing a bundle only writes the delta against the target database.
+
+Usage:
+    python question_io.py export bank.zip [--subject NAME]
+    python question_io.py import bank.zip [--dry-run] [--keep-removed]
+"""
+
+import csv
+import hashlib
+import io
+import json
+import zipfile
+from datetime import datetime
+
+from config import Config
+from bson.objectid import ObjectId
+
+from dedupe import duplicate_index
+from search import search_index
+from models import db_manager, Question, Exam
+
+# Expected format: Question, Option A, Option B, Option C, Option D, Correct Answer, Subject
+CSV_HEADER = ['Question', 'Option A', 'Option B', 'Option C', 'Option D', 'Correct Answer', 'Subject']
+
+OPTION_LETTERS = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+
+def resolve_answer(answer, options):
+    """
+    Option text for a correct answer given as a letter (A-D) or as one of the options
+
+    Students' answers are stored as the option text they clicked, so this is
+    the form 'correct' must have for scoring.
+
+    Returns:
+        tuple: (option_text, None) on success, (None, error_message) otherwise
+    """
+    given = str(answer).strip()
+    value = given.upper()
+    if value in OPTION_LETTERS and OPTION_LETTERS[value] < len(options):
+        return options[OPTION_LETTERS[value]], None
+    for option in options:
+        # Keep the option's original casing
+        if str(option).strip().upper() == value:
+            return option, None
+    return None, f'Correct answer "{given}" is not A-D or one of the options'
+
+
+def parse_question_row(row):
+    """
+    Validate a CSV row and convert it into question fields
+
+    Returns:
+        tuple: ((question_text, options, correct, subject), None) on success,
+               (None, error_message) when the row is invalid
+    """
+    if len(row) < 7:
+        return None, f'Expected 7 columns, found {len(row)}'
+
+    question_text = row[0].strip()
+    options = [row[1].strip(), row[2].strip(), row[3].strip(), row[4].strip()]
+    correct = row[5].strip()  # Expecting 'A', 'B', 'C', or 'D'
+    subject = row[6].strip()
+
+    if not question_text:
+        return None, 'Question text is empty'
+    if not all(options):
+        return None, 'All 4 options are required'
+    if not correct:
+        return None, 'Correct answer is empty'
+    if not subject:
+        return None, 'Subject is empty'
+
+    # The uploaded sheet gives the letter, the model stores the option text
+    correct, error = resolve_answer(correct, options)
+    if error:
+        return None, error
+
+    return (question_text, options, correct, subject), None
+
+
+def iter_csv_rows(binary_stream):
+    """
+    Decode an uploaded CSV incrementally
+
+    Yields:
+        tuple: (line_number, row) for every data row after the header
+    """
+    text = io.TextIOWrapper(binary_stream, encoding='utf-8-sig', newline='')
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if not header:
+            raise ValueError('Empty file')
+
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue  # Blank line
+            yield reader.line_num, row
+    finally:
+        # Leave the underlying upload open for the caller
+        text.detach()
+
+
+class ImportProgress:
+    """Running totals for a streamed import"""
+
+    def __init__(self, max_errors=None):
+        self.max_errors = Config.UPLOAD_MAX_ERRORS if max_errors is None else max_errors
+        self.processed = 0
+        self.inserted = 0
+        self.failed = 0
+        self.batches = 0
+        self.errors = []
+
+    def add_error(self, line_number, message):
+        """Record a per-row error, keeping only the first few messages"""
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(f'Row {line_number}: {message}')
+
+    def to_dict(self):
+        return {
+            'processed': self.processed,
+            'count': self.inserted,
+            'failed': self.failed,
+            'batches': self.batches,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors)
+        }
+
+
+def stream_import_questions_csv(binary_stream, batch_size=None, allow_similar=False):
+    """
+    Stream a questions CSV into the database in batches
+
+    Every row is checked against the duplicate index first: exact duplicates
+    are always rejected, near-duplicates unless allow_similar is set.
+
+    Args:
+        binary_stream: Readable binary file object (e.g. an upload's stream)
+        batch_size: Rows per insert_many call (defaults to Config.UPLOAD_BATCH_SIZE)
+        allow_similar: Insert rows that only look like existing questions
+
+    Yields:
+        ImportProgress: Running totals after each inserted batch, then the final totals
+    """
+    batch_size = batch_size or Config.UPLOAD_BATCH_SIZE
+    progress = ImportProgress()
+    batch = []
+    batch_lines = []
+
+    def flush():
+        try:
+            inserted, write_errors = Question.create_many(batch)
+        except Exception:
+            # Nothing is known to be written (AutoReconnect, timeout): unregister the batch so a
+            # re-upload of these rows is not rejected as duplicates of questions that do not exist
+            for doc in batch:
+                duplicate_index.remove(doc['_id'])
+            raise
+        progress.inserted += inserted
+        progress.batches += 1
+        failed = set()
+        for index, message in write_errors:
+            if 0 <= index < len(batch):
+                failed.add(index)
+                duplicate_index.remove(batch[index]['_id'])
+                line_number = batch_lines[index]
+            else:
+                line_number = '?'
+            if 'E11000' in message:
+                message = 'Duplicate of an existing question'
+            progress.add_error(line_number, message)
+        for index, doc in enumerate(batch):
+            if index not in failed:
+                search_index.add(doc['_id'], doc['question'], doc['options'], doc['subject'], doc['correct'])
+        batch.clear()
+        batch_lines.clear()
+
+    for line_number, row in iter_csv_rows(binary_stream):
+        progress.processed += 1
+        fields, error = parse_question_row(row)
+        if error:
+            progress.add_error(line_number, error)
+            continue
+
+        question_text, options, _, subject = fields
+        match, signature = duplicate_index.check(question_text, options, subject)
+        if match.exact_id or (match.similar and not allow_similar):
+            progress.add_error(line_number, match.message())
+            continue
+
+        # Register the row right away so later rows in the same file are checked against it
+        doc = Question.build(*fields)
+        doc['_id'] = ObjectId()
+        duplicate_index.add(doc['_id'], question_text, options, subject, signature=signature)
+
+        batch.append(doc)
+        batch_lines.append(line_number)
+        if len(batch) >= batch_size:
+            flush()
+            yield progress
+
+    if batch:
+        flush()
+    yield progress
+
+
+def import_questions_csv(binary_stream, batch_size=None, allow_similar=False):
+    """Run a streamed CSV import to completion and return the final ImportProgress"""
+    progress = None
+    for progress in stream_import_questions_csv(binary_stream, batch_size, allow_similar):
+        pass
+    return progress
+
+
+# ==================== BUNDLES ====================
+
+BUNDLE_FORMAT = 'olevel-question-bundle'
+BUNDLE_VERSION = 1
+BUNDLE_COLUMNS = CSV_HEADER + ['Content Hash']
+
+
+class BundleError(Exception):
+    """Raised when a bundle is malformed or fails its integrity check"""
+
+
+class _HashingReader(io.RawIOBase):
+    """Read-through wrapper that hashes every byte read from a binary stream"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.raw.read(len(buffer))
+        self.sha.update(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def export_bundle(path, subject=None):
+    """
+    Write the question bank (or one subject) to a bundle file
+
+    Returns:
+        dict: The bundle manifest
+    """
+    Question.backfill_content_hashes()
+
+    sha = hashlib.sha256()
+    subjects = {}
+    count = 0
+    row_buffer = io.StringIO()
+    writer = csv.writer(row_buffer)
+
+    def encode_row(row):
+        writer.writerow(row)
+        data = row_buffer.getvalue().encode('utf-8')
+        row_buffer.seek(0)
+        row_buffer.truncate()
+        sha.update(data)
+        return data
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        with zf.open('questions.csv', 'w') as out:
+            out.write(encode_row(BUNDLE_COLUMNS))
+            for q in Question.iter_sorted(subject):
+                options = (list(q.get('options', [])) + ['', '', '', ''])[:4]
+                out.write(encode_row([q.get('question', '')] + options +
+                                     [q.get('correct', ''), q.get('subject', ''), q['content_hash']]))
+                subjects[q.get('subject', '')] = subjects.get(q.get('subject', ''), 0) + 1
+                count += 1
+
+        manifest = {
+            'format': BUNDLE_FORMAT,
+            'version': BUNDLE_VERSION,
+            'exported_at': datetime.now().isoformat(timespec='seconds'),
+            'subject': subject,
+            'count': count,
+            'subjects': subjects,
+            'columns': BUNDLE_COLUMNS,
+            'sha256': sha.hexdigest()
+        }
+        zf.writestr('manifest.json', json.dumps(manifest, indent=2, ensure_ascii=False))
+
+    return manifest
+
+
+def read_manifest(zf):
+    """Load and validate a bundle's manifest"""
+    try:
+        manifest = json.loads(zf.read('manifest.json'))
+    except KeyError:
+        raise BundleError('Bundle has no manifest.json')
+
+    if manifest.get('format') != BUNDLE_FORMAT:
+        raise BundleError(f"Not a question bundle (format {manifest.get('format')!r})")
+    if manifest.get('version') != BUNDLE_VERSION:
+        raise BundleError(f"Unsupported bundle version {manifest.get('version')}")
+    return manifest
+
+
+def iter_bundle_records(zf, manifest):
+    """
+    Yield (content_hash, document) for every record in a bundle
+
+    The content hash of each record is recomputed and the SHA-256 of the
+    whole file is checked once the last record has been read.
+    """
+    hashing = _HashingReader(zf.open('questions.csv'))
+    text = io.TextIOWrapper(io.BufferedReader(hashing), encoding='utf-8', newline='')
+    reader = csv.reader(text)
+
+    if next(reader, None) != BUNDLE_COLUMNS:
+        raise BundleError('Unexpected questions.csv columns')
+
+    count = 0
+    for row in reader:
+        if len(row) != len(BUNDLE_COLUMNS):
+            raise BundleError(f'Row {reader.line_num}: expected {len(BUNDLE_COLUMNS)} columns')
+
+        doc = Question.build(row[0], row[1:5], row[5], row[6])
+        if doc['content_hash'] != row[7]:
+            raise BundleError(f'Row {reader.line_num}: content hash mismatch')
+        count += 1
+        yield doc['content_hash'], doc
+
+    if count != manifest.get('count'):
+        raise BundleError(f"Manifest lists {manifest.get('count')} records, bundle has {count}")
+    if hashing.sha.hexdigest() != manifest.get('sha256'):
+        raise BundleError('questions.csv checksum does not match the manifest')
+
+
+def import_bundle(path, dry_run=False, prune=True, batch_size=None):
+    """
+    Bring the database in line with a bundle by applying only the delta
+
+    The bundle is read twice: once to compare hashes and answer keys with the
+    database, and once to collect only the new and changed records. Questions
+    missing from the bundle are removed when prune is set, except those used by
+    exams still in progress.
+
+    Returns:
+        dict: Counts of new, changed, removed, in-use (kept) and unchanged records
+    """
+    batch_size = batch_size or Config.UPLOAD_BATCH_SIZE
+    Question.backfill_content_hashes()
+
+    with zipfile.ZipFile(path) as zf:
+        manifest = read_manifest(zf)
+        stored = Question.get_hash_index(manifest.get('subject'))
+
+        # Pass 1: classify hashes
+        to_write = set()
+        seen = set()
+        new = changed = 0
+        for content_hash, doc in iter_bundle_records(zf, manifest):
+            seen.add(content_hash)
+            if content_hash not in stored:
+                new += 1
+                to_write.add(content_hash)
+            elif stored[content_hash][1] != doc['correct']:
+                changed += 1
+                to_write.add(content_hash)
+
+        removed_ids = [stored[h][0] for h in stored.keys() - seen] if prune else []
+        in_use = 0
+        if removed_ids:
+            active = Exam.get_in_progress_question_ids()
+            in_use = sum(1 for qid in removed_ids if str(qid) in active)
+            removed_ids = [qid for qid in removed_ids if str(qid) not in active]
+
+        report = {
+            'new': new,
+            'changed': changed,
+            'removed': len(removed_ids),
+            'in_use': in_use,
+            'unchanged': len(seen) - new - changed
+        }
+        if dry_run:
+            return report
+
+        # Pass 2: write only the records that differ
+        batch = []
+        if to_write:
+            for content_hash, doc in iter_bundle_records(zf, manifest):
+                if content_hash in to_write:
+                    batch.append(doc)
+                    if len(batch) >= batch_size:
+                        Question.upsert_many(batch)
+                        batch = []
+            Question.upsert_many(batch)
+
+        Question.delete_by_ids(removed_ids, batch_size)
+
+    duplicate_index.invalidate()
+    search_index.invalidate()
+    return report
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export or import question bank bundles')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help='Write the question bank to a bundle')
+    export_parser.add_argument('path')
+    export_parser.add_argument('--subject', help='Only export one subject')
+
+    import_parser = commands.add_parser('import', help='Apply a bundle to the database')
+    import_parser.add_argument('path')
+    import_parser.add_argument('--dry-run', action='store_true', help='Show the delta without writing')
+    import_parser.add_argument('--keep-removed', action='store_true',
+                               help='Do not delete questions missing from the bundle')
+    import_parser.add_argument('--batch-size', type=int, default=None, help='Records per bulk write')
+    args = parser.parse_args()
+
+    db_manager.connect()
+    if args.command == 'export':
+        manifest = export_bundle(args.path, args.subject)
+        print(f"Exported {manifest['count']} questions to {args.path}")
+        for subject, count in sorted(manifest['subjects'].items()):
+            print(f"  {subject}: {count}")
+    else:
+        report = import_bundle(args.path, dry_run=args.dry_run,
+                               prune=not args.keep_removed, batch_size=args.batch_size)
+        print(f"{'Dry run' if args.dry_run else 'Imported'} {args.path}:")
+        for key in ('new', 'changed', 'removed', 'in_use', 'unchanged'):
+            print(f"  {key}: {report[key]}")
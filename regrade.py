@@ -0,0 +1,392 @@
+"""
+Bulk regrade of completed exams
+
+Completed exams store their score, percentage and grade, so fixing a wrong
+answer key or changing Config.GRADE_BOUNDARIES leaves old results as they
+were. A regrade recomputes them:
+
+    * affected exams are found through the multikey index on
+      exams.questions (answer-key fixes) or taken as all completed exams
+      (--all, after a grade boundary change), optionally for one subject;
+    * exams are streamed in _id order, Config.REGRADE_BATCH_SIZE at a time;
+    * each batch is scored in one pass: the answer key of every question in
+      the batch is loaded with one query (kept for later batches), then
+      every exam is compared against it column-wise (map over aligned
+      question/answer lists) instead of question document by document;
+    * changed exams are written with one bulk_write per batch, each update
+      conditional on the exam still holding the values it was read with;
+    * every change is recorded as a before/after row in regrade_changes,
+      and progress (the last exam _id done and counters) in regrade_runs.
+
+A corrected answer is given as a letter (A-D) or as the text of one of the
+question's options, and is stored as the option text, the form students'
+answers are saved in; anything else is rejected before the run starts.
+
+A run that is interrupted continues from its checkpoint with
+`python regrade.py resume RUN_ID`. Rows are keyed by run and exam, so a
+batch that is redone after a crash is written only once. --dry-run computes
+the same report without writing anything.
+
+PASSING_MARKS is applied when results are displayed, so changing it needs no
+rewrite. --previous-passing-marks shows in the report whose PASS/FAIL flips.
+Exams whose questions were deleted since are left unchanged and counted as
+skipped.
+
+Usage:
+    python regrade.py run --correct 65a1...=B --dry-run     # preview an answer-key fix (option B)
+    python regrade.py run --correct "65a1...=Photosynthesis" --csv fix.csv
+    python regrade.py run --questions 65a1...,65a2...       # keys already fixed in the database
+    python regrade.py run --all [--subject Python]          # after a grade boundary change
+    python regrade.py resume RUN_ID
+    python regrade.py status [RUN_ID]
+    python regrade.py report RUN_ID [--csv FILE]
+"""
+
+import csv
+import operator
+import sys
+import time
+import uuid
+from datetime import datetime
+
+from bson.objectid import ObjectId
+from pymongo import ReplaceOne, UpdateOne
+
+from config import Config
+from models import Exam, Question, db_manager, exam_cache
+from question_io import resolve_answer
+from utils import calculate_grade
+
+_MISSING = object()
+_EXAM_FIELDS = {'student_roll': 1, 'subject': 1, 'questions': 1, 'answers': 1,
+                'score': 1, 'total': 1, 'percentage': 1, 'grade': 1}
+REPORT_FIELDS = ['exam_id', 'student_roll', 'subject', 'score_before', 'score_after', 'total',
+                 'percentage_before', 'percentage_after', 'grade_before', 'grade_after',
+                 'status_before', 'status_after']
+
+
+def score_batch(exams, answer_key):
+    """
+    (score, total, percentage, grade) for each exam, or None if one of its questions is gone
+
+    Same result as utils.calculate_score/calculate_grade; the comparisons run
+    as one map() per exam over its question list.
+    """
+    eq = operator.eq
+    results = []
+    for exam in exams:
+        question_ids = exam['questions']
+        key = [answer_key.get(qid, _MISSING) for qid in question_ids]
+        if _MISSING in key:
+            results.append(None)
+            continue
+        given = list(map(exam.get('answers', {}).get, question_ids))
+        score = sum(map(eq, given, key))
+        total = len(question_ids)
+        percentage = round(score / total * 100, 2) if total > 0 else 0
+        results.append((score, total, percentage, calculate_grade(percentage)))
+    return results
+
+
+def pass_fail(percentage, passing_marks):
+    return 'PASS' if percentage >= passing_marks else 'FAIL'
+
+
+class Regrade:
+    """One regrade run: scope, answer-key overrides, progress and counters"""
+
+    def __init__(self, question_ids=(), corrections=None, subject=None, dry_run=False,
+                 batch_size=None, previous_passing_marks=None, run_id=None):
+        self.corrections = dict(corrections or {})   # question_id -> corrected answer
+        self.question_ids = sorted(set(question_ids) | set(self.corrections))
+        self.subject = subject
+        self.dry_run = dry_run
+        self.batch_size = batch_size or Config.REGRADE_BATCH_SIZE
+        self.previous_passing_marks = previous_passing_marks
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6]
+        self.last_exam_id = None
+        self.counters = {'scanned': 0, 'changed': 0, 'unchanged': 0, 'skipped_missing_questions': 0,
+                         'written': 0, 'conflicts': 0, 'grade_changes': 0, 'pass_fail_flips': 0, 'batches': 0}
+        self._answer_key = {}
+
+    # ---------- persistence ----------
+
+    def params(self):
+        return {'question_ids': self.question_ids, 'corrections': self.corrections, 'subject': self.subject,
+                'batch_size': self.batch_size, 'previous_passing_marks': self.previous_passing_marks}
+
+    @classmethod
+    def resume(cls, run_id):
+        db = db_manager.get_db()
+        run = db.regrade_runs.find_one({'_id': run_id})
+        if run is None:
+            raise ValueError(f'No regrade run {run_id}')
+        if run['status'] == 'completed':
+            raise ValueError(f'Regrade run {run_id} already completed')
+        params = run['params']
+        regrade = cls(params['question_ids'], params['corrections'], params['subject'],
+                      batch_size=params['batch_size'], previous_passing_marks=params['previous_passing_marks'],
+                      run_id=run_id)
+        regrade.last_exam_id = run.get('last_exam_id')
+        regrade.counters.update(run.get('counters', {}))
+        return regrade
+
+    def _checkpoint(self, db, status='running'):
+        db.regrade_runs.update_one({'_id': self.run_id}, {
+            '$set': {'status': status, 'last_exam_id': self.last_exam_id, 'counters': self.counters,
+                     'updated_at': datetime.now()},
+            '$setOnInsert': {'params': self.params(), 'started_at': datetime.now()}
+        }, upsert=True)
+
+    def _resolve_corrections(self, db):
+        """Check the corrected answers against the questions' options and store them as option text"""
+        if not self.corrections:
+            return
+        ids = [ObjectId(qid) for qid in self.corrections]
+        options = {str(doc['_id']): doc.get('options', [])
+                   for doc in db.questions.find({'_id': {'$in': ids}}, {'options': 1})}
+        resolved, errors = {}, []
+        for qid, answer in self.corrections.items():
+            if qid not in options:
+                errors.append(f'{qid}: no such question')
+                continue
+            correct, error = resolve_answer(answer, options[qid])
+            if error:
+                errors.append(f'{qid}: {error}')
+            else:
+                resolved[qid] = correct
+        if errors:
+            raise ValueError('; '.join(errors))
+        self.corrections = resolved
+
+    def _apply_corrections(self, db):
+        """Write corrected answers to the question documents (first start of a run only)"""
+        if not self.corrections or self.counters['batches']:
+            return
+        db.questions.bulk_write([
+            UpdateOne({'_id': ObjectId(qid)}, {'$set': {'correct': answer}})
+            for qid, answer in self.corrections.items()
+        ])
+        Question.notify_changed()
+
+    # ---------- regrading ----------
+
+    def query(self):
+        query = {'status': 'completed'}
+        if self.question_ids:
+            query['questions'] = {'$in': self.question_ids}
+        if self.subject:
+            query['subject'] = self.subject
+        if self.last_exam_id is not None:
+            query['_id'] = {'$gt': self.last_exam_id}
+        return query
+
+    def _load_answer_key(self, db, exams):
+        wanted = {qid for exam in exams for qid in exam['questions']} - self._answer_key.keys()
+        ids = [ObjectId(qid) for qid in wanted if ObjectId.is_valid(qid)]
+        for qid in wanted:
+            self._answer_key[qid] = _MISSING   # Deleted questions are not looked up again
+        if ids:
+            for doc in db.questions.find({'_id': {'$in': ids}}, {'correct': 1}):
+                self._answer_key[str(doc['_id'])] = doc.get('correct')
+        self._answer_key.update(self.corrections)
+
+    def run(self, report=None):
+        """Regrade every exam in scope after the checkpoint; report(row) is called per changed exam"""
+        db = db_manager.get_db()
+        Exam.ensure_indexes()
+        self._resolve_corrections(db)
+        if not self.dry_run:
+            self._apply_corrections(db)
+            self._checkpoint(db)
+
+        cursor = db.exams.find(self.query(), _EXAM_FIELDS).sort('_id', 1).batch_size(self.batch_size)
+        batch = []
+        for exam in cursor:
+            batch.append(exam)
+            if len(batch) == self.batch_size:
+                self._process(db, batch, report)
+                batch = []
+        if batch:
+            self._process(db, batch, report)
+
+        if not self.dry_run:
+            self._checkpoint(db, status='completed')
+        return self.counters
+
+    def _process(self, db, exams, report):
+        self._load_answer_key(db, exams)
+        updates, rows, changed_rolls = [], [], set()
+        previous_marks = self.previous_passing_marks if self.previous_passing_marks is not None else Config.PASSING_MARKS
+        now = datetime.now()
+
+        for exam, result in zip(exams, score_batch(exams, self._answer_key)):
+            self.counters['scanned'] += 1
+            if result is None:
+                self.counters['skipped_missing_questions'] += 1
+                continue
+            score, total, percentage, grade = result
+            status_before = pass_fail(exam['percentage'], previous_marks)
+            status_after = pass_fail(percentage, Config.PASSING_MARKS)
+            if (score, total, percentage, grade) == (exam['score'], exam['total'], exam['percentage'], exam['grade']):
+                self.counters['unchanged'] += 1
+                if status_before != status_after:
+                    self.counters['pass_fail_flips'] += 1
+                    rows.append(self._row(exam, result, status_before, status_after))
+                continue
+
+            self.counters['changed'] += 1
+            self.counters['grade_changes'] += grade != exam['grade']
+            self.counters['pass_fail_flips'] += status_before != status_after
+            rows.append(self._row(exam, result, status_before, status_after))
+            changed_rolls.add(exam['student_roll'])
+            updates.append(UpdateOne(
+                # Only if nobody changed the exam since it was read
+                {'_id': exam['_id'], 'status': 'completed', 'score': exam['score'],
+                 'percentage': exam['percentage'], 'grade': exam['grade']},
+                {'$set': {'score': score, 'total': total, 'percentage': percentage, 'grade': grade,
+                          'regraded_at': now, 'regrade_run': self.run_id}}
+            ))
+
+        if not self.dry_run:
+            if updates:
+                result = db.exams.bulk_write(updates, ordered=False)
+                self.counters['written'] += result.modified_count
+                self.counters['conflicts'] += len(updates) - result.matched_count
+                for roll_number in changed_rolls:
+                    exam_cache.invalidate_tag(roll_number)
+            if rows:
+                db.regrade_changes.bulk_write([
+                    ReplaceOne({'_id': f"{self.run_id}:{row['exam_id']}"}, {**row, 'run': self.run_id}, upsert=True)
+                    for row in rows
+                ], ordered=False)
+
+        self.last_exam_id = exams[-1]['_id']
+        self.counters['batches'] += 1
+        if not self.dry_run:
+            self._checkpoint(db)
+        if report:
+            for row in rows:
+                report(row)
+
+    @staticmethod
+    def _row(exam, result, status_before, status_after):
+        score, total, percentage, grade = result
+        return {
+            'exam_id': str(exam['_id']),
+            'student_roll': exam['student_roll'],
+            'subject': exam.get('subject'),
+            'score_before': exam['score'], 'score_after': score, 'total': total,
+            'percentage_before': exam['percentage'], 'percentage_after': percentage,
+            'grade_before': exam['grade'], 'grade_after': grade,
+            'status_before': status_before, 'status_after': status_after
+        }
+
+
+# ---------- command line ----------
+
+def _csv_writer(path):
+    if not path:
+        return None, None
+    handle = open(path, 'a', newline='', encoding='utf-8')
+    writer = csv.DictWriter(handle, fieldnames=REPORT_FIELDS, extrasaction='ignore')
+    if handle.tell() == 0:
+        writer.writeheader()
+    return handle, writer.writerow
+
+
+def _print_row(row):
+    print(f"  {row['student_roll']:<14} {row['subject'] or '':<20} "
+          f"{row['score_before']:>3} -> {row['score_after']:<3} "
+          f"{row['grade_before']:>2} -> {row['grade_after']:<2} {row['status_before']} -> {row['status_after']}")
+
+
+def _execute(regrade, csv_path, verbose):
+    handle, write_csv = _csv_writer(csv_path)
+
+    def report(row):
+        if write_csv:
+            write_csv(row)
+        if verbose:
+            _print_row(row)
+
+    started = time.perf_counter()
+    try:
+        counters = regrade.run(report)
+    except ValueError as e:
+        sys.exit(f"Regrade stopped: {e}")
+    finally:
+        if handle:
+            handle.close()
+    mode = 'dry run' if regrade.dry_run else f'run {regrade.run_id}'
+    print(f"Regrade {mode} finished in {time.perf_counter() - started:.1f}s: {counters}")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rescore completed exams after answer-key or grade boundary changes')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='Start a regrade')
+    run.add_argument('--questions', default='', help='Comma-separated question IDs whose answer key changed')
+    run.add_argument('--correct', action='append', default=[], metavar='ID=ANSWER',
+                     help='Set the correct answer of a question, then regrade the exams using it')
+    run.add_argument('--all', action='store_true', help='Every completed exam (grade boundary changes)')
+    run.add_argument('--subject', help='Only exams of this subject')
+    run.add_argument('--dry-run', action='store_true', help='Report the changes without writing them')
+    run.add_argument('--batch-size', type=int, default=None)
+    run.add_argument('--previous-passing-marks', type=float, default=None,
+                     help='PASSING_MARKS before the change, to report PASS/FAIL flips')
+    run.add_argument('--csv', help='Append the before/after rows to this CSV file')
+    run.add_argument('--verbose', action='store_true', help='Print every changed exam')
+
+    resume = sub.add_parser('resume', help='Continue an interrupted regrade')
+    resume.add_argument('run_id')
+    resume.add_argument('--csv')
+    resume.add_argument('--verbose', action='store_true')
+
+    status = sub.add_parser('status', help='Progress of regrade runs')
+    status.add_argument('run_id', nargs='?')
+
+    report_cmd = sub.add_parser('report', help='Before/after rows of a run')
+    report_cmd.add_argument('run_id')
+    report_cmd.add_argument('--csv')
+
+    args = parser.parse_args()
+    db_manager.connect()
+    db = db_manager.get_db()
+
+    if args.command == 'run':
+        corrections = dict(item.split('=', 1) for item in args.correct)
+        question_ids = [qid for qid in args.questions.split(',') if qid]
+        invalid = [qid for qid in [*question_ids, *corrections] if not ObjectId.is_valid(qid)]
+        if invalid:
+            sys.exit(f"Not question IDs: {', '.join(invalid)}")
+        if not (question_ids or corrections or args.all or args.subject):
+            sys.exit('Name the questions (--questions/--correct) or pass --all or --subject')
+        _execute(Regrade(question_ids, corrections, args.subject, args.dry_run, args.batch_size,
+                         args.previous_passing_marks), args.csv, args.verbose)
+
+    elif args.command == 'resume':
+        _execute(Regrade.resume(args.run_id), args.csv, args.verbose)
+
+    elif args.command == 'status':
+        query = {'_id': args.run_id} if args.run_id else {}
+        for run_doc in db.regrade_runs.find(query).sort('started_at', -1).limit(20):
+            print(f"{run_doc['_id']}  {run_doc['status']:<10} last exam {run_doc.get('last_exam_id')}  "
+                  f"{run_doc.get('counters')}")
+
+    else:
+        handle, write_csv = _csv_writer(args.csv)
+        rows = db.regrade_changes.find({'run': args.run_id}).sort('_id', 1)
+        count = 0
+        for row in rows:
+            count += 1
+            if write_csv:
+                write_csv(row)
+            else:
+                _print_row(row)
+        if handle:
+            handle.close()
+        print(f"{count} changed exams in run {args.run_id}")
@@ -0,0 +1,214 @@
+"""
+Admin question search
+
+An in-process inverted index over question text and options, built lazily
+from the database and kept in sync on add/delete in this process (and
+rebuilt after Config.SEARCH_INDEX_TTL seconds to pick up other workers'
+writes), the same lifecycle as the duplicate index in dedupe.py.
+
+Queries are AND-ed terms ranked with BM25; the last term is treated as a
+prefix so the admin dashboard can search as you type. Results can be
+filtered by subject and by answer letter, and every search also returns the
+number of matches per subject.
+"""
+
+import bisect
+import math
+import re
+import threading
+import time
+
+from config import Config
+from models import db_manager
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+QUESTION_WEIGHT = 2  # A term in the question counts double a term in the options
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def tokenize(text):
+    """Lower-cased word tokens of a text"""
+    return TOKEN_RE.findall(str(text).casefold())
+
+
+def answer_letter(correct, options):
+    """
+    Letter of the correct option
+
+    Seeded questions store the letter, uploaded ones store the option text.
+    """
+    correct = str(correct or '').strip()
+    if correct.upper() in ('A', 'B', 'C', 'D') and len(correct) == 1:
+        return correct.upper()
+    for index, option in enumerate(options or []):
+        if option == correct:
+            return 'ABCD'[index] if index < 4 else ''
+    return ''
+
+
+class QuestionSearchIndex:
+    """Inverted index for ranked, filtered question search"""
+
+    def __init__(self, ttl=None):
+        self.ttl = Config.SEARCH_INDEX_TTL if ttl is None else ttl
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._docs = {}        # question_id -> (subject, answer_letter, length, tokens)
+        self._postings = {}    # token -> {question_id: weighted term frequency}
+        self._vocab = []       # sorted tokens, for prefix expansion
+        self._total_length = 0
+
+    # ---------- maintenance ----------
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt from the database on next use"""
+        with self._lock:
+            self._loaded_at = None
+            self._docs = {}
+            self._postings = {}
+            self._vocab = []
+            self._total_length = 0
+
+    def _ensure_loaded(self):
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return
+        self.invalidate()
+        db = db_manager.get_db()
+        cursor = db.questions.find({}, {'question': 1, 'options': 1, 'subject': 1, 'correct': 1})
+        for q in cursor:
+            self._add(str(q['_id']), q.get('question', ''), q.get('options', []),
+                      q.get('subject', ''), q.get('correct', ''))
+        self._vocab.sort()
+        self._loaded_at = time.monotonic()
+
+    def _add(self, question_id, question_text, options, subject, correct, keep_vocab_sorted=False):
+        if question_id in self._docs:
+            self._remove(question_id)
+
+        weights = {}
+        for token in tokenize(question_text):
+            weights[token] = weights.get(token, 0) + QUESTION_WEIGHT
+        for option in options:
+            for token in tokenize(option):
+                weights[token] = weights.get(token, 0) + 1
+
+        length = sum(weights.values())
+        self._docs[question_id] = (subject, answer_letter(correct, options), length, tuple(weights))
+        self._total_length += length
+        for token, weight in weights.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                if keep_vocab_sorted:
+                    position = bisect.bisect_left(self._vocab, token)
+                    if position == len(self._vocab) or self._vocab[position] != token:
+                        self._vocab.insert(position, token)
+                else:
+                    self._vocab.append(token)
+            posting[question_id] = weight
+
+    def _remove(self, question_id):
+        doc = self._docs.pop(question_id, None)
+        if not doc:
+            return
+        self._total_length -= doc[2]
+        for token in doc[3]:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(question_id, None)
+                if not posting:
+                    # The token stays in _vocab; prefix expansion skips it
+                    del self._postings[token]
+
+    def add(self, question_id, question_text, options, subject, correct):
+        """Index a newly inserted question"""
+        with self._lock:
+            if self._loaded_at is not None:
+                self._add(str(question_id), question_text, options, subject, correct, keep_vocab_sorted=True)
+
+    def remove(self, question_id):
+        """Forget a deleted question"""
+        with self._lock:
+            self._remove(str(question_id))
+
+    # ---------- queries ----------
+
+    def _expand_prefix(self, prefix):
+        start = bisect.bisect_left(self._vocab, prefix)
+        expansions = []
+        for token in self._vocab[start:]:
+            if not token.startswith(prefix) or len(expansions) >= MAX_PREFIX_EXPANSIONS:
+                break
+            if token in self._postings:
+                expansions.append(token)
+        return expansions
+
+    def _term_scores(self, tokens, avg_length):
+        """BM25 score per document for one query term (a set of alternative tokens)"""
+        n = len(self._docs)
+        scores = {}
+        for token in tokens:
+            posting = self._postings.get(token, {})
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for question_id, tf in posting.items():
+                length = self._docs[question_id][2]
+                norm = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length))
+                score = idf * norm
+                if score > scores.get(question_id, 0):
+                    scores[question_id] = score
+        return scores
+
+    def search(self, text='', subject=None, answer=None, skip=0, limit=20):
+        """
+        Ranked search
+
+        Returns:
+            tuple: ([question_id, ...] for the requested page, total matches,
+                    {subject: matches} ignoring the subject filter)
+        """
+        terms = tokenize(text)
+        with self._lock:
+            self._ensure_loaded()
+
+            if terms:
+                avg_length = (self._total_length / len(self._docs)) if self._docs else 1
+                scores = None
+                for i, term in enumerate(terms):
+                    # The last term may still be being typed
+                    tokens = self._expand_prefix(term) if i == len(terms) - 1 else [term]
+                    term_scores = self._term_scores(tokens, avg_length)
+                    if scores is None:
+                        scores = term_scores
+                    else:
+                        scores = {qid: s + term_scores[qid] for qid, s in scores.items() if qid in term_scores}
+                    if not scores:
+                        break
+                matches = scores or {}
+            else:
+                matches = dict.fromkeys(self._docs, 0)
+
+            if answer:
+                answer = answer.upper()
+                matches = {qid: s for qid, s in matches.items() if self._docs[qid][1] == answer}
+
+            subject_counts = {}
+            for question_id in matches:
+                doc_subject = self._docs[question_id][0]
+                subject_counts[doc_subject] = subject_counts.get(doc_subject, 0) + 1
+
+            if subject:
+                matches = {qid: s for qid, s in matches.items() if self._docs[qid][0] == subject}
+
+        if terms:
+            ranked = sorted(matches, key=lambda qid: (-matches[qid], qid))
+        else:
+            ranked = sorted(matches, reverse=True)  # Newest first (ObjectIds sort by time)
+
+        return ranked[skip:skip + limit], len(ranked), subject_counts
+
+
+# Shared per-process index
+search_index = QuestionSearchIndex()
@@ -1,1966 +1,155 @@
 """
 Database seeding script for O Level Exam Portal - COMPLETE VERSION
-Populates the database with 1000 Computer Science MCQ questions and default admin
+Populates the database with the Computer Science MCQ question bank and default admin
 Author: Enhanced Question Bank Generator
 Date: December 2025
-"""
-
-from models import db_manager, Question, Admin
-from config import Config
-
-questions_data = [
-    # ==================== PYTHON BASICS (1-50) ====================
-    {"question": "Who developed Python programming language?", "options": ["Guido van Rossum", "Dennis Ritchie", "James Gosling", "Bjarne Stroustrup"], "correct": "A", "subject": "Python"},
-    {"question": "In which year was Python first released?", "options": ["1989", "1991", "1995", "2000"], "correct": "B", "subject": "Python"},
-    {"question": "Python is a:", "options": ["Compiled language", "Interpreted language", "Machine language", "Assembly language"], "correct": "B", "subject": "Python"},
-    {"question": "What is the extension of Python files?", "options": [".python", ".py", ".pt", ".pyt"], "correct": "B", "subject": "Python"},
-    {"question": "Which symbol is used for single line comments in Python?", "options": ["//", "/* */", "#", "--"], "correct": "C", "subject": "Python"},
-    {"question": "Python is:", "options": ["Case sensitive", "Case insensitive", "Both", "None"], "correct": "A", "subject": "Python"},
-    {"question": "Which keyword is used to define a function in Python?", "options": ["function", "def", "define", "func"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(type(5))?", "options": ["<class 'float'>", "<class 'int'>", "<class 'number'>", "<class 'integer'>"], "correct": "B", "subject": "Python"},
-    {"question": "Which of the following is NOT a valid variable name?", "options": ["_myvar", "my_var", "2myvar", "myVar"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(2**3)?", "options": ["6", "8", "9", "5"], "correct": "B", "subject": "Python"},
-    {"question": "Which operator is used for floor division?", "options": ["/", "//", "%", "**"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(17%5)?", "options": ["3", "2", "3.4", "12"], "correct": "B", "subject": "Python"},
-    {"question": "Which data type is immutable?", "options": ["List", "Dictionary", "Tuple", "Set"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(10/3)?", "options": ["3", "3.333", "3.3333333333333335", "3.33"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(10//3)?", "options": ["3", "3.333", "4", "3.0"], "correct": "A", "subject": "Python"},
-    {"question": "Which function is used to get the length of a list?", "options": ["size()", "length()", "len()", "count()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(bool(0))?", "options": ["True", "False", "0", "1"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(bool(''))?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which of the following is a valid Python identifier?", "options": ["@name", "2name", "_name", "for"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of type(3.14)?", "options": ["<class 'int'>", "<class 'float'>", "<class 'double'>", "<class 'decimal'>"], "correct": "B", "subject": "Python"},
-    {"question": "What is None in Python?", "options": ["A zero value", "An empty string", "A null object", "An undefined variable"], "correct": "C", "subject": "Python"},
-    {"question": "Which operator is used for exponentiation?", "options": ["^", "**", "^^", "exp"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(5+3*2)?", "options": ["16", "11", "13", "10"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print('Hello'*3)?", "options": ["HelloHelloHello", "Hello3", "Hello Hello Hello", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which of the following is not a keyword in Python?", "options": ["pass", "eval", "assert", "nonlocal"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(type([]))?", "options": ["<class 'tuple'>", "<class 'list'>", "<class 'array'>", "<class 'set'>"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(type({}))?", "options": ["<class 'set'>", "<class 'dict'>", "<class 'tuple'>", "<class 'list'>"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(type(()))?", "options": ["<class 'tuple'>", "<class 'list'>", "<class 'set'>", "<class 'dict'>"], "correct": "A", "subject": "Python"},
-    {"question": "Which statement is used to exit from a loop?", "options": ["exit", "break", "stop", "quit"], "correct": "B", "subject": "Python"},
-    {"question": "Which statement is used to skip current iteration?", "options": ["skip", "pass", "continue", "break"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(3==3)?", "options": ["3", "True", "False", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(3!=3)?", "options": ["3", "True", "False", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(not True)?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(True and False)?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(True or False)?", "options": ["True", "False", "None", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which function converts string to integer?", "options": ["str()", "int()", "float()", "convert()"], "correct": "B", "subject": "Python"},
-    {"question": "Which function converts integer to string?", "options": ["str()", "int()", "string()", "text()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of print(int(3.9))?", "options": ["3", "4", "3.9", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of print(float(5))?", "options": ["5", "5.0", "5.00", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(abs(-5))?", "options": ["-5", "5", "0", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(max(1,2,3))?", "options": ["1", "2", "3", "6"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(min(1,2,3))?", "options": ["1", "2", "3", "0"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of print(sum([1,2,3]))?", "options": ["123", "6", "[1,2,3]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(pow(2,3))?", "options": ["6", "8", "9", "5"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(round(3.7))?", "options": ["3", "4", "3.7", "3.0"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(round(3.4))?", "options": ["3", "4", "3.4", "3.0"], "correct": "A", "subject": "Python"},
-    {"question": "Which function returns ASCII value of a character?", "options": ["ascii()", "ord()", "char()", "asc()"], "correct": "B", "subject": "Python"},
-    {"question": "Which function returns character from ASCII value?", "options": ["ascii()", "ord()", "chr()", "char()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print(ord('A'))?", "options": ["65", "97", "64", "66"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of print(chr(65))?", "options": ["A", "a", "65", "B"], "correct": "A", "subject": "Python"},
-
-    # ==================== STRINGS (51-120) ====================
-    {"question": "Strings in Python are:", "options": ["Mutable", "Immutable", "Both", "None"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print('Hello'[0])?", "options": ["H", "e", "Hello", "o"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of print('Hello'[-1])?", "options": ["H", "e", "o", "l"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of print('Hello'[1:4])?", "options": ["Hel", "ell", "ello", "Hell"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print('Hello'[:3])?", "options": ["Hel", "ell", "llo", "Helo"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of print('Hello'[2:])?", "options": ["He", "llo", "lo", "ell"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(len('Python'))?", "options": ["5", "6", "7", "4"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'Hello' + 'World'?", "options": ["HelloWorld", "Hello World", "Hello+World", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which method converts string to uppercase?", "options": ["upper()", "uppercase()", "toUpper()", "caps()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method converts string to lowercase?", "options": ["lower()", "lowercase()", "toLower()", "small()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.capitalize()?", "options": ["Hello", "HELLO", "hello", "hELLO"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.title()?", "options": ["Hello", "HELLO", "hello", "hELLO"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello world'.title()?", "options": ["Hello world", "Hello World", "HELLO WORLD", "hello world"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes leading and trailing spaces?", "options": ["trim()", "strip()", "remove()", "delete()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of '  hello  '.strip()?", "options": ["hello", "  hello  ", "hello  ", "  hello"], "correct": "A", "subject": "Python"},
-    {"question": "Which method replaces a substring?", "options": ["change()", "replace()", "substitute()", "swap()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'.replace('l','x')?", "options": ["hexlo", "hexxo", "helxo", "xello"], "correct": "B", "subject": "Python"},
-    {"question": "Which method splits a string into a list?", "options": ["divide()", "split()", "separate()", "break()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'a,b,c'.split(',')?", "options": ["['a,b,c']", "['a','b','c']", "('a','b','c')", "a b c"], "correct": "B", "subject": "Python"},
-    {"question": "Which method joins list elements into a string?", "options": ["join()", "concat()", "merge()", "combine()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of '-'.join(['a','b','c'])?", "options": ["abc", "a-b-c", "a,b,c", "-a-b-c-"], "correct": "B", "subject": "Python"},
-    {"question": "Which method finds substring position?", "options": ["search()", "find()", "locate()", "position()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'.find('l')?", "options": ["2", "3", "1", "-1"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.find('x')?", "options": ["0", "-1", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which method counts substring occurrences?", "options": ["count()", "number()", "total()", "sum()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.count('l')?", "options": ["1", "2", "3", "0"], "correct": "B", "subject": "Python"},
-    {"question": "Which method checks if string starts with substring?", "options": ["begins()", "startswith()", "start()", "prefix()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method checks if string ends with substring?", "options": ["ends()", "endswith()", "end()", "suffix()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'.startswith('he')?", "options": ["True", "False", "he", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.endswith('lo')?", "options": ["True", "False", "lo", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if string is alphabetic?", "options": ["isalpha()", "isalphabet()", "ischar()", "isletter()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if string is numeric?", "options": ["isnumber()", "isdigit()", "isint()", "isnumeric()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of '123'.isdigit()?", "options": ["True", "False", "123", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'abc'.isalpha()?", "options": ["True", "False", "abc", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if string is alphanumeric?", "options": ["isalnum()", "isalphanumeric()", "ismixed()", "isboth()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'abc123'.isalnum()?", "options": ["True", "False", "abc123", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if string is in uppercase?", "options": ["isupper()", "isuppercase()", "iscaps()", "isupp()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if string is in lowercase?", "options": ["islower()", "islowercase()", "issmall()", "islow()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'HELLO'.isupper()?", "options": ["True", "False", "HELLO", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.islower()?", "options": ["True", "False", "hello", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'[::-1]?", "options": ["hello", "olleh", "h", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'[::2]?", "options": ["hlo", "el", "hel", "ello"], "correct": "A", "subject": "Python"},
-    {"question": "Which method swaps case of characters?", "options": ["swap()", "swapcase()", "toggle()", "switchcase()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'HeLLo'.swapcase()?", "options": ["hEllO", "HELLO", "hello", "HeLLo"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'hello'.index('l')?", "options": ["2", "3", "1", "0"], "correct": "A", "subject": "Python"},
-    {"question": "What happens when index() doesn't find substring?", "options": ["Returns -1", "Returns None", "Raises ValueError", "Returns 0"], "correct": "C", "subject": "Python"},
-    {"question": "Which method checks if string contains only spaces?", "options": ["isspace()", "isblank()", "isempty()", "iswhite()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of '   '.isspace()?", "options": ["True", "False", "3", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is a raw string in Python?", "options": ["String without quotes", "String prefixed with r", "Encrypted string", "Compressed string"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of print(r'\\n')?", "options": ["New line", "\\n", "n", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which escape sequence represents newline?", "options": ["\\t", "\\n", "\\r", "\\b"], "correct": "B", "subject": "Python"},
-    {"question": "Which escape sequence represents tab?", "options": ["\\t", "\\n", "\\tab", "\\space"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 'Hello\\nWorld'?", "options": ["HelloWorld", "Hello World", "Hello on one line, World on next", "Hello\\nWorld"], "correct": "C", "subject": "Python"},
-    {"question": "What is string formatting in Python?", "options": ["Encrypting strings", "Inserting values into strings", "Compressing strings", "Sorting strings"], "correct": "B", "subject": "Python"},
-    {"question": "Which symbol is used in old-style string formatting?", "options": ["#", "%", "@", "&"], "correct": "B", "subject": "Python"},
-    {"question": "What is f-string in Python?", "options": ["Formatted string literal", "Float string", "Function string", "File string"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of f'{5+3}'?", "options": ["5+3", "8", "{5+3}", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'.center(10)?", "options": ["hello", "  hello   ", "   hello  ", "hello     "], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'.ljust(10)?", "options": ["hello", "hello     ", "     hello", "  hello  "], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'hello'.rjust(10)?", "options": ["hello", "hello     ", "     hello", "  hello  "], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of 'hello'.zfill(10)?", "options": ["00000hello", "hello00000", "hello", "     hello"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of '42'.zfill(5)?", "options": ["00042", "42000", "42", "   42"], "correct": "A", "subject": "Python"},
-    {"question": "Which method removes leading spaces only?", "options": ["strip()", "lstrip()", "rstrip()", "trim()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes trailing spaces only?", "options": ["strip()", "lstrip()", "rstrip()", "trim()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of 'Hello World'.split()?", "options": ["['Hello World']", "['Hello', 'World']", "('Hello', 'World')", "Hello World"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'a b c'.split(' ', 1)?", "options": ["['a', 'b c']", "['a', 'b', 'c']", "['a b c']", "['a b', 'c']"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if string is a valid identifier?", "options": ["isvalid()", "isidentifier()", "isname()", "isvar()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'my_var'.isidentifier()?", "options": ["True", "False", "my_var", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of '2var'.isidentifier()?", "options": ["True", "False", "2var", "Error"], "correct": "B", "subject": "Python"},
-
-    # ==================== LISTS (121-190) ====================
-    {"question": "Lists in Python are:", "options": ["Immutable", "Mutable", "Static", "Constant"], "correct": "B", "subject": "Python"},
-    {"question": "How do you create an empty list?", "options": ["list = {}", "list = []", "list = ()", "list = <>"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [1,2,3][0]?", "options": ["1", "2", "3", "[1]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of [1,2,3][-1]?", "options": ["1", "2", "3", "-1"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of [1,2,3,4,5][1:4]?", "options": ["[1,2,3,4]", "[2,3,4]", "[2,3,4,5]", "[1,2,3]"], "correct": "B", "subject": "Python"},
-    {"question": "Which method adds element at the end of list?", "options": ["add()", "append()", "insert()", "push()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method adds element at specific position?", "options": ["add()", "append()", "insert()", "place()"], "correct": "C", "subject": "Python"},
-    {"question": "Which method removes specific element from list?", "options": ["delete()", "remove()", "pop()", "discard()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes element at specific index?", "options": ["delete()", "remove()", "pop()", "discard()"], "correct": "C", "subject": "Python"},
-    {"question": "What does pop() return?", "options": ["None", "The removed element", "The list", "Index"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [1,2,3].pop()?", "options": ["1", "2", "3", "[1,2]"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of [1,2,3].pop(0)?", "options": ["1", "2", "3", "[2,3]"], "correct": "A", "subject": "Python"},
-    {"question": "Which method extends list with another list?", "options": ["add()", "append()", "extend()", "merge()"], "correct": "C", "subject": "Python"},
-    {"question": "What is [1,2] + [3,4]?", "options": ["[1,2,3,4]", "[4,6]", "[[1,2],[3,4]]", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is [1,2] * 3?", "options": ["[3,6]", "[1,2,1,2,1,2]", "[[1,2],[1,2],[1,2]]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which method sorts list in ascending order?", "options": ["order()", "sort()", "arrange()", "organize()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method reverses the list?", "options": ["invert()", "reverse()", "flip()", "backwards()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of sorted([3,1,2])?", "options": ["[3,1,2]", "[1,2,3]", "[3,2,1]", "None"], "correct": "B", "subject": "Python"},
-    {"question": "What is the difference between sort() and sorted()?", "options": ["No difference", "sort() returns new list", "sorted() returns new list", "sort() doesn't work on lists"], "correct": "C", "subject": "Python"},
-    {"question": "Which method returns index of an element?", "options": ["find()", "search()", "index()", "locate()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of [1,2,3,2].count(2)?", "options": ["1", "2", "3", "4"], "correct": "B", "subject": "Python"},
-    {"question": "Which method clears all elements from list?", "options": ["delete()", "remove()", "clear()", "empty()"], "correct": "C", "subject": "Python"},
-    {"question": "Which method creates a copy of list?", "options": ["clone()", "copy()", "duplicate()", "replica()"], "correct": "B", "subject": "Python"},
-    {"question": "What is list comprehension?", "options": ["List sorting", "List copying", "Concise way to create lists", "List deletion"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of [x for x in range(3)]?", "options": ["[1,2,3]", "[0,1,2]", "[0,1,2,3]", "[1,2]"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [x*2 for x in range(3)]?", "options": ["[0,2,4]", "[2,4,6]", "[1,2,3]", "[0,1,2]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of [x for x in range(5) if x%2==0]?", "options": ["[0,2,4]", "[1,3,5]", "[2,4]", "[0,1,2,3,4]"], "correct": "A", "subject": "Python"},
-    {"question": "How to check if element exists in list?", "options": ["exists()", "contains()", "in keyword", "has()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of 2 in [1,2,3]?", "options": ["True", "False", "2", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 5 in [1,2,3]?", "options": ["True", "False", "5", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is nested list?", "options": ["Empty list", "List inside list", "Sorted list", "Reversed list"], "correct": "B", "subject": "Python"},
-    {"question": "How to access element in nested list [[1,2],[3,4]]?", "options": ["list[0,0]", "list[0][0]", "list(0)(0)", "list{0}{0}"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [[1,2],[3,4]][1][0]?", "options": ["1", "2", "3", "4"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of len([[1,2],[3,4,5]])?", "options": ["2", "5", "3", "4"], "correct": "A", "subject": "Python"},
-    {"question": "Which keyword is used to delete list element?", "options": ["remove", "delete", "del", "discard"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of del [1,2,3][0]?", "options": ["[2,3]", "[1,2,3]", "1", "Error"], "correct": "D", "subject": "Python"},
-    {"question": "What is slicing in Python?", "options": ["Cutting list", "Extracting portion of sequence", "Deleting elements", "Sorting list"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [1,2,3,4,5][::2]?", "options": ["[1,3,5]", "[2,4]", "[1,2]", "[4,5]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of [1,2,3,4,5][::-1]?", "options": ["[1,2,3,4,5]", "[5,4,3,2,1]", "[5]", "[1]"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of list('abc')?", "options": ["['abc']", "['a','b','c']", "('a','b','c')", "abc"], "correct": "B", "subject": "Python"},
-    {"question": "Which function converts list to tuple?", "options": ["tuple()", "to_tuple()", "convert()", "make_tuple()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of max([1,5,3,9,2])?", "options": ["1", "5", "9", "2"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of min([1,5,3,9,2])?", "options": ["1", "5", "9", "2"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of sum([1,2,3,4])?", "options": ["1234", "10", "4", "24"], "correct": "B", "subject": "Python"},
-    {"question": "Which method is used to insert at index 0?", "options": ["append(0, x)", "insert(0, x)", "add(0, x)", "push(x)"], "correct": "B", "subject": "Python"},
-    {"question": "What happens when you append a list to another list?", "options": ["Elements merge", "List added as single element", "Error", "Nothing"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [1,2].append([3,4])?", "options": ["[1,2,3,4]", "[1,2,[3,4]]", "None", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is list aliasing?", "options": ["Copying list", "Two variables pointing to same list", "Renaming list", "Deleting list"], "correct": "B", "subject": "Python"},
-    {"question": "How to create true copy of list?", "options": ["list2 = list1", "list2 = list1.copy()", "list2 = list1.clone()", "list2 == list1"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [1,2,3].insert(1, 10)?", "options": ["[1,10,2,3]", "[10,1,2,3]", "[1,2,10,3]", "None"], "correct": "D", "subject": "Python"},
-    {"question": "After a=[1,2,3]; a.insert(1,10), what is a?", "options": ["[1,10,2,3]", "[10,1,2,3]", "[1,2,10,3]", "[1,2,3,10]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of list(range(1,5))?", "options": ["[1,2,3,4]", "[1,2,3,4,5]", "[0,1,2,3,4]", "[1,5]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of list(range(0,10,2))?", "options": ["[0,2,4,6,8]", "[0,2,4,6,8,10]", "[2,4,6,8,10]", "[0,1,2,3,4]"], "correct": "A", "subject": "Python"},
-    {"question": "What is enumerate() used for?", "options": ["Count elements", "Get index and value pairs", "Sort list", "Reverse list"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of list(enumerate(['a','b']))?", "options": ["['a','b']", "[(0,'a'),(1,'b')]", "[('a',0),('b',1)]", "[0,1]"], "correct": "B", "subject": "Python"},
-    {"question": "What is zip() used for?", "options": ["Compress list", "Combine multiple iterables", "Sort list", "Delete elements"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of list(zip([1,2],[3,4]))?", "options": ["[1,2,3,4]", "[(1,3),(2,4)]", "[[1,3],[2,4]]", "[(1,2),(3,4)]"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of any([True, False, False])?", "options": ["True", "False", "None", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of all([True, False, True])?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of any([False, False, False])?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of all([True, True, True])?", "options": ["True", "False", "None", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "How to check if list is empty?", "options": ["if list == None", "if list == []", "if not list", "Both B and C"], "correct": "D", "subject": "Python"},
-    {"question": "What is the output of bool([])?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of bool([0])?", "options": ["True", "False", "None", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which is faster: append() or insert()?", "options": ["append()", "insert()", "Same speed", "Depends on list size"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of [1,2,3] == [1,2,3]?", "options": ["True", "False", "[1,2,3]", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of [1,2,3] is [1,2,3]?", "options": ["True", "False", "[1,2,3]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of [1,2,3].reverse()?", "options": ["[3,2,1]", "None", "[1,2,3]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "After a=[1,2,3]; a.reverse(), what is a?", "options": ["[1,2,3]", "[3,2,1]", "None", "Error"], "correct": "B", "subject": "Python"},
-
-    # ==================== TUPLES (191-230) ====================
-    {"question": "Tuples in Python are:", "options": ["Mutable", "Immutable", "Dynamic", "Static"], "correct": "B", "subject": "Python"},
-    {"question": "How do you create an empty tuple?", "options": ["tuple = []", "tuple = {}", "tuple = ()", "tuple = <>"], "correct": "C", "subject": "Python"},
-    {"question": "How do you create a tuple with one element?", "options": ["(1)", "(1,)", "[1]", "{1}"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of type((1))?", "options": ["<class 'tuple'>", "<class 'int'>", "<class 'list'>", "<class 'set'>"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of type((1,))?", "options": ["<class 'tuple'>", "<class 'int'>", "<class 'list'>", "<class 'set'>"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of (1,2,3)[0]?", "options": ["1", "2", "3", "(1)"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of (1,2,3)[-1]?", "options": ["1", "2", "3", "-1"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of (1,2,3,4,5)[1:4]?", "options": ["(1,2,3,4)", "(2,3,4)", "(2,3,4,5)", "(1,2,3)"], "correct": "B", "subject": "Python"},
-    {"question": "Can you modify elements of a tuple?", "options": ["Yes", "No", "Sometimes", "Only integers"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of (1,2) + (3,4)?", "options": ["(1,2,3,4)", "(4,6)", "((1,2),(3,4))", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of (1,2) * 3?", "options": ["(3,6)", "(1,2,1,2,1,2)", "((1,2),(1,2),(1,2))", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which method counts element occurrences in tuple?", "options": ["number()", "count()", "total()", "sum()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method returns index of element in tuple?", "options": ["find()", "search()", "index()", "locate()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of (1,2,3,2).count(2)?", "options": ["1", "2", "3", "4"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of (1,2,3).index(2)?", "options": ["0", "1", "2", "3"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of len((1,2,3,4,5))?", "options": ["4", "5", "6", "3"], "correct": "B", "subject": "Python"},
-    {"question": "What is tuple packing?", "options": ["Compressing tuple", "Creating tuple from values", "Sorting tuple", "Deleting tuple"], "correct": "B", "subject": "Python"},
-    {"question": "What is tuple unpacking?", "options": ["Extracting values from tuple", "Creating tuple", "Compressing tuple", "Deleting tuple"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of a,b = (1,2); print(a)?", "options": ["(1,2)", "1", "2", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of a,b,c = (1,2,3); print(b)?", "options": ["1", "2", "3", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which function converts list to tuple?", "options": ["tuple()", "to_tuple()", "convert()", "make_tuple()"], "correct": "A", "subject": "Python"},
-    {"question": "Which function converts tuple to list?", "options": ["list()", "to_list()", "convert()", "make_list()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of tuple([1,2,3])?", "options": ["[1,2,3]", "(1,2,3)", "{1,2,3}", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of list((1,2,3))?", "options": ["[1,2,3]", "(1,2,3)", "{1,2,3}", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of max((1,5,3,9,2))?", "options": ["1", "5", "9", "2"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of min((1,5,3,9,2))?", "options": ["1", "5", "9", "2"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of sum((1,2,3,4))?", "options": ["1234", "10", "4", "24"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of sorted((3,1,2))?", "options": ["(1,2,3)", "[1,2,3]", "(3,1,2)", "[3,1,2]"], "correct": "B", "subject": "Python"},
-    {"question": "Can tuples contain mutable objects?", "options": ["Yes", "No", "Sometimes", "Only strings"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of ([1,2],)[0].append(3)?", "options": ["Error", "None", "3", "[1,2,3]"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 2 in (1,2,3)?", "options": ["True", "False", "2", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 5 in (1,2,3)?", "options": ["True", "False", "5", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Why are tuples faster than lists?", "options": ["They are mutable", "They are immutable", "They are smaller", "They are not faster"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of (1,2,3)[::-1]?", "options": ["(1,2,3)", "(3,2,1)", "[3,2,1]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of tuple('abc')?", "options": ["('abc',)", "('a','b','c')", "['a','b','c']", "abc"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of (1,2,3)[1:2]?", "options": ["(2,)", "(2)", "2", "(1,2)"], "correct": "A", "subject": "Python"},
-    {"question": "Can tuple be used as dictionary key?", "options": ["Yes", "No", "Sometimes", "Only empty tuples"], "correct": "A", "subject": "Python"},
-    {"question": "Can list be used as dictionary key?", "options": ["Yes", "No", "Sometimes", "Only empty lists"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of hash((1,2,3))?", "options": ["Error", "An integer", "None", "(1,2,3)"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of (1,2,3) == (1,2,3)?", "options": ["True", "False", "(1,2,3)", "Error"], "correct": "A", "subject": "Python"},
-
-    # ==================== DICTIONARIES (231-300) ====================
-    {"question": "Dictionaries in Python store data as:", "options": ["Indexed elements", "Key-value pairs", "Ordered sequence", "Linked nodes"], "correct": "B", "subject": "Python"},
-    {"question": "How do you create an empty dictionary?", "options": ["dict = []", "dict = {}", "dict = ()", "dict = <>"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of type({})?", "options": ["<class 'set'>", "<class 'dict'>", "<class 'tuple'>", "<class 'list'>"], "correct": "B", "subject": "Python"},
-    {"question": "How to access value in dictionary?", "options": ["dict[index]", "dict[key]", "dict.get[key]", "dict(key)"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {'a':1,'b':2}['a']?", "options": ["1", "2", "a", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What happens when accessing non-existent key with []?", "options": ["Returns None", "Returns 0", "Raises KeyError", "Returns empty string"], "correct": "C", "subject": "Python"},
-    {"question": "Which method safely accesses dictionary value?", "options": ["access()", "get()", "fetch()", "retrieve()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {'a':1}.get('b')?", "options": ["Error", "None", "0", "b"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {'a':1}.get('b', 0)?", "options": ["Error", "None", "0", "b"], "correct": "C", "subject": "Python"},
-    {"question": "Which method returns all keys?", "options": ["keys()", "getkeys()", "allkeys()", "keylist()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method returns all values?", "options": ["values()", "getvalues()", "allvalues()", "valuelist()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method returns all key-value pairs?", "options": ["pairs()", "items()", "getitems()", "all()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of list({'a':1,'b':2}.keys())?", "options": ["['a','b']", "[1,2]", "[('a',1),('b',2)]", "{'a','b'}"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of list({'a':1,'b':2}.values())?", "options": ["['a','b']", "[1,2]", "[('a',1),('b',2)]", "{1,2}"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of list({'a':1,'b':2}.items())?", "options": ["['a','b']", "[1,2]", "[('a',1),('b',2)]", "{'a':1,'b':2}"], "correct": "C", "subject": "Python"},
-    {"question": "How to add new key-value pair to dictionary?", "options": ["dict.add(key,value)", "dict[key] = value", "dict.insert(key,value)", "dict.put(key,value)"], "correct": "B", "subject": "Python"},
-    {"question": "How to update existing key's value?", "options": ["dict.change(key,value)", "dict[key] = new_value", "dict.modify(key,value)", "dict.set(key,value)"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes key-value pair and returns value?", "options": ["remove()", "delete()", "pop()", "discard()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of {'a':1,'b':2}.pop('a')?", "options": ["{'b':2}", "1", "a", "('a',1)"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes and returns last item?", "options": ["pop()", "popitem()", "removelast()", "deletelast()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method updates dictionary with another dictionary?", "options": ["merge()", "update()", "combine()", "add()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method clears all items from dictionary?", "options": ["delete()", "remove()", "clear()", "empty()"], "correct": "C", "subject": "Python"},
-    {"question": "Which method creates a copy of dictionary?", "options": ["clone()", "copy()", "duplicate()", "replica()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of len({'a':1,'b':2,'c':3})?", "options": ["2", "3", "6", "9"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'a' in {'a':1,'b':2}?", "options": ["True", "False", "a", "1"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 1 in {'a':1,'b':2}?", "options": ["True", "False", "1", "a"], "correct": "B", "subject": "Python"},
-    {"question": "How to check if key exists in dictionary?", "options": ["dict.exists(key)", "key in dict", "dict.has(key)", "dict.contains(key)"], "correct": "B", "subject": "Python"},
-    {"question": "What is dictionary comprehension?", "options": ["Dictionary copying", "Concise way to create dictionaries", "Dictionary sorting", "Dictionary deletion"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {x:x**2 for x in range(3)}?", "options": ["{0:0,1:1,2:4}", "{1:1,2:4,3:9}", "[0,1,4]", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Can dictionary have duplicate keys?", "options": ["Yes", "No", "Sometimes", "Only strings"], "correct": "B", "subject": "Python"},
-    {"question": "Can dictionary have duplicate values?", "options": ["Yes", "No", "Sometimes", "Only strings"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {'a':1,'a':2}['a']?", "options": ["1", "2", "[1,2]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which types can be dictionary keys?", "options": ["Only strings", "Only integers", "Immutable types", "Any type"], "correct": "C", "subject": "Python"},
-    {"question": "Can list be a dictionary key?", "options": ["Yes", "No", "Sometimes", "Only empty lists"], "correct": "B", "subject": "Python"},
-    {"question": "Can tuple be a dictionary key?", "options": ["Yes", "No", "Sometimes", "Only empty tuples"], "correct": "A", "subject": "Python"},
-    {"question": "What is nested dictionary?", "options": ["Empty dictionary", "Dictionary inside dictionary", "Sorted dictionary", "Reversed dictionary"], "correct": "B", "subject": "Python"},
-    {"question": "How to access nested dictionary value?", "options": ["dict[key1,key2]", "dict[key1][key2]", "dict(key1)(key2)", "dict{key1}{key2}"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {'a':{'b':1}}['a']['b']?", "options": ["a", "b", "1", "{'b':1}"], "correct": "C", "subject": "Python"},
-    {"question": "Which method returns value or sets default?", "options": ["get()", "setdefault()", "getorset()", "default()"], "correct": "B", "subject": "Python"},
-    {"question": "What does dict.fromkeys(['a','b'], 0) return?", "options": ["{'a':0,'b':0}", "['a','b']", "{0:'a',0:'b'}", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Are dictionaries ordered in Python 3.7+?", "options": ["Yes", "No", "Sometimes", "Only when sorted"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of dict([('a',1),('b',2)])?", "options": ["[('a',1),('b',2)]", "{'a':1,'b':2}", "(('a',1),('b',2))", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {'a':1,'b':2} == {'b':2,'a':1}?", "options": ["True", "False", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "How to merge two dictionaries in Python 3.9+?", "options": ["dict1 + dict2", "dict1 | dict2", "dict1 & dict2", "dict1 - dict2"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {**{'a':1}, **{'b':2}}?", "options": ["{'a':1,'b':2}", "[{'a':1},{'b':2}]", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "How to iterate over dictionary keys?", "options": ["for key in dict", "for key in dict.keys()", "Both A and B", "Neither"], "correct": "C", "subject": "Python"},
-    {"question": "How to iterate over dictionary values?", "options": ["for val in dict", "for val in dict.values()", "Both A and B", "Neither"], "correct": "B", "subject": "Python"},
-    {"question": "How to iterate over key-value pairs?", "options": ["for k,v in dict", "for k,v in dict.items()", "for (k,v) in dict", "All of above"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of max({'a':1,'b':2,'c':3})?", "options": ["3", "c", "('c',3)", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of min({'a':1,'b':2,'c':3})?", "options": ["1", "a", "('a',1)", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which keyword deletes a key from dictionary?", "options": ["remove", "delete", "del", "discard"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output after del {'a':1,'b':2}['a']?", "options": ["{'a':1,'b':2}", "{'b':2}", "1", "Error"], "correct": "D", "subject": "Python"},
-    {"question": "What is the output of {'a':1,'b':2}.pop('c', 0)?", "options": ["Error", "None", "0", "c"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of sorted({'c':1,'a':2,'b':3})?", "options": ["['a','b','c']", "[1,2,3]", "{'a':2,'b':3,'c':1}", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "How to get dictionary sorted by values?", "options": ["sorted(dict.values())", "sorted(dict, key=dict.get)", "dict.sort()", "sort(dict)"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of bool({})?", "options": ["True", "False", "None", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of bool({'a':1})?", "options": ["True", "False", "None", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of list({'a':1,'b':2})?", "options": ["['a','b']", "[1,2]", "[('a',1),('b',2)]", "['a':1,'b':2]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the default value returned by get()?", "options": ["0", "''", "None", "False"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of {'a':1}.get('a', 0)?", "options": ["0", "1", "a", "None"], "correct": "B", "subject": "Python"},
-    {"question": "Can dictionary values be of different types?", "options": ["Yes", "No", "Only if keys are same type", "Only numbers and strings"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of dict(a=1, b=2)?", "options": ["{'a':1,'b':2}", "[('a',1),('b',2)]", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of dict(zip(['a','b'],[1,2]))?", "options": ["{'a':1,'b':2}", "[('a',1),('b',2)]", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "How to reverse a dictionary (swap keys and values)?", "options": ["{v:k for k,v in d.items()}", "d.reverse()", "reversed(d)", "d.swap()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1:'a', 2:'b', 3:'c'}[2]?", "options": ["2", "b", "('2','b')", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of sum({'a':1,'b':2,'c':3}.values())?", "options": ["'abc'", "6", "Error", "None"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 'a' in {'a':1}.keys()?", "options": ["True", "False", "a", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 1 in {'a':1}.values()?", "options": ["True", "False", "1", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which method returns keys with default values?", "options": ["keys()", "fromkeys()", "defaultkeys()", "getkeys()"], "correct": "B", "subject": "Python"},
-
-    # ==================== SETS (301-340) ====================
-    {"question": "Sets in Python contain:", "options": ["Duplicate elements", "Unique elements only", "Ordered elements", "Key-value pairs"], "correct": "B", "subject": "Python"},
-    {"question": "How do you create an empty set?", "options": ["set = {}", "set = set()", "set = []", "set = ()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of type({})?", "options": ["<class 'set'>", "<class 'dict'>", "<class 'tuple'>", "<class 'list'>"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of type(set())?", "options": ["<class 'set'>", "<class 'dict'>", "<class 'tuple'>", "<class 'list'>"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2,2,3,3,3}?", "options": ["{1,2,2,3,3,3}", "{1,2,3}", "[1,2,3]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Are sets ordered in Python?", "options": ["Yes", "No", "Sometimes", "Only when sorted"], "correct": "B", "subject": "Python"},
-    {"question": "Can you access set elements by index?", "options": ["Yes", "No", "Sometimes", "Only first element"], "correct": "B", "subject": "Python"},
-    {"question": "Which method adds element to set?", "options": ["append()", "add()", "insert()", "push()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method adds multiple elements to set?", "options": ["add()", "update()", "extend()", "append()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes element from set (raises error if not found)?", "options": ["delete()", "remove()", "discard()", "pop()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method removes element from set (no error if not found)?", "options": ["delete()", "remove()", "discard()", "pop()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of {1,2,3}.pop()?", "options": ["1", "3", "Random element", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "Which method clears all elements from set?", "options": ["delete()", "remove()", "clear()", "empty()"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of len({1,2,3})?", "options": ["2", "3", "6", "1"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of 2 in {1,2,3}?", "options": ["True", "False", "2", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of 5 in {1,2,3}?", "options": ["True", "False", "5", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Which operator performs set union?", "options": ["&", "|", "-", "^"], "correct": "B", "subject": "Python"},
-    {"question": "Which operator performs set intersection?", "options": ["&", "|", "-", "^"], "correct": "A", "subject": "Python"},
-    {"question": "Which operator performs set difference?", "options": ["&", "|", "-", "^"], "correct": "C", "subject": "Python"},
-    {"question": "Which operator performs symmetric difference?", "options": ["&", "|", "-", "^"], "correct": "D", "subject": "Python"},
-    {"question": "What is the output of {1,2} | {2,3}?", "options": ["{1,2,3}", "{2}", "{1,3}", "{1,2,2,3}"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2} & {2,3}?", "options": ["{1,2,3}", "{2}", "{1,3}", "{}"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {1,2,3} - {2,3}?", "options": ["{1}", "{2,3}", "{1,2,3}", "{}"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2} ^ {2,3}?", "options": ["{1,2,3}", "{2}", "{1,3}", "{}"], "correct": "C", "subject": "Python"},
-    {"question": "Which method returns union of sets?", "options": ["union()", "merge()", "combine()", "join()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method returns intersection of sets?", "options": ["common()", "intersect()", "intersection()", "both()"], "correct": "C", "subject": "Python"},
-    {"question": "Which method returns difference of sets?", "options": ["diff()", "difference()", "subtract()", "minus()"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of {1,2}.union({2,3})?", "options": ["{1,2,3}", "{2}", "{1,3}", "{1,2,2,3}"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2}.intersection({2,3})?", "options": ["{1,2,3}", "{2}", "{1,3}", "{}"], "correct": "B", "subject": "Python"},
-    {"question": "Which method checks if set is subset?", "options": ["issubset()", "subset()", "issub()", "containedin()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if set is superset?", "options": ["issuperset()", "superset()", "issuper()", "contains()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2}.issubset({1,2,3})?", "options": ["True", "False", "{1,2}", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2,3}.issuperset({1,2})?", "options": ["True", "False", "{1,2,3}", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which method checks if sets have no common elements?", "options": ["isdisjoint()", "nocommon()", "separate()", "distinct()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of {1,2}.isdisjoint({3,4})?", "options": ["True", "False", "{}", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is frozen set?", "options": ["Sorted set", "Immutable set", "Empty set", "Ordered set"], "correct": "B", "subject": "Python"},
-    {"question": "How to create a frozen set?", "options": ["frozenset()", "frozen()", "immutable()", "fixedset()"], "correct": "A", "subject": "Python"},
-    {"question": "Can frozen set be modified?", "options": ["Yes", "No", "Sometimes", "Only add elements"], "correct": "B", "subject": "Python"},
-    {"question": "Can frozen set be used as dictionary key?", "options": ["Yes", "No", "Sometimes", "Only empty frozensets"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of set('hello')?", "options": ["{'hello'}", "{'h','e','l','o'}", "['h','e','l','l','o']", "Error"], "correct": "B", "subject": "Python"},
-
-    # ==================== CONTROL FLOW (341-400) ====================
-    {"question": "Which statement is used for conditional execution?", "options": ["for", "while", "if", "switch"], "correct": "C", "subject": "Python"},
-    {"question": "What is the correct syntax for if statement?", "options": ["if (condition):", "if condition:", "if condition then:", "if [condition]:"], "correct": "B", "subject": "Python"},
-    {"question": "Which keyword is used for else-if in Python?", "options": ["else if", "elsif", "elif", "elseif"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: if True: print('Yes')?", "options": ["Yes", "True", "No output", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: if False: print('Yes')?", "options": ["Yes", "False", "No output", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: if 1: print('Yes')?", "options": ["Yes", "1", "No output", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: if 0: print('Yes')?", "options": ["Yes", "0", "No output", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: if '': print('Yes')?", "options": ["Yes", "''", "No output", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: if 'hello': print('Yes')?", "options": ["Yes", "hello", "No output", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: if []: print('Yes')?", "options": ["Yes", "[]", "No output", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: if [1]: print('Yes')?", "options": ["Yes", "[1]", "No output", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "Which loop is used for definite iteration?", "options": ["for", "while", "do-while", "repeat"], "correct": "A", "subject": "Python"},
-    {"question": "Which loop is used for indefinite iteration?", "options": ["for", "while", "do-while", "repeat"], "correct": "B", "subject": "Python"},
-    {"question": "What is the correct syntax for for loop?", "options": ["for i in range:", "for (i=0; i<n; i++):", "for i in range(n):", "for i = 0 to n:"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: for i in range(3): print(i)?", "options": ["0 1 2", "1 2 3", "0 1 2 3", "1 2"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: for i in range(1,4): print(i)?", "options": ["0 1 2 3", "1 2 3", "1 2 3 4", "0 1 2"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: for i in range(0,10,2): print(i)?", "options": ["0 2 4 6 8", "0 2 4 6 8 10", "2 4 6 8 10", "0 1 2 3 4"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: for i in range(5,0,-1): print(i)?", "options": ["5 4 3 2 1", "5 4 3 2 1 0", "4 3 2 1 0", "1 2 3 4 5"], "correct": "A", "subject": "Python"},
-    {"question": "Which statement exits a loop immediately?", "options": ["exit", "break", "stop", "quit"], "correct": "B", "subject": "Python"},
-    {"question": "Which statement skips current iteration?", "options": ["skip", "pass", "continue", "next"], "correct": "C", "subject": "Python"},
-    {"question": "What does pass statement do?", "options": ["Exits loop", "Skips iteration", "Does nothing", "Raises error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: for i in 'abc': print(i)?", "options": ["abc", "a b c", "'a' 'b' 'c'", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: for i in [1,2,3]: print(i)?", "options": ["[1,2,3]", "1 2 3", "[1] [2] [3]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the else clause in loop used for?", "options": ["Error handling", "Executes if loop completes normally", "Alternative loop", "Loop termination"], "correct": "B", "subject": "Python"},
-    {"question": "When does loop's else clause NOT execute?", "options": ["When loop completes", "When break is used", "When continue is used", "Never"], "correct": "B", "subject": "Python"},
-    {"question": "What is the correct syntax for while loop?", "options": ["while condition:", "while (condition):", "while condition do:", "Both A and B"], "correct": "D", "subject": "Python"},
-    {"question": "What is infinite loop?", "options": ["Very fast loop", "Loop that never ends", "Loop with many iterations", "Loop without body"], "correct": "B", "subject": "Python"},
-    {"question": "Which creates infinite loop?", "options": ["while True:", "while 1:", "Both A and B", "Neither"], "correct": "C", "subject": "Python"},
-    {"question": "What is nested loop?", "options": ["Loop without condition", "Loop inside loop", "Loop with break", "Loop with else"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: x=0; while x<3: print(x); x+=1?", "options": ["0 1 2", "1 2 3", "0 1 2 3", "1 2"], "correct": "A", "subject": "Python"},
-    {"question": "What is ternary operator in Python?", "options": ["a ? b : c", "a if condition else b", "condition ? a : b", "if a then b else c"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: 'Yes' if True else 'No'?", "options": ["Yes", "No", "True", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: 'Yes' if False else 'No'?", "options": ["Yes", "No", "False", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: x=5; print('Big' if x>3 else 'Small')?", "options": ["Big", "Small", "5", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is match statement in Python 3.10+?", "options": ["Pattern matching", "String matching", "Regular expression", "Type matching"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: for i in range(3): pass?", "options": ["0 1 2", "None", "No output", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "How many times does 'for i in range(5)' iterate?", "options": ["4", "5", "6", "Infinite"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: list(range(5))?", "options": ["[1,2,3,4,5]", "[0,1,2,3,4]", "[0,1,2,3,4,5]", "[1,2,3,4]"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: list(range(2,5))?", "options": ["[2,3,4]", "[2,3,4,5]", "[1,2,3,4,5]", "[2,5]"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: list(range(10,0,-2))?", "options": ["[10,8,6,4,2]", "[10,8,6,4,2,0]", "[8,6,4,2,0]", "[2,4,6,8,10]"], "correct": "A", "subject": "Python"},
-    {"question": "What happens if while condition is initially False?", "options": ["Runs once", "Never runs", "Infinite loop", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: i=0; while i<3: print(i); i+=1; else: print('Done')?", "options": ["0 1 2", "0 1 2 Done", "Done", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: for i in range(3): if i==1: break; print(i)?", "options": ["0", "0 1", "0 1 2", "1"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: for i in range(3): if i==1: continue; print(i)?", "options": ["0 2", "0 1 2", "1", "0"], "correct": "A", "subject": "Python"},
-    {"question": "What is walrus operator in Python 3.8+?", "options": [":=", "=:", "==", "::"], "correct": "A", "subject": "Python"},
-    {"question": "What does := operator do?", "options": ["Comparison", "Assignment expression", "Division", "Slicing"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: (n := 10) + 5?", "options": ["10", "15", "5", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is short-circuit evaluation?", "options": ["Fast loops", "Stop evaluating when result is known", "Skip conditions", "Quick sorting"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: True or print('Hello')?", "options": ["True", "Hello", "True Hello", "None"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: False and print('Hello')?", "options": ["False", "Hello", "False Hello", "None"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: 5 > 3 > 1?", "options": ["True", "False", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: 5 > 3 < 2?", "options": ["True", "False", "Error", "None"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: 1 < 2 < 3 < 4?", "options": ["True", "False", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: not not True?", "options": ["True", "False", "Error", "None"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: bool(not 0)?", "options": ["True", "False", "0", "1"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: bool(not 1)?", "options": ["True", "False", "0", "1"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: 5 and 3?", "options": ["True", "5", "3", "False"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: 0 or 3?", "options": ["True", "0", "3", "False"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: 5 or 3?", "options": ["True", "5", "3", "8"], "correct": "B", "subject": "Python"},
-
-    # ==================== FUNCTIONS (401-460) ====================
-    {"question": "Which keyword is used to define a function?", "options": ["function", "def", "define", "func"], "correct": "B", "subject": "Python"},
-    {"question": "What is the correct syntax to define a function?", "options": ["def function_name:", "def function_name():", "function function_name():", "def function_name[];"], "correct": "B", "subject": "Python"},
-    {"question": "Which keyword is used to return a value from function?", "options": ["return", "yield", "give", "output"], "correct": "A", "subject": "Python"},
-    {"question": "What does a function return if no return statement?", "options": ["0", "''", "None", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is a parameter?", "options": ["Value passed to function", "Variable in function definition", "Function output", "Function name"], "correct": "B", "subject": "Python"},
-    {"question": "What is an argument?", "options": ["Value passed to function", "Variable in function definition", "Function output", "Function name"], "correct": "A", "subject": "Python"},
-    {"question": "What is positional argument?", "options": ["Argument with name", "Argument by position", "Optional argument", "Default argument"], "correct": "B", "subject": "Python"},
-    {"question": "What is keyword argument?", "options": ["Argument with name", "Argument by position", "Optional argument", "First argument"], "correct": "A", "subject": "Python"},
-    {"question": "What is default parameter?", "options": ["First parameter", "Parameter with default value", "Required parameter", "Last parameter"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: def f(a=1): return a; print(f())?", "options": ["Error", "None", "1", "a"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: def f(a=1): return a; print(f(5))?", "options": ["Error", "1", "5", "a"], "correct": "C", "subject": "Python"},
-    {"question": "What is *args used for?", "options": ["Single argument", "Variable positional arguments", "Keyword arguments", "No arguments"], "correct": "B", "subject": "Python"},
-    {"question": "What is **kwargs used for?", "options": ["Single argument", "Positional arguments", "Variable keyword arguments", "No arguments"], "correct": "C", "subject": "Python"},
-    {"question": "What type is *args inside function?", "options": ["List", "Tuple", "Dictionary", "Set"], "correct": "B", "subject": "Python"},
-    {"question": "What type is **kwargs inside function?", "options": ["List", "Tuple", "Dictionary", "Set"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: def f(*args): return args; print(f(1,2,3))?", "options": ["[1,2,3]", "(1,2,3)", "{1,2,3}", "1 2 3"], "correct": "B", "subject": "Python"},
-    {"question": "What is a lambda function?", "options": ["Named function", "Anonymous function", "Recursive function", "Generator function"], "correct": "B", "subject": "Python"},
-    {"question": "What is the syntax of lambda function?", "options": ["lambda: expression", "lambda args: expression", "def lambda(): expression", "lambda(args) expression"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: (lambda x: x*2)(5)?", "options": ["5", "10", "x*2", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: (lambda x,y: x+y)(3,4)?", "options": ["7", "34", "x+y", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is a recursive function?", "options": ["Function with loop", "Function calling itself", "Function with return", "Function with parameters"], "correct": "B", "subject": "Python"},
-    {"question": "What is the base case in recursion?", "options": ["First call", "Condition to stop recursion", "Last call", "Recursive call"], "correct": "B", "subject": "Python"},
-    {"question": "What is local variable?", "options": ["Variable inside function", "Variable outside function", "Global variable", "Class variable"], "correct": "A", "subject": "Python"},
-    {"question": "What is global variable?", "options": ["Variable inside function", "Variable outside function", "Local variable", "Parameter"], "correct": "B", "subject": "Python"},
-    {"question": "Which keyword accesses global variable inside function?", "options": ["global", "extern", "outer", "public"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: x=5; def f(): print(x); f()?", "options": ["5", "Error", "None", "x"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: x=5; def f(): x=10; print(x); f(); print(x)?", "options": ["10 5", "10 10", "5 5", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is a docstring?", "options": ["Comment", "Function documentation", "Error message", "Variable name"], "correct": "B", "subject": "Python"},
-    {"question": "How to access function's docstring?", "options": ["func.doc", "func.__doc__", "func.docstring", "doc(func)"], "correct": "B", "subject": "Python"},
-    {"question": "What is a higher-order function?", "options": ["Complex function", "Function taking/returning function", "Recursive function", "Built-in function"], "correct": "B", "subject": "Python"},
-    {"question": "Which is a higher-order function?", "options": ["print()", "len()", "map()", "int()"], "correct": "C", "subject": "Python"},
-    {"question": "What does map() function do?", "options": ["Creates dictionary", "Applies function to all items", "Filters items", "Reduces items"], "correct": "B", "subject": "Python"},
-    {"question": "What does filter() function do?", "options": ["Creates dictionary", "Applies function to all items", "Filters items based on condition", "Reduces items"], "correct": "C", "subject": "Python"},
-    {"question": "What does reduce() function do?", "options": ["Creates dictionary", "Applies function to all items", "Filters items", "Reduces items to single value"], "correct": "D", "subject": "Python"},
-    {"question": "Which module contains reduce()?", "options": ["math", "functools", "itertools", "collections"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: list(map(lambda x: x*2, [1,2,3]))?", "options": ["[1,2,3]", "[2,4,6]", "[1,4,9]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: list(filter(lambda x: x>2, [1,2,3,4]))?", "options": ["[1,2]", "[3,4]", "[1,2,3,4]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is function annotation?", "options": ["Function comment", "Type hints for parameters", "Function documentation", "Function name"], "correct": "B", "subject": "Python"},
-    {"question": "What is the syntax for function annotation?", "options": ["def f(x: int) -> str:", "def f(x int) str:", "def f<int>(x) -> str:", "def f(x) -> int, str:"], "correct": "A", "subject": "Python"},
-    {"question": "What is a closure in Python?", "options": ["Closed function", "Function with access to enclosing scope", "Private function", "Static function"], "correct": "B", "subject": "Python"},
-    {"question": "What keyword is used for nested function's outer variable?", "options": ["global", "outer", "nonlocal", "external"], "correct": "C", "subject": "Python"},
-    {"question": "What is a decorator?", "options": ["Function beautifier", "Function modifier", "Function caller", "Function deleter"], "correct": "B", "subject": "Python"},
-    {"question": "What symbol is used for decorator?", "options": ["#", "@", "$", "&"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: def f(): pass; print(f())?", "options": ["Error", "0", "None", "pass"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: def f(): return; print(f())?", "options": ["Error", "0", "None", "return"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: def f(): return 1,2; print(f())?", "options": ["1 2", "(1,2)", "[1,2]", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Can function have multiple return statements?", "options": ["Yes", "No", "Only 2", "Only in loops"], "correct": "A", "subject": "Python"},
-    {"question": "What is the scope of variable defined in function?", "options": ["Global", "Local", "Both", "Neither"], "correct": "B", "subject": "Python"},
-    {"question": "What is LEGB rule?", "options": ["Error handling", "Variable scope resolution", "Function naming", "Import order"], "correct": "B", "subject": "Python"},
-    {"question": "What does LEGB stand for?", "options": ["Local, Enclosing, Global, Built-in", "Local, External, Global, Base", "Loop, Else, Global, Break", "List, Element, Get, Built-in"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: f = lambda: 'Hello'; print(f())?", "options": ["lambda", "Hello", "f", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "Can lambda have multiple statements?", "options": ["Yes", "No", "Only 2", "Only with return"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: (lambda x=2: x*3)()?", "options": ["2", "3", "6", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: list(map(str, [1,2,3]))?", "options": ["['1','2','3']", "[1,2,3]", "['str','str','str']", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is the output of: list(filter(None, [0,1,'',2,'a']))?", "options": ["[0,1,'',2,'a']", "[1,2,'a']", "[0,'']", "Error"], "correct": "B", "subject": "Python"},
-    {"question": "What is partial function?", "options": ["Incomplete function", "Function with fixed arguments", "Half function", "Error function"], "correct": "B", "subject": "Python"},
-    {"question": "Which module contains partial()?", "options": ["math", "functools", "itertools", "partial"], "correct": "B", "subject": "Python"},
-    {"question": "What is the output of: def f(a,b): return a+b; g=lambda x: f(x,10); print(g(5))?", "options": ["5", "10", "15", "Error"], "correct": "C", "subject": "Python"},
-    {"question": "What is the output of: def f(x): return x**2; print(list(map(f, range(3))))?", "options": ["[0,1,4]", "[1,4,9]", "[0,1,2]", "Error"], "correct": "A", "subject": "Python"},
-    {"question": "What is callable in Python?", "options": ["Any object", "Object that can be called like function", "Only functions", "Only classes"], "correct": "B", "subject": "Python"},
-
-    # ==================== FILE HANDLING (461-490) ====================
-    {"question": "Which function opens a file in Python?", "options": ["open()", "file()", "read()", "load()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the default mode for open()?", "options": ["w", "r", "a", "x"], "correct": "B", "subject": "Python"},
-    {"question": "What does 'r' mode mean?", "options": ["Read", "Write", "Append", "Execute"], "correct": "A", "subject": "Python"},
-    {"question": "What does 'w' mode mean?", "options": ["Read", "Write", "Append", "Execute"], "correct": "B", "subject": "Python"},
-    {"question": "What does 'a' mode mean?", "options": ["Read", "Write", "Append", "All"], "correct": "C", "subject": "Python"},
-    {"question": "What does 'x' mode mean?", "options": ["Read", "Exclusive create", "Execute", "Exit"], "correct": "B", "subject": "Python"},
-    {"question": "What does 'b' in mode mean?", "options": ["Binary", "Buffer", "Backup", "Block"], "correct": "A", "subject": "Python"},
-    {"question": "What does 't' in mode mean?", "options": ["Text", "Temporary", "Tab", "Transfer"], "correct": "A", "subject": "Python"},
-    {"question": "Which method reads entire file content?", "options": ["read()", "readline()", "readlines()", "readall()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method reads one line?", "options": ["read()", "readline()", "readlines()", "readone()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method reads all lines as list?", "options": ["read()", "readline()", "readlines()", "readall()"], "correct": "C", "subject": "Python"},
-    {"question": "Which method writes string to file?", "options": ["write()", "writeline()", "writelines()", "print()"], "correct": "A", "subject": "Python"},
-    {"question": "Which method writes list of strings to file?", "options": ["write()", "writeline()", "writelines()", "writeall()"], "correct": "C", "subject": "Python"},
-    {"question": "Which method closes a file?", "options": ["close()", "end()", "finish()", "stop()"], "correct": "A", "subject": "Python"},
-    {"question": "What is the advantage of 'with' statement for files?", "options": ["Faster reading", "Automatic closing", "Better formatting", "Encryption"], "correct": "B", "subject": "Python"},
-    {"question": "What is the correct syntax for 'with' statement?", "options": ["with open('file') as f:", "with file('name') as f:", "with f = open('file'):", "open('file') with f:"], "correct": "A", "subject": "Python"},
-    {"question": "What happens when opening non-existent file in 'r' mode?", "options": ["Creates file", "Returns None", "Raises FileNotFoundError", "Returns empty string"], "correct": "C", "subject": "Python"},
-    {"question": "What happens when opening non-existent file in 'w' mode?", "options": ["Creates file", "Raises error", "Returns None", "Returns empty string"], "correct": "A", "subject": "Python"},
-    {"question": "What happens when file exists and opened in 'w' mode?", "options": ["Appends content", "Overwrites content", "Raises error", "Does nothing"], "correct": "B", "subject": "Python"},
-    {"question": "What happens when file exists and opened in 'x' mode?", "options": ["Creates file", "Overwrites", "Raises FileExistsError", "Appends"], "correct": "C", "subject": "Python"},
-    {"question": "Which method moves file pointer?", "options": ["move()", "seek()", "pointer()", "position()"], "correct": "B", "subject": "Python"},
-    {"question": "Which method returns current file pointer position?", "options": ["position()", "tell()", "where()", "current()"], "correct": "B", "subject": "Python"},
-    {"question": "What does seek(0) do?", "options": ["Goes to end", "Goes to beginning", "Deletes content", "Closes file"], "correct": "B", "subject": "Python"},
-    {"question": "What does IoT stand for?", "options": ["Internet of Technology", "Interaction of Things", "Internet of Things", "Intelligent Online Tools"],
-        "correct": "C",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which of the following is NOT a component of an IoT system?",
-        "options": ["Sensor", "Actuator", "Processor", "Printer only used for reports"],
-        "correct": "D",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which device senses changes in the environment?",
-        "options": ["Actuator", "Microcontroller", "Sensor", "Display unit"],
-        "correct": "C",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which device performs actions based on commands from the system?",
-        "options": ["Sensor", "Transducer", "Microprocessor", "Actuator"],
-        "correct": "D",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which of the following is an example of an IoT sensor?",
-        "options": ["LED bulb", "Relay switch", "Temperature sensor", "Power supply"],
-        "correct": "C",
-        "subject": "IoT"
-    },
-    {
-        "question": "What is the main purpose of a microcontroller in an IoT device?",
-        "options": ["To connect to the internet only", "To store large videos", "To process data and control devices", "To increase Wi-Fi range"],
-        "correct": "C",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which communication protocol is commonly used for short-range wireless communication in IoT?",
-        "options": ["HTTP", "Bluetooth", "SMTP", "FTP"],
-        "correct": "B",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which protocol is designed for low-power, low-data-rate wireless networks in IoT?",
-        "options": ["Wi-Fi", "Zigbee", "Ethernet", "USB"],
-        "correct": "B",
-        "subject": "IoT"
-    },
-    {
-        "question": "Which of the following best describes MQTT?",
-        "options": ["A database system", "A machine learning model", "A lightweight messaging protocol for IoT", "A video streaming service"],
-        "correct": "C",
-        "subject": "IoT"
-    },
-    {
-        "question": "What does RFID stand for?",
-        "options": ["Radio Frequency Identification", "Remote Frequency Indicator", "Rapid File Detection", "Radio Finder Interface Device"],
-        "correct": "A",
-        "subject": "IoT"
-    },
-    {"question": "Which of these is a popular microcontroller used in IoT projects?", "options": ["Arduino", "Photoshop", "Excel", "Linux"], "correct": "A", "subject": "IoT"},
-    {"question": "What is the role of an actuator in an IoT system?", "options": ["Measure temperature", "Send emails", "Perform physical action", "Store passwords"], "correct": "C", "subject": "IoT"},
-    {"question": "Which network allows IoT devices to communicate over long distances with low power?", "options": ["LAN", "PAN", "LPWAN", "MANET"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following is NOT an IoT communication protocol?", "options": ["MQTT", "CoAP", "AMQP", "JPEG"], "correct": "D", "subject": "IoT"},
-    {"question": "What type of data do sensors typically generate?", "options": ["Audio files", "Environmental readings", "Text documents", "Images only"], "correct": "B", "subject": "IoT"},
-    {"question": "Which technology enables IoT devices to send data to cloud platforms?", "options": ["Blockchain", "Cloud computing", "Virtual reality", "3D printing"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following is a security concern in IoT?", "options": ["High cost", "Lack of user manuals", "Weak default passwords", "Large size"], "correct": "C", "subject": "IoT"},
-    {"question": "Which protocol uses publish-subscribe architecture?", "options": ["HTTP", "FTP", "MQTT", "TCP/IP"], "correct": "C", "subject": "IoT"},
-    {"question": "What does 'smart home' refer to in IoT?", "options": ["House made of smart materials", "Home with automated systems", "House with solar panels only", "Home without electricity"], "correct": "B", "subject": "IoT"},
-    {"question": "Which layer of IoT architecture handles data storage and analysis?", "options": ["Perception layer", "Network layer", "Application layer", "Physical layer"], "correct": "C", "subject": "IoT"},
-    {"question": "Which device converts physical input into electrical signals?", "options": ["Actuator", "Sensor", "Switch", "Battery"], "correct": "B", "subject": "IoT"},
-    {"question": "Which device converts electrical signals into physical movement?", "options": ["Resistor", "Capacitor", "Sensor", "Actuator"], "correct": "D", "subject": "IoT"},
-    {"question": "Which of the following is an example of an actuator?", "options": ["Thermometer", "Humidity sensor", "Motor", "Camera lens"], "correct": "C", "subject": "IoT"},
-    {"question": "Which wireless technology is most suitable for connecting wearable IoT devices?", "options": ["WiMAX", "Bluetooth Low Energy", "Dial-up", "Infrared"], "correct": "B", "subject": "IoT"},
-    {"question": "Which term refers to uniquely identifiable objects connected to the internet?", "options": ["AI Systems", "Cloud Servers", "Internet of Things", "Mobile Apps"], "correct": "C", "subject": "IoT"},
-    {"question": "Which organization manages IP addresses globally?", "options": ["IEEE", "IETF", "ICANN", "UNESCO"], "correct": "C", "subject": "IoT"},
-    {"question": "Which IPv6 feature benefits IoT?", "options": ["Smaller address space", "Larger address space", "No encryption", "Slower speed"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following is a common power source for remote IoT sensors?", "options": ["USB cable", "Batteries or solar energy", "Ethernet cable", "HDMI port"], "correct": "B", "subject": "IoT"},
-    {"question": "What is edge computing in IoT?", "options": ["Storing data in USB drives", "Processing data near the source", "Using old computers", "Printing reports locally"], "correct": "B", "subject": "IoT"},
-    {"question": "Why is data privacy important in IoT?", "options": ["To make devices heavier", "To reduce battery life", "To protect personal information", "To increase internet speed"], "correct": "C", "subject": "IoT"},
-    {"question": "Which protocol operates efficiently on constrained devices?", "options": ["HTTP", "CoAP", "SMTP", "Telnet"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following is a real-world application of IoT?", "options": ["Smart lighting", "Paper filing", "Handwritten notes", "Analog clocks"], "correct": "A", "subject": "IoT"},
-    {"question": "What is firmware in an IoT device?", "options": ["Outer plastic case", "Built-in software controlling hardware", "User manual", "Wi-Fi password"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following helps secure IoT communications?", "options": ["Using weak passwords", "Disabling updates", "Encryption", "Sharing MAC addresses publicly"], "correct": "C", "subject": "IoT"},
-    {"question": "Which layer includes sensors and actuators in IoT?", "options": ["Application layer", "Network layer", "Perception layer", "Transport layer"], "correct": "C", "subject": "IoT"},
-    {"question": "Which communication method requires line-of-sight?", "options": ["Wi-Fi", "Bluetooth", "Infrared", "Cellular"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following improves IoT scalability?", "options": ["Fewer devices", "Standardized protocols", "Manual configuration", "Proprietary cables"], "correct": "B", "subject": "IoT"},
-    {"question": "Which device acts as a bridge between analog sensors and digital systems?", "options": ["ADC (Analog-to-Digital Converter)", "DAC", "LED", "Resistor"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is NOT a wireless communication medium?", "options": ["Radio waves", "Microwaves", "Optical fiber", "Infrared"], "correct": "C", "subject": "IoT"},
-    {"question": "Which technology allows machines to communicate without human intervention?", "options": ["M2M (Machine to Machine)", "MAN", "LAN", "VPN"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a challenge in IoT deployment?", "options": ["Interoperability", "Color options", "Screen brightness", "Keyboard layout"], "correct": "A", "subject": "IoT"},
-    {"question": "Which protocol is used for web-based communication in IoT?", "options": ["HTTP", "FTP", "UDP", "All of the above"], "correct": "D", "subject": "IoT"},
-    {"question": "What is the primary function of a gateway in IoT?", "options": ["Play music", "Connect different networks", "Charge batteries", "Print receipts"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following supports bidirectional communication?", "options": ["MQTT", "One-way radio", "Television broadcast", "Billboard"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of these is an IoT cloud platform?", "options": ["Google Drive", "AWS IoT Core", "Notepad++", "WinRAR"], "correct": "B", "subject": "IoT"},
-    {"question": "Which standard operates at 2.4 GHz and supports mesh networking?", "options": ["Wi-Fi", "Zigbee", "AM Radio", "VGA"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following increases reliability in IoT systems?", "options": ["Single point of failure", "Redundant systems", "No backups", "Shared passwords"], "correct": "B", "subject": "IoT"},
-    {"question": "Which technology uses small cells for urban IoT coverage?", "options": ["Satellite", "5G", "Walkie-talkie", "Ethernet hub"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following is essential for device authentication in IoT?", "options": ["Username/password", "Digital certificates", "Device color", "Serial number only"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following ensures timely delivery in IoT?", "options": ["Low latency", "High resolution", "Big screen", "Volume control"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a benefit of IoT in agriculture?", "options": ["Manual watering", "Soil moisture monitoring", "Hand planting", "Paper records"], "correct": "B", "subject": "IoT"},
-    {"question": "Which protocol uses UDP instead of TCP?", "options": ["HTTP", "FTP", "CoAP", "SMTP"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following is used to identify IoT devices uniquely?", "options": ["IP address", "MAC address", "IMEI", "All of the above"], "correct": "D", "subject": "IoT"},
-    {"question": "Which of the following reduces bandwidth usage in IoT?", "options": ["Data compression", "High-resolution images", "Long videos", "Repetitive logs"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a health-related IoT application?", "options": ["Fitness tracker", "Coffee mug", "Wall paint", "Desk lamp"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is NOT a sensor type?", "options": ["Temperature", "Pressure", "Humidity", "Speaker"], "correct": "D", "subject": "IoT"},
-    {"question": "Which communication mode allows two-way transmission simultaneously?", "options": ["Simplex", "Half-duplex", "Duplex", "Full-duplex"], "correct": "D", "subject": "IoT"},
-    {"question": "Which of the following is a disadvantage of IoT?", "options": ["Automation", "Security risks", "Energy efficiency", "Remote access"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following stores data temporarily in IoT devices?", "options": ["Hard disk", "RAM", "DVD", "Flashlight"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following processes instructions in an IoT device?", "options": ["CPU", "Monitor", "Keyboard", "Mouse"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following connects IoT devices to the internet?", "options": ["Router", "Printer", "Speaker", "Projector"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a wireless PAN technology?", "options": ["Wi-Fi", "Bluetooth", "Ethernet", "Fiber"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following is a wired communication option in IoT?", "options": ["RS-232", "Zigbee", "LoRa", "NFC"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is used to detect motion?", "options": ["Accelerometer", "Barometer", "Thermocouple", "Photodiode"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following measures atmospheric pressure?", "options": ["Hygrometer", "Barometer", "Tachometer", "Voltmeter"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following detects light intensity?", "options": ["Thermistor", "LDR (Light Dependent Resistor)", "Piezoelectric sensor", "Hall effect sensor"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following converts light into electricity?", "options": ["LED", "LCD", "Solar cell", "Laser"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following emits light when current flows?", "options": ["Photodiode", "LDR", "LED", "Thermistor"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following is used in touch-sensitive screens?", "options": ["Capacitive sensor", "Smoke detector", "Microphone", "Heater"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following detects smoke?", "options": ["Flame sensor", "Gas sensor", "Smoke sensor", "Moisture sensor"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following measures distance using sound?", "options": ["Ultrasonic sensor", "IR sensor", "Camera", "Radar"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following uses infrared to measure distance?", "options": ["GPS", "Ultrasonic sensor", "IR proximity sensor", "Barometer"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following is used for location tracking?", "options": ["GPS", "Thermometer", "Potentiometer", "Relay"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a programmable logic device in IoT?", "options": ["Arduino", "Calculator", "Clock", "Battery"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is an open-source electronics platform?", "options": ["Arduino", "Windows", "iOS", "Android"], "correct": "A", "subject": "IoT"},
-    {"question": "Which language is commonly used to program Arduino?", "options": ["Python", "Java", "C/C++", "HTML"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following provides Wi-Fi connectivity to microcontrollers?", "options": ["ESP8266", "LED", "Resistor", "Capacitor"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a single-board computer used in IoT?", "options": ["Raspberry Pi", "Keyboard", "Monitor", "Printer"], "correct": "A", "subject": "IoT"},
-    {"question": "Which GPIO pin mode sets output?", "options": ["INPUT", "OUTPUT", "ANALOG", "POWER"], "correct": "B", "subject": "IoT"},
-    {"question": "Which command sends data to serial monitor in Arduino?", "options": ["Serial.print()", "Console.log()", "printf()", "echo"], "correct": "A", "subject": "IoT"},
-    {"question": "Which loop runs continuously in Arduino code?", "options": ["setup()", "loop()", "main()", "start()"], "correct": "B", "subject": "IoT"},
-    {"question": "Which function runs once at startup in Arduino?", "options": ["repeat()", "forever()", "setup()", "begin()"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following is a cloud service for IoT analytics?", "options": ["Google Sheets", "Microsoft Word", "IBM Watson IoT", "Adobe Reader"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following allows voice-controlled IoT devices?", "options": ["Virtual assistants", "Spreadsheets", "Compilers", "Antivirus"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a risk of unsecured IoT devices?", "options": ["Botnet attacks", "Faster processing", "Better UI", "Lower cost"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following helps prevent unauthorized access?", "options": ["Firewall", "Extension cord", "Speaker", "Cable tie"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a common IoT attack vector?", "options": ["Phishing", "Default credentials", "Screen saver", "Mouse pad"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following improves IoT performance?", "options": ["Latency", "Jitter", "Bandwidth", "Packet loss"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following defines rules for data exchange?", "options": ["Protocol", "Hardware", "Color scheme", "Price tag"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following enables automation in homes?", "options": ["Smart thermostats", "Wooden doors", "Paper calendars", "Ceiling fans without remotes"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following monitors heart rate?", "options": ["Smartwatch", "Tablet", "Desktop", "Landline phone"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is used in smart cities for traffic control?", "options": ["Traffic sensors", "Billboards", "Benches", "Streetlights without sensors"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following transmits data wirelessly over long distances with low power?", "options": ["LoRa", "Bluetooth", "Wi-Fi", "USB"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a cellular-based IoT network?", "options": ["NB-IoT", "Ethernet", "Parallel port", "PS/2"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following allows contactless payment?", "options": ["NFC", "Barcode", "QR Code", "Cash"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following detects magnetic fields?", "options": ["Hall effect sensor", "Microphone", "Accelerometer", "Gyroscope"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following combines temperature and humidity sensing?", "options": ["DHT11", "LED", "Button", "Buzzer"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following produces sound?", "options": ["Buzzer", "LDR", "Thermistor", "Capacitor"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following detects tilt or orientation?", "options": ["Accelerometer", "Barometer", "Hygrometer", "Voltmeter"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following measures rotation?", "options": ["Gyroscope", "Thermometer", "Manometer", "Oscilloscope"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is used to control high-voltage devices?", "options": ["Relay", "Resistor", "Diode", "Capacitor"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following converts digital signals to analog?", "options": ["ADC", "DAC", "CPU", "GPU"], "correct": "B", "subject": "IoT"},
-    {"question": "Which of the following is NOT part of IoT architecture?", "options": ["Perception layer", "Network layer", "Business layer", "Application layer"], "correct": "C", "subject": "IoT"},
-    {"question": "Which of the following ensures data integrity?", "options": ["Checksum", "Brightness", "Volume", "Size"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following allows firmware updates over the internet?", "options": ["OTA update", "Manual flash", "CD installation", "Email attachment"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a JSON-based messaging format in IoT?", "options": ["XML", "CSV", "JSON", "MQTT payload with JSON"], "correct": "D", "subject": "IoT"},
-    {"question": "Which of the following is a key element of IoT security?", "options": ["Authentication", "Large icons", "Fast scrolling", "Color themes"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following enables remote monitoring?", "options": ["Cloud dashboard", "Local switch", "Mechanical dial", "Paper logbook"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following reduces energy consumption in IoT?", "options": ["Sleep mode", "Continuous transmission", "Bright display", "Loud speaker"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a benefit of IoT in healthcare?", "options": ["Remote patient monitoring", "Handwritten prescriptions", "Paper files", "Manual scheduling"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is used to collect and forward sensor data?", "options": ["Gateway", "Mouse", "Keyboard", "Headphones"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following allows integration of various IoT devices?", "options": ["IoT platform", "Charger", "Case", "Stand"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a drawback of centralized IoT systems?", "options": ["Single point of failure", "High cost", "Too many features", "Heavy weight"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following supports decentralized processing?", "options": ["Edge computing", "Central server only", "Mainframe", "Typewriter"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a lightweight OS for IoT?", "options": ["RIOT OS", "Windows 11", "macOS", "Ubuntu Desktop"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a containerization tool used in IoT?", "options": ["Docker", "Paint", "Calculator", "Media Player"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following improves interoperability?", "options": ["Open standards", "Proprietary formats", "Locked-down systems", "Hidden APIs"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a real-time operating system?", "options": ["FreeRTOS", "Windows XP", "Linux Mint", "Chrome OS"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a common IoT data format?", "options": ["JSON", "DOCX", "MP3", "AVI"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following allows device discovery in a network?", "options": ["mDNS", "DHCP", "DNS", "All of the above"], "correct": "D", "subject": "IoT"},
-    {"question": "Which of the following is used to represent IoT data visually?", "options": ["Dashboard", "Terminal", "Code editor", "Compiler"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a challenge in IoT data management?", "options": ["Volume of data", "Font size", "Screen resolution", "Mouse sensitivity"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following enables predictive maintenance?", "options": ["Sensor data analysis", "Manual inspection", "Guessing", "Waiting for breakdown"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a use of IoT in logistics?", "options": ["Asset tracking", "Paper labels", "Manual entry", "Walking surveys"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a smart city application?", "options": ["Smart parking", "Paper tickets", "Manual gates", "Non-automatic lights"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a smart farming technique?", "options": ["Automated irrigation", "Hand watering", "Guessing soil condition", "No monitoring"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following helps in minimizing false alarms in IoT?", "options": ["Data filtering", "Random triggers", "Ignoring inputs", "Turning off sensors"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a key factor in IoT scalability?", "options": ["Modular design", "Fixed wiring", "Manual updates", "Limited connectivity"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following ensures secure boot in IoT?", "options": ["Trusted execution environment", "Open bootloader", "No verification", "Public keys only"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is used to manage IoT devices remotely?", "options": ["Device Management Platform", "Physical access", "Paper logs", "Verbal commands"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a common IoT development kit?", "options": ["NodeMCU", "Keyboard", "Mouse", "Printer"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is NOT an IoT application?", "options": ["Traditional farming without sensors", "Smart grid", "Connected cars", "Industrial automation"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following enhances user experience in IoT?", "options": ["User-friendly interface", "Complex menus", "No feedback", "Slow response"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following contributes to green technology in IoT?", "options": ["Energy-efficient devices", "Always-on systems", "High power consumption", "No sleep mode"], "correct": "A", "subject": "IoT"},
-    {"question": "Which of the following is a future trend in IoT?", "options": ["AI integration", "Reduced connectivity", "Less automation", "Analog systems"], "correct": "A", "subject": "IoT"},
-    {"question": "What does HTML stand for?", "options": ["Hyper Text Markup Language", "High Text Markup Language", "Hyperlink and Text Markup Language", "Home Tool Markup Language"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to create a hyperlink in HTML?", "options": ["<link>", "<a>", "<href>", "<hyper>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does CSS stand for?", "options": ["Creative Style Sheets", "Cascading Style Sheets", "Computer Style Sheets", "Colorful Style Sheets"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which HTML tag is used to define an unordered list?", "options": ["<ol>", "<ul>", "<li>", "<list>"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you insert an image in HTML?", "options": ["<img src='image.jpg'>", "<image>image.jpg</image>", "<pic>image.jpg</pic>", "<img href='image.jpg'>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property is used to change the background color in CSS?", "options": ["color", "bgcolor", "background-color", "background"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you select an element with id='header' in CSS?", "options": [".header", "#header", "*header", "header"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used to create a table in HTML?", "options": ["<table>", "<tab>", "<tr>", "<td>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the correct HTML for creating a checkbox?", "options": ["<input type='check'>", "<input type='checkbox'>", "<check>", "<checkbox>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS property controls text size?", "options": ["font-style", "text-size", "font-size", "text-style"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you make a list that lists items with bullets?", "options": ["<ol>", "<ul>", "<dl>", "<list>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the correct HTML for inserting a line break?", "options": ["<lb>", "<break>", "<br>", "<newline>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used to define a paragraph?", "options": ["<p>", "<para>", "<pg>", "<par>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you add a comment in CSS?", "options": ["// comment", "<!-- comment -->", "/* comment */", "# comment"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which HTML attribute specifies an alternate text for an image?", "options": ["title", "src", "alt", "href"], "correct": "C", "subject": "Web Design"},
-    {"question": "What does SEO stand for?", "options": ["Search Engine Optimization", "System Engine Output", "Secure Engine Online", "Search Engine Operation"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to create a dropdown list in HTML?", "options": ["<select>", "<dropdown>", "<list>", "<option>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you center an element horizontally in CSS?", "options": ["text-align: center", "margin: center", "margin: auto", "align: center"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which HTML tag is used for the largest heading?", "options": ["<h6>", "<h1>", "<head>", "<heading>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the correct way to link an external CSS file?", "options": ["<link rel='stylesheet' href='style.css'>", "<style src='style.css'>", "<css>style.css</css>", "<link>style.css</link>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property is used to change the font of text?", "options": ["font-style", "font-family", "font-weight", "text-font"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you make text bold in CSS?", "options": ["font-weight: bold", "style: bold", "font: bold", "bold: true"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the default value of the position property?", "options": ["relative", "fixed", "absolute", "static"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which tag is used to create a radio button?", "options": ["<input type='radio'>", "<radio>", "<input type='check'>", "<rb>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a flexbox container?", "options": ["display: flexbox", "display: flex", "flex: on", "display: block"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS property controls the space between elements?", "options": ["padding", "margin", "border", "spacing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does URL stand for?", "options": ["Uniform Resource Locator", "Universal Resource Link", "Uniform Retrieval Language", "Unique Resource Locator"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element is used to specify a footer?", "options": ["<bottom>", "<foot>", "<footer>", "<section>"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you change the color of text in CSS?", "options": ["text-color", "color", "font-color", "text-style"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used to define navigation links?", "options": ["<nav>", "<navigation>", "<menu>", "<links>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the correct HTML for creating a text input field?", "options": ["<input type='textfield'>", "<input type='text'>", "<textinput>", "<input>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS selector targets all elements?", "options": ["*", ".", "#", "all"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you make a rounded corner border in CSS?", "options": ["border-radius", "corner-radius", "border-round", "round-border"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML tag is used to define an article?", "options": ["<article>", "<section>", "<div>", "<content>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does WWW stand for?", "options": ["World Wide Web", "World Web Wide", "Wide World Web", "Web World Wide"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which attribute is used to open a link in a new tab?", "options": ["target='_blank'", "target='new'", "open='new'", "link='new'"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you add a shadow to text in CSS?", "options": ["text-shadow", "shadow", "font-shadow", "box-shadow"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to embed video in HTML5?", "options": ["<video>", "<movie>", "<media>", "<embed>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the correct syntax for an internal CSS?", "options": ["<style> ... </style>", "<css> ... </css>", "<script> ... </script>", "<headstyle> ... </headstyle>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property is used to create space inside an element?", "options": ["margin", "padding", "border", "spacing"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you select a class in CSS?", "options": ["#classname", ".classname", "*classname", "classname"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the purpose of the <meta> tag?", "options": ["To style the page", "To provide metadata", "To create links", "To display content"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which HTML element is used for a section header?", "options": ["<header>", "<head>", "<top>", "<sectionhead>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a grid layout in CSS?", "options": ["display: grid", "display: block", "grid: on", "layout: grid"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to create a button?", "options": ["<button>", "<btn>", "<input>", "<push>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does RGB stand for in CSS?", "options": ["Red Green Blue", "Red Gray Black", "Real Green Blue", "Red Gold Blue"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property changes the cursor appearance?", "options": ["pointer", "cursor", "mouse", "hover"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you make an element float left?", "options": ["float: left", "align: left", "position: left", "direction: left"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to define a division or section?", "options": ["<div>", "<section>", "<span>", "<block>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the correct HTML for a mailto link?", "options": ["<a href='mailto:info@example.com'>", "<a link='mailto:info@example.com'>", "<mail>info@example.com</mail>", "<a>mailto:info@example.com</a>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS property is used for transitions?", "options": ["animation", "transition", "transform", "effect"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you hide an element in CSS?", "options": ["display: none", "visibility: hidden", "opacity: 0", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which tag is used to embed audio in HTML5?", "options": ["<sound>", "<audio>", "<mp3>", "<music>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the purpose of the viewport meta tag?", "options": ["To set page title", "To control layout on mobile", "To add styles", "To link CSS"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which unit is relative to font size of the root element?", "options": ["px", "em", "rem", "%"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you create a media query in CSS?", "options": ["@media (condition) { }", "@screen (condition) { }", "@query (condition) { }", "media: condition"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML attribute is used for form submission method?", "options": ["action", "method", "target", "enctype"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does the z-index property control?", "options": ["Stacking order", "Transparency", "Position", "Size"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to create a form?", "options": ["<form>", "<input>", "<fieldset>", "<submit>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you make text italic in CSS?", "options": ["font-style: italic", "text-style: italic", "style: italic", "font-italic: true"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property aligns flex items vertically?", "options": ["justify-content", "align-items", "flex-direction", "align-content"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the default display value of a <div> element?", "options": ["inline", "block", "flex", "grid"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used for inline styling?", "options": ["<style>", "<css>", "<span>", "<div style=''>"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a hover effect in CSS?", "options": [":hover", ".hover", "#hover", "onhover"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML5 element is used for canvas graphics?", "options": ["<graphics>", "<drawing>", "<canvas>", "<svg>"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is responsive web design?", "options": ["Design that responds to user clicks", "Design that works on all devices", "Design with fast loading", "Design with animations"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute makes an input field required?", "options": ["mandatory", "required", "validate", "mustfill"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you add a favicon to a website?", "options": ["<link rel='icon' href='favicon.ico'>", "<favicon>favicon.ico</favicon>", "<icon>favicon.ico</icon>", "<link icon='favicon.ico'>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS framework is most popular?", "options": ["jQuery", "React", "Bootstrap", "Angular"], "correct": "C", "subject": "Web Design"},
-    {"question": "What does the 'em' unit measure?", "options": ["Parent element font size", "Root element font size", "Pixel size", "Percentage"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for semantic main content?", "options": ["<main>", "<content>", "<body>", "<div>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a box shadow in CSS?", "options": ["box-shadow", "shadow", "element-shadow", "border-shadow"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls the order of flex items?", "options": ["order", "flex-order", "z-index", "position"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the alt attribute in images?", "options": ["For decoration", "For accessibility", "For linking", "For styling"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which HTML tag is used for superscript?", "options": ["<sup>", "<super>", "<up>", "<^>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you prevent text wrapping in CSS?", "options": ["white-space: nowrap", "text-wrap: none", "overflow: hidden", "word-break: none"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for a progress bar in HTML5?", "options": ["<progress>", "<meter>", "<range>", "<bar>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the correct doctype for HTML5?", "options": ["<!DOCTYPE html>", "<!DOCTYPE HTML5>", "<!DOCTYPE HTML PUBLIC>", "<doctype html>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS property creates a gradient background?", "options": ["background-gradient", "gradient", "background-image", "linear-gradient"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you target the first child element?", "options": [":first-child", ":first", ":child-first", "first-of-type"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which element is used for bold text semantically?", "options": ["<b>", "<strong>", "<bold>", "<em>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the purpose of the <title> tag?", "options": ["Page heading", "Browser tab title", "Meta description", "Header text"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property makes an element sticky?", "options": ["position: fixed", "position: sticky", "position: absolute", "float: stick"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create columns in CSS Grid?", "options": ["grid-template-columns", "columns", "grid-columns", "column-count"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for a details disclosure widget?", "options": ["<details>", "<collapse>", "<accordion>", "<toggle>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does the term 'wireframe' mean in web design?", "options": ["Color scheme", "Layout sketch", "Final design", "Code structure"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute specifies where to send form data?", "options": ["method", "action", "target", "submit"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create an animation in CSS?", "options": ["@keyframes", "@animation", "transition", "transform"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element represents preformatted text?", "options": ["<code>", "<pre>", "<samp>", "<kbd>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the default port for HTTPS?", "options": ["80", "443", "8080", "21"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property controls line height?", "options": ["line-height", "height", "text-height", "spacing"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you make an image responsive?", "options": ["width: 100%", "max-width: 100%", "Both A and B", "img-responsive class"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used for a quotation?", "options": ["<quote>", "<q>", "<blockquote>", "<cit>"], "correct": "C", "subject": "Web Design"},
-    {"question": "What does the term UX stand for?", "options": ["User Experience", "User Extension", "Universal XML", "User Express"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS pseudo-class targets visited links?", "options": [":link", ":visited", ":hover", ":active"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create a transparent background?", "options": ["opacity: 0.5", "background: transparent", "visibility: hidden", "display: none"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which HTML5 API is used for geolocation?", "options": ["Geolocation API", "Location API", "GPS API", "Map API"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the <noscript> tag?", "options": ["To run scripts", "To show content when JavaScript is disabled", "To link scripts", "To disable scripts"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property creates a 3D transformation?", "options": ["transform", "transition", "animation", "perspective"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you disable an input field?", "options": ["disabled", "readonly", "inactive", "off"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for a caption in a table?", "options": ["<caption>", "<thead>", "<title>", "<head>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the correct way to write a CSS comment?", "options": ["// comment", "<!-- comment -->", "/* comment */", "' comment"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which HTML element is used for abbreviations?", "options": ["<abbr>", "<acronym>", "<def>", "<short>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a full-width background?", "options": ["width: 100%", "width: 100vw", "background-size: cover", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which property controls text alignment?", "options": ["align-text", "text-align", "align", "text-position"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does the acronym CMS stand for?", "options": ["Content Management System", "Creative Management Software", "Central Module Script", "Computer Management System"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to group form elements?", "options": ["<group>", "<fieldset>", "<formgroup>", "<section>"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create a tooltip in HTML?", "options": ["title attribute", "tooltip attribute", "alt attribute", "<tooltip> tag"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS property is used for word wrapping?", "options": ["word-wrap", "text-wrap", "overflow-wrap", "wrap-text"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is the purpose of the lang attribute?", "options": ["To specify language", "To link files", "To style text", "To add scripts"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element is used for a thematic break?", "options": ["<br>", "<hr>", "<line>", "<break>"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create a fixed header?", "options": ["position: fixed", "position: sticky", "position: absolute", "float: top"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls the visibility of an element?", "options": ["display", "visibility", "opacity", "show"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the default value of overflow?", "options": ["visible", "hidden", "scroll", "auto"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for a definition list?", "options": ["<dl>", "<ol>", "<ul>", "<list>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a border image?", "options": ["border-image", "border-picture", "image-border", "background-border"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML5 element is used for aside content?", "options": ["<sidebar>", "<aside>", "<side>", "<extra>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does the term 'above the fold' mean?", "options": ["Content visible without scrolling", "Content at the bottom", "Hidden content", "Footer content"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates multiple background images?", "options": ["background", "background-image", "background-repeat", "background-position"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create a custom bullet point?", "options": ["list-style-type", "bullet-style", "marker", "list-marker"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which attribute specifies the input pattern?", "options": ["pattern", "regex", "validate", "format"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the srcset attribute?", "options": ["Responsive images", "Image styling", "Image linking", "Image caption"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS function creates a circular clip?", "options": ["circle()", "round()", "ellipse()", "clip-circle()"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a multi-column layout?", "options": ["column-count", "columns", "Both A and B", "grid-template-columns"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used for a dialog box?", "options": ["<dialog>", "<modal>", "<popup>", "<window>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the contenteditable attribute?", "options": ["To make content editable", "To add content", "To style content", "To hide content"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls pointer events?", "options": ["pointer-events", "cursor", "click", "event"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a smooth scroll behavior?", "options": ["scroll-behavior: smooth", "scroll: smooth", "overflow: smooth", "behavior: smooth"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element is used for ruby annotations?", "options": ["<ruby>", "<annotation>", "<note>", "<rt>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does the term 'graceful degradation' mean?", "options": ["Older browsers still work", "New features only", "Mobile first", "Fast loading"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates a resize handle?", "options": ["resize", "size", "handle", "drag"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a variable in CSS?", "options": ["--variable-name", "$variable", "@variable", "var()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML attribute improves accessibility?", "options": ["aria-label", "title", "alt", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "What is the purpose of the picture element?", "options": ["Art direction", "Multiple image sources", "Image gallery", "Image styling"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS selector has the highest specificity?", "options": ["Element", "Class", "ID", "Inline style"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a parallax effect?", "options": ["background-attachment: fixed", "position: fixed", "transform: translateZ()", "perspective"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for a meter?", "options": ["<meter>", "<progress>", "<gauge>", "<level>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the loading='lazy' attribute?", "options": ["Lazy loading images", "Fast loading", "Preloading", "Caching"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls aspect ratio?", "options": ["aspect-ratio", "ratio", "size-ratio", "width-height"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a dark mode toggle?", "options": ["prefers-color-scheme media query", "class toggle", "CSS variables", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which HTML element is used for a time?", "options": ["<time>", "<date>", "<clock>", "<datetime>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does the term 'mobile-first' mean?", "options": ["Design for mobile first", "Mobile only", "Desktop first", "Tablet first"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS function creates a conic gradient?", "options": ["conic-gradient()", "radial-gradient()", "linear-gradient()", "repeating-conic-gradient()"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a custom scrollbar?", "options": ["::webkit-scrollbar", "scrollbar-style", "custom-scroll", "overflow-style"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which attribute prevents form submission?", "options": ["novalidate", "prevent", "nosubmit", "disabled"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the crossorigin attribute?", "options": ["CORS for resources", "Cross-browser compatibility", "Cross-domain linking", "Cross-platform"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates a blend mode?", "options": ["mix-blend-mode", "blend", "background-blend-mode", "filter"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a print stylesheet?", "options": ["@media print", "@print", "media='print'", "print: css"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element is used for a mark/highlight?", "options": ["<mark>", "<highlight>", "<strong>", "<em>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the referrerpolicy attribute?", "options": ["Control referrer policy", "Referencing", "Linking", "Security"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS function creates a color with alpha?", "options": ["rgba()", "hsla()", "color()", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a masonry layout?", "options": ["CSS columns", "Grid with auto-placement", "Flexbox", "Masonry library"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used for a summary?", "options": ["<summary>", "<caption>", "<title>", "<head>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does the term 'progressive enhancement' mean?", "options": ["Start with core functionality", "Add features later", "Both A and B", "Advanced features first"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property controls filter effects?", "options": ["filter", "effect", "image-filter", "css-filter"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a container query?", "options": ["@container", "@media", "container-query", "resize"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML attribute improves performance?", "options": ["async", "defer", "loading", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "What is the purpose of the inert attribute?", "options": ["Disable interaction", "Hide element", "Remove from DOM", "Make readonly"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS property creates a scroll snap?", "options": ["scroll-snap-type", "snap", "scroll-behavior", "overflow"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a logical property?", "options": ["inset-inline", "margin-block", "padding-inline", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which element is used for web components?", "options": ["<template>", "<slot>", "<shadow>", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "What is the purpose of the has() selector?", "options": ["Parent selector", "Child selector", "Sibling selector", "Attribute selector"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates a cascade layer?", "options": ["@layer", "@cascade", "layer()", "cascade"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a color scheme preference?", "options": ["prefers-color-scheme", "color-mode", "dark-mode", "theme"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element is used for a popover?", "options": ["popover attribute", "<dialog>", "<details>", "<popup>"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the latest HTML version as of 2024?", "options": ["HTML5", "HTML5.1", "HTML5.2", "HTML Living Standard"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which CSS feature improves performance?", "options": ["contain", "will-change", "content-visibility", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a nested dropdown?", "options": ["CSS only", "JavaScript", "Both", "HTML only"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property creates a text stroke?", "options": ["-webkit-text-stroke", "text-outline", "stroke", "border-text"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the accent-color property?", "options": ["Color form controls", "Text color", "Background color", "Border color"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which selector targets anchor elements?", "options": [":where(a)", ":is(a)", ":has(a)", "a"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a gap in grid?", "options": ["gap", "grid-gap", "column-gap", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which HTML attribute is used for autocomplete?", "options": ["autocomplete", "auto-complete", "complete", "fill"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the enterkeyhint attribute?", "options": ["Change Enter key label", "Submit form", "New line", "Close keyboard"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS function creates a trigonometric value?", "options": ["sin()", "cos()", "tan()", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a subgrid?", "options": ["grid-template-columns: subgrid", "display: subgrid", "subgrid: true", "inherit grid"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls text orientation?", "options": ["writing-mode", "text-orientation", "direction", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "What is the purpose of the anchor-positioning property?", "options": ["Position elements relative to anchor", "Fixed positioning", "Absolute positioning", "Sticky positioning"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element supports the popover API?", "options": ["Any element with popover attribute", "<popover>", "<dialog>", "<details>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a scroll-driven animation?", "options": ["@scroll-timeline", "animation-timeline", "scroll-animation", "timeline"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which selector is the new standard parent selector?", "options": [":has()", ":parent()", ":scope()", ":where()"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the view-transition API?", "options": ["Smooth page transitions", "View changes", "Animation", "Routing"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates individual transform properties?", "options": ["translate", "rotate", "scale", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a range slider?", "options": ["<input type='range'>", "<slider>", "<range>", "<input type='slider'>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS at-rule is used for feature support?", "options": ["@supports", "@media", "@container", "@layer"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the font-display property?", "options": ["Control font loading behavior", "Display font", "Font size", "Font style"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML attribute is used for lazy loading iframes?", "options": ["loading='lazy'", "lazyload", "defer", "async"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a custom property fallback?", "options": ["var(--name, fallback)", "fallback(--name)", "default(--name)", "var-fallback"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates a masonry grid in Firefox?", "options": ["display: masonry", "grid-template-rows: masonry", "masonry: auto", "layout: masonry"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the purpose of the isolation property?", "options": ["Create new stacking context", "Isolate element", "Hide element", "Separate layers"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which selector matches elements based on text?", "options": [":text()", ":contains()", "CSS has no text selector", "::content()"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you create an anchor positioning?", "options": ["position-anchor", "anchor-name", "position: anchored", "anchor()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS function creates a relative color?", "options": ["relative()", "color()", "from()", "relative-color()"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is the purpose of the timeline-scope property?", "options": ["Define scroll timeline scope", "Animation scope", "Time range", "Duration"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element has built-in validation?", "options": ["<form>", "<input>", "<textarea>", "All form elements"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create a light-dark() color function?", "options": ["light-dark(light, dark)", "color-scheme()", "prefers-color-scheme", "theme()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls scrollbar gutter?", "options": ["scrollbar-gutter", "gutter", "scrollbar-width", "overflow"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the latest CSS color space?", "options": ["oklch()", "lch()", "oklab()", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which attribute enables native lazy loading?", "options": ["loading='lazy'", "lazy='true'", "defer='image'", "data-lazy"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a text underline offset?", "options": ["text-underline-offset", "underline-offset", "text-decoration-offset", "line-offset"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which selector targets focus within?", "options": [":focus-within", ":focus-inside", ":has-focus", ":focused"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the math-style property?", "options": ["Control mathematical layout", "Font style", "Text alignment", "Spacing"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS function creates a stepped value?", "options": ["steps()", "step()", "jump()", "stair()"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a color contrast function?", "options": ["color-contrast()", "contrast()", "wcag-contrast()", "contrast-color()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates automatic hyphenation?", "options": ["hyphens", "word-break", "overflow-wrap", "text-wrap"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the anchor-scope property?", "options": ["Limit anchor name scope", "Global anchor", "Local anchor", "Anchor visibility"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML attribute is used for exportparts?", "options": ["exportparts", "part-export", "shadow-parts", "component-parts"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a wide gamut color?", "options": ["color(display-p3, ...)", "wide-gamut()", "p3()", "display-p3"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which selector is stateful?", "options": [":state()", ":custom-state()", ":has-state()", "No state selector"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the field-sizing property?", "options": ["Control form field size", "Input sizing", "Content-based sizing", "Responsive fields"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which CSS at-rule creates a scope?", "options": ["@scope", "@container", "@media", "@layer"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a trigonometric animation?", "options": ["sin(), cos(), tan()", "Math functions in calc()", "Both", "No trig functions"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property controls initial letter?", "options": ["initial-letter", "drop-cap", "first-letter", "cap-height"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the latest way to create a carousel?", "options": ["scroll-snap + container queries", "Flexbox", "Grid", "JavaScript"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element has a built-in search role?", "options": ["<search>", "<form role='search'>", "No native search", "<input type='search'>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a nested grid?", "options": ["display: grid inside grid item", "subgrid", "Both", "Not possible"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which CSS function creates a modular value?", "options": ["mod()", "remainder()", "%", "calc()"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of the text-wrap property?", "options": ["Control text wrapping", "Word wrapping", "Line breaking", "All text layout"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which selector targets the current element?", "options": [":target", ":current", ":active", ":focus"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create an anchor-based popover?", "options": ["anchor attribute + popovertarget", "data-popover", "trigger attribute", "onclick"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property creates a scroll padding?", "options": ["scroll-padding", "scroll-margin", "Both", "overflow-padding"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is the purpose of the @starting-style rule?", "options": ["Define entrance animation styles", "Initial styles", "Start animation", "Loading styles"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS color space has the widest gamut?", "options": ["rec2020", "display-p3", "srgb", "prophoto"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a linear() easing function?", "options": ["linear()", "ease-linear()", "cubic-bezier()", "steps()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML attribute is used for virtual keyboard policy?", "options": ["enterkeyhint", "virtualkeyboardpolicy", "keyboard", "inputmode"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the purpose of the overscroll-behavior property?", "options": ["Control scroll chaining", "Bounce effect", "Scroll speed", "Overflow"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which selector matches elements in light DOM?", "options": [":host", ":light", "::slotted", "No selector"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a range context?", "options": ["@range", "@context", "range()", "No range context"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which property controls timeline name?", "options": ["animation-timeline", "timeline-name", "scroll-timeline", "view-timeline"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the future of CSS layout?", "options": ["Everything will be possible with Grid + Container Queries", "Flexbox only", "Floats return", "Tables"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which HTML element will get more semantic power?", "options": ["<search>", "<article>", "<section>", "<div>"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create a modern button with perfect alignment?", "options": ["display: grid + place-items", "Flexbox", "Inline-block", "Float"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS feature is the most exciting for 2025?", "options": ["All of the modern features combined", "Just color", "Only animations", "Nothing new"], "correct": "A", "subject": "Web Design"}, 
-    {"question": "What does HTML stand for?", "options": ["Hyper Text Markup Language", "High Tech Modern Language", "Hyper Transfer Markup Language", "Home Tool Markup Language"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to define a paragraph in HTML?", "options": ["<para>", "<p>", "<paragraph>", "<text>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which HTML tag is used to create a hyperlink?", "options": ["<link>", "<a>", "<href>", "<url>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute specifies the URL in an anchor tag?", "options": ["src", "link", "href", "url"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used to insert an image in HTML?", "options": ["<image>", "<pic>", "<img>", "<photo>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which attribute specifies the image source?", "options": ["href", "src", "link", "source"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the correct HTML tag for the largest heading?", "options": ["<h6>", "<heading>", "<h1>", "<head>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used to create an unordered list?", "options": ["<ol>", "<ul>", "<li>", "<list>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used to create an ordered list?", "options": ["<ul>", "<ol>", "<li>", "<list>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines a list item?", "options": ["<item>", "<li>", "<list>", "<il>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used to create a line break?", "options": ["<break>", "<lb>", "<br>", "<newline>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag creates a horizontal line?", "options": ["<line>", "<hr>", "<hl>", "<horizontal>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used for bold text?", "options": ["<bold>", "<b>", "<strong>", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which tag is used for italic text?", "options": ["<italic>", "<i>", "<em>", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which tag is used for underlined text?", "options": ["<underline>", "<u>", "<ul>", "<under>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which section contains meta information about the document?", "options": ["<body>", "<header>", "<head>", "<meta>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag contains the visible content of a webpage?", "options": ["<head>", "<body>", "<content>", "<main>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines the title shown in browser tab?", "options": ["<heading>", "<name>", "<title>", "<tab>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which DOCTYPE declaration is used for HTML5?", "options": ["<!DOCTYPE html5>", "<!DOCTYPE HTML>", "<!DOCTYPE html>", "<!HTML5>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used to create a table?", "options": ["<tb>", "<table>", "<tbl>", "<tab>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines a table row?", "options": ["<row>", "<tr>", "<td>", "<trow>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines a table data cell?", "options": ["<tc>", "<td>", "<cell>", "<data>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines a table header cell?", "options": ["<header>", "<th>", "<thead>", "<hd>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute makes a cell span multiple columns?", "options": ["rowspan", "colspan", "span", "merge"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute makes a cell span multiple rows?", "options": ["rowspan", "colspan", "span", "merge"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag is used to create a form?", "options": ["<input>", "<form>", "<submit>", "<formdata>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag creates an input field?", "options": ["<textfield>", "<input>", "<field>", "<text>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which input type creates a password field?", "options": ["type='hidden'", "type='text'", "type='password'", "type='secret'"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which input type creates a submit button?", "options": ["type='button'", "type='send'", "type='submit'", "type='post'"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag creates a dropdown list?", "options": ["<dropdown>", "<select>", "<list>", "<option>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines options in a dropdown?", "options": ["<item>", "<choice>", "<option>", "<select>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag creates a multi-line text input?", "options": ["<input>", "<text>", "<textarea>", "<multiline>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which attribute specifies form submission method?", "options": ["action", "method", "type", "submit"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute specifies where form data is sent?", "options": ["action", "method", "target", "href"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which input type creates a checkbox?", "options": ["type='check'", "type='checkbox'", "type='tick'", "type='box'"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which input type creates a radio button?", "options": ["type='radio'", "type='button'", "type='option'", "type='circle'"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which attribute groups radio buttons together?", "options": ["group", "id", "name", "class"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used to embed video in HTML5?", "options": ["<media>", "<movie>", "<video>", "<embed>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used to embed audio in HTML5?", "options": ["<sound>", "<audio>", "<music>", "<mp3>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute makes video controls visible?", "options": ["controls", "autoplay", "display", "show"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag embeds external content like maps?", "options": ["<embed>", "<iframe>", "<frame>", "Both A and B"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which attribute specifies alternative text for images?", "options": ["title", "alt", "name", "desc"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is used for navigation links?", "options": ["<navigation>", "<nav>", "<menu>", "<links>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which semantic tag represents main content?", "options": ["<content>", "<main>", "<body>", "<article>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which semantic tag represents a section?", "options": ["<div>", "<section>", "<part>", "<segment>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which semantic tag represents an article?", "options": ["<post>", "<blog>", "<article>", "<content>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which semantic tag represents a footer?", "options": ["<bottom>", "<footer>", "<end>", "<foot>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which semantic tag represents a header?", "options": ["<top>", "<header>", "<head>", "<heading>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which semantic tag represents side content?", "options": ["<sidebar>", "<side>", "<aside>", "<margin>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag is used for figure captions?", "options": ["<caption>", "<figcaption>", "<label>", "<title>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag groups figure and its caption?", "options": ["<image>", "<figure>", "<group>", "<fig>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute specifies element's unique identifier?", "options": ["class", "name", "id", "key"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which attribute specifies element's class?", "options": ["id", "class", "type", "group"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is a generic block-level container?", "options": ["<span>", "<div>", "<block>", "<container>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag is a generic inline container?", "options": ["<div>", "<inline>", "<span>", "<text>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag defines a definition list?", "options": ["<dl>", "<list>", "<def>", "<ul>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag defines a term in definition list?", "options": ["<dd>", "<dt>", "<term>", "<def>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines description in definition list?", "options": ["<dt>", "<dd>", "<desc>", "<def>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag marks text as important?", "options": ["<important>", "<strong>", "<b>", "<mark>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag marks text with emphasis?", "options": ["<emphasis>", "<em>", "<i>", "<italic>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag highlights text?", "options": ["<highlight>", "<mark>", "<hl>", "<color>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays deleted text?", "options": ["<remove>", "<del>", "<strike>", "<delete>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays inserted text?", "options": ["<add>", "<ins>", "<insert>", "<new>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays subscript text?", "options": ["<sub>", "<sup>", "<down>", "<lower>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which tag displays superscript text?", "options": ["<sub>", "<sup>", "<up>", "<upper>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag preformats text?", "options": ["<format>", "<pre>", "<code>", "<text>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays code?", "options": ["<script>", "<code>", "<program>", "<syntax>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays keyboard input?", "options": ["<key>", "<kbd>", "<keyboard>", "<input>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays sample output?", "options": ["<output>", "<samp>", "<sample>", "<result>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag displays a variable?", "options": ["<variable>", "<var>", "<v>", "<val>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag creates a citation?", "options": ["<citation>", "<cite>", "<ref>", "<quote>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag creates a block quote?", "options": ["<quote>", "<blockquote>", "<bq>", "<q>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag creates an inline quote?", "options": ["<quote>", "<q>", "<iq>", "<inline>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines abbreviation?", "options": ["<abbreviation>", "<abbr>", "<ab>", "<short>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines contact information?", "options": ["<contact>", "<address>", "<info>", "<details>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag defines bidirectional text?", "options": ["<bdo>", "<bdi>", "<rtl>", "<dir>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which element is used for time/date?", "options": ["<date>", "<time>", "<datetime>", "<calendar>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag creates a progress bar?", "options": ["<bar>", "<progress>", "<loading>", "<status>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which tag creates a meter/gauge?", "options": ["<gauge>", "<meter>", "<measure>", "<scale>"], "correct": "B", "subject": "Web Design"},
-
-    # ========== CSS BASICS (81-180) ==========
-    {"question": "What does CSS stand for?", "options": ["Computer Style Sheets", "Cascading Style Sheets", "Creative Style System", "Colorful Style Sheets"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property changes text color?", "options": ["text-color", "font-color", "color", "foreground"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property changes background color?", "options": ["bg-color", "background-color", "color", "back-color"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property changes font size?", "options": ["text-size", "font-size", "size", "text-style"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property changes font family?", "options": ["font-name", "font-family", "font-type", "typeface"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property makes text bold?", "options": ["font-bold", "font-weight", "text-weight", "bold"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property makes text italic?", "options": ["font-italic", "font-style", "text-style", "italic"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property underlines text?", "options": ["text-underline", "underline", "text-decoration", "font-decoration"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property aligns text horizontally?", "options": ["text-align", "align", "horizontal-align", "text-position"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets element width?", "options": ["size", "width", "length", "horizontal"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets element height?", "options": ["size", "height", "length", "vertical"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets all margins at once?", "options": ["margin-all", "margins", "margin", "spacing"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property sets all paddings at once?", "options": ["padding-all", "paddings", "padding", "inner-spacing"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property sets border style?", "options": ["border-type", "border-style", "border-line", "border-format"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets border width?", "options": ["border-size", "border-width", "border-thickness", "border-weight"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets border color?", "options": ["border-color", "border-bg", "border-fill", "border-tone"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which value hides an element completely?", "options": ["display: hidden", "display: none", "visibility: none", "show: false"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which value makes element invisible but keeps space?", "options": ["display: none", "visibility: hidden", "opacity: 0", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which property changes cursor appearance?", "options": ["mouse", "pointer", "cursor", "hover"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which selector selects element by ID?", "options": [".", "#", "*", "@"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which selector selects element by class?", "options": [".", "#", "*", "@"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which selector selects all elements?", "options": [".", "#", "*", "all"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you select element with id='header'?", "options": [".header", "#header", "*header", "header"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you select elements with class='menu'?", "options": [".menu", "#menu", "*menu", "menu"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets background image?", "options": ["background-img", "background-image", "bg-image", "image"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property controls background repeat?", "options": ["background-repeat", "bg-repeat", "repeat", "background-tile"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property positions background image?", "options": ["background-position", "bg-position", "background-place", "position"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls background size?", "options": ["background-size", "bg-size", "background-scale", "size"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets line height?", "options": ["line-height", "line-spacing", "text-height", "spacing"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets letter spacing?", "options": ["letter-spacing", "char-spacing", "text-spacing", "font-spacing"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets word spacing?", "options": ["word-spacing", "text-spacing", "spacing", "word-gap"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property transforms text case?", "options": ["text-case", "text-transform", "font-case", "case"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which value of text-transform makes text uppercase?", "options": ["upper", "uppercase", "capital", "caps"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property indents first line of text?", "options": ["text-indent", "first-line", "indent", "paragraph-indent"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property adds shadow to text?", "options": ["text-shadow", "font-shadow", "shadow", "text-effect"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property adds shadow to box?", "options": ["box-shadow", "shadow", "element-shadow", "border-shadow"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property rounds corners?", "options": ["border-radius", "corner-radius", "border-round", "corners"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets element opacity?", "options": ["transparency", "opacity", "alpha", "visible"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets element position type?", "options": ["position", "placement", "location", "place"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which position value is relative to viewport?", "options": ["relative", "absolute", "fixed", "static"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which position value is relative to parent?", "options": ["relative", "absolute", "fixed", "static"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property controls stacking order?", "options": ["z-index", "stack", "layer", "order"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property makes element float?", "options": ["float", "align", "position", "flow"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property clears floats?", "options": ["clear", "reset", "no-float", "unfloat"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property controls overflow content?", "options": ["overflow", "scroll", "content", "clip"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which overflow value adds scrollbar when needed?", "options": ["scroll", "auto", "hidden", "visible"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets display type?", "options": ["display", "type", "show", "render"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which display value makes element inline?", "options": ["block", "inline", "flex", "grid"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which display value makes element block?", "options": ["block", "inline", "flex", "grid"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which display value enables flexbox?", "options": ["block", "inline", "flex", "grid"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which display value enables grid layout?", "options": ["block", "inline", "flex", "grid"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which property defines flex direction?", "options": ["flex-flow", "flex-direction", "flex-orient", "direction"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property wraps flex items?", "options": ["flex-wrap", "flex-flow", "wrap", "flex-break"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property aligns flex items on main axis?", "options": ["align-items", "justify-content", "align-content", "justify-items"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property aligns flex items on cross axis?", "options": ["align-items", "justify-content", "align-content", "justify-items"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets flex item grow factor?", "options": ["flex-grow", "flex-expand", "grow", "flex-size"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets flex item shrink factor?", "options": ["flex-shrink", "flex-reduce", "shrink", "flex-small"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets flex item initial size?", "options": ["flex-size", "flex-basis", "flex-initial", "flex-start"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property defines grid columns?", "options": ["grid-columns", "grid-template-columns", "columns", "grid-col"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property defines grid rows?", "options": ["grid-rows", "grid-template-rows", "rows", "grid-row"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets gap between grid items?", "options": ["grid-gap", "gap", "spacing", "Both A and B"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which unit is relative to font size?", "options": ["px", "em", "%", "cm"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which unit is relative to root font size?", "options": ["em", "rem", "px", "%"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which unit is relative to viewport width?", "options": ["vw", "vh", "%", "px"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which unit is relative to viewport height?", "options": ["vw", "vh", "%", "px"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which pseudo-class styles visited links?", "options": [":hover", ":active", ":visited", ":link"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which pseudo-class styles links on hover?", "options": [":hover", ":active", ":visited", ":focus"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which pseudo-class styles active links?", "options": [":hover", ":active", ":visited", ":focus"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which pseudo-class styles focused elements?", "options": [":hover", ":active", ":visited", ":focus"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which pseudo-class selects first child?", "options": [":first-child", ":first", ":start", ":initial"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which pseudo-class selects last child?", "options": [":last-child", ":last", ":end", ":final"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which pseudo-element styles first line?", "options": ["::first-line", "::line", "::start", "::initial"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which pseudo-element styles first letter?", "options": ["::first-letter", "::letter", "::initial", "::start"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which pseudo-element adds content before?", "options": ["::before", "::pre", "::start", "::insert"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which pseudo-element adds content after?", "options": ["::after", "::post", "::end", "::append"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property is used with ::before and ::after?", "options": ["text", "value", "content", "data"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which property adds transition effects?", "options": ["animation", "transition", "effect", "transform"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property transforms elements?", "options": ["modify", "change", "transform", "transition"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which transform function rotates element?", "options": ["rotate()", "turn()", "spin()", "angle()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which transform function scales element?", "options": ["resize()", "scale()", "size()", "zoom()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which transform function moves element?", "options": ["move()", "translate()", "shift()", "position()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which transform function skews element?", "options": ["tilt()", "skew()", "slant()", "angle()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property creates animations?", "options": ["animation", "animate", "motion", "keyframes"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which at-rule defines animation keyframes?", "options": ["@animation", "@keyframes", "@frames", "@motion"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets animation duration?", "options": ["animation-time", "animation-duration", "animation-length", "animation-speed"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets animation timing function?", "options": ["animation-timing-function", "animation-ease", "animation-curve", "animation-speed"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets animation delay?", "options": ["animation-wait", "animation-delay", "animation-pause", "animation-start"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets animation iteration count?", "options": ["animation-repeat", "animation-iteration-count", "animation-loop", "animation-count"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets animation direction?", "options": ["animation-direction", "animation-flow", "animation-path", "animation-way"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you link external CSS file?", "options": ["<style src='style.css'>", "<link rel='stylesheet' href='style.css'>", "<css href='style.css'>", "<stylesheet='style.css'>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute adds inline CSS?", "options": ["css", "class", "style", "design"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which tag adds internal CSS?", "options": ["<css>", "<style>", "<styles>", "<stylesheet>"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which has highest CSS specificity?", "options": ["Element", "Class", "ID", "Inline style"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which keyword makes CSS rule important?", "options": ["!priority", "!important", "!override", "!force"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property sets list style type?", "options": ["list-type", "list-style-type", "list-format", "bullet-type"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property removes list bullets?", "options": ["list-style: none", "bullets: false", "list-type: empty", "list: hidden"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which property sets list marker position?", "options": ["list-position", "list-style-position", "marker-position", "bullet-position"], "correct": "B", "subject": "Web Design"},
-
-    # ========== JAVASCRIPT BASICS (181-280) ==========
-    {"question": "Which tag is used to include JavaScript?", "options": ["<javascript>", "<js>", "<script>", "<code>"], "correct": "C", "subject": "Web Design"},
-    {"question": "Where is JavaScript code typically placed?", "options": ["In <head> or before </body>", "In <title>", "In <meta>", "In <link>"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method writes to HTML output?", "options": ["document.write()", "console.log()", "window.print()", "alert()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method displays an alert box?", "options": ["msg()", "alert()", "prompt()", "confirm()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method gets user input?", "options": ["input()", "prompt()", "get()", "read()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method displays confirmation dialog?", "options": ["alert()", "prompt()", "confirm()", "dialog()"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which method logs to console?", "options": ["print()", "log()", "console.log()", "debug()"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you declare a variable in JavaScript?", "options": ["variable x", "var x", "v x", "declare x"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which keyword declares a constant?", "options": ["var", "let", "const", "constant"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which keyword declares block-scoped variable?", "options": ["var", "let", "const", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "How do you create a function?", "options": ["function myFunc()", "def myFunc()", "func myFunc()", "create myFunc()"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you call a function named 'myFunc'?", "options": ["call myFunc", "myFunc()", "run myFunc", "execute myFunc"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which operator is used for assignment?", "options": ["==", "=", "===", ":="], "correct": "B", "subject": "Web Design"},
-    {"question": "Which operator checks equality with type?", "options": ["==", "=", "===", "!="], "correct": "C", "subject": "Web Design"},
-    {"question": "Which operator checks equality without type?", "options": ["==", "=", "===", "!="], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you write a comment in JavaScript?", "options": ["<!-- comment -->", "// comment", "# comment", "** comment"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you write multi-line comment?", "options": ["// comment //", "/* comment */", "<!-- comment -->", "## comment ##"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method selects element by ID?", "options": ["getElementById()", "getElement()", "selectById()", "findId()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method selects elements by class?", "options": ["getElementByClass()", "getElementsByClassName()", "selectByClass()", "findClass()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method selects elements by tag?", "options": ["getElementsByTagName()", "getElementByTag()", "selectByTag()", "findTag()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method selects first matching element?", "options": ["querySelector()", "querySelectorAll()", "select()", "find()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method selects all matching elements?", "options": ["querySelector()", "querySelectorAll()", "selectAll()", "findAll()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property changes element content?", "options": ["innerText", "innerHTML", "textContent", "All of the above"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which property includes HTML tags?", "options": ["innerText", "innerHTML", "textContent", "outerText"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method adds event listener?", "options": ["addEvent()", "addEventListener()", "onEvent()", "attachEvent()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which event fires when page loads?", "options": ["onload", "onstart", "onready", "oninit"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which event fires on mouse click?", "options": ["onpress", "onclick", "onmouse", "ontouch"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which event fires on mouse hover?", "options": ["onhover", "onmouseover", "onmouseenter", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which event fires when mouse leaves?", "options": ["onleave", "onmouseout", "onmouseleave", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which event fires on key press?", "options": ["onkey", "onkeypress", "onkeydown", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which event fires on form submit?", "options": ["onsubmit", "onsend", "onpost", "onform"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which event fires on input change?", "options": ["onchange", "oninput", "onmodify", "Both A and B"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which event fires on input focus?", "options": ["onfocus", "onselect", "onactive", "onclick"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which event fires when input loses focus?", "options": ["onblur", "onunfocus", "onleave", "onlost"], "correct": "A", "subject": "Web Design"},
-    {"question": "How do you create an array?", "options": ["var arr = ()", "var arr = []", "var arr = {}", "var arr = <>"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you access first array element?", "options": ["arr[1]", "arr[0]", "arr.first", "arr.start"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method adds element to array end?", "options": ["add()", "push()", "append()", "insert()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method removes last array element?", "options": ["remove()", "pop()", "delete()", "cut()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method removes first array element?", "options": ["shift()", "unshift()", "remove()", "delete()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method adds element to array start?", "options": ["shift()", "unshift()", "prepend()", "insert()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property returns array length?", "options": ["size", "length", "count", "total"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you create an object?", "options": ["var obj = ()", "var obj = []", "var obj = {}", "var obj = <>"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you access object property?", "options": ["obj.property or obj['property']", "obj->property", "obj::property", "obj.get(property)"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which loop iterates a specific number of times?", "options": ["for", "while", "do-while", "foreach"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which loop checks condition at start?", "options": ["for", "while", "do-while", "Both A and B"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which loop checks condition at end?", "options": ["for", "while", "do-while", "foreach"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which statement exits a loop?", "options": ["exit", "break", "stop", "end"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which statement skips current iteration?", "options": ["skip", "continue", "next", "pass"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which statement returns value from function?", "options": ["give", "return", "output", "send"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method converts string to number?", "options": ["toNumber()", "parseInt()", "Number()", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which method converts number to string?", "options": ["toString()", "String()", "toText()", "Both A and B"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which method finds substring position?", "options": ["find()", "search()", "indexOf()", "position()"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which method extracts part of string?", "options": ["cut()", "substring()", "slice()", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which method converts string to uppercase?", "options": ["toUpper()", "toUpperCase()", "upper()", "uppercase()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method converts string to lowercase?", "options": ["toLower()", "toLowerCase()", "lower()", "lowercase()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method replaces text in string?", "options": ["change()", "replace()", "swap()", "modify()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method splits string into array?", "options": ["divide()", "split()", "separate()", "break()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method joins array into string?", "options": ["merge()", "join()", "combine()", "connect()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method removes whitespace from ends?", "options": ["strip()", "trim()", "clean()", "remove()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which object represents the browser window?", "options": ["document", "window", "browser", "screen"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which object represents the HTML document?", "options": ["document", "window", "html", "page"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method changes CSS style?", "options": ["element.style.property", "element.css.property", "element.design.property", "element.look.property"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method adds CSS class?", "options": ["addClass()", "classList.add()", "class.add()", "addClassName()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method removes CSS class?", "options": ["removeClass()", "classList.remove()", "class.remove()", "removeClassName()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method toggles CSS class?", "options": ["toggleClass()", "classList.toggle()", "class.toggle()", "switchClass()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method creates new element?", "options": ["document.create()", "document.createElement()", "document.newElement()", "document.makeElement()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method appends child element?", "options": ["addChild()", "appendChild()", "insertChild()", "attachChild()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method removes element?", "options": ["delete()", "remove()", "removeChild()", "Both B and C"], "correct": "D", "subject": "Web Design"},
-    {"question": "Which method sets element attribute?", "options": ["setAttr()", "setAttribute()", "addAttribute()", "attr()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method gets element attribute?", "options": ["getAttr()", "getAttribute()", "readAttribute()", "attr()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method removes element attribute?", "options": ["deleteAttr()", "removeAttribute()", "clearAttribute()", "unsetAttr()"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is JSON?", "options": ["JavaScript Object Notation", "Java Syntax Object Notation", "JavaScript Online Notation", "Java Standard Object Notation"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method converts JSON string to object?", "options": ["JSON.parse()", "JSON.stringify()", "JSON.toObject()", "JSON.convert()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method converts object to JSON string?", "options": ["JSON.parse()", "JSON.stringify()", "JSON.toString()", "JSON.convert()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method executes function after delay?", "options": ["delay()", "setTimeout()", "wait()", "pause()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method executes function repeatedly?", "options": ["repeat()", "setInterval()", "loop()", "cycle()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method stops setInterval?", "options": ["stopInterval()", "clearInterval()", "cancelInterval()", "endInterval()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method stops setTimeout?", "options": ["stopTimeout()", "clearTimeout()", "cancelTimeout()", "endTimeout()"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the typeof null?", "options": ["null", "undefined", "object", "none"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is NaN?", "options": ["Not a Null", "Not a Number", "Null and None", "Number and Null"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which value represents no value?", "options": ["null", "undefined", "0", "Both A and B"], "correct": "D", "subject": "Web Design"},
-    {"question": "What does 'use strict' do?", "options": ["Enables strict mode", "Disables errors", "Speeds up code", "Compresses code"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which keyword creates a class?", "options": ["object", "class", "struct", "type"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which keyword creates an instance?", "options": ["create", "new", "instance", "make"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a callback function?", "options": ["Function passed as argument", "Function that calls itself", "Function with no parameters", "Function that returns nothing"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is a Promise?", "options": ["Guaranteed variable", "Async operation result", "Error handler", "Loop control"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which keyword handles async operations?", "options": ["sync", "async", "wait", "promise"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which keyword waits for Promise?", "options": ["wait", "await", "pause", "hold"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method handles Promise success?", "options": [".success()", ".then()", ".done()", ".complete()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method handles Promise error?", "options": [".error()", ".catch()", ".fail()", ".reject()"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is arrow function syntax?", "options": ["function => {}", "() => {}", "-> () {}", "=> function()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method iterates over array?", "options": ["each()", "forEach()", "loop()", "iterate()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method transforms array elements?", "options": ["transform()", "map()", "change()", "modify()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method filters array elements?", "options": ["filter()", "select()", "find()", "search()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method reduces array to single value?", "options": ["reduce()", "sum()", "combine()", "merge()"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which method finds element in array?", "options": ["search()", "find()", "locate()", "get()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method checks if all elements pass test?", "options": ["all()", "every()", "each()", "check()"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which method checks if any element passes test?", "options": ["any()", "some()", "one()", "check()"], "correct": "B", "subject": "Web Design"},
-
-    # ========== RESPONSIVE DESIGN (281-350) ==========
-    {"question": "What is responsive web design?", "options": ["Fast loading websites", "Websites that adapt to screen size", "Interactive websites", "Secure websites"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which meta tag enables responsive design?", "options": ["<meta charset>", "<meta viewport>", "<meta responsive>", "<meta mobile>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does viewport meta tag control?", "options": ["Page title", "Page width and scaling", "Page color", "Page speed"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS feature enables responsive design?", "options": ["@media queries", "@responsive", "@mobile", "@screen"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is a breakpoint?", "options": ["Error point", "Screen width where design changes", "Page load time", "Maximum file size"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which approach designs for mobile first?", "options": ["Desktop-first", "Mobile-first", "Tablet-first", "Print-first"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is mobile-first design?", "options": ["Design for mobile then scale up", "Design for desktop then scale down", "Design only for mobile", "Ignore mobile devices"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which unit is best for responsive font sizes?", "options": ["px", "rem", "cm", "pt"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which unit makes images responsive?", "options": ["px", "%", "cm", "pt"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which CSS property makes images scale?", "options": ["max-width: 100%", "width: auto", "size: responsive", "scale: fit"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which layout system is best for responsive design?", "options": ["Tables", "Floats", "Flexbox/Grid", "Frames"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is a fluid layout?", "options": ["Fixed width layout", "Layout using percentages", "Animated layout", "3D layout"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a fixed layout?", "options": ["Layout using pixels", "Layout using percentages", "Layout using em", "Layout using rem"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which is NOT a common breakpoint?", "options": ["320px", "768px", "1024px", "999px"], "correct": "D", "subject": "Web Design"},
-    {"question": "What does min-width in media query mean?", "options": ["Maximum screen width", "Minimum screen width", "Fixed screen width", "Average screen width"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does max-width in media query mean?", "options": ["Maximum screen width", "Minimum screen width", "Fixed screen width", "Average screen width"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which media type targets screens?", "options": ["print", "screen", "speech", "all"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which media type targets printers?", "options": ["print", "screen", "paper", "document"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is a hamburger menu?", "options": ["Food ordering interface", "Three-line mobile menu icon", "Footer navigation", "Sidebar menu"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a responsive image?", "options": ["Animated image", "Image that adapts to container", "High resolution image", "Compressed image"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which HTML element provides responsive images?", "options": ["<img>", "<picture>", "<responsive>", "<image>"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is srcset attribute used for?", "options": ["Setting image source", "Providing multiple image sources", "Image styling", "Image animation"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is CSS framework?", "options": ["Browser extension", "Pre-written CSS code", "Image editor", "Code compiler"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which is a popular CSS framework?", "options": ["Bootstrap", "React", "Node.js", "Python"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is Bootstrap?", "options": ["JavaScript library", "CSS framework", "Database system", "Server software"], "correct": "B", "subject": "Web Design"},
-    {"question": "How many columns does Bootstrap grid have?", "options": ["10", "12", "16", "24"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which Bootstrap class creates a container?", "options": [".box", ".container", ".wrapper", ".holder"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which Bootstrap class creates a row?", "options": [".line", ".row", ".horizontal", ".flex"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which Bootstrap prefix is for small devices?", "options": ["xs", "sm", "md", "lg"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which Bootstrap prefix is for medium devices?", "options": ["xs", "sm", "md", "lg"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which Bootstrap prefix is for large devices?", "options": ["xs", "sm", "md", "lg"], "correct": "D", "subject": "Web Design"},
-    {"question": "What is Tailwind CSS?", "options": ["JavaScript framework", "Utility-first CSS framework", "Database", "Server"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the difference between Bootstrap and Tailwind?", "options": ["Bootstrap is component-based, Tailwind is utility-based", "They are the same", "Bootstrap is newer", "Tailwind is a JavaScript framework"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is CSS Grid?", "options": ["Table layout", "Two-dimensional layout system", "Font system", "Color system"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is Flexbox?", "options": ["Table layout", "One-dimensional layout system", "Font system", "Animation system"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which is better for complex layouts?", "options": ["Tables", "Floats", "CSS Grid", "Inline-block"], "correct": "C", "subject": "Web Design"},
-    {"question": "What does fr unit represent in Grid?", "options": ["Frame", "Fraction of available space", "Frequency", "Front"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property defines grid areas?", "options": ["grid-area", "grid-template-areas", "grid-zone", "grid-section"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is auto-fit in CSS Grid?", "options": ["Automatic sizing", "Creates columns to fit container", "Error correction", "Speed optimization"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is auto-fill in CSS Grid?", "options": ["Automatic content", "Fills row with as many columns as possible", "Background fill", "Form autofill"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property centers items in Flexbox?", "options": ["center-items", "justify-content: center", "align: center", "middle: true"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a sticky header?", "options": ["Header with adhesive", "Header that stays visible on scroll", "Slow loading header", "Animated header"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which position value creates sticky element?", "options": ["fixed", "sticky", "absolute", "relative"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is lazy loading?", "options": ["Slow website", "Loading content as needed", "Error handling", "Caching"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which attribute enables lazy loading for images?", "options": ["lazy", "loading='lazy'", "defer", "async"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is progressive enhancement?", "options": ["Building basic first, adding features", "Building complex first, simplifying", "Speed optimization", "Security feature"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is graceful degradation?", "options": ["Building basic first", "Building complex first, ensuring basic works", "Speed reduction", "Error handling"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which approach is recommended for modern web?", "options": ["Progressive enhancement", "Graceful degradation", "Both are equally used", "Neither is recommended"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is viewport width?", "options": ["Browser window width", "Monitor physical width", "Page content width", "Text column width"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is viewport height?", "options": ["Browser window height", "Monitor physical height", "Page content height", "Text block height"], "correct": "A", "subject": "Web Design"},
-    {"question": "Which CSS function calculates values?", "options": ["calc()", "compute()", "math()", "calculate()"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is clamp() function used for?", "options": ["Locking elements", "Setting min, preferred, max values", "Animation control", "Color mixing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is min() function used for?", "options": ["Finding minimum of values", "Setting minimum width", "Both A and B", "None of the above"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is max() function used for?", "options": ["Finding maximum of values", "Setting maximum width", "Both A and B", "None of the above"], "correct": "C", "subject": "Web Design"},
-    {"question": "What are CSS custom properties?", "options": ["Browser properties", "CSS variables", "HTML attributes", "JavaScript variables"], "correct": "B", "subject": "Web Design"},
-    {"question": "How do you define a CSS variable?", "options": ["$variable", "@variable", "--variable", "var-variable"], "correct": "C", "subject": "Web Design"},
-    {"question": "How do you use a CSS variable?", "options": ["$variable", "var(--variable)", "@variable", "use(variable)"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is aspect-ratio property?", "options": ["Image quality", "Width to height ratio", "Font ratio", "Color ratio"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which property controls object fit?", "options": ["object-fit", "image-fit", "content-fit", "box-fit"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does object-fit: cover do?", "options": ["Shows full image", "Fills container, may crop", "Stretches image", "Tiles image"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does object-fit: contain do?", "options": ["Shows full image within container", "Fills container, may crop", "Stretches image", "Tiles image"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is container query?", "options": ["Database query", "Styles based on container size", "JavaScript query", "Server query"], "correct": "B", "subject": "Web Design"},
-    {"question": "Which is newer: media queries or container queries?", "options": ["Media queries", "Container queries", "Both introduced same time", "Neither exists"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is intrinsic sizing?", "options": ["Fixed sizing", "Sizing based on content", "Percentage sizing", "Viewport sizing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does min-content mean?", "options": ["Minimum container size", "Smallest size without overflow", "Zero size", "Auto size"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does max-content mean?", "options": ["Maximum container size", "Size of content without wrapping", "100% width", "Screen width"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does fit-content mean?", "options": ["Uses available space up to max-content", "Always maximum size", "Always minimum size", "Fixed size"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is a responsive table?", "options": ["Table with animations", "Table that adapts to screen size", "Table with colors", "Table with borders"], "correct": "B", "subject": "Web Design"},
-    {"question": "How to make tables responsive?", "options": ["Horizontal scroll", "Stack columns", "Hide columns", "All of the above"], "correct": "D", "subject": "Web Design"},
-
-    # ========== UI/UX DESIGN (351-420) ==========
-    {"question": "What does UI stand for?", "options": ["User Interface", "Universal Integration", "Unique Interaction", "User Integration"], "correct": "A", "subject": "Web Design"},
-    {"question": "What does UX stand for?", "options": ["User Experience", "Universal Exchange", "Unique Experience", "User Extension"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the difference between UI and UX?", "options": ["UI is visual, UX is overall experience", "They are the same", "UX is visual, UI is experience", "No difference"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is a wireframe?", "options": ["Metal frame", "Basic layout sketch", "Final design", "Animated prototype"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a mockup?", "options": ["Basic sketch", "High-fidelity static design", "Functional prototype", "Finished website"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a prototype?", "options": ["Basic sketch", "Static design", "Interactive model of design", "Final product"], "correct": "C", "subject": "Web Design"},
-    {"question": "Which comes first in design process?", "options": ["Mockup", "Prototype", "Wireframe", "Development"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is user persona?", "options": ["Login credential", "Fictional user representation", "User account", "Profile picture"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is user journey?", "options": ["User's physical travel", "User's path through website", "User registration", "User logout"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is information architecture?", "options": ["Building design", "Content organization and structure", "Server architecture", "Database design"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is visual hierarchy?", "options": ["Folder structure", "Arrangement showing importance", "Color palette", "Font list"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is whitespace in design?", "options": ["White color only", "Empty space in design", "Blank pages", "Error pages"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is the purpose of whitespace?", "options": ["Waste space", "Improve readability and focus", "Fill unused area", "Reduce content"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a call-to-action (CTA)?", "options": ["Phone number", "Element prompting user action", "Contact form", "About page"], "correct": "B", "subject": "Web Design"},
-    {"question": "What makes a good CTA?", "options": ["Small and hidden", "Clear, visible, and action-oriented", "Complex wording", "Multiple options"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is above the fold?", "options": ["Top of page", "Content visible without scrolling", "Header only", "Navigation only"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is below the fold?", "options": ["Footer", "Content requiring scroll to see", "Hidden content", "Deleted content"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is F-pattern?", "options": ["Font pattern", "How users scan web pages", "Form pattern", "Footer pattern"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is Z-pattern?", "options": ["Zigzag design", "How users scan landing pages", "Zoom pattern", "Zone pattern"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is color psychology?", "options": ["Color mixing", "How colors affect emotions/behavior", "Color blindness", "Color correction"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does blue color typically represent?", "options": ["Danger", "Trust and professionalism", "Warning", "Excitement"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does red color typically represent?", "options": ["Calm", "Trust", "Urgency and excitement", "Nature"], "correct": "C", "subject": "Web Design"},
-    {"question": "What does green color typically represent?", "options": ["Danger", "Warning", "Growth and nature", "Luxury"], "correct": "C", "subject": "Web Design"},
-    {"question": "What is a color palette?", "options": ["Painting tool", "Set of colors used in design", "Color wheel", "Paint brush"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is typography?", "options": ["Typing speed", "Art of arranging text", "Keyboard layout", "Text editor"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is font pairing?", "options": ["Using two fonts together", "Font installation", "Font creation", "Font deletion"], "correct": "A", "subject": "Web Design"},
-    {"question": "How many fonts should typically be used?", "options": ["1", "2-3", "5-6", "As many as possible"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is line height?", "options": ["Font size", "Space between lines of text", "Text width", "Paragraph width"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is kerning?", "options": ["Line spacing", "Space between individual characters", "Paragraph spacing", "Word spacing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is leading?", "options": ["First line", "Space between lines", "Last line", "Header line"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is accessibility in web design?", "options": ["Easy access to files", "Design usable by everyone", "Fast loading", "Secure access"], "correct": "B", "subject": "Web Design"},
-    {"question": "What does WCAG stand for?", "options": ["Web Content Accessibility Guidelines", "World Computer Access Group", "Web Color And Graphics", "Website Coding And Guidelines"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is alt text used for?", "options": ["Alternative website", "Image description for accessibility", "Alternative font", "Backup text"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is color contrast?", "options": ["Color mixing", "Difference between colors for readability", "Color intensity", "Color brightness"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is ARIA?", "options": ["Animation system", "Accessible Rich Internet Applications", "Audio system", "Archive format"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is focus state?", "options": ["Zoom level", "Visual indication of selected element", "Loading state", "Error state"], "correct": "B", "subject": "Web Design"},
-    {"question": "Why is focus state important?", "options": ["Looks nice", "Keyboard navigation accessibility", "Faster loading", "Security"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a tooltip?", "options": ["Tool icon", "Small info popup on hover", "Toolbar", "Toolbox"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a modal?", "options": ["Fashion style", "Popup overlay requiring action", "Footer section", "Header section"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a breadcrumb?", "options": ["Food item", "Navigation showing page hierarchy", "Footer link", "Social icon"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a card in web design?", "options": ["Playing card", "Contained content block", "Credit card form", "ID verification"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a carousel?", "options": ["Amusement ride", "Rotating content slideshow", "Loading animation", "Navigation menu"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a hero section?", "options": ["About page", "Large banner at top of page", "Footer", "Sidebar"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a landing page?", "options": ["Any page", "Page designed for specific conversion", "Home page only", "Error page"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is conversion rate?", "options": ["Loading speed", "Percentage of visitors who take action", "Page views", "Bounce rate"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is bounce rate?", "options": ["Animation rate", "Percentage leaving without interaction", "Click rate", "Scroll rate"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is A/B testing?", "options": ["Alphabet testing", "Comparing two versions of design", "Error testing", "Speed testing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is usability testing?", "options": ["Speed testing", "Testing with real users", "Security testing", "Code testing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is heuristic evaluation?", "options": ["Math evaluation", "Expert review using usability principles", "User testing", "Automated testing"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is affordance in design?", "options": ["Price", "Visual cue suggesting how to use element", "Availability", "Discount"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is Fitts's Law?", "options": ["Color theory", "Larger, closer targets are easier to click", "Typography rule", "Animation principle"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is cognitive load?", "options": ["Page weight", "Mental effort required to use interface", "Server load", "Network load"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is progressive disclosure?", "options": ["Showing all at once", "Revealing information gradually", "Hiding everything", "Random display"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is skeuomorphism?", "options": ["Flat design", "Design mimicking real-world objects", "Minimalist design", "Abstract design"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is flat design?", "options": ["3D design", "Minimalist design without realistic textures", "Textured design", "Animated design"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is material design?", "options": ["Physical materials", "Google's design language", "Adobe's design system", "Microsoft's design system"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a design system?", "options": ["Software", "Collection of reusable components and guidelines", "Single design", "Design tool"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a style guide?", "options": ["Fashion magazine", "Document defining design standards", "Tutorial", "Template"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a component library?", "options": ["Book collection", "Reusable UI element collection", "Image gallery", "Font library"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is atomic design?", "options": ["Nuclear physics", "Design methodology using smallest elements", "Explosive design", "Complex design"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is microinteraction?", "options": ["Small website", "Small animations responding to user action", "Tiny text", "Small images"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is onboarding?", "options": ["Boarding pass", "Introducing new users to product", "Checkout process", "Login process"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is dark mode?", "options": ["Hidden mode", "Interface with dark color scheme", "Night time", "Error state"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is responsive typography?", "options": ["Animated text", "Typography that adapts to screen size", "Colorful text", "3D text"], "correct": "B", "subject": "Web Design"},
-    {"question": "What is a favicon?", "options": ["Favorite icon in browser tab", "Large image", "Background image", "Profile picture"], "correct": "A", "subject": "Web Design"},
-    {"question": "What is the purpose of a 404 page?", "options": ["Homepage", "Show page not found error", "Contact page", "Login page"], "correct": "B", "subject": "Web Design"},
-    {"question": "What makes a good 404 page?", "options": ["Blank page", "Helpful message and navigation options", "Just error code", "Complex design"], "correct": "B", "subject": "Web Design"},
-    # Basic Computer Concepts (1-100)
-    {"question": "What does CPU stand for?", "options": ["Central Processing Unit", "Central Program Unit", "Computer Processing Unit", "Central Processor Utility"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which of the following is an input device?", "options": ["Monitor", "Printer", "Keyboard", "Speaker"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the brain of the computer?", "options": ["RAM", "CPU", "Hard Disk", "Monitor"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is volatile?", "options": ["ROM", "RAM", "Hard Disk", "CD-ROM"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does RAM stand for?", "options": ["Random Access Memory", "Read Access Memory", "Ready Application Module", "Remote Access Machine"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not an operating system?", "options": ["Windows", "Linux", "Oracle", "DOS"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "1 KB is equal to how many bytes?", "options": ["1000", "1024", "1048", "1000000"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which device is used to connect a computer to the internet?", "options": ["Modem", "CD Drive", "Mouse", "RAM"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What type of software is MS Word?", "options": ["System Software", "Application Software", "Firmware", "Malware"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which key is used to delete characters to the left of cursor?", "options": ["Delete", "Backspace", "Escape", "Shift"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What does BIOS stand for?", "options": ["Basic Input Output System", "Binary Input Output System", "Basic Internal Operating System", "Binary Internal Operating System"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the fastest memory?", "options": ["Hard Disk", "RAM", "Cache Memory", "ROM"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the extension of executable files?", "options": [".txt", ".doc", ".exe", ".pdf"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Which port is used to connect a mouse?", "options": ["Serial Port", "Parallel Port", "PS/2 or USB Port", "Network Port"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What does GUI stand for?", "options": ["Graphical User Interface", "General User Interface", "Graphical Utility Interface", "General Utility Interface"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a programming language?", "options": ["Java", "C++", "HTML", "Python"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the shortcut key for copy?", "options": ["Ctrl+C", "Ctrl+V", "Ctrl+X", "Ctrl+Z"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device is used for scanning documents?", "options": ["Printer", "Scanner", "Monitor", "Speaker"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does HTTP stand for?", "options": ["Hyper Text Transfer Protocol", "High Text Transfer Protocol", "Hyper Transfer Text Protocol", "Home Text Transfer Protocol"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is primary memory?", "options": ["Hard Disk", "RAM", "CD-ROM", "Pen Drive"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is the full form of PDF?", "options": ["Portable Document Format", "Personal Document Format", "Portable Data File", "Personal Data File"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is an output device?", "options": ["Keyboard", "Mouse", "Scanner", "Printer"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "1 MB is equal to how many KB?", "options": ["1000", "1024", "1048", "1000000"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the shortcut key for paste?", "options": ["Ctrl+C", "Ctrl+V", "Ctrl+X", "Ctrl+Z"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a type of computer?", "options": ["Mainframe", "Mini", "Laptop", "Algorithm"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does ALU stand for?", "options": ["Arithmetic Logic Unit", "Array Logic Unit", "Application Logic Unit", "Automatic Logic Unit"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the first page of a website?", "options": ["Home page", "Index page", "Main page", "First page"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is the binary equivalent of decimal 10?", "options": ["1010", "1100", "1001", "1111"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device is used to display output?", "options": ["Keyboard", "Monitor", "Mouse", "CPU"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does USB stand for?", "options": ["Universal Serial Bus", "Universal System Bus", "Unified Serial Bus", "Unified System Bus"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is not a web browser?", "options": ["Chrome", "Firefox", "Safari", "Windows"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is the function of Control Unit?", "options": ["Perform arithmetic operations", "Control computer operations", "Store data", "Display output"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which key is used to refresh a webpage?", "options": ["F1", "F5", "F12", "F10"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What type of software is Windows?", "options": ["Application Software", "System Software", "Utility Software", "Programming Software"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is the smallest unit of data?", "options": ["Bit", "Byte", "Kilobyte", "Megabyte"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What does LAN stand for?", "options": ["Local Area Network", "Large Area Network", "Line Area Network", "Linear Area Network"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a storage device?", "options": ["Hard Disk", "CD", "Keyboard", "Pen Drive"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the extension of Word documents?", "options": [".docx", ".xlsx", ".pptx", ".txt"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which generation of computers used transistors?", "options": ["First", "Second", "Third", "Fourth"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does ROM stand for?", "options": ["Read Only Memory", "Random Only Memory", "Read Operating Memory", "Random Operating Memory"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is the fastest type of computer?", "options": ["Laptop", "Desktop", "Supercomputer", "Tablet"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the shortcut key for undo?", "options": ["Ctrl+Z", "Ctrl+Y", "Ctrl+A", "Ctrl+S"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which protocol is used for email?", "options": ["HTTP", "FTP", "SMTP", "TCP"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What does WWW stand for?", "options": ["World Wide Web", "World Wide Word", "Web Wide World", "World Web Wide"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a type of printer?", "options": ["Laser", "Inkjet", "Dot Matrix", "Keyboard"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "1 GB is equal to how many MB?", "options": ["1000", "1024", "1048", "1000000"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the function of an operating system?", "options": ["Manage hardware and software", "Create documents", "Browse internet", "Play games"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is an example of firmware?", "options": ["MS Word", "BIOS", "Chrome", "Windows"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does ISP stand for?", "options": ["Internet Service Provider", "Internal Service Provider", "Internet System Protocol", "Internal System Protocol"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device converts digital signals to analog?", "options": ["Router", "Modem", "Switch", "Hub"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is a byte made up of?", "options": ["4 bits", "8 bits", "16 bits", "32 bits"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which company developed Windows operating system?", "options": ["Apple", "Microsoft", "Google", "IBM"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does VDU stand for?", "options": ["Visual Display Unit", "Video Display Unit", "Virtual Display Unit", "Visual Data Unit"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not antivirus software?", "options": ["Norton", "McAfee", "Avast", "Photoshop"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is the decimal equivalent of binary 1111?", "options": ["12", "13", "14", "15"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "Which key combination is used to close a window?", "options": ["Alt+F4", "Ctrl+F4", "Shift+F4", "Del+F4"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is the main circuit board of a computer called?", "options": ["Motherboard", "Fatherboard", "Daughter board", "Circuit board"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a type of network?", "options": ["LAN", "WAN", "MAN", "PAN"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does CD-ROM stand for?", "options": ["Compact Disk Read Only Memory", "Computer Disk Read Only Memory", "Compact Data Read Only Memory", "Computer Data Read Only Memory"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device is both input and output?", "options": ["Monitor", "Printer", "Modem", "Scanner"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is the extension of Excel files?", "options": [".docx", ".xlsx", ".pptx", ".txt"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a computer language?", "options": ["BASIC", "COBOL", "FORTRAN", "MICROSOFT"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does DOS stand for?", "options": ["Disk Operating System", "Digital Operating System", "Data Operating System", "Dual Operating System"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which generation computers used Integrated Circuits?", "options": ["First", "Second", "Third", "Fourth"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the shortcut key for Select All?", "options": ["Ctrl+A", "Ctrl+S", "Ctrl+C", "Ctrl+V"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the largest unit of data?", "options": ["GB", "TB", "PB", "EB"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does HTTPS stand for?", "options": ["Hyper Text Transfer Protocol Secure", "High Text Transfer Protocol Secure", "Hyper Text Transfer Program Secure", "High Text Transfer Program Secure"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which company developed the first microprocessor?", "options": ["IBM", "Intel", "Microsoft", "Apple"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the full form of JPEG?", "options": ["Joint Photographic Expert Group", "Joint Picture Expert Group", "Joint Photographic Electronic Group", "Joint Picture Electronic Group"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which key is used to enter Safe Mode in Windows?", "options": ["F2", "F8", "F10", "F12"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is phishing?", "options": ["A type of virus", "Internet fraud technique", "Hardware problem", "Software bug"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a search engine?", "options": ["Google", "Yahoo", "Bing", "Firefox"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does WiFi stand for?", "options": ["Wireless Fidelity", "Wired Fidelity", "Wireless Fiber", "Wired Fiber"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the default port for HTTP?", "options": ["21", "80", "443", "25"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the purpose of a firewall?", "options": ["Speed up internet", "Protect from unauthorized access", "Store data", "Display graphics"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a social media platform?", "options": ["Facebook", "Twitter", "Instagram", "Mozilla"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does URL stand for?", "options": ["Uniform Resource Locator", "Universal Resource Locator", "Uniform Resource Link", "Universal Resource Link"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which file format is used for videos?", "options": [".doc", ".jpg", ".mp4", ".exe"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is malware?", "options": ["Good software", "Malicious software", "Hardware", "Operating system"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a type of malware?", "options": ["Virus", "Worm", "Trojan", "Firewall"], "correct": "D", "subject": "Computer Fundamentals"},
-    
-    {"question": "What does FTP stand for?", "options": ["File Transfer Protocol", "Fast Transfer Protocol", "File Transport Protocol", "Fast Transport Protocol"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the extension of PowerPoint files?", "options": [".docx", ".xlsx", ".pptx", ".txt"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is spam?", "options": ["Wanted email", "Unwanted email", "Important email", "Deleted email"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a cloud storage service?", "options": ["Google Drive", "Dropbox", "OneDrive", "Windows"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does HTML stand for?", "options": ["Hyper Text Markup Language", "High Text Markup Language", "Hyper Text Machine Language", "High Text Machine Language"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is a programming language?", "options": ["Windows", "Linux", "Python", "Chrome"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the purpose of DNS?", "options": ["Convert domain names to IP addresses", "Store files", "Send emails", "Browse websites"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not an image file format?", "options": [".jpg", ".png", ".gif", ".exe"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does VPN stand for?", "options": ["Virtual Private Network", "Virtual Public Network", "Virtual Private Node", "Virtual Public Node"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which key combination is used to open Task Manager?", "options": ["Ctrl+Alt+Del", "Ctrl+Shift+Esc", "Alt+Tab", "Both A and B"], "correct": "D", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is booting?", "options": ["Shutting down computer", "Starting computer", "Restarting computer", "Installing software"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a type of boot?", "options": ["Cold boot", "Warm boot", "Hot boot", "Soft boot"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is a cookie?", "options": ["Small data file", "Virus", "Hardware", "Software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which protocol is used for secure web pages?", "options": ["HTTP", "HTTPS", "FTP", "SMTP"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the full form of MPEG?", "options": ["Moving Picture Expert Group", "Motion Picture Expert Group", "Moving Photo Expert Group", "Motion Photo Expert Group"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a video conferencing application?", "options": ["Zoom", "Skype", "Teams", "Notepad"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does CSS stand for?", "options": ["Cascading Style Sheets", "Computer Style Sheets", "Creative Style Sheets", "Colorful Style Sheets"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the default web browser in Windows 10?", "options": ["Internet Explorer", "Chrome", "Edge", "Firefox"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is bandwidth?", "options": ["Data transfer capacity", "Storage capacity", "Processing speed", "Memory size"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a computer port?", "options": ["USB", "HDMI", "VGA", "PDF"], "correct": "D", "subject": "Computer Fundamentals"},
-    
-    # Memory & Storage (101-150)
-    {"question": "What is cache memory?", "options": ["Temporary high-speed memory", "Permanent storage", "Input device", "Output device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which has the largest storage capacity?", "options": ["CD", "DVD", "Blu-ray", "Floppy disk"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is virtual memory?", "options": ["Physical RAM", "Hard disk space used as RAM", "ROM", "Cache"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is non-volatile memory?", "options": ["RAM", "Cache", "ROM", "Register"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the capacity of a standard DVD?", "options": ["700 MB", "4.7 GB", "25 GB", "50 GB"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is faster - HDD or SSD?", "options": ["HDD", "SSD", "Both same", "Depends on brand"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What does SSD stand for?", "options": ["Solid State Drive", "Super Speed Drive", "System State Drive", "Solid Speed Drive"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is closest to CPU?", "options": ["RAM", "Cache", "Hard disk", "ROM"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the capacity of a standard CD?", "options": ["650 MB", "700 MB", "4.7 GB", "Both A and B"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a type of RAM?", "options": ["DRAM", "SRAM", "PROM", "DDR"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is EEPROM?", "options": ["Electrically Erasable Programmable ROM", "Electronic Erasable Programmable ROM", "Electrically Enhanced Programmable ROM", "Electronic Enhanced Programmable ROM"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "1 TB is equal to how many GB?", "options": ["1000", "1024", "1048", "2048"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which memory loses data when power is off?", "options": ["ROM", "PROM", "RAM", "EPROM"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the smallest unit of storage?", "options": ["Bit", "Byte", "Nibble", "Word"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is optical storage?", "options": ["Hard disk", "Pen drive", "CD", "RAM"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What does HDD stand for?", "options": ["Hard Disk Drive", "High Density Drive", "Hard Data Drive", "High Disk Drive"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is portable storage?", "options": ["Hard disk", "RAM", "Pen drive", "ROM"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the capacity of Blu-ray disc?", "options": ["4.7 GB", "8.5 GB", "25 GB", "50 GB"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is programmable?", "options": ["ROM", "PROM", "RAM", "Cache"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is flash memory?", "options": ["Volatile memory", "Non-volatile memory", "Cache memory", "Virtual memory"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which has the fastest access time?", "options": ["Hard disk", "SSD", "Cache", "DVD"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is DDR RAM?", "options": ["Double Data Rate RAM", "Dual Data Rate RAM", "Direct Data Rate RAM", "Digital Data Rate RAM"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is magnetic storage?", "options": ["CD", "DVD", "Hard disk", "SSD"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is buffer memory?", "options": ["Temporary storage area", "Permanent storage", "Input device", "Output device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "1 PB is equal to how many TB?", "options": ["1000", "1024", "2048", "4096"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is the oldest storage device?", "options": ["Hard disk", "CD", "Floppy disk", "DVD"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is RAID?", "options": ["Redundant Array of Independent Disks", "Random Array of Independent Disks", "Redundant Access of Independent Disks", "Random Access of Independent Disks"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is used in BIOS?", "options": ["RAM", "ROM", "Cache", "Virtual"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the capacity of a double layer DVD?", "options": ["4.7 GB", "8.5 GB", "9.4 GB", "17 GB"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is semiconductor memory?", "options": ["Hard disk", "CD", "RAM", "Magnetic tape"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    {"question": "What does NAS stand for?", "options": ["Network Attached Storage", "Network Area Storage", "Node Attached Storage", "Node Area Storage"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which has longer lifespan - HDD or SSD?", "options": ["HDD", "SSD", "Both same", "Cannot determine"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is memory hierarchy?", "options": ["Organization of memory types", "Memory size", "Memory speed", "Memory cost"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is erasable by UV light?", "options": ["PROM", "EPROM", "EEPROM", "RAM"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the access time of cache memory?", "options": ["Nanoseconds", "Microseconds", "Milliseconds", "Seconds"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a level of cache?", "options": ["L1 cache", "L2 cache", "L3 cache", "L4 cache"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is register in CPU?", "options": ["Smallest and fastest memory", "Largest memory", "Slowest memory", "Permanent memory"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which storage is used for backup?", "options": ["RAM", "Cache", "External hard disk", "ROM"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is memory address?", "options": ["Location of data", "Size of memory", "Type of memory", "Speed of memory"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which has lowest cost per GB?", "options": ["SSD", "HDD", "Pen drive", "SD card"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is SDRAM?", "options": ["Synchronous Dynamic RAM", "Static Dynamic RAM", "Super Dynamic RAM", "System Dynamic RAM"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is used for multimedia?", "options": ["Text memory", "Video RAM", "Audio memory", "Image memory"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the full form of DIMM?", "options": ["Dual Inline Memory Module", "Direct Inline Memory Module", "Digital Inline Memory Module", "Dynamic Inline Memory Module"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is volatile - SRAM or DRAM?", "options": ["Only SRAM", "Only DRAM", "Both", "Neither"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is memory leak?", "options": ["Memory not properly released", "Memory overflow", "Memory shortage", "Memory damage"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is refreshed periodically?", "options": ["SRAM", "DRAM", "ROM", "Cache"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is memory bandwidth?", "options": ["Data transfer rate", "Memory size", "Memory type", "Memory cost"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is primary storage?", "options": ["Hard disk", "RAM and ROM", "CD", "Pen drive"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is memory latency?", "options": ["Access delay time", "Storage capacity", "Transfer speed", "Memory type"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which memory is inside CPU?", "options": ["RAM", "ROM", "Cache and Registers", "Hard disk"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    # Input & Output Devices (151-200)
-    {"question": "Which is a pointing device?", "options": ["Keyboard", "Mouse", "Printer", "Monitor"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a joystick used for?", "options": ["Typing", "Gaming", "Printing", "Scanning"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which device is used for voice input?", "options": ["Speaker", "Microphone", "Headphone", "Monitor"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a trackball?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is a biometric device?", "options": ["Keyboard", "Fingerprint scanner", "Mouse", "Monitor"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a light pen?", "options": ["Writing pen", "Pointing device", "Lighting device", "Drawing device"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which printer is fastest?", "options": ["Dot matrix", "Inkjet", "Laser", "Thermal"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is a plotter used for?", "options": ["Large drawings", "Text printing", "Photo printing", "3D printing"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not an input device?", "options": ["Scanner", "Webcam", "Projector", "Digitizer"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is a touchpad?", "options": ["Pointing device", "Display device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which device captures images?", "options": ["Printer", "Scanner", "Monitor", "Speaker"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is DPI in printer?", "options": ["Dots Per Inch", "Data Per Inch", "Digital Per Inch", "Display Per Inch"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is a softcopy output device?", "options": ["Printer", "Monitor", "Plotter", "Speaker"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a barcode reader?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device produces hardcopy?", "options": ["Monitor", "Printer", "Screen", "Projector"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is OCR?", "options": ["Optical Character Recognition", "Optical Code Reader", "Online Character Recognition", "Online Code Reader"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is a multimedia input device?", "options": ["Keyboard", "Webcam", "Printer", "Monitor"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a graphics tablet?", "options": ["Display device", "Drawing input device", "Storage device", "Gaming device"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which printer uses toner?", "options": ["Inkjet", "Laser", "Dot matrix", "Thermal"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a stylus?", "options": ["Pointing device", "Keyboard", "Mouse", "Printer"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which device is used for presentation?", "options": ["Scanner", "Printer", "Projector", "Microphone"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is OMR?", "options": ["Optical Mark Recognition", "Online Mark Recognition", "Optical Mark Reader", "Online Mark Reader"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is an audio output device?", "options": ["Microphone", "Speaker", "Scanner", "Keyboard"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a digitizer?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which printer is cheapest?", "options": ["Laser", "Inkjet", "Dot matrix", "Plotter"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is MICR?", "options": ["Magnetic Ink Character Recognition", "Manual Ink Character Recognition", "Magnetic Input Character Recognition", "Manual Input Character Recognition"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device reads magnetic strips?", "options": ["Barcode reader", "Card reader", "OCR", "OMR"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a touchscreen?", "options": ["Input and output device", "Only input device", "Only output device", "Storage device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is impact printer?", "options": ["Laser", "Inkjet", "Dot matrix", "Thermal"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is resolution in monitor?", "options": ["Number of pixels", "Screen size", "Brightness", "Color depth"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which device converts text to digital?", "options": ["Printer", "OCR scanner", "Monitor", "Speaker"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a 3D printer?", "options": ["Prints 3D objects", "Prints 3D images", "3 color printer", "3 page printer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which monitor is best for eyes?", "options": ["CRT", "LCD", "LED", "OLED"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is a VR headset?", "options": ["Input device", "Output device", "Both input and output", "Storage device"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Which is a game input device?", "options": ["Monitor", "Joystick", "Printer", "Scanner"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is pixel?", "options": ["Smallest display unit", "Largest display unit", "Screen size", "Color type"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which printer is best for photos?", "options": ["Dot matrix", "Inkjet", "Laser", "Line printer"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a smart card reader?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device has highest resolution?", "options": ["Monitor", "Printer", "Scanner", "Projector"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is refresh rate?", "options": ["Screen update frequency", "Data transfer rate", "Storage capacity", "Processing speed"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is non-impact printer?", "options": ["Dot matrix", "Daisy wheel", "Laser", "Chain printer"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is aspect ratio?", "options": ["Width to height ratio", "Screen size", "Resolution", "Brightness"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device is used in bank for cheque processing?", "options": ["OCR", "OMR", "MICR", "Barcode"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is a motion sensor?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the most common pointing device?", "options": ["Trackball", "Joystick", "Mouse", "Light pen"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is contrast ratio?", "options": ["Brightest to darkest ratio", "Screen size", "Resolution", "Refresh rate"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device is used for data entry?", "options": ["Monitor", "Keyboard", "Printer", "Speaker"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a dot matrix printer?", "options": ["Impact printer", "Non-impact printer", "Laser printer", "Inkjet printer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the fastest input device?", "options": ["Keyboard", "Scanner", "OMR", "OCR"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is LCD?", "options": ["Liquid Crystal Display", "Light Crystal Display", "Liquid Clear Display", "Light Clear Display"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which device converts analog to digital?", "options": ["DAC", "ADC", "Modem", "Router"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a multifunction printer?", "options": ["Print, scan, copy device", "Only printer", "Only scanner", "Only copier"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is wireless input device?", "options": ["Wired keyboard", "Wireless mouse", "Scanner", "Printer"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a braille reader?", "options": ["Output device for blind", "Input device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which printer is quietest?", "options": ["Dot matrix", "Daisy wheel", "Laser", "Chain printer"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is a QR code scanner?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which monitor consumes least power?", "options": ["CRT", "LCD", "LED", "Plasma"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is a document camera?", "options": ["Input device", "Output device", "Storage device", "Processing device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is used for OMR sheets?", "options": ["Pencil marks", "Pen marks", "Digital marks", "Printed marks"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is response time in monitor?", "options": ["Pixel change time", "Refresh rate", "Resolution", "Brightness"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    # Software & Operating Systems (201-250)
-    {"question": "Which is system software?", "options": ["MS Word", "Windows", "Chrome", "Photoshop"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is an operating system?", "options": ["Application software", "System software", "Utility software", "Programming software"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is not an OS?", "options": ["Windows", "Linux", "Unix", "Excel"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does OS stand for?", "options": ["Operating System", "Operating Software", "Open System", "Open Software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is open source OS?", "options": ["Windows", "macOS", "Linux", "MS-DOS"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is utility software?", "options": ["System maintenance software", "Application software", "Operating system", "Programming language"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not application software?", "options": ["MS Word", "MS Excel", "Device Driver", "Photoshop"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is UNIX?", "options": ["Operating system", "Application software", "Programming language", "Database"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which company developed macOS?", "options": ["Microsoft", "Apple", "Google", "IBM"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is Linux?", "options": ["Paid OS", "Free and open source OS", "Application software", "Hardware"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is not a function of OS?", "options": ["Memory management", "File management", "Creating documents", "Process management"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is device driver?", "options": ["Software to control hardware", "Hardware device", "Operating system", "Application software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is mobile OS?", "options": ["Windows 10", "Android", "Linux", "Unix"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is file system?", "options": ["Way to organize files", "Type of file", "Storage device", "Input device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a Windows version?", "options": ["Windows 7", "Windows 10", "Windows 11", "Windows 15"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is multitasking?", "options": ["Running multiple programs", "Using multiple computers", "Multiple users", "Multiple monitors"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is compiler?", "options": ["Hardware", "Software that converts code", "Operating system", "Database"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is GUI?", "options": ["Graphical User Interface", "Text interface", "Command line", "Programming interface"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is command line OS?", "options": ["Windows 10", "macOS", "MS-DOS", "Android"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is antivirus software?", "options": ["System software", "Utility software", "Application software", "Operating system"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is not utility software?", "options": ["Antivirus", "Disk cleanup", "MS Word", "Backup software"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is file extension?", "options": ["File type identifier", "File size", "File name", "File location"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is programming language?", "options": ["Windows", "Java", "Chrome", "Word"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is BIOS?", "options": ["Basic Input Output System", "Operating system", "Application software", "Utility software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is database software?", "options": ["MS Word", "MS Excel", "MS Access", "MS PowerPoint"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is firmware?", "options": ["Permanent software in ROM", "Temporary software", "Application software", "Operating system"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is spreadsheet software?", "options": ["MS Word", "MS Excel", "MS PowerPoint", "MS Access"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is defragmentation?", "options": ["Organizing disk data", "Deleting files", "Creating files", "Copying files"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is presentation software?", "options": ["MS Word", "MS Excel", "MS PowerPoint", "MS Access"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is kernel?", "options": ["Core of OS", "Application software", "Hardware", "Input device"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is word processing software?", "options": ["MS Word", "MS Excel", "MS PowerPoint", "MS Access"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is interpreter?", "options": ["Translates code line by line", "Compiles entire code", "Operating system", "Hardware"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not file type?", "options": [".doc", ".exe", ".jpg", ".cpu"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is software piracy?", "options": ["Illegal copying of software", "Legal software", "Free software", "Open source software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is graphics software?", "options": ["MS Word", "Photoshop", "Excel", "PowerPoint"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is spyware?", "options": ["Malicious software", "Antivirus", "Operating system", "Utility software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is email client?", "options": ["Chrome", "Outlook", "Word", "Excel"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is patch?", "options": ["Software update", "New software", "Hardware", "Operating system"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is media player software?", "options": ["MS Word", "VLC", "Excel", "PowerPoint"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is bloatware?", "options": ["Unwanted pre-installed software", "Useful software", "Operating system", "Antivirus"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is compression software?", "options": ["WinRAR", "MS Word", "Chrome", "Paint"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is freeware?", "options": ["Free software", "Paid software", "Trial software", "Pirated software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is PDF reader?", "options": ["MS Word", "Adobe Reader", "Excel", "PowerPoint"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is shareware?", "options": ["Trial software", "Free software", "Paid software", "Open source"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is web browser?", "options": ["MS Word", "Chrome", "Excel", "PowerPoint"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is open source software?", "options": ["Source code is available", "Closed source", "Paid software", "Trial software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is backup software?", "options": ["MS Word", "Windows Backup", "Chrome", "Paint"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is malware?", "options": ["Malicious software", "Good software", "Operating system", "Utility software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a browser?", "options": ["Chrome", "Firefox", "Safari", "Notepad"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is adware?", "options": ["Software showing ads", "Antivirus", "Operating system", "Browser"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    # Networking & Internet (251-300)
-    {"question": "What is a computer network?", "options": ["Connected computers", "Single computer", "Internet", "Software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the largest network?", "options": ["LAN", "MAN", "WAN", "Internet"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What does IP stand for?", "options": ["Internet Protocol", "Internal Protocol", "Internet Program", "Internal Program"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device connects networks?", "options": ["Hub", "Switch", "Router", "Modem"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is bandwidth?", "options": ["Data transfer capacity", "Network size", "Number of computers", "Cable length"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a network type?", "options": ["LAN", "MAN", "WAN", "TAN"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is topology?", "options": ["Network layout", "Network speed", "Network size", "Network device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which topology uses central hub?", "options": ["Bus", "Ring", "Star", "Mesh"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is Ethernet?", "options": ["Network technology", "Internet service", "Operating system", "Software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is wireless technology?", "options": ["Ethernet", "WiFi", "Fiber optic", "Coaxial"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What does MAC address stand for?", "options": ["Media Access Control", "Machine Access Control", "Memory Access Control", "Module Access Control"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which protocol is used for web pages?", "options": ["FTP", "HTTP", "SMTP", "POP3"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is a server?", "options": ["Computer providing services", "Client computer", "Network device", "Storage device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is client-server network?", "options": ["Peer to peer", "Centralized network", "Decentralized network", "Mesh network"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is firewall?", "options": ["Security system", "Network device", "Operating system", "Application software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which cable is fastest?", "options": ["Coaxial", "Twisted pair", "Fiber optic", "Phone line"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is DNS?", "options": ["Domain Name System", "Data Network System", "Digital Name System", "Domain Network Service"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a search engine?", "options": ["Google", "Yahoo", "Bing", "Windows"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is cloud computing?", "options": ["Internet-based computing", "Local computing", "Offline computing", "Mobile computing"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is email protocol?", "options": ["HTTP", "FTP", "SMTP", "TCP"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is ISP?", "options": ["Internet Service Provider", "Internet System Provider", "Internal Service Provider", "Internal System Provider"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which port is used for HTTPS?", "options": ["80", "443", "21", "25"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is VPN?", "options": ["Virtual Private Network", "Virtual Public Network", "Visual Private Network", "Visual Public Network"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not an internet browser?", "options": ["Chrome", "Firefox", "Edge", "Excel"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is downloading?", "options": ["Receiving data from internet", "Sending data to internet", "Deleting data", "Creating data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is social media platform?", "options": ["Windows", "Facebook", "Chrome", "Word"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is uploading?", "options": ["Sending data to internet", "Receiving data from internet", "Deleting data", "Creating data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is video sharing platform?", "options": ["Facebook", "Twitter", "YouTube", "LinkedIn"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is e-commerce?", "options": ["Online buying and selling", "Email service", "Social media", "Cloud storage"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is online payment service?", "options": ["Google", "PayPal", "Facebook", "Twitter"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is streaming?", "options": ["Real-time media delivery", "Downloading", "Uploading", "Installing"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a cloud storage?", "options": ["Google Drive", "Dropbox", "OneDrive", "Windows"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is blog?", "options": ["Online journal", "Social media", "Email", "Website"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is instant messaging app?", "options": ["Email", "WhatsApp", "Browser", "Word"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is podcast?", "options": ["Audio program", "Video program", "Text program", "Image program"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is professional networking site?", "options": ["Facebook", "Instagram", "LinkedIn", "Snapchat"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is webinar?", "options": ["Online seminar", "Offline seminar", "Email", "Chat"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not social media?", "options": ["Facebook", "Twitter", "Instagram", "Excel"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is hashtag?", "options": ["Topic tag", "Password", "Username", "Email"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is video calling app?", "options": ["Word", "Skype", "Excel", "PowerPoint"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is Wi-Fi?", "options": ["Wireless Fidelity", "Wired Fidelity", "Wide Fidelity", "Web Fidelity"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is search engine?", "options": ["Windows", "Google", "Word", "Excel"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is homepage?", "options": ["First page of website", "Last page", "Any page", "Error page"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a domain extension?", "options": [".com", ".org", ".net", ".cpu"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is hyperlink?", "options": ["Clickable link", "Text", "Image", "Video"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which protocol downloads email?", "options": ["SMTP", "POP3", "HTTP", "FTP"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is spam?", "options": ["Unwanted email", "Important email", "Sent email", "Draft email"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not email service?", "options": ["Gmail", "Yahoo Mail", "Outlook", "Windows"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is attachment in email?", "options": ["File sent with email", "Email subject", "Email body", "Email address"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is correct email format?", "options": ["user@domain.com", "user.domain.com", "user-domain-com", "user domain com"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    # Data & Security (301-350)
-    {"question": "What is data?", "options": ["Raw facts", "Processed information", "Software", "Hardware"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is information?", "options": ["Processed data", "Raw data", "Hardware", "Software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a data type?", "options": ["Text", "Number", "Image", "Computer"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is database?", "options": ["Organized data collection", "Random data", "Software", "Hardware"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is database software?", "options": ["MS Word", "MS Access", "MS PowerPoint", "Paint"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is encryption?", "options": ["Converting data to code", "Deleting data", "Copying data", "Creating data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is password?", "options": ["Secret code for access", "Username", "Email", "Phone number"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is strongest password?", "options": ["12345678", "password", "P@ssw0rd123!", "admin"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is backup?", "options": ["Data copy", "Data deletion", "Data creation", "Data modification"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is virus?", "options": ["Malicious program", "Antivirus", "Operating system", "Application"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is antivirus software?", "options": ["Norton", "MS Word", "Chrome", "Windows"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is hacking?", "options": ["Unauthorized access", "Authorized access", "Software development", "Hardware repair"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is phishing?", "options": ["Fraudulent attempt to get information", "Fishing", "Shopping", "Gaming"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not a cyber threat?", "options": ["Virus", "Malware", "Firewall", "Trojan"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is two-factor authentication?", "options": ["Two-step verification", "Single step verification", "No verification", "Three-step verification"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is cybercrime?", "options": ["Crime using computers", "Regular crime", "No crime", "Legal activity"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is biometric authentication?", "options": ["Password", "Fingerprint", "PIN", "Pattern"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is data privacy?", "options": ["Protecting personal data", "Sharing data", "Selling data", "Deleting data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is ransomware?", "options": ["Malware demanding payment", "Antivirus", "Operating system", "Application"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is secure protocol?", "options": ["HTTP", "HTTPS", "FTP", "Telnet"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is digital signature?", "options": ["Electronic verification", "Handwritten signature", "Password", "PIN"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is SSL certificate?", "options": ["Security certificate", "Software license", "Hardware certificate", "Email certificate"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is not malware?", "options": ["Virus", "Worm", "Trojan", "Antivirus"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is spyware?", "options": ["Monitors activity secretly", "Antivirus", "Operating system", "Browser"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is adware?", "options": ["Displays advertisements", "Blocks ads", "Operating system", "Browser"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is data loss prevention?", "options": ["Backup", "Deletion", "Formatting", "Shutdown"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is trojan horse?", "options": ["Disguised malware", "Antivirus", "Operating system", "Browser"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is worm?", "options": ["Self-replicating malware", "Antivirus", "Operating system", "Browser"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is secure password practice?", "options": ["Using same password everywhere", "Using strong unique passwords", "Sharing passwords", "Writing passwords openly"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is social engineering?", "options": ["Manipulating people for information", "Software engineering", "Hardware engineering", "Network engineering"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is data breach?", "options": ["Unauthorized data access", "Authorized access", "Data backup", "Data encryption"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is authentication method?", "options": ["Password", "Monitor", "Keyboard", "Mouse"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is cyberbullying?", "options": ["Online harassment", "Online shopping", "Online gaming", "Online learning"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is identity theft?", "options": ["Stealing personal information", "Shopping", "Gaming", "Learning"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is privacy protection?", "options": ["Encryption", "Sharing data", "Public posting", "No password"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is DDoS attack?", "options": ["Distributed Denial of Service", "Direct Denial of Service", "Distributed Data Service", "Direct Data Service"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is botnet?", "options": ["Network of infected computers", "Social network", "Computer network", "Internet service"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is data integrity?", "options": ["Data accuracy", "Data deletion", "Data creation", "Data sharing"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is keylogger?", "options": ["Records keystrokes", "Deletes files", "Formats disk", "Installs software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is pharming?", "options": ["Redirecting to fake website", "Farming", "Shopping", "Gaming"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which is secure browsing practice?", "options": ["Clicking unknown links", "Using HTTPS sites", "Sharing passwords", "Disabling firewall"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is data recovery?", "options": ["Restoring lost data", "Deleting data", "Creating data", "Sharing data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is computer forensics?", "options": ["Digital crime investigation", "Computer repair", "Software development", "Network design"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is ethical hacking?", "options": ["Authorized security testing", "Illegal hacking", "Software piracy", "Data theft"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is copyright?", "options": ["Legal right to creative work", "Copy paste", "Backup", "Download"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is plagiarism?", "options": ["Using others' work without credit", "Original work", "Legal copying", "Backup"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is intellectual property?", "options": ["Creative works", "Computer hardware", "Software bugs", "Internet speed"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is digital footprint?", "options": ["Online activity trail", "Computer size", "Internet speed", "Storage capacity"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is cookie in browser?", "options": ["Small data file", "Virus", "Password", "Email"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is safe online practice?", "options": ["Sharing personal info publicly", "Using strong passwords", "Clicking spam links", "Disabling antivirus"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    # Number Systems & Logic (351-400)
-    {"question": "Which is the binary number system base?", "options": ["2", "8", "10", "16"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the decimal number system base?", "options": ["2", "8", "10", "16"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Which is the octal number system base?", "options": ["2", "8", "10", "16"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which is the hexadecimal number system base?", "options": ["2", "8", "10", "16"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is binary digit called?", "options": ["Byte", "Bit", "Nibble", "Word"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "How many bits in a nibble?", "options": ["2", "4", "8", "16"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "How many bits in a byte?", "options": ["2", "4", "8", "16"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is decimal 5 in binary?", "options": ["100", "101", "110", "111"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is binary 1000 in decimal?", "options": ["4", "6", "8", "10"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Which digits are used in binary?", "options": ["0-9", "0-7", "0-1", "0-15"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    {"question": "Which digits are used in octal?", "options": ["0-9", "0-7", "0-1", "0-15"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which symbols are used in hexadecimal?", "options": ["0-9", "A-F", "0-9, A-F", "0-7"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is the complement of 1 in binary?", "options": ["0", "1", "2", "10"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is BCD?", "options": ["Binary Coded Decimal", "Binary Computer Data", "Byte Coded Decimal", "Bit Coded Decimal"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is ASCII?", "options": ["American Standard Code for Information Interchange", "Advanced Standard Code for Information Interchange", "American System Code for Information Interchange", "Advanced System Code for Information Interchange"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "How many bits in ASCII code?", "options": ["6", "7", "8", "16"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is Unicode?", "options": ["Universal character encoding", "Binary code", "Decimal code", "Hexadecimal code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is logic gate?", "options": ["Electronic circuit", "Software", "Operating system", "Network device"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is a basic logic gate?", "options": ["AND", "NAND", "XOR", "XNOR"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is the output of AND gate when both inputs are 1?", "options": ["0", "1", "Both", "Neither"], "correct": "B", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is the output of OR gate when both inputs are 0?", "options": ["0", "1", "Both", "Neither"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is NOT gate?", "options": ["Inverter", "Buffer", "Amplifier", "Multiplier"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is the output of NOT gate with input 1?", "options": ["0", "1", "Same", "Both"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is NAND gate?", "options": ["NOT AND", "NOT OR", "AND NOT", "OR NOT"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is NOR gate?", "options": ["NOT OR", "NOT AND", "OR NOT", "AND NOT"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which gate is universal gate?", "options": ["AND", "OR", "NAND", "XOR"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is XOR gate?", "options": ["Exclusive OR", "Exclusive AND", "Extended OR", "Extended AND"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is Boolean algebra?", "options": ["Logical operations", "Arithmetic operations", "String operations", "File operations"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who developed Boolean algebra?", "options": ["George Boole", "Charles Babbage", "Alan Turing", "Bill Gates"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What are Boolean values?", "options": ["0 and 1", "True and False", "Both A and B", "Neither"], "correct": "C", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is truth table?", "options": ["Logic gate output table", "Data table", "Multiplication table", "ASCII table"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is the result of 1 AND 1?", "options": ["0", "1", "10", "11"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the result of 1 OR 0?", "options": ["0", "1", "10", "11"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the result of 0 XOR 0?", "options": ["0", "1", "10", "11"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is hexadecimal A in decimal?", "options": ["10", "11", "12", "13"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is hexadecimal F in decimal?", "options": ["13", "14", "15", "16"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is decimal 16 in hexadecimal?", "options": ["F", "10", "11", "A"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is octal 10 in decimal?", "options": ["8", "10", "16", "7"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is the largest single digit in binary?", "options": ["0", "1", "2", "10"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is the largest single digit in octal?", "options": ["7", "8", "9", "10"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is binary addition of 1+1?", "options": ["0", "1", "10", "11"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "What is EBCDIC?", "options": ["Extended Binary Coded Decimal Interchange Code", "Enhanced Binary Coded Decimal Interchange Code", "Extended Byte Coded Decimal Interchange Code", "Enhanced Byte Coded Decimal Interchange Code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which code is used in mainframes?", "options": ["ASCII", "EBCDIC", "Unicode", "BCD"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is parity bit?", "options": ["Error checking bit", "Data bit", "Control bit", "Sign bit"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is Gray code?", "options": ["Reflected binary code", "Direct binary code", "Decimal code", "ASCII code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is excess-3 code?", "options": ["BCD + 3", "BCD + 2", "BCD + 1", "BCD + 4"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is signed magnitude?", "options": ["Number representation with sign", "Unsigned number", "Decimal number", "Octal number"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is 2's complement?", "options": ["Negative number representation", "Positive number", "Zero", "Infinity"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is 1's complement?", "options": ["Binary digit inversion", "Decimal conversion", "Hexadecimal conversion", "Octal conversion"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which number system is most compact?", "options": ["Binary", "Octal", "Decimal", "Hexadecimal"], "correct": "D", "subject": "Computer Fundamentals"},
-    
-    # Computer Generations & History (401-450)
-    {"question": "Which device was used in first generation computers?", "options": ["Transistors", "Vacuum tubes", "IC", "Microprocessor"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Which device was used in second generation computers?", "options": ["Transistors", "Vacuum tubes", "IC", "Microprocessor"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which device was used in third generation computers?", "options": ["Transistors", "Vacuum tubes", "IC", "Microprocessor"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Which device was used in fourth generation computers?", "options": ["Transistors", "Vacuum tubes", "IC", "Microprocessor"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is the current generation of computers?", "options": ["Third", "Fourth", "Fifth", "Sixth"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Who is known as father of computer?", "options": ["Charles Babbage", "Alan Turing", "Bill Gates", "Steve Jobs"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is ENIAC?", "options": ["First electronic computer", "Operating system", "Programming language", "Network"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who developed the first compiler?", "options": ["Grace Hopper", "Charles Babbage", "Alan Turing", "Bill Gates"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is UNIVAC?", "options": ["First commercial computer", "Operating system", "Programming language", "Network"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which computer used vacuum tubes?", "options": ["ENIAC", "IBM PC", "Macintosh", "Laptop"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "When was the first generation of computers?", "options": ["1940-1956", "1956-1963", "1964-1971", "1971-present"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "When was the second generation of computers?", "options": ["1940-1956", "1956-1963", "1964-1971", "1971-present"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "When was the third generation of computers?", "options": ["1940-1956", "1956-1963", "1964-1971", "1971-present"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "When was the fourth generation of computers?", "options": ["1940-1956", "1956-1963", "1964-1971", "1971-present"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is Analytical Engine?", "options": ["Early mechanical computer", "Modern computer", "Mobile phone", "Tablet"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who developed Analytical Engine?", "options": ["Charles Babbage", "Alan Turing", "Bill Gates", "Steve Jobs"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is Difference Engine?", "options": ["Mechanical calculator", "Modern computer", "Mobile phone", "Tablet"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who is known as first computer programmer?", "options": ["Ada Lovelace", "Grace Hopper", "Bill Gates", "Steve Jobs"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is Abacus?", "options": ["Ancient calculating device", "Modern computer", "Mobile phone", "Tablet"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What does ENIAC stand for?", "options": ["Electronic Numerical Integrator and Computer", "Electronic Number Integrator and Computer", "Electronic Numerical Internal and Computer", "Electronic Number Internal and Computer"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What does UNIVAC stand for?", "options": ["Universal Automatic Computer", "Universal Analytical Computer", "United Automatic Computer", "United Analytical Computer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which company developed IBM PC?", "options": ["Apple", "IBM", "Microsoft", "Dell"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "When was IBM PC introduced?", "options": ["1971", "1981", "1991", "2001"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Who founded Microsoft?", "options": ["Bill Gates and Paul Allen", "Steve Jobs and Steve Wozniak", "Larry Page and Sergey Brin", "Mark Zuckerberg"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who founded Apple?", "options": ["Bill Gates and Paul Allen", "Steve Jobs and Steve Wozniak", "Larry Page and Sergey Brin", "Mark Zuckerberg"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What was the first Apple computer?", "options": ["Apple I", "Macintosh", "iMac", "MacBook"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "When was Apple founded?", "options": ["1966", "1976", "1986", "1996"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "When was Microsoft founded?", "options": ["1965", "1975", "1985", "1995"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "What is Moore's Law?", "options": ["Transistor doubling every 2 years", "Computer speed doubles", "Memory doubles", "Storage doubles"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who stated Moore's Law?", "options": ["Gordon Moore", "Charles Babbage", "Alan Turing", "Bill Gates"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is AI?", "options": ["Artificial Intelligence", "Automatic Intelligence", "Applied Intelligence", "Advanced Intelligence"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What are fifth generation computers based on?", "options": ["AI and parallel processing", "Transistors", "Vacuum tubes", "IC"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is supercomputer?", "options": ["Fastest computer", "Personal computer", "Mobile phone", "Tablet"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Which is the first supercomputer?", "options": ["CDC 6600", "IBM PC", "Apple I", "ENIAC"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is mainframe computer?", "options": ["Large centralized computer", "Personal computer", "Mobile phone", "Tablet"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is minicomputer?", "options": ["Mid-sized computer", "Smallest computer", "Largest computer", "Personal computer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is microcomputer?", "options": ["Personal computer", "Mainframe", "Supercomputer", "Minicomputer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is embedded computer?", "options": ["Computer inside device", "Desktop computer", "Laptop computer", "Server computer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is workstation?", "options": ["High-performance computer", "Regular PC", "Mobile phone", "Tablet"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is client computer?", "options": ["User computer in network", "Server computer", "Mainframe", "Supercomputer"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What was the first programming language?", "options": ["Assembly", "FORTRAN", "COBOL", "BASIC"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What does FORTRAN stand for?", "options": ["Formula Translation", "Forward Translation", "Formula Transfer", "Forward Transfer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What does COBOL stand for?", "options": ["Common Business Oriented Language", "Computer Business Oriented Language", "Common Binary Oriented Language", "Computer Binary Oriented Language"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What does BASIC stand for?", "options": ["Beginners All-purpose Symbolic Instruction Code", "Binary All-purpose Symbolic Instruction Code", "Beginners Advanced Symbolic Instruction Code", "Binary Advanced Symbolic Instruction Code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who developed C programming language?", "options": ["Dennis Ritchie", "Bjarne Stroustrup", "James Gosling", "Guido van Rossum"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who developed C++ programming language?", "options": ["Dennis Ritchie", "Bjarne Stroustrup", "James Gosling", "Guido van Rossum"], "correct": "B", "subject": "Computer Fundamentals"},
-    {"question": "Who developed Java programming language?", "options": ["Dennis Ritchie", "Bjarne Stroustrup", "James Gosling", "Guido van Rossum"], "correct": "C", "subject": "Computer Fundamentals"},
-    {"question": "Who developed Python programming language?", "options": ["Dennis Ritchie", "Bjarne Stroustrup", "James Gosling", "Guido van Rossum"], "correct": "D", "subject": "Computer Fundamentals"},
-    {"question": "What is the first web browser?", "options": ["WorldWideWeb", "Netscape", "Internet Explorer", "Chrome"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "Who invented the World Wide Web?", "options": ["Tim Berners-Lee", "Bill Gates", "Steve Jobs", "Mark Zuckerberg"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    # Miscellaneous (451-500)
-    {"question": "What is open source?", "options": ["Source code available freely", "Closed source", "Paid software", "Trial software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is proprietary software?", "options": ["Closed source paid software", "Open source software", "Free software", "Trial software"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is algorithm?", "options": ["Step-by-step procedure", "Programming language", "Operating system", "Hardware"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is flowchart?", "options": ["Visual algorithm representation", "Program code", "Data table", "Network diagram"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is pseudocode?", "options": ["Algorithm in plain language", "Program code", "Machine code", "Binary code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is debugging?", "options": ["Finding and fixing errors", "Writing code", "Running program", "Compiling code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is bug?", "options": ["Error in program", "Virus", "Hardware problem", "Network issue"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is syntax?", "options": ["Language rules", "Program logic", "Data structure", "Algorithm"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is syntax error?", "options": ["Grammar mistake in code", "Logic error", "Runtime error", "Hardware error"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is runtime error?", "options": ["Error during execution", "Syntax error", "Compile error", "No error"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is logical error?", "options": ["Wrong program logic", "Syntax error", "Runtime error", "Hardware error"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is variable?", "options": ["Storage location with name", "Constant value", "Function", "Operator"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is constant?", "options": ["Fixed value", "Variable value", "Function", "Operator"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is function?", "options": ["Reusable code block", "Variable", "Constant", "Operator"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is loop?", "options": ["Repeated code execution", "Single execution", "No execution", "Conditional execution"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is conditional statement?", "options": ["Decision making in code", "Loop statement", "Function", "Variable"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is array?", "options": ["Collection of same type data", "Single variable", "Function", "Constant"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is string?", "options": ["Sequence of characters", "Number", "Boolean", "Array"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is integer?", "options": ["Whole number", "Decimal number", "Character", "String"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is float?", "options": ["Decimal number", "Whole number", "Character", "String"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is boolean?", "options": ["True or False value", "Number", "Character", "String"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is character?", "options": ["Single letter or symbol", "Number", "String", "Boolean"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is operator?", "options": ["Symbol for operation", "Variable", "Constant", "Function"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is arithmetic operator?", "options": ["+, -, *, /", "AND, OR, NOT", "=, ==, !=", "<, >, <=, >="], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is logical operator?", "options": ["AND, OR, NOT", "+, -, *, /", "=, ==, !=", "<, >, <=, >="], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is relational operator?", "options": ["<, >, <=, >=", "+, -, *, /", "AND, OR, NOT", "=, ==, !="], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is assignment operator?", "options": ["=", "==", "!=", "<"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is comparison operator?", "options": ["==, !=", "=", "+, -", "AND, OR"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is increment operator?", "options": ["++", "--", "+=", "-="], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is decrement operator?", "options": ["--", "++", "+=", "-="], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is comment in code?", "options": ["Non-executable text", "Executable code", "Variable", "Function"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is compilation?", "options": ["Converting code to machine code", "Running program", "Debugging", "Writing code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is interpretation?", "options": ["Line by line execution", "Full compilation", "Debugging", "Writing code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is source code?", "options": ["Human readable code", "Machine code", "Binary code", "Executable code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is machine code?", "options": ["Computer executable code", "Human readable code", "Source code", "High-level code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is object code?", "options": ["Compiled code", "Source code", "Machine code", "Executable code"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is executable file?", "options": ["Runnable program", "Source code", "Text file", "Image file"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is library?", "options": ["Collection of reusable code", "Single function", "Variable", "Operator"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is API?", "options": ["Application Programming Interface", "Application Program Interface", "Applied Programming Interface", "Applied Program Interface"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is GUI programming?", "options": ["Creating graphical interfaces", "Command line programming", "System programming", "Network programming"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is recursion?", "options": ["Function calling itself", "Loop", "Conditional statement", "Variable declaration"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is iteration?", "options": ["Repetition", "Single execution", "No execution", "Conditional execution"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is data structure?", "options": ["Way to organize data", "Data type", "Variable", "Function"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is sorting?", "options": ["Arranging data in order", "Searching data", "Deleting data", "Creating data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is searching?", "options": ["Finding specific data", "Sorting data", "Deleting data", "Creating data"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is Big O notation?", "options": ["Algorithm complexity measure", "Programming language", "Data structure", "Sorting algorithm"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is stack?", "options": ["LIFO data structure", "FIFO data structure", "Random access", "Sequential access"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is queue?", "options": ["FIFO data structure", "LIFO data structure", "Random access", "Tree structure"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is linked list?", "options": ["Linear data structure", "Tree structure", "Graph structure", "Array"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is tree?", "options": ["Hierarchical data structure", "Linear structure", "Graph structure", "Array"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is graph?", "options": ["Nodes and edges structure", "Linear structure", "Tree structure", "Array"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is hash table?", "options": ["Key-value data structure", "Linear structure", "Tree structure", "Graph structure"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is pointer?", "options": ["Variable storing address", "Regular variable", "Constant", "Function"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is null pointer?", "options": ["Pointer with no address", "Valid pointer", "Data pointer", "Function pointer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is reference?", "options": ["Alias to variable", "New variable", "Constant", "Function"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is garbage collection?", "options": ["Automatic memory management", "Manual memory management", "Memory leak", "Memory overflow"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is memory leak?", "options": ["Unreleased memory", "Memory overflow", "No memory", "Full memory"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is buffer overflow?", "options": ["Writing beyond buffer", "Empty buffer", "Normal buffer", "Small buffer"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is exception?", "options": ["Runtime error event", "Syntax error", "No error", "Warning"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is exception handling?", "options": ["Managing runtime errors", "Preventing syntax errors", "Writing code", "Compiling code"], "correct": "A", "subject": "Computer Fundamentals"},
-    
-    {"question": "What is cloud computing?", "options": ["Internet-based computing", "Local computing", "Offline computing", "Mobile computing"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is IoT?", "options": ["Internet of Things", "Internet of Technology", "Internal of Things", "Internal of Technology"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is machine learning?", "options": ["AI subset", "Programming language", "Operating system", "Network protocol"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is blockchain?", "options": ["Distributed ledger", "Database", "Network", "Operating system"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is cryptocurrency?", "options": ["Digital currency", "Physical currency", "Credit card", "Debit card"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is Bitcoin?", "options": ["Cryptocurrency", "Programming language", "Operating system", "Network"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is augmented reality?", "options": ["Enhanced real world view", "Virtual world", "Real world only", "No reality"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is virtual reality?", "options": ["Simulated environment", "Real environment", "Augmented reality", "No environment"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is 5G?", "options": ["Fifth generation mobile network", "Fifth generation computer", "Five gigabytes", "Five games"], "correct": "A", "subject": "Computer Fundamentals"},
-    {"question": "What is quantum computing?", "options": ["Computing using quantum mechanics", "Regular computing", "Cloud computing", "Mobile computing"], "correct": "A", "subject": "Computer Fundamentals"}
-
-
-
-
-
-
-]
 
+Questions are read lazily from a gzipped JSON Lines file (data/questions.jsonl.gz,
+one {"question", "options", "correct", "subject"} object per line) and upserted
+in bulk keyed by content hash, so re-running the script never wipes or duplicates
+the bank.
 
+Usage:
+    python seed_data.py [--file PATH] [--workers N] [--batch-size N] [--dry-run]
+"""
 
+import argparse
+import gzip
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+from models import db_manager, Question, Admin
+from config import Config
 
-def seed_database():
-    """Seed the database with questions and admin"""
-    print("Connecting to database...")
-    db = db_manager.connect()
-    
-    # Clear existing data (optional - comment out if you want to keep existing data)
-    print("Clearing existing questions...")
-    db.questions.delete_many({})
-    
-    # Insert questions
-    print(f"Inserting {len(questions_data)} questions...")
-    for q_data in questions_data:
-        Question.create(
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'questions.jsonl.gz')
+
+
+def load_questions(path=DEFAULT_DATA_FILE):
+    """Yield question dicts one at a time from a (optionally gzipped) JSON Lines file"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}")
+
+
+def iter_subject_batches(questions, batch_size):
+    """
+    Group a question stream into per-subject batches of question documents
+
+    Only one partial batch per subject is held in memory at a time. Repeated
+    questions in the file are dropped so parallel batches never race to
+    upsert the same content hash.
+    """
+    pending = {}
+    seen = set()
+    for q_data in questions:
+        doc = Question.build(
             question_text=q_data['question'],
             options=q_data['options'],
             correct_answer=q_data['correct'],
             subject=q_data['subject']
         )
-    
+        if doc['content_hash'] in seen:
+            continue
+        seen.add(doc['content_hash'])
+
+        batch = pending.setdefault(doc['subject'], [])
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield doc['subject'], pending.pop(doc['subject'])
+
+    for subject, batch in pending.items():
+        yield subject, batch
+
+
+def diff_batch(batch):
+    """Compare a batch with the database without writing: (new, changed, unchanged)"""
+    stored = Question.get_by_hashes(q['content_hash'] for q in batch)
+    new = changed = unchanged = 0
+    for q in batch:
+        if q['content_hash'] not in stored:
+            new += 1
+        elif stored[q['content_hash']] != q['correct']:
+            changed += 1
+        else:
+            unchanged += 1
+    return new, changed, unchanged
+
+
+def seed_questions(path=DEFAULT_DATA_FILE, workers=4, batch_size=500, dry_run=False):
+    """
+    Upsert the question bank from a data file
+
+    Batches are processed in parallel by a worker pool; rows are grouped per
+    subject so each batch only touches one subject.
+
+    Returns:
+        dict: {subject: {'new': n, 'changed': n, 'unchanged': n}}
+    """
+    stats = {}
+
+    def process(subject, batch):
+        if dry_run:
+            new, changed, unchanged = diff_batch(batch)
+        else:
+            new, changed = Question.upsert_many(batch)
+            unchanged = len(batch) - new - changed
+        return subject, new, changed, unchanged
+
+    def record(future):
+        subject, new, changed, unchanged = future.result()
+        totals = stats.setdefault(subject, {'new': 0, 'changed': 0, 'unchanged': 0})
+        totals['new'] += new
+        totals['changed'] += changed
+        totals['unchanged'] += unchanged
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Keep only a couple of batches per worker in flight so memory stays bounded
+        in_flight = deque()
+        for subject, batch in iter_subject_batches(load_questions(path), batch_size):
+            in_flight.append(pool.submit(process, subject, batch))
+            if len(in_flight) >= workers * 2:
+                record(in_flight.popleft())
+        while in_flight:
+            record(in_flight.popleft())
+
+    return stats
+
+
+def seed_database(path=DEFAULT_DATA_FILE, workers=4, batch_size=500, dry_run=False):
+    """Seed the database with questions and admin"""
+    print("Connecting to database...")
+    db = db_manager.connect(max_pool_size=workers)
+    if db is None:
+        print("Could not connect to database.")
+        return
+
+    if not dry_run:
+        Question.ensure_indexes()
+        backfilled = Question.backfill_content_hashes()
+        if backfilled:
+            print(f"Added content hashes to {backfilled} existing questions")
+
+    print(f"{'Comparing' if dry_run else 'Upserting'} questions from {path}...")
+    stats = seed_questions(path, workers=workers, batch_size=batch_size, dry_run=dry_run)
+
+    print(f"\n{'Subject':<30} {'New':>8} {'Changed':>8} {'Unchanged':>10}")
+    for subject in sorted(stats):
+        s = stats[subject]
+        print(f"{subject:<30} {s['new']:>8} {s['changed']:>8} {s['unchanged']:>10}")
+
+    if dry_run:
+        print("\nDry run: no changes were written.")
+        return
+
     # Ensure default admin exists
     print("Creating default admin...")
     Admin.ensure_default_admin()
@@ -1984,4 +173,11 @@ def seed_database():
     print("="*50)
 
 if __name__ == '__main__':
-    seed_database()
+    parser = argparse.ArgumentParser(description='Seed the question bank and default admin')
+    parser.add_argument('--file', default=DEFAULT_DATA_FILE, help='Question data file (.jsonl or .jsonl.gz)')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel upsert workers')
+    parser.add_argument('--batch-size', type=int, default=500, help='Questions per bulk write')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change without writing')
+    args = parser.parse_args()
+
+    seed_database(args.file, workers=args.workers, batch_size=args.batch_size, dry_run=args.dry_run)
@@ -0,0 +1,194 @@
+"""
+Cold-start profiling
+
+On Vercel every cold start imports app.py, runs its module-level setup and
+then serves a first request that also connects to MongoDB. This module
+times those steps:
+
+    * import time of app.py's own imports, its module-level setup and its
+      route registration (mark());
+    * the first-request initialisation phases: connecting, ensuring the
+      default admin, ensuring indexes (phase());
+    * time from the start of the import to the first request, and how long
+      that first request took.
+
+report() returns the numbers (also served at /api/admin/startup). With
+STARTUP_PROFILE=1 they are printed once after the first request.
+
+Cold-start budget, checked by benchmarks/bench_cold_start.py:
+
+    IMPORT_BUDGET_MS         `import app` in a fresh interpreter
+    OWN_IMPORT_BUDGET_MS     the part of that spent in this repository's modules
+    FIRST_REQUEST_BUDGET_MS  first request, including the database connection
+
+Modules in LAZY_MODULES are only needed by admin or command-line code and
+must not be imported by `import app`.
+
+Usage:
+    python startup.py profile [--path /login] [--top 25] [--no-request]
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+STARTED = time.perf_counter()   # app.py imports this module first
+
+IMPORT_BUDGET_MS = 300
+OWN_IMPORT_BUDGET_MS = 40
+FIRST_REQUEST_BUDGET_MS = 1500
+
+LAZY_MODULES = ('question_io', 'argparse', 'gzip')
+
+_lock = threading.Lock()
+_last_mark = STARTED
+_marks = []        # (name, ms) for module-level setup steps
+_phases = []       # (name, ms) for first-request initialisation
+_first_request = {}
+
+
+def mark(name):
+    """Record the time since the previous mark as a named setup step"""
+    global _last_mark
+    now = time.perf_counter()
+    _marks.append((name, round((now - _last_mark) * 1000, 2)))
+    _last_mark = now
+
+
+@contextmanager
+def phase(name):
+    """Time a named initialisation phase"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        with _lock:
+            _phases.append((name, round((time.perf_counter() - started) * 1000, 2)))
+
+
+def report():
+    with _lock:
+        first = dict(_first_request)
+        phases = list(_phases)
+    imported = sum(ms for _, ms in _marks)
+    return {
+        'setup_ms': dict(_marks),
+        'import_total_ms': round(imported, 2),
+        'phases_ms': dict(phases),
+        'first_request': first,
+        'budget_ms': {'import': IMPORT_BUDGET_MS, 'first_request': FIRST_REQUEST_BUDGET_MS},
+        'within_budget': (imported <= IMPORT_BUDGET_MS
+                          and first.get('duration_ms', 0) <= FIRST_REQUEST_BUDGET_MS)
+    }
+
+
+def init_app(app):
+    """Time the first request; call before other before_request hooks are registered"""
+    from flask import g, request
+
+    @app.before_request
+    def startup_first_request_started():
+        if not _first_request:
+            with _lock:
+                if not _first_request:
+                    _first_request['path'] = request.path
+                    _first_request['since_start_ms'] = round((time.perf_counter() - STARTED) * 1000, 2)
+                    g.startup_first_request = time.perf_counter()
+
+    @app.after_request
+    def startup_first_request_finished(response):
+        started = g.pop('startup_first_request', None)
+        if started is not None:
+            with _lock:
+                _first_request['duration_ms'] = round((time.perf_counter() - started) * 1000, 2)
+                _first_request['status'] = response.status_code
+            if app.config['STARTUP_PROFILE']:
+                print(f"Startup profile: {report()}")
+        return response
+
+
+# ---------- profiling a fresh interpreter ----------
+
+def parse_importtime(text):
+    """Rows of (module, self_us, cumulative_us, depth) from `python -X importtime` output"""
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def own_modules():
+    """Names of the top-level modules in this repository"""
+    base = os.path.dirname(os.path.abspath(__file__))
+    return {name[:-3] for name in os.listdir(base) if name.endswith('.py')}
+
+
+def profile_fresh_process(path='/', request_path=True):
+    """Import app (and serve one request) in a new interpreter; returns (import rows, report)"""
+    import json
+    import subprocess
+    import sys
+
+    script = (
+        "import json, startup, app\n"
+        + (f"app.app.test_client().get({path!r})\n" if request_path else "")
+        + "print('STARTUP_REPORT ' + json.dumps(startup.report()))\n"
+    )
+    base = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', script],
+                            cwd=base, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'import failed')
+
+    report_line = [line for line in result.stdout.splitlines() if line.startswith('STARTUP_REPORT ')]
+    return parse_importtime(result.stderr), json.loads(report_line[-1][len('STARTUP_REPORT '):])
+
+
+def _print_profile(rows, data, top):
+    own = own_modules()
+    total = next((cumulative for name, _, cumulative, _ in rows if name == 'app'), 0)
+    own_self = sum(self_us for name, self_us, _, _ in rows if name.split('.')[0] in own)
+
+    packages = {}
+    for name, self_us, _, _ in rows:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    print(f"import app: {total / 1000:.1f} ms (budget {IMPORT_BUDGET_MS} ms), "
+          f"repository modules: {own_self / 1000:.1f} ms (budget {OWN_IMPORT_BUDGET_MS} ms)\n")
+
+    print(f"{'package':<28} {'self ms':>9}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:<28} {self_us / 1000:9.2f}")
+
+    print(f"\n{'module':<40} {'self ms':>9} {'cumulative ms':>14}")
+    for name, self_us, cumulative_us, _ in sorted(rows, key=lambda row: -row[1])[:top]:
+        print(f"{name:<40} {self_us / 1000:9.2f} {cumulative_us / 1000:14.2f}")
+
+    print("\napp.py setup (ms):", data['setup_ms'])
+    print("first-request phases (ms):", data['phases_ms'])
+    print("first request:", data['first_request'] or 'not measured')
+
+    loaded = {name for name, _, _, _ in rows}
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        print("\nimported eagerly but meant to be lazy:", ', '.join(eager))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Profile the cold start of the app in a fresh interpreter')
+    parser.add_argument('command', choices=['profile'])
+    parser.add_argument('--path', default='/', help='Path of the first request')
+    parser.add_argument('--top', type=int, default=25, help='Rows per table')
+    parser.add_argument('--no-request', action='store_true', help='Only import the app')
+    args = parser.parse_args()
+
+    rows, data = profile_fresh_process(args.path, request_path=not args.no_request)
+    _print_profile(rows, data, args.top)
@@ -0,0 +1,340 @@
+let allQuestions = [];
+let selectedQuestions = new Set();
+async function loadStudents() {
+try {
+const response = await fetch('/api/admin/students');
+const data = await response.json();
+if (data.success) {
+const container = document.getElementById('studentsContainer');
+if (data.students.length === 0) {
+container.innerHTML = '<p class="text-center" style="color: var(--text-muted); padding: 2rem;">No students registered yet</p>';
+return;
+}
+container.innerHTML = `
+                <div class="table-container">
+                    <table class="table">
+                        <thead>
+                            <tr>
+                                <th>Roll Number</th>
+                                <th>Name</th>
+                                <th>Email</th>
+                                <th>Phone</th>
+                                <th>DOB</th>
+                                <th>Password (Hash)</th>
+                                <th>Exam Status</th>
+                                <th>Registered At</th>
+                                <th>Action</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            ${data.students.map(student => `
+                                <tr>
+                                    <td>${student.roll_number}</td>
+                                    <td>${student.name}</td>
+                                    <td>${student.email}</td>
+                                    <td>${student.phone}</td>
+                                    <td>${student.dob}</td>
+                                    <td title="${student.password}">${student.password}</td>
+                                    <td>
+                                        ${student.completed_subjects && student.completed_subjects.length > 0
+? student.completed_subjects.map(subject =>
+`<span style="display: inline-block; background: rgba(72, 187, 120, 0.2); color: #48bb78; padding: 2px 8px; border-radius: 12px; font-size: 0.85em; margin-right: 4px; margin-bottom: 4px;">${subject}</span>`
+).join('')
+: '<span style="color: var(--warning);">⏳ Pending</span>'}
+                                    </td>
+                                    <td>${student.registered_at}</td>
+                                    <td>
+                                        <div style="display: flex; gap: 5px;">
+                                            ${student.completed_subjects && student.completed_subjects.length > 0
+? `<a href="/result/${student.roll_number}" target="_blank" class="btn btn-outline" style="padding: 0.5rem 1rem; font-size: 0.85rem;" title="View Result">📄</a>`
+: ''}
+                                            <button class="btn btn-danger" style="padding: 0.5rem 1rem; font-size: 0.85rem;" onclick="deleteStudent('${student.roll_number}')" title="Delete Student">🗑️</button>
+                                        </div>
+                                    </td>
+                                </tr>
+                            `).join('')}
+                        </tbody>
+                    </table>
+                </div>
+            `;
+}
+} catch (error) {
+console.error('Failed to load students');
+}
+}
+let questionPage = 1;
+let questionPages = 1;
+let searchTimer = null;
+let searchRequest = 0;
+async function loadQuestions(page = 1) {
+const params = new URLSearchParams({
+q: document.getElementById('questionSearch').value,
+subject: document.getElementById('subjectFilter').value,
+answer: document.getElementById('answerFilter').value,
+page: page
+});
+const requestId = ++searchRequest;
+try {
+const response = await fetch('/api/admin/questions/search?' + params.toString());
+const data = await response.json();
+if (requestId !== searchRequest) return;
+if (data.success) {
+allQuestions = data.questions;
+questionPage = data.page;
+questionPages = data.pages;
+updateSubjectFilter(data.subject_counts);
+renderQuestions(data.total);
+}
+} catch (error) {
+console.error('Failed to load questions');
+}
+}
+function updateSubjectFilter(counts) {
+const select = document.getElementById('subjectFilter');
+const current = select.value;
+const subjects = Object.keys(counts).sort();
+if (current && !subjects.includes(current)) subjects.push(current);
+select.innerHTML = '<option value="">All subjects</option>' + subjects.map(subject =>
+`<option value="${subject}">${subject} (${counts[subject] || 0})</option>`
+).join('');
+select.value = current;
+}
+function scheduleSearch() {
+clearTimeout(searchTimer);
+searchTimer = setTimeout(() => loadQuestions(1), 200);
+}
+function renderQuestions(total) {
+const container = document.getElementById('questionsContainer');
+selectedQuestions.clear();
+updateBulkActionUI();
+if (allQuestions.length === 0) {
+container.innerHTML = '<p class="text-center" style="color: var(--text-muted); padding: 2rem;">No questions found.</p>';
+return;
+}
+container.innerHTML = `
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+            <span style="color: var(--text-muted);">${total} matching questions</span>
+            <div style="display: flex; gap: 0.5rem; align-items: center;">
+                <button class="btn btn-outline" ${questionPage <= 1 ? 'disabled' : ''} onclick="loadQuestions(${questionPage - 1})">&laquo;</button>
+                <span>Page ${questionPage} of ${questionPages}</span>
+                <button class="btn btn-outline" ${questionPage >= questionPages ? 'disabled' : ''} onclick="loadQuestions(${questionPage + 1})">&raquo;</button>
+            </div>
+        </div>
+        <div class="table-container">
+            <table class="table">
+                <thead>
+                    <tr>
+                        <th style="width: 40px;">
+                            <input type="checkbox" id="selectAll" onchange="toggleSelectAll()">
+                        </th>
+                        <th>Question</th>
+                        <th>Subject</th>
+                        <th>Action</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    ${allQuestions.map(q => `
+                        <tr>
+                            <td>
+                                <input type="checkbox" class="question-checkbox" value="${q.id}" onchange="toggleSelection('${q.id}')">
+                            </td>
+                            <td>${q.question}</td>
+                            <td>${q.subject}</td>
+                            <td>
+                                <button class="btn btn-danger" onclick="deleteQuestion('${q.id}')">Delete</button>
+                            </td>
+                        </tr>
+                    `).join('')}
+                </tbody>
+            </table>
+        </div>
+    `;
+}
+async function loadDuplicates() {
+const container = document.getElementById('duplicatesContainer');
+container.innerHTML = '<p class="text-center" style="color: var(--text-muted);">Scanning question bank...</p>';
+try {
+const response = await fetch('/api/admin/questions/duplicates');
+const data = await response.json();
+if (!data.success) {
+container.innerHTML = `<p class="text-center" style="color: var(--error);">Error: ${data.message}</p>`;
+return;
+}
+if (data.clusters.length === 0) {
+container.innerHTML = '<p class="text-center" style="color: var(--success); padding: 1rem;">No duplicate questions found.</p>';
+return;
+}
+container.innerHTML = `
+            <p style="margin-bottom: 1rem;">${data.total_clusters} duplicate clusters (${data.duplicate_questions} redundant questions)</p>
+            <div class="table-container" style="margin-bottom: 2rem;">
+                <table class="table">
+                    <thead>
+                        <tr>
+                            <th>Type</th>
+                            <th>Question</th>
+                            <th>Subject</th>
+                            <th>Action</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        ${data.clusters.map(cluster => cluster.questions.map((q, i) => `
+                            <tr>
+                                <td>${i === 0 ? (cluster.kind === 'exact' ? 'Exact' : 'Similar') : ''}</td>
+                                <td>${q.question}</td>
+                                <td>${q.subject}</td>
+                                <td>
+                                    <button class="btn btn-danger" onclick="deleteQuestion('${q.id}')">Delete</button>
+                                </td>
+                            </tr>
+                        `).join('')).join('')}
+                    </tbody>
+                </table>
+            </div>
+        `;
+} catch (error) {
+container.innerHTML = '<p class="text-center" style="color: var(--error);">Failed to load duplicate report.</p>';
+}
+}
+function toggleSelectAll() {
+const selectAll = document.getElementById('selectAll');
+const checkboxes = document.querySelectorAll('.question-checkbox');
+checkboxes.forEach(cb => {
+cb.checked = selectAll.checked;
+if (selectAll.checked) {
+selectedQuestions.add(cb.value);
+} else {
+selectedQuestions.delete(cb.value);
+}
+});
+updateBulkActionUI();
+}
+function toggleSelection(id) {
+if (selectedQuestions.has(id)) {
+selectedQuestions.delete(id);
+} else {
+selectedQuestions.add(id);
+}
+const selectAll = document.getElementById('selectAll');
+const checkboxes = document.querySelectorAll('.question-checkbox');
+selectAll.checked = selectedQuestions.size === checkboxes.length && checkboxes.length > 0;
+updateBulkActionUI();
+}
+function updateBulkActionUI() {
+const btn = document.getElementById('deleteSelectedBtn');
+const countSpan = document.getElementById('selectedCount');
+if (selectedQuestions.size > 0) {
+btn.style.display = 'inline-block';
+countSpan.textContent = selectedQuestions.size;
+} else {
+btn.style.display = 'none';
+}
+}
+async function deleteSelectedQuestions() {
+if (!confirm(`Are you sure you want to delete ${selectedQuestions.size} questions?`)) {
+return;
+}
+try {
+const response = await fetch('/api/admin/questions/delete_bulk', {
+method: 'POST',
+headers: { 'Content-Type': 'application/json' },
+body: JSON.stringify({ ids: Array.from(selectedQuestions) })
+});
+const data = await response.json();
+if (data.success) {
+alert(data.message);
+loadQuestions(questionPage);
+} else {
+alert('Error: ' + data.message);
+}
+} catch (error) {
+alert('Failed to delete selected questions.');
+}
+}
+async function deleteStudent(rollNumber) {
+if (!confirm(`Are you sure you want to delete student ${rollNumber}? This will also delete their exam results.`)) {
+return;
+}
+try {
+const response = await fetch('/api/admin/students/' + rollNumber, {
+method: 'DELETE'
+});
+const data = await response.json();
+if (data.success) {
+alert('Student deleted successfully');
+loadStudents();
+} else {
+alert('Error: ' + data.message);
+}
+} catch (error) {
+alert('Failed to delete student');
+}
+}
+async function deleteAllStudents() {
+if (!confirm('WARNING: This will delete ALL registered students. This action cannot be undone. Are you sure?')) {
+return;
+}
+if (!confirm('Double Check: Are you absolutely sure you want to delete ALL student data?')) {
+return;
+}
+try {
+const response = await fetch('/api/admin/students/all', {
+method: 'DELETE'
+});
+const data = await response.json();
+if (data.success) {
+alert(data.message);
+loadStudents();
+} else {
+alert('Error: ' + data.message);
+}
+} catch (error) {
+alert('Failed to delete all students.');
+}
+}
+async function deleteAllQuestions() {
+if (!confirm('WARNING: This will delete ALL questions from the database. This action cannot be undone. Are you sure?')) {
+return;
+}
+if (!confirm('Double Check: Are you absolutely sure you want to delete EVERYTHING?')) {
+return;
+}
+try {
+const response = await fetch('/api/admin/questions/all', {
+method: 'DELETE'
+});
+const data = await response.json();
+if (data.success) {
+alert(data.message);
+loadQuestions();
+} else {
+alert('Error: ' + data.message);
+}
+} catch (error) {
+alert('Failed to delete all questions.');
+}
+}
+async function deleteQuestion(questionId) {
+if (confirm('Are you sure you want to delete this question?')) {
+try {
+const response = await fetch('/api/admin/questions/' + questionId, {
+method: 'DELETE'
+});
+const data = await response.json();
+if (data.success) {
+alert('Question deleted successfully!');
+loadQuestions(questionPage);
+} else {
+alert('Error: ' + data.message);
+}
+} catch (error) {
+alert('Failed to delete question. Please try again.');
+}
+}
+}
+window.addEventListener('load', () => {
+loadStudents();
+loadQuestions();
+document.getElementById('questionSearch').addEventListener('input', scheduleSearch);
+document.getElementById('subjectFilter').addEventListener('change', () => loadQuestions(1));
+document.getElementById('answerFilter').addEventListener('change', () => loadQuestions(1));
+});
@@ -0,0 +1,187 @@
+let questions = [];
+let currentIdx = 0;
+let savedAnswers = {};
+let answerSeq = {};
+let timerInterval;
+const examConfig = document.body.dataset;
+let timeLeft = Number(examConfig.duration) * 60;
+window.onload = async function () {
+try {
+const data = await startExam(examConfig.subject);
+if (data.success) {
+const paperRes = await fetch(data.paper_url, { cache: 'no-cache' });
+const paper = await paperRes.json();
+if (!paper.success) {
+alert(paper.message);
+return;
+}
+questions = paper.questions;
+savedAnswers = data.saved_answers || {};
+timeLeft = data.remaining_time;
+initPalette();
+loadQuestion(0);
+startTimer();
+} else {
+alert(data.message);
+if (data.redirect) window.location.href = data.redirect;
+}
+} catch (e) {
+console.error(e);
+alert("Failed to load exam.");
+}
+};
+async function startExam(subject) {
+const loader = document.getElementById('loader');
+const status = document.getElementById('queue-status');
+let ticket = null;
+while (true) {
+const res = await fetch(`/api/start_exam/${encodeURIComponent(subject)}`, {
+method: 'POST',
+headers: { 'Content-Type': 'application/json' },
+body: JSON.stringify({ ticket })
+});
+const data = await res.json();
+if (res.status !== 202 || !data.queued) {
+loader.classList.remove('visible');
+status.textContent = '';
+return data;
+}
+ticket = data.ticket;
+const wait = data.estimated_wait > 0 ? ` Estimated wait: about ${data.estimated_wait}s.` : '';
+status.textContent = `Many students are starting right now. You are number ${data.position} in the queue.${wait} Your exam time has not started yet.`;
+loader.classList.add('visible');
+await new Promise(resolve => setTimeout(resolve, data.retry_after * 1000));
+}
+}
+function idempotencyKey() {
+if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+}
+async function postWithRetry(url, body, attempts = 4) {
+const key = idempotencyKey();
+for (let attempt = 1; ; attempt++) {
+try {
+const res = await fetch(url, {
+method: 'POST',
+headers: { 'Content-Type': 'application/json', 'Idempotency-Key': key },
+body: JSON.stringify(body)
+});
+if (attempt < attempts && (res.status === 409 || res.status >= 500)) throw new Error(`HTTP ${res.status}`);
+return res;
+} catch (e) {
+if (attempt >= attempts) throw e;
+await new Promise(resolve => setTimeout(resolve, 500 * 2 ** (attempt - 1)));
+}
+}
+}
+function startTimer() {
+const display = document.getElementById('timer');
+timerInterval = setInterval(() => {
+if (timeLeft <= 0) {
+clearInterval(timerInterval);
+submitExam();
+return;
+}
+timeLeft--;
+const h = Math.floor(timeLeft / 3600);
+const m = Math.floor((timeLeft % 3600) / 60);
+const s = timeLeft % 60;
+display.textContent = `${h.toString().padStart(2, '0')}:${m.toString().padStart(2, '0')}:${s.toString().padStart(2, '0')}`;
+if (timeLeft < 300) {
+display.classList.add('warning');
+}
+}, 1000);
+}
+function initPalette() {
+const palette = document.getElementById('palette');
+palette.innerHTML = '';
+questions.forEach((q, idx) => {
+const btn = document.createElement('button');
+btn.className = `palette-btn ${savedAnswers[q.id] ? 'answered' : ''}`;
+btn.textContent = idx + 1;
+btn.onclick = () => loadQuestion(idx);
+palette.appendChild(btn);
+});
+}
+function loadQuestion(idx) {
+if (idx < 0 || idx >= questions.length) return;
+currentIdx = idx;
+const q = questions[idx];
+document.getElementById('q-number').textContent = `Question ${idx + 1} of ${questions.length}`;
+const qText = document.getElementById('q-text');
+qText.style.opacity = 0;
+document.getElementById('options-area').style.opacity = 0;
+setTimeout(() => {
+qText.textContent = q.question;
+renderOptions(q);
+qText.style.opacity = 1;
+document.getElementById('options-area').style.opacity = 1;
+}, 200);
+document.querySelectorAll('.palette-btn').forEach((btn, i) => {
+btn.classList.toggle('active', i === idx);
+});
+document.getElementById('btn-prev').disabled = idx === 0;
+document.getElementById('btn-prev').style.opacity = idx === 0 ? 0.5 : 1;
+const nextBtn = document.getElementById('btn-next');
+if (idx === questions.length - 1) {
+nextBtn.innerHTML = 'Submit <i class="fas fa-check"></i>';
+nextBtn.onclick = submitExam;
+nextBtn.className = 'btn-nav btn-submit';
+} else {
+nextBtn.innerHTML = 'Next <i class="fas fa-arrow-right"></i>';
+nextBtn.onclick = () => navQuestion(1);
+nextBtn.className = 'btn-nav';
+nextBtn.style.background = '#0072FF';
+}
+}
+function renderOptions(q) {
+const container = document.getElementById('options-area');
+container.innerHTML = '';
+q.options.forEach((opt, i) => {
+const card = document.createElement('div');
+const isSelected = savedAnswers[q.id] === opt;
+card.className = `option-card ${isSelected ? 'selected' : ''}`;
+const marker = document.createElement('div');
+marker.className = 'option-marker';
+marker.textContent = String.fromCharCode(65 + i);
+const text = document.createElement('span');
+text.textContent = opt;
+card.onclick = () => selectOption(q.id, opt);
+card.appendChild(marker);
+card.appendChild(text);
+container.appendChild(card);
+});
+}
+async function selectOption(qId, answer) {
+savedAnswers[qId] = answer;
+const paletteBtn = document.querySelectorAll('.palette-btn')[currentIdx];
+if (paletteBtn) paletteBtn.classList.add('answered');
+renderOptions(questions[currentIdx]);
+try {
+const seq = answerSeq[qId] = Math.max((answerSeq[qId] || 0) + 1, Date.now());
+await postWithRetry('/api/save_answer', { question_id: qId, answer: answer, seq: seq });
+} catch (e) {
+console.error("Failed to save answer", e);
+}
+}
+function navQuestion(dir) {
+loadQuestion(currentIdx + dir);
+}
+async function submitExam() {
+if (!confirm("Are you sure you want to submit the exam?")) return;
+document.getElementById('loader').classList.add('visible');
+try {
+const res = await postWithRetry('/api/submit_exam', {});
+const data = await res.json();
+if (data.success) {
+window.location.href = data.redirect;
+} else {
+alert(data.message);
+document.getElementById('loader').classList.remove('visible');
+}
+} catch (e) {
+console.error(e);
+alert("Submission failed. Please try again.");
+document.getElementById('loader').classList.remove('visible');
+}
+}
@@ -0,0 +1,186 @@
+function showToast(message, type = 'info') {
+const toast = document.createElement('div');
+toast.className = `toast alert-${type}`;
+toast.textContent = message;
+document.body.appendChild(toast);
+setTimeout(() => {
+toast.remove();
+}, 3000);
+}
+function showAlert(message, type = 'info') {
+const alertContainer = document.getElementById('alert-container');
+if (!alertContainer) {
+showToast(message, type);
+return;
+}
+const alertClass = `alert-${type}`;
+const icons = {
+success: '✓',
+error: '✗',
+warning: '⚠',
+info: 'ℹ'
+};
+alertContainer.innerHTML = `
+        <div class="alert ${alertClass} scale-in">
+            <span style="font-size: 1.2rem; margin-right: 0.5rem;">${icons[type] || 'ℹ'}</span>
+            <span>${message}</span>
+        </div>
+    `;
+setTimeout(() => {
+const alert = alertContainer.querySelector('.alert');
+if (alert) {
+alert.style.animation = 'fadeOut 0.3s ease';
+setTimeout(() => {
+alertContainer.innerHTML = '';
+}, 300);
+}
+}, 5000);
+}
+function setButtonLoading(button, loading) {
+if (loading) {
+button.classList.add('loading');
+button.disabled = true;
+} else {
+button.classList.remove('loading');
+button.disabled = false;
+}
+}
+function showLoader(containerId) {
+const container = document.getElementById(containerId);
+if (container) {
+container.innerHTML = '<div class="loader"></div>';
+}
+}
+function hideLoader(containerId) {
+const container = document.getElementById(containerId);
+if (container) {
+container.innerHTML = '';
+}
+}
+function validateInput(input, isValid) {
+if (isValid) {
+input.classList.remove('error');
+input.classList.add('success');
+} else {
+input.classList.remove('success');
+input.classList.add('error');
+}
+}
+function clearValidation(input) {
+input.classList.remove('success', 'error');
+}
+function formatTime(seconds) {
+const minutes = Math.floor(seconds / 60);
+const secs = seconds % 60;
+return `${minutes.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+}
+function isValidEmail(email) {
+const re = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+return re.test(email);
+}
+function isValidPhone(phone) {
+const re = /^\d{10}$/;
+return re.test(phone);
+}
+function debounce(func, wait) {
+let timeout;
+return function executedFunction(...args) {
+const later = () => {
+clearTimeout(timeout);
+func(...args);
+};
+clearTimeout(timeout);
+timeout = setTimeout(later, wait);
+};
+}
+function scrollToElement(elementId) {
+const element = document.getElementById(elementId);
+if (element) {
+element.scrollIntoView({ behavior: 'smooth', block: 'start' });
+}
+}
+async function copyToClipboard(text) {
+try {
+await navigator.clipboard.writeText(text);
+showToast('Copied to clipboard!', 'success');
+return true;
+} catch (err) {
+console.error('Failed to copy:', err);
+showToast('Failed to copy', 'error');
+return false;
+}
+}
+function animate(element, animationClass) {
+element.classList.add(animationClass);
+element.addEventListener('animationend', () => {
+element.classList.remove(animationClass);
+}, { once: true });
+}
+function initScrollAnimations() {
+const observer = new IntersectionObserver((entries) => {
+entries.forEach(entry => {
+if (entry.isIntersecting) {
+entry.target.classList.add('fade-in');
+}
+});
+}, {
+threshold: 0.1
+});
+document.querySelectorAll('.glass-card, .stat-card').forEach(el => {
+observer.observe(el);
+});
+}
+document.addEventListener('DOMContentLoaded', () => {
+initScrollAnimations();
+document.querySelectorAll('.btn').forEach(button => {
+if (!button.classList.contains('ripple')) {
+button.classList.add('ripple');
+}
+});
+});
+function updateProgressBar(percentage) {
+const progressBar = document.querySelector('.progress-bar-fill');
+if (progressBar) {
+progressBar.style.width = `${percentage}%`;
+}
+}
+if (typeof module !== 'undefined' && module.exports) {
+module.exports = {
+showAlert,
+showToast,
+setButtonLoading,
+showLoader,
+hideLoader,
+validateInput,
+clearValidation,
+formatTime,
+isValidEmail,
+isValidPhone,
+debounce,
+scrollToElement,
+copyToClipboard,
+animate,
+updateProgressBar
+};
+}
+document.addEventListener('DOMContentLoaded', () => {
+const hamburger = document.getElementById('hamburger-btn');
+const sidebar = document.getElementById('sidebar');
+const closeBtn = document.getElementById('close-sidebar');
+const overlay = document.getElementById('sidebar-overlay');
+function toggleSidebar() {
+if (!sidebar) return;
+sidebar.classList.toggle('active');
+hamburger.classList.toggle('active');
+if (overlay) overlay.classList.toggle('active');
+}
+if (hamburger) {
+hamburger.addEventListener('click', toggleSidebar);
+}
+if (closeBtn) {
+closeBtn.addEventListener('click', toggleSidebar);
+}
+if (overlay) {
+overlay.addEventListener('click', toggleSidebar);
+}
+});
@@ -0,0 +1,280 @@
+"""
+Template precompilation and bytecode cache
+
+Jinja turns every template into Python code the first time it is rendered.
+On a serverless cold start that happens on the first request, which makes
+the first exam page noticeably slower. Two layers avoid it:
+
+    * Precompiled templates: `python template_cache.py build` compiles every
+      template into a Python module under compiled_templates/
+      (Config.TEMPLATE_PRECOMPILED_DIR), which is committed with the code.
+      A template is only loaded from there if its source still matches the
+      hash recorded at build time and the installed Jinja version is the one
+      it was built with; otherwise it is compiled from source as usual.
+    * Bytecode cache: templates compiled at runtime are cached as marshalled
+      bytecode in Config.TEMPLATE_BYTECODE_DIR, shared by all workers on a
+      host and kept across warm restarts.
+
+Debug mode skips the precompiled modules so that edited templates reload.
+
+Every template load is recorded with how it was loaded (precompiled,
+bytecode or compiled) and how long it took. With Config.TEMPLATE_PROFILE set,
+render times are recorded too, and stats() reports load versus render time
+per template.
+
+Usage:
+    python template_cache.py build
+    python template_cache.py profile [--repeat N]
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import shutil
+import threading
+import time
+
+import jinja2
+from flask import before_render_template, template_rendered
+from jinja2 import BaseLoader, ChoiceLoader, FileSystemBytecodeCache, ModuleLoader, TemplateNotFound
+
+MANIFEST_NAME = 'manifest.json'
+
+_local = threading.local()   # How the template currently being loaded was obtained
+
+
+def _source_digest(source):
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Filesystem bytecode cache that notes whether a load was served from it"""
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            _local.source = 'bytecode'
+
+
+class PrecompiledLoader(ModuleLoader):
+    """Loads templates compiled by `python template_cache.py build`, if still current"""
+
+    def __init__(self, path, templates, source_loader):
+        super().__init__(path)
+        self.templates = templates   # name -> sha1 of the source it was built from
+        self.source_loader = source_loader
+
+    def load(self, environment, name, globals=None):
+        digest = self.templates.get(name)
+        if digest is None:
+            raise TemplateNotFound(name)
+        source = self.source_loader.get_source(environment, name)[0]
+        if _source_digest(source) != digest:
+            raise TemplateNotFound(name)  # Edited since the build; compile from source
+
+        template = super().load(environment, name, globals)
+        _local.source = 'precompiled'
+        return template
+
+
+class ProfilingLoader(BaseLoader):
+    """Wraps the environment's loader and records how long each load takes"""
+
+    def __init__(self, loader, record):
+        self.loader = loader
+        self.record = record
+
+    def get_source(self, environment, template):
+        return self.loader.get_source(environment, template)
+
+    def list_templates(self):
+        return self.loader.list_templates()
+
+    def load(self, environment, name, globals=None):
+        _local.source = 'compiled'
+        started = time.perf_counter()
+        template = self.loader.load(environment, name, globals)
+        self.record(name, _local.source, time.perf_counter() - started)
+        return template
+
+
+def read_manifest(path):
+    try:
+        with open(os.path.join(path, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class TemplateCache:
+    """Installs the precompiled loader and bytecode cache on a Flask app"""
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._templates = {}   # name -> load/render counters
+        self.precompiled = 0
+        self.bytecode_dir = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        env = app.jinja_env
+        source_loader = env.loader
+
+        directory = app.config['TEMPLATE_BYTECODE_DIR']
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+                env.bytecode_cache = TemplateBytecodeCache(directory)
+                self.bytecode_dir = directory
+            except OSError as e:
+                app.logger.warning(f"Template bytecode cache disabled: {e}")
+
+        loader = source_loader
+        manifest = read_manifest(app.config['TEMPLATE_PRECOMPILED_DIR'])
+        if manifest and not app.debug and manifest.get('jinja2') == jinja2.__version__:
+            self.precompiled = len(manifest['templates'])
+            loader = ChoiceLoader([
+                PrecompiledLoader(app.config['TEMPLATE_PRECOMPILED_DIR'], manifest['templates'], source_loader),
+                source_loader
+            ])
+        env.loader = ProfilingLoader(loader, self._record_load)
+
+        if app.config['TEMPLATE_PROFILE']:
+            before_render_template.connect(self._render_started, app)
+            template_rendered.connect(self._render_finished, app)
+
+    # ---------- statistics ----------
+
+    def _counters(self, name):
+        return self._templates.setdefault(name, {
+            'source': None, 'loads': 0, 'load_ms': 0.0,
+            'renders': 0, 'render_ms_total': 0.0, 'render_ms_max': 0.0
+        })
+
+    def _record_load(self, name, source, seconds):
+        with self._lock:
+            counters = self._counters(name)
+            counters['source'] = source
+            counters['loads'] += 1
+            counters['load_ms'] += seconds * 1000
+
+    def _render_started(self, sender, template, context, **extra):
+        stack = getattr(_local, 'renders', None)
+        if stack is None:
+            stack = _local.renders = []
+        stack.append(time.perf_counter())
+
+    def _render_finished(self, sender, template, context, **extra):
+        stack = getattr(_local, 'renders', None)
+        if not stack:
+            return
+        ms = (time.perf_counter() - stack.pop()) * 1000
+        with self._lock:
+            counters = self._counters(template.name)
+            counters['renders'] += 1
+            counters['render_ms_total'] += ms
+            counters['render_ms_max'] = max(counters['render_ms_max'], ms)
+
+    def stats(self):
+        """Per-template load (compile) and render times"""
+        with self._lock:
+            templates = {}
+            for name, c in sorted(self._templates.items()):
+                templates[name] = {
+                    'source': c['source'],
+                    'loads': c['loads'],
+                    'load_ms': round(c['load_ms'], 2),
+                    'renders': c['renders'],
+                    'render_ms_avg': round(c['render_ms_total'] / c['renders'], 2) if c['renders'] else 0.0,
+                    'render_ms_max': round(c['render_ms_max'], 2)
+                }
+        return {'precompiled': self.precompiled, 'bytecode_dir': self.bytecode_dir, 'templates': templates}
+
+
+# ---------- build ----------
+
+def _source_environment(app):
+    """A copy of the app's Jinja environment that always compiles from source"""
+    env = app.jinja_env.overlay(bytecode_cache=None, cache_size=0)
+    loader = env.loader
+    env.loader = loader.loader if isinstance(loader, ProfilingLoader) else loader
+    if isinstance(env.loader, ChoiceLoader):
+        env.loader = env.loader.loaders[-1]
+    return env
+
+
+def build(app, verbose=True):
+    """Precompile every template into Config.TEMPLATE_PRECOMPILED_DIR"""
+    target = app.config['TEMPLATE_PRECOMPILED_DIR']
+    env = _source_environment(app)
+
+    if os.path.isdir(target):
+        shutil.rmtree(target)
+    os.makedirs(target)
+
+    names = sorted(env.list_templates(extensions=['html']))
+    env.compile_templates(target, filter_func=lambda name: name in names, zip=None, ignore_errors=False)
+
+    templates = {}
+    for name in names:
+        templates[name] = _source_digest(env.loader.get_source(env, name)[0])
+        if verbose:
+            print(f"{name:<32} -> {ModuleLoader.get_module_filename(name)}")
+
+    with open(os.path.join(target, MANIFEST_NAME), 'w') as f:
+        json.dump({'jinja2': jinja2.__version__, 'templates': templates}, f, indent=2, sort_keys=True)
+    return templates
+
+
+def profile(app, repeat=20):
+    """Time compiling each template from source against the precompiled and bytecode paths"""
+    env = _source_environment(app)
+    manifest = read_manifest(app.config['TEMPLATE_PRECOMPILED_DIR']) or {'templates': {}}
+
+    print(f"{'template':<28} {'compile ms':>11} {'bytecode ms':>12} {'precompiled ms':>15}")
+    for name in sorted(env.list_templates(extensions=['html'])):
+        source = env.loader.get_source(env, name)[0]
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            code = env.compile(source, name)
+        compile_ms = (time.perf_counter() - started) * 1000 / repeat
+
+        data = marshal.dumps(code)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            marshal.loads(data)
+        bytecode_ms = (time.perf_counter() - started) * 1000 / repeat
+
+        precompiled_ms = None
+        if name in manifest['templates']:
+            path = os.path.join(app.config['TEMPLATE_PRECOMPILED_DIR'], ModuleLoader.get_module_filename(name))
+            with open(path) as f:
+                module_source = f.read()
+            started = time.perf_counter()
+            for _ in range(repeat):
+                compile(module_source, path, 'exec')
+            precompiled_ms = (time.perf_counter() - started) * 1000 / repeat
+
+        precompiled = f"{precompiled_ms:15.2f}" if precompiled_ms is not None else f"{'-':>15}"
+        print(f"{name:<28} {compile_ms:11.2f} {bytecode_ms:12.3f} {precompiled}")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Precompile and profile Jinja templates')
+    parser.add_argument('command', choices=['build', 'profile'])
+    parser.add_argument('--repeat', type=int, default=20, help='Iterations per template for profile')
+    args = parser.parse_args()
+
+    from app import app
+
+    if args.command == 'build':
+        built = build(app)
+        print(f"Precompiled {len(built)} templates into "
+              f"{os.path.relpath(app.config['TEMPLATE_PRECOMPILED_DIR'])}")
+    else:
+        profile(app, repeat=args.repeat)
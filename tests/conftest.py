@@ -0,0 +1,23 @@
+"""Shared fixtures: the models' database replaced by an in-memory mongomock one"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def db():
+    mongomock = pytest.importorskip('mongomock')
+    import models
+
+    client = mongomock.MongoClient()
+    saved = models.db_manager._client, models.db_manager._db
+    models.db_manager._client, models.db_manager._db = client, client['olevel_exam']
+    # Cached documents of an earlier test's database would leak into this one
+    models.student_cache.clear()
+    models.exam_cache.clear()
+    yield models.db_manager._db
+    models.db_manager._client, models.db_manager._db = saved
@@ -0,0 +1,139 @@
+"""Tests for SingleFlight: N concurrent callers of one key run the loader once"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache import SingleFlight, SingleFlightTimeout
+
+CALLERS = 50
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('condition not reached')
+        time.sleep(0.001)
+
+
+def run_concurrently(flight, key, loader, callers=CALLERS, timeout=None):
+    """Call flight.do() from callers threads; returns (results, errors)"""
+    results, errors = [], []
+    lock = threading.Lock()
+
+    def caller():
+        try:
+            value = flight.do(key, loader, timeout=timeout)
+            with lock:
+                results.append(value)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+class SlowLoader:
+    """Counts its calls and blocks until released, so every caller overlaps the first call"""
+
+    def __init__(self, result=None, error=None):
+        self.calls = 0
+        self.release = threading.Event()
+        self.result = result if result is not None else object()
+        self.error = error
+
+    def __call__(self):
+        self.calls += 1
+        assert self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight('test-shared', timeout=5)
+    loader = SlowLoader()
+
+    threads, results, errors = run_concurrently(flight, 'count', loader)
+    # Every caller but the leader is waiting on the in-flight call before it finishes
+    wait_until(lambda: flight.shared == CALLERS - 1)
+    loader.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert errors == []
+    assert len(results) == CALLERS
+    assert all(result is loader.result for result in results)
+    assert flight.stats()['in_flight'] == 0
+
+
+def test_calls_after_completion_run_again():
+    flight = SingleFlight('test-sequential', timeout=5)
+    calls = []
+
+    assert flight.do('key', lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do('key', lambda: calls.append(1) or len(calls)) == 2
+
+
+def test_different_keys_are_not_coalesced():
+    flight = SingleFlight('test-keys', timeout=5)
+    loader = SlowLoader()
+
+    threads = []
+    for key in ('a', 'b', 'c'):
+        started, _, _ = run_concurrently(flight, key, loader, callers=1)
+        threads += started
+    wait_until(lambda: loader.calls == 3)
+    loader.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert flight.shared == 0
+
+
+def test_error_is_raised_to_every_waiter():
+    flight = SingleFlight('test-errors', timeout=5)
+    loader = SlowLoader(error=ValueError('database down'))
+
+    threads, results, errors = run_concurrently(flight, 'count', loader)
+    wait_until(lambda: flight.shared == CALLERS - 1)
+    loader.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert results == []
+    assert len(errors) == CALLERS
+    assert all(isinstance(e, ValueError) and str(e) == 'database down' for e in errors)
+    assert flight.errors == 1
+
+    # The failed call is not remembered: the next caller runs the loader again
+    assert flight.do('count', lambda: 42) == 42
+
+
+def test_waiter_times_out_while_leader_finishes():
+    flight = SingleFlight('test-timeout', timeout=5)
+    loader = SlowLoader()
+
+    leader, results, errors = run_concurrently(flight, 'count', loader, callers=1)
+    wait_until(lambda: loader.calls == 1)
+
+    with pytest.raises(SingleFlightTimeout):
+        flight.do('count', loader, timeout=0.05)
+    assert flight.timeouts == 1
+
+    loader.release.set()
+    leader[0].join()
+    assert results == [loader.result]
+    assert errors == []
+    assert loader.calls == 1
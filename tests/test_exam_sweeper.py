@@ -0,0 +1,102 @@
+"""Tests for ExamSweeper: expired exams are finalized once, however many workers sweep"""
+
+import threading
+from datetime import datetime, timedelta
+
+from config import Config
+from exam_sweeper import ExamSweeper, LEASE_NAME
+from models import Exam, Lease
+
+EXAMS = 12
+
+
+def add_exams(db, count, started):
+    """count in-progress exams of one question each, answered correctly by every even student"""
+    question_id = str(db.questions.insert_one({
+        'question': 'What is 2 + 2?', 'options': ['3', '4', '5', '6'], 'correct': '4', 'subject': 'Maths'
+    }).inserted_id)
+    for i in range(count):
+        roll = f'R{i:03d}'
+        db.students.insert_one({'roll_number': roll, 'exam_taken': False})
+        db.exams.insert_one({
+            'student_roll': roll, 'subject': 'Maths', 'questions': [question_id],
+            'answers': {question_id: '4' if i % 2 == 0 else '5'},
+            'start_time': started, 'status': 'in_progress'
+        })
+
+
+def long_ago():
+    return datetime.now() - timedelta(minutes=Config.EXAM_DURATION_MINUTES + 60)
+
+
+def test_expired_exams_are_scored_and_completed(db):
+    add_exams(db, 2, long_ago())
+
+    run = ExamSweeper().sweep()
+
+    assert run['lease'] and run['finalized'] == 2
+    even, odd = db.exams.find().sort('student_roll', 1)
+    assert (even['status'], even['score'], even['auto_submitted']) == ('completed', 1, True)
+    assert (odd['status'], odd['score']) == ('completed', 0)
+    assert even['submit_time'] == even['start_time'] + timedelta(minutes=Config.EXAM_DURATION_MINUTES)
+    assert db.students.count_documents({'exam_taken': True}) == 2
+    assert db.leases.count_documents({'_id': LEASE_NAME}) == 0
+
+
+def test_exams_still_running_are_left_alone(db):
+    add_exams(db, 1, datetime.now())
+
+    assert ExamSweeper().sweep()['expired_found'] == 0
+    assert db.exams.find_one()['status'] == 'in_progress'
+
+
+def test_concurrent_sweeps_finalize_each_exam_once(db):
+    add_exams(db, EXAMS, long_ago())
+    sweepers = [ExamSweeper(), ExamSweeper()]
+    start = threading.Barrier(len(sweepers))
+    runs = []
+
+    def sweep(sweeper):
+        start.wait()
+        runs.append(sweeper.sweep())
+
+    threads = [threading.Thread(target=sweep, args=(sweeper,)) for sweeper in sweepers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(run['finalized'] for run in runs) == EXAMS
+    assert db.exams.count_documents({'status': 'completed', 'auto_submitted': True}) == EXAMS
+
+
+def test_batch_read_by_two_workers_is_written_once(db):
+    # Both workers read the same batch, e.g. the first one stalled past its lease
+    add_exams(db, EXAMS, long_ago())
+    first, second = ExamSweeper(), ExamSweeper()
+    batch = Exam.find_expired(datetime.now(), EXAMS)
+
+    assert first.finalize(batch) == EXAMS
+    assert second.finalize(batch) == 0
+    assert db.exams.count_documents({'status': 'completed'}) == EXAMS
+
+
+def test_sweep_is_skipped_while_another_worker_holds_the_lease(db):
+    add_exams(db, 1, long_ago())
+    assert Lease.acquire(LEASE_NAME, 'other-worker', Config.EXAM_SWEEP_LEASE)
+
+    sweeper = ExamSweeper()
+    assert sweeper.sweep() == {'batches': 0, 'expired_found': 0, 'finalized': 0, 'already_completed': 0,
+                               'lease': False}
+    assert sweeper.stats()['skipped_no_lease'] == 1
+    assert db.exams.find_one()['status'] == 'in_progress'
+
+
+def test_submission_during_the_sweep_is_not_overwritten(db):
+    add_exams(db, 1, long_ago())
+    batch = Exam.find_expired(datetime.now(), 1)
+    # The student's own submit lands between the sweeper's read and its write
+    db.exams.update_one({'_id': batch[0]['_id']}, {'$set': {'status': 'completed', 'score': 1}})
+
+    assert ExamSweeper().finalize(batch) == 0
+    assert 'auto_submitted' not in db.exams.find_one()
@@ -0,0 +1,182 @@
+"""Tests for IdempotencyStore: replays, mismatched bodies, failed requests and failed claims"""
+
+import pytest
+from flask import Flask, jsonify
+
+from config import Config
+from idempotency import HEADER, IdempotencyStore
+
+SCOPE = 'submit_exam'
+
+
+def make_store(durable=(SCOPE,)):
+    config = {name: getattr(Config, name) for name in dir(Config) if name.startswith('IDEMPOTENCY_')}
+    config['IDEMPOTENCY_DURABLE_SCOPES'] = list(durable)
+    return IdempotencyStore(config)
+
+
+class ExamApp:
+    """A Flask app with one idempotent route that counts its runs; fail_with is a status or an exception"""
+
+    def __init__(self, store):
+        self.store = store
+        self.runs = 0
+        self.fail_with = None
+        self.app = Flask(__name__)
+        self.app.secret_key = 'test'
+        self.app.testing = True   # Exceptions reach the test instead of becoming a 500 page
+
+        @self.app.route('/submit', methods=['POST'])
+        @store.idempotent(SCOPE)
+        def submit():
+            self.runs += 1
+            if isinstance(self.fail_with, Exception):
+                raise self.fail_with
+            if self.fail_with is not None:
+                return jsonify({'success': False}), self.fail_with
+            return jsonify({'success': True, 'run': self.runs})
+
+    def client(self, roll='R001'):
+        client = self.app.test_client()
+        with client.session_transaction() as s:
+            s['student_roll'] = roll
+        return client
+
+
+def post(client, key, body=b'{"answers": 1}'):
+    return client.post('/submit', data=body, content_type='application/json', headers={HEADER: key})
+
+
+@pytest.fixture
+def exam_app(db):
+    return ExamApp(make_store())
+
+
+def test_retry_gets_the_first_response_replayed(exam_app):
+    client = exam_app.client()
+
+    first = post(client, 'k1')
+    retry = post(client, 'k1')
+
+    assert exam_app.runs == 1
+    assert retry.status_code == 200 and retry.get_json() == first.get_json() == {'success': True, 'run': 1}
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    assert 'Idempotent-Replayed' not in first.headers
+    assert post(client, 'k2').get_json()['run'] == 2
+
+
+def test_retry_on_another_worker_is_replayed_from_mongodb(db, exam_app):
+    post(exam_app.client(), 'k1')
+    other_worker = ExamApp(make_store())
+
+    retry = post(other_worker.client(), 'k1')
+
+    assert other_worker.runs == 0
+    assert retry.get_json() == {'success': True, 'run': 1}
+    assert db.idempotency_keys.find_one()['state'] == 'done'
+
+
+def test_same_key_from_another_student_runs_again(exam_app):
+    post(exam_app.client('R001'), 'k1')
+    post(exam_app.client('R002'), 'k1')
+
+    assert exam_app.runs == 2
+
+
+def test_key_reused_with_a_different_body_gets_422(exam_app):
+    client = exam_app.client()
+    post(client, 'k1')
+
+    response = post(client, 'k1', body=b'{"answers": 2}')
+
+    assert response.status_code == 422
+    assert exam_app.runs == 1
+    assert exam_app.store.stats()['routes'][SCOPE]['mismatched'] == 1
+
+
+def test_server_error_releases_the_key(db, exam_app):
+    client = exam_app.client()
+    exam_app.fail_with = 503
+    assert post(client, 'k1').status_code == 503
+    assert db.idempotency_keys.count_documents({}) == 0
+    assert exam_app.store.stats()['pending'] == 0
+
+    exam_app.fail_with = None
+    retry = post(client, 'k1')
+
+    assert exam_app.runs == 2
+    assert retry.status_code == 200 and 'Idempotent-Replayed' not in retry.headers
+
+
+def test_client_error_is_replayed(exam_app):
+    client = exam_app.client()
+    exam_app.fail_with = 400
+    post(client, 'k1')
+    exam_app.fail_with = None
+
+    assert post(client, 'k1').status_code == 400
+    assert exam_app.runs == 1
+
+
+def test_exception_in_the_view_releases_the_key(db, exam_app):
+    exam_app.fail_with = RuntimeError('scoring failed')
+    client = exam_app.client()
+
+    with pytest.raises(RuntimeError):
+        post(client, 'k1')
+    assert exam_app.store.stats()['pending'] == 0
+    assert db.idempotency_keys.count_documents({}) == 0
+
+
+def test_duplicate_while_the_first_request_runs_gets_409(db):
+    store = make_store()
+    assert store.begin(SCOPE, 'R001', 'k1', 'body').action == 'new'
+
+    assert store.begin(SCOPE, 'R001', 'k1', 'body').action == 'in_progress'
+    # Another worker sees the claim in MongoDB
+    assert make_store().begin(SCOPE, 'R001', 'k1', 'body').action == 'in_progress'
+
+    store.complete(SCOPE, 'R001', 'k1', 'body', 200, '{}')
+    assert store.begin(SCOPE, 'R001', 'k1', 'body').action == 'replay'
+
+
+def test_failed_claim_releases_the_key(db, monkeypatch):
+    store = make_store()
+    collection = store._collection
+    failures = []
+
+    def unavailable():
+        if not failures:
+            failures.append(1)
+            raise ConnectionError('MongoDB unavailable')
+        return collection()
+
+    monkeypatch.setattr(store, '_collection', unavailable)
+
+    with pytest.raises(ConnectionError):
+        store.begin(SCOPE, 'R001', 'k1', 'body')
+    assert store.stats()['pending'] == 0
+
+    # The retry claims the key instead of getting 409 from the leftover entry
+    assert store.begin(SCOPE, 'R001', 'k1', 'body').action == 'new'
+    assert db.idempotency_keys.find_one()['state'] == 'pending'
+
+
+def test_failed_claim_leaves_another_workers_claim_alone(db, monkeypatch):
+    owner = make_store()
+    assert owner.begin(SCOPE, 'R001', 'k1', 'body').action == 'new'
+    other = make_store()
+
+    def timeout(*args):
+        raise ConnectionError('timeout')
+
+    monkeypatch.setattr(other, '_claim', timeout)
+    client = ExamApp(other).client()
+
+    with pytest.raises(ConnectionError):
+        post(client, 'k1', body=b'body')
+
+    # The owner's claim is still there and it can store its response
+    assert db.idempotency_keys.find_one()['state'] == 'pending'
+    owner.complete(SCOPE, 'R001', 'k1', 'body', 200, '{}')
+    assert db.idempotency_keys.find_one()['state'] == 'done'
@@ -0,0 +1,120 @@
+"""Tests for regrade: batch scoring, answer-key corrections and resuming an interrupted run"""
+
+import pytest
+
+from models import Exam
+from regrade import Regrade, score_batch
+from utils import calculate_grade
+
+OPTIONS = ['Red', 'Green', 'Blue', 'Yellow']
+EXAMS = 7
+
+
+class Interrupted(Exception):
+    pass
+
+
+def add_questions(db, count, correct='Red'):
+    return [str(db.questions.insert_one({
+        'question': f'Question {i}', 'options': OPTIONS, 'correct': correct, 'subject': 'Art'
+    }).inserted_id) for i in range(count)]
+
+
+def add_completed_exams(db, question_ids, count=EXAMS):
+    """Completed exams scored against the current keys; student i answered 'Green' to the first i questions"""
+    keys = {str(q['_id']): q for q in db.questions.find()}
+    for i in range(count):
+        exam = {
+            'student_roll': f'R{i:03d}', 'subject': 'Art', 'questions': question_ids, 'status': 'completed',
+            'answers': {qid: 'Green' if n < i else 'Red' for n, qid in enumerate(question_ids)}
+        }
+        score, total, percentage, grade = Exam.score(exam, [keys[qid] for qid in question_ids])
+        db.exams.insert_one({**exam, 'score': score, 'total': total, 'percentage': percentage, 'grade': grade})
+
+
+def test_score_batch_matches_scoring_question_by_question(db):
+    question_ids = add_questions(db, 4)
+    add_completed_exams(db, question_ids)
+    db.exams.update_one({'student_roll': 'R003'}, {'$unset': {f'answers.{question_ids[0]}': ''}})
+    exams = list(db.exams.find().sort('_id', 1))
+    questions = list(db.questions.find())
+    answer_key = {str(q['_id']): q['correct'] for q in questions}
+
+    assert score_batch(exams, answer_key) == [Exam.score(exam, questions) for exam in exams]
+
+
+def test_score_batch_skips_exams_with_deleted_questions(db):
+    question_ids = add_questions(db, 2)
+    exam = {'questions': question_ids, 'answers': {question_ids[0]: 'Red'}}
+
+    assert score_batch([exam], {question_ids[0]: 'Red'}) == [None]
+    assert score_batch([exam], {qid: 'Red' for qid in question_ids}) == [(1, 2, 50.0, calculate_grade(50.0))]
+
+
+def test_correction_by_letter_regrades_affected_exams(db):
+    question_ids = add_questions(db, 4)
+    add_completed_exams(db, question_ids)
+
+    counters = Regrade(corrections={question_ids[0]: 'b'}).run()
+
+    # Stored as the option text, the form students' answers are saved in
+    assert [q['correct'] for q in db.questions.find().sort('_id', 1)] == ['Green', 'Red', 'Red', 'Red']
+    # Students who answered Green to the first question gain it, the one who answered Red loses it
+    assert counters['scanned'] == EXAMS and counters['written'] == EXAMS
+    assert db.exams.find_one({'student_roll': 'R000'})['score'] == 3
+    assert db.exams.find_one({'student_roll': 'R004'})['score'] == 1
+
+
+@pytest.mark.parametrize('correction', ['Purple', 'E', ''])
+def test_correction_that_is_not_an_option_is_rejected(db, correction):
+    question_ids = add_questions(db, 1)
+    add_completed_exams(db, question_ids, count=1)
+
+    with pytest.raises(ValueError):
+        Regrade(corrections={question_ids[0]: correction}).run()
+    assert db.questions.find_one()['correct'] == 'Red'
+    assert db.regrade_runs.count_documents({}) == 0
+
+
+def test_dry_run_writes_nothing(db):
+    question_ids = add_questions(db, 2)
+    add_completed_exams(db, question_ids, count=3)
+    before = list(db.exams.find())
+
+    counters = Regrade(corrections={question_ids[0]: 'Green'}, dry_run=True).run()
+
+    assert counters['changed'] == 3 and counters['written'] == 0
+    assert list(db.exams.find()) == before
+    assert db.questions.find_one({'correct': 'Green'}) is None
+
+
+def test_interrupted_run_resumes_after_its_last_exam(db):
+    question_ids = add_questions(db, 4)
+    add_completed_exams(db, question_ids)
+    exam_ids = [exam['_id'] for exam in db.exams.find().sort('_id', 1)]
+    regrade = Regrade(corrections={question_ids[0]: 'B'}, batch_size=3)
+
+    def crash_after_first_batch(row):
+        raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        regrade.run(report=crash_after_first_batch)
+    checkpoint = db.regrade_runs.find_one({'_id': regrade.run_id})
+    assert checkpoint['status'] == 'running'
+    assert checkpoint['last_exam_id'] == exam_ids[2]
+
+    resumed = Regrade.resume(regrade.run_id)
+    assert resumed.last_exam_id == exam_ids[2]
+    assert resumed.query()['_id'] == {'$gt': exam_ids[2]}
+    seen = []
+    counters = resumed.run(report=seen.append)
+
+    # Only the exams after the checkpoint were processed again
+    assert sorted(row['exam_id'] for row in seen) == [str(exam_id) for exam_id in exam_ids[3:]]
+    assert counters['scanned'] == EXAMS and counters['written'] == EXAMS
+    assert db.regrade_runs.find_one({'_id': regrade.run_id})['status'] == 'completed'
+    assert db.regrade_changes.count_documents({'run': regrade.run_id}) == EXAMS
+    assert db.exams.count_documents({'regrade_run': regrade.run_id}) == EXAMS
+
+    with pytest.raises(ValueError):
+        Regrade.resume(regrade.run_id)
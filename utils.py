@@ -1,4 +1,4 @@
-import bcrypt
+import hashlib
 import random
 import string
 from datetime import datetime
@@ -6,6 +6,8 @@ from config import Config
 
 def hash_password(password):
     """Hash a password using bcrypt"""
+    # Only needed once students log in or register, so kept off the cold-start import path
+    import bcrypt
     password_bytes = password.encode('utf-8')
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password_bytes, salt)
@@ -13,6 +15,7 @@ def hash_password(password):
 
 def verify_password(password, hashed_password):
     """Verify a password against its hash"""
+    import bcrypt
     password_bytes = password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password_bytes, hashed_bytes)
@@ -24,6 +27,21 @@ def generate_roll_number():
     random_part = ''.join(random.choices(string.digits, k=4))
     return f"OL{year}{random_part}"
 
+def normalize_text(text):
+    """Collapse whitespace and case so trivially different copies compare equal"""
+    return ' '.join(str(text).split()).casefold()
+
+def question_hash(question_text, options, subject):
+    """
+    Content hash identifying a question
+
+    The correct answer is deliberately left out so that fixing an answer
+    key updates the existing question instead of creating a new one.
+    """
+    parts = [normalize_text(subject), normalize_text(question_text)]
+    parts.extend(normalize_text(option) for option in options)
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
 def calculate_score(questions, answers):
     """
     Calculate exam score